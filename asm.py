@@ -0,0 +1,149 @@
+import io
+from typing import NamedTuple
+
+
+class Instr(tuple):
+    """an instruction as the tuple (op, operand, ..., comment). the operands are register names, immediates or
+    memory operands like 8(sp), the comment is "" if there is none."""
+
+    __slots__ = ()
+
+    @property
+    def op(self):
+        return self[0]
+
+    @property
+    def args(self):
+        return self[1:-1]
+
+    @property
+    def comment(self):
+        return self[-1]
+
+    def render(self):
+        line = self[0]
+        if len(self) > 2:
+            line += " " + ", ".join(self[1:-1])
+        if self[-1]:
+            line += " # " + self[-1]
+        return line + "\n"
+
+    def __repr__(self):
+        return f"Instr{tuple(self)!r}"
+
+
+class Label(NamedTuple):
+    name: str
+
+    def render(self):
+        return self.name + ":\n"
+
+
+class Directive(NamedTuple):
+    """an assembler directive or any other line that is copied to the output as it is."""
+
+    text: str
+
+    def render(self):
+        return self.text + "\n"
+
+
+def quoted(data):
+    """the bytes data as a string literal of the assembler, the bytes that aren't printable ASCII as octal
+    escapes."""
+    chars = []
+    for byte in data:
+        if byte in b'"\\':
+            chars.append("\\" + chr(byte))
+        elif 32 <= byte < 127:
+            chars.append(chr(byte))
+        else:
+            chars.append(f"\\{byte:03o}")
+    return '"' + "".join(chars) + '"'
+
+
+# tags of the records in a Code buffer, an instruction's tag is its number of operands
+LABEL = -1
+DIRECTIVE = -2
+
+
+class Code(list):
+    """buffer of instructions, labels and directives. like TokenBuffer it does not keep an object per record,
+    the fields of the records are laid out one after the other: an instruction as its number of operands, op,
+    operands and comment, a label as LABEL and its name, a directive as DIRECTIVE and its text.
+
+    a buffer added with add() or += is kept as a reference, so combining the code of nested constructs copies
+    nothing. the text is only produced by the final write() or str()."""
+
+    __slots__ = ()
+
+    def emit(self, op, *args, comment=""):
+        self.extend((len(args), op, *args, comment))
+
+    def label(self, name):
+        self.extend((LABEL, name))
+
+    def directive(self, text=""):
+        self.extend((DIRECTIVE, text))
+
+    def add(self, code):
+        self.append(code)
+        return self
+
+    __iadd__ = add
+
+    def _fields(self):
+        """(buffer, position) of every record in order, with the added buffers flattened."""
+        stack = [(self, 0)]
+        while stack:
+            items, i = stack.pop()
+            n = len(items)
+            while i < n:
+                tag = items[i]
+                if type(tag) is Code:
+                    stack.append((items, i + 1))
+                    items, i, n = tag, 0, len(tag)
+                    continue
+                yield items, i
+                i += tag + 3 if tag >= 0 else 2
+
+    def records(self):
+        """the instructions, labels and directives as Instr, Label and Directive tuples."""
+        for items, i in self._fields():
+            tag = items[i]
+            if tag >= 0:
+                yield Instr(items[i + 1:i + tag + 3])
+            elif tag == LABEL:
+                yield Label(items[i + 1])
+            else:
+                yield Directive(items[i + 1])
+
+    def __bool__(self):
+        """whether there is anything to render, buffers that only hold empty buffers are false."""
+        return next(self._fields(), None) is not None
+
+    def write(self, out, chunk=4096):
+        """renders the code to the text stream out, chunk lines at a time."""
+        write = out.write
+        lines = []
+        for items, i in self._fields():
+            tag = items[i]
+            if tag >= 0:
+                line = items[i + 1]
+                if tag:
+                    line += " " + ", ".join(items[i + 2:i + tag + 2])
+                comment = items[i + tag + 2]
+                lines.append(line + " # " + comment + "\n" if comment else line + "\n")
+            elif tag == LABEL:
+                lines.append(items[i + 1] + ":\n")
+            else:
+                lines.append(items[i + 1] + "\n")
+            if len(lines) >= chunk:
+                write("".join(lines))
+                lines.clear()
+        write("".join(lines))
+
+    def __str__(self):
+        out = io.StringIO()
+        self.write(out)
+        return out.getvalue()
@@ -1,39 +1,60 @@
 from __future__ import annotations
+import io
+import sys
 from dataclasses import dataclass
 from abc import ABC, abstractmethod
+from types import GeneratorType
 from typing import List, Union
 
 
+class Slotted:
+    """nodes keep their fields in __slots__ instead of a per instance __dict__. pickle can't restore
+    the slots of frozen instances by itself, the fields are pickled as a tuple."""
+
+    __slots__ = ()
+
+    def __getstate__(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state):
+        # pickles made before the nodes had slots hold a dict
+        items = state.items() if isinstance(state, dict) else zip(self.__slots__, state)
+        for name, value in items:
+            object.__setattr__(self, name, value)
+
+
 @dataclass(frozen=True)
-class ASTNode:
-    pass
+class ASTNode(Slotted):
+    __slots__ = ()
 
 
 @dataclass(frozen=True)
 class Expr(ASTNode):
     """expressions. some of the the parse tree components are not explicitly represented (such as parantheses to increase precedence)"""
 
-    pass
+    __slots__ = ()
 
 
 @dataclass(frozen=True)
 class LExpr(Expr):
     """logical expressions. conditions of if/while/for stmts, operands of logical operators, and primaries prepended with # are members."""
 
-    pass
+    __slots__ = ()
 
 
 @dataclass(frozen=True)
 class AExpr(Expr):
     """arithmetic expressions."""
 
-    pass
+    __slots__ = ()
 
 
 @dataclass(frozen=True)
 class SLiteral(Expr):
     """string literal. the grammar makes them unusable in arithmetic/logical ops when they are expressed as naked string literals."""
 
+    __slots__ = ("value",)
+
     value: str
 
 
@@ -41,37 +62,45 @@ class SLiteral(Expr):
 class Stmt(ASTNode):
     """statements. middle classes of statements (simpleStmt/free-statement etc.) are not explicitly represented."""
 
-    pass
+    __slots__ = ()
 
 
 @dataclass(frozen=True)
 class ErrorStmt(Stmt):
     """this node should correspond to an error during parsing that is resolved with character re-synchronization."""
 
-    pass
+    __slots__ = ()
 
 
 @dataclass(frozen=True)
 class Decl(ASTNode):
     """declarations."""
 
-    pass
+    __slots__ = ()
 
 
 @dataclass(frozen=True)
-class Identifier:
-    """represents an identifier token. lineno and index fields are added to help with error reporting."""
+class Identifier(Slotted):
+    """represents an identifier token. lineno and index fields are added to help with error reporting.
+    names are interned, all identifiers with the same name share one string."""
+
+    __slots__ = ("name", "lineno", "index")
 
     name: str
     lineno: int
     index: int
 
+    def __post_init__(self):
+        object.__setattr__(self, "name", sys.intern(self.name))
+
 
 @dataclass(frozen=True)
 class VarDecl(Decl):
     """variable declaration. the initilializer attribute is None if the variable is not initialized to any value,
     it is a list if the variable is initialized as a vector, and and Expr if it is initialized as a non-vector."""
 
+    __slots__ = ("identifier", "initializer")
+
     identifier: Identifier
     initializer: Union[Expr, List[Expr], None]
 
@@ -80,6 +109,8 @@ class VarDecl(Decl):
 class FunDecl(Decl):
     """function declaration. as in fun identifier(params...) body"""
 
+    __slots__ = ("identifier", "params", "body")
+
     identifier: Identifier
     params: List[Identifier]
     body: Block
@@ -89,6 +120,8 @@ class FunDecl(Decl):
 class Program(ASTNode):
     """the root node of the AST."""
 
+    __slots__ = ("var_decls", "fun_decls", "statements")
+
     var_decls: List[VarDecl]
     fun_decls: List[FunDecl]
     statements: List[Stmt]
@@ -98,6 +131,8 @@ class Program(ASTNode):
 class Assign(Stmt):
     """assignments to a variable in the form identifier = expr"""
 
+    __slots__ = ("identifier", "expr")
+
     identifier: Identifier
     expr: Expr
 
@@ -106,6 +141,8 @@ class Assign(Stmt):
 class SetVector(Stmt):
     """assignments to a member of vector in the form identifier[vector_index] = expr"""
 
+    __slots__ = ("identifier", "vector_index", "expr")
+
     identifier: Identifier
     vector_index: AExpr
     expr: Expr
@@ -115,6 +152,8 @@ class SetVector(Stmt):
 class ForLoop(Stmt):
     """a for loop. If any of the fields are left empty, such as in for(;;){}, set them as None."""
 
+    __slots__ = ("initializer", "condition", "increment", "body")
+
     initializer: Union[Assign, None]
     condition: Union[LExpr, None]
     increment: Union[Assign, None]
@@ -123,23 +162,31 @@ class ForLoop(Stmt):
 
 @dataclass(frozen=True)
 class Return(Stmt):
+    __slots__ = ("expr",)
+
     expr: Expr
 
 
 @dataclass(frozen=True)
 class WhileLoop(Stmt):
+    __slots__ = ("condition", "body")
+
     condition: LExpr
     body: Stmt
 
 
 @dataclass(frozen=True)
 class Block(Stmt):
+    __slots__ = ("var_decls", "statements")
+
     var_decls: List[VarDecl]
     statements: List[Stmt]
 
 
 @dataclass(frozen=True)
 class Print(Stmt):
+    __slots__ = ("expr",)
+
     expr: Expr
 
 
@@ -147,6 +194,8 @@ class Print(Stmt):
 class IfElse(Stmt):
     """an if-else statement. If there is no else corresponding to this if, set else_branch as None."""
 
+    __slots__ = ("condition", "if_branch", "else_branch")
+
     condition: LExpr
     if_branch: Stmt
     else_branch: Union[Stmt, None]
@@ -156,6 +205,8 @@ class IfElse(Stmt):
 class LBinary(LExpr):
     """logical binary operations and and or. Set op as "and"/"or"."""
 
+    __slots__ = ("op", "left", "right")
+
     op: str
     left: LExpr
     right: LExpr
@@ -165,6 +216,8 @@ class LBinary(LExpr):
 class Comparison(LExpr):
     """comparison operations <,>,==,!=,<=,>=. Set op as "<"/">"/"=="/"!="/"<="/">="."""
 
+    __slots__ = ("op", "left", "right")
+
     op: str
     left: AExpr
     right: AExpr
@@ -174,6 +227,8 @@ class Comparison(LExpr):
 class LLiteral(LExpr):
     """logical literals (TRUE/FALSE tokens)."""
 
+    __slots__ = ("value",)
+
     value: bool
 
 
@@ -181,6 +236,8 @@ class LLiteral(LExpr):
 class LPrimary(LExpr):
     """# operator on primaries: function calls(# fizzbuzz()), vector accesses(# foo[0]) or variables (# bar) to cast them explicitly as logical."""
 
+    __slots__ = ("primary",)
+
     primary: Union[Call, GetVector, Variable]
 
 
@@ -188,6 +245,8 @@ class LPrimary(LExpr):
 class GetVector(AExpr):
     """vector access as an expression, as in foo = identifier[vector_index]"""
 
+    __slots__ = ("identifier", "vector_index")
+
     identifier: Identifier
     vector_index: AExpr
 
@@ -196,6 +255,8 @@ class GetVector(AExpr):
 class Variable(AExpr):
     """variable access as an expression, as in foo = identifier"""
 
+    __slots__ = ("identifier",)
+
     identifier: Identifier
 
 
@@ -203,6 +264,8 @@ class Variable(AExpr):
 class LNot(LExpr):
     """! operation."""
 
+    __slots__ = ("right",)
+
     right: LExpr
 
 
@@ -210,6 +273,8 @@ class LNot(LExpr):
 class ABinary(AExpr):
     '''arithmetic binary operations +,-,* or /. Set op as "+"/"-"/"*" or "/"'''
 
+    __slots__ = ("op", "left", "right")
+
     op: str
     left: AExpr
     right: AExpr
@@ -219,6 +284,8 @@ class ABinary(AExpr):
 class AUMinus(AExpr):
     """unary minus operation"""
 
+    __slots__ = ("right",)
+
     right: AExpr
 
 
@@ -226,6 +293,8 @@ class AUMinus(AExpr):
 class ALiteral(AExpr):
     """arithmetic literals (Number)"""
 
+    __slots__ = ("value",)
+
     value: float
 
 
@@ -233,6 +302,8 @@ class ALiteral(AExpr):
 class Call(AExpr):
     """function call as an expression, as in foo = callee(arguments...)"""
 
+    __slots__ = ("callee", "arguments")
+
     callee: Identifier
     arguments: List[Expr]
 
@@ -240,37 +311,44 @@ class Call(AExpr):
 # https://stackoverflow.com/questions/11154668/is-the-visitor-pattern-useful-for-dynamically-typed-languages
 
 
+# the concrete node classes, each one has a visit_<class name> method in ASTNodeVisitor
+NODE_TYPES = (
+    SLiteral,
+    Program,
+    ErrorStmt,
+    VarDecl,
+    FunDecl,
+    Assign,
+    SetVector,
+    ForLoop,
+    Return,
+    WhileLoop,
+    Block,
+    Print,
+    IfElse,
+    LBinary,
+    Comparison,
+    LLiteral,
+    LPrimary,
+    GetVector,
+    Variable,
+    LNot,
+    ABinary,
+    AUMinus,
+    ALiteral,
+    Call,
+)
+
+
 class ASTNodeVisitor(ABC):
-    def __init__(self):
-        self.ASTNodes = {
-            SLiteral: self.visit_SLiteral,
-            Program: self.visit_Program,
-            ErrorStmt: self.visit_ErrorStmt,
-            VarDecl: self.visit_VarDecl,
-            FunDecl: self.visit_FunDecl,
-            Assign: self.visit_Assign,
-            SetVector: self.visit_SetVector,
-            ForLoop: self.visit_ForLoop,
-            Return: self.visit_Return,
-            WhileLoop: self.visit_WhileLoop,
-            Block: self.visit_Block,
-            Print: self.visit_Print,
-            IfElse: self.visit_IfElse,
-            LBinary: self.visit_LBinary,
-            Comparison: self.visit_Comparison,
-            LLiteral: self.visit_LLiteral,
-            LPrimary: self.visit_LPrimary,
-            GetVector: self.visit_GetVector,
-            Variable: self.visit_Variable,
-            LNot: self.visit_LNot,
-            ABinary: self.visit_ABinary,
-            AUMinus: self.visit_AUMinus,
-            ALiteral: self.visit_ALiteral,
-            Call: self.visit_Call,
-        }
+    """the dispatch table from node classes to visit methods is built once for every visitor class."""
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.ASTNodes = {node: getattr(cls, f"visit_{node.__name__}") for node in NODE_TYPES}
 
     def visit(self, ast_node: ASTNode):
-        return self.ASTNodes[type(ast_node)](ast_node)
+        return self.ASTNodes[type(ast_node)](self, ast_node)
 
     @abstractmethod
     def visit_SLiteral(self, sliteral: SLiteral):
@@ -369,113 +447,241 @@ class ASTNodeVisitor(ABC):
         pass
 
 
-class PrintVisitor(ASTNodeVisitor):
-    def indent(self, strr):
-        return "\n".join(["    " + elem for elem in strr.split("\n")])
+class IterativeVisitor(ASTNodeVisitor):
+    """visitor that traverses the tree with an explicit stack instead of recursion, so the depth of the tree is
+    not limited by the Python stack. a visit method may be a generator that yields its child nodes, the value of
+    a yield expression is the result of visiting the yielded node and the generator's return value is the result
+    of the method. visit methods of leaves can stay plain functions."""
+
+    def visit(self, ast_node: ASTNode):
+        gen = self.ASTNodes[type(ast_node)](self, ast_node)
+        if type(gen) is not GeneratorType:
+            return gen
+        return self.run(gen)
+
+    def run(self, gen):
+        """the return value of gen, a generator that yields nodes like a visit method."""
+        dispatch = self.ASTNodes
+        # generators of the ancestors of gen, each one waits for the result of the node it yielded last
+        stack = []
+        value = None
+        while True:
+            try:
+                child = gen.send(value)
+            except StopIteration as stop:
+                if not stack:
+                    return stop.value
+                value = stop.value
+                gen = stack.pop()
+                continue
+
+            value = dispatch[type(child)](self, child)
+            if type(value) is GeneratorType:
+                stack.append(gen)
+                gen = value
+                value = None
+
+
+class PrintVisitor(IterativeVisitor):
+    """writes the tree to the text stream out, keeping track of the indentation instead of indenting the text
+    of nested statements afterwards, so every character is written once. if out is None, visit() returns the text."""
+
+    def __init__(self, out=None):
+        super().__init__()
+        self.out = out
+        self._indent = ""
+
+    def visit(self, ast_node: ASTNode):
+        if self.out is not None:
+            return super().visit(ast_node)
+
+        self.out = io.StringIO()
+        try:
+            super().visit(ast_node)
+            return self.out.getvalue()
+        finally:
+            self.out = None
+
+    def write(self, text):
+        # lines of string literals are indented along with the statement they are in
+        if self._indent and "\n" in text:
+            text = text.replace("\n", "\n" + self._indent)
+        self.out.write(text)
+
+    def newline(self):
+        self.out.write("\n" + self._indent)
+
+    def lines(self, nodes, prefix=""):
+        """nodes on one line each, after prefix."""
+        for i, elem in enumerate(nodes):
+            if i:
+                self.newline()
+            self.write(prefix)
+            yield elem
+
+    def assignment(self, node):
+        """Assign or SetVector without the ";", as in the header of a for loop."""
+        self.write(node.identifier.name)
+        if type(node) is SetVector:
+            self.write("[")
+            yield node.vector_index
+            self.write("]")
+        self.write(" = ")
+        yield node.expr
+
+    def separated(self, nodes):
+        for i, elem in enumerate(nodes):
+            if i:
+                self.write(", ")
+            yield elem
 
     def visit_SLiteral(self, sliteral: SLiteral):
-        return f'"{sliteral.value}"'
+        self.write(f'"{sliteral.value}"')
 
     def visit_Program(self, program: Program):
-        return "\n".join(
-            [
-                "TOP_LVL VAR_DECLS:",
-                "\n".join([self.visit(elem) for elem in program.var_decls]),
-                "TOP_LVL FUN_DECLS:",
-                "\n".join([self.visit(elem) for elem in program.fun_decls]),
-                "TOP_LVL STMTS:",
-                "\n".join([self.visit(elem) for elem in program.statements]),
-            ]
-        )
+        self.write("TOP_LVL VAR_DECLS:")
+        self.newline()
+        yield from self.lines(program.var_decls)
+        self.newline()
+        self.write("TOP_LVL FUN_DECLS:")
+        self.newline()
+        yield from self.lines(program.fun_decls)
+        self.newline()
+        self.write("TOP_LVL STMTS:")
+        self.newline()
+        yield from self.lines(program.statements)
 
     def visit_ErrorStmt(self, errorstmt: ErrorStmt):
-        return "ERROR_STMT;"
+        self.write("ERROR_STMT;")
 
     def visit_VarDecl(self, vardecl: VarDecl):
-        if vardecl.initializer is None:
-            return f"var {vardecl.identifier.name};"
-        elif type(vardecl.initializer) == list:
-            return f"var {vardecl.identifier.name} = [{', '.join([self.visit(elem) for elem in vardecl.initializer])}];"
-        else:
-            return f"var {vardecl.identifier.name} = {self.visit(vardecl.initializer)};"
+        self.write(f"var {vardecl.identifier.name}")
+        if type(vardecl.initializer) == list:
+            self.write(" = [")
+            yield from self.separated(vardecl.initializer)
+            self.write("]")
+        elif vardecl.initializer is not None:
+            self.write(" = ")
+            yield vardecl.initializer
+        self.write(";")
 
     def visit_FunDecl(self, fundecl: FunDecl):
-        return f"fun {fundecl.identifier.name}({', '.join([elem.name for elem in fundecl.params])}){self.visit(fundecl.body)}"
+        self.write(f"fun {fundecl.identifier.name}({', '.join([elem.name for elem in fundecl.params])})")
+        yield fundecl.body
 
     def visit_Assign(self, assign: Assign):
-        return f"{assign.identifier.name} = {self.visit(assign.expr)};"
+        yield from self.assignment(assign)
+        self.write(";")
 
     def visit_SetVector(self, setvector: SetVector):
-        return f"{setvector.identifier.name}[{self.visit(setvector.vector_index)}] = {self.visit(setvector.expr)};"
+        yield from self.assignment(setvector)
+        self.write(";")
 
     def visit_ForLoop(self, forloop: ForLoop):
-        initializer = (
-            "" if forloop.initializer is None else self.visit(forloop.initializer)[:-1]
-        )
-        condition = "" if forloop.condition is None else self.visit(forloop.condition)
-        increment = (
-            "" if forloop.increment is None else self.visit(forloop.increment)[:-1]
-        )
-        return f"for ({initializer};{condition};{increment}) {self.visit(forloop.body)}"
+        self.write("for (")
+        if forloop.initializer is not None:
+            yield from self.assignment(forloop.initializer)
+        self.write(";")
+        if forloop.condition is not None:
+            yield forloop.condition
+        self.write(";")
+        if forloop.increment is not None:
+            yield from self.assignment(forloop.increment)
+        self.write(") ")
+        yield forloop.body
 
     def visit_Return(self, returnn: Return):
-        return f"return {self.visit(returnn.expr)};"
+        self.write("return ")
+        yield returnn.expr
+        self.write(";")
 
     def visit_WhileLoop(self, whileloop: WhileLoop):
-        return f"while {self.visit(whileloop.condition)} {self.visit(whileloop.body)}"
+        self.write("while ")
+        yield whileloop.condition
+        self.write(" ")
+        yield whileloop.body
 
     def visit_Block(self, block: Block):
-        return "\n".join(
-            [
-                "{",
-                "  VAR_DECLS:",
-                "\n".join(["    " + self.visit(elem) for elem in block.var_decls]),
-                "  STMTS:",
-                "\n".join([self.indent(self.visit(elem)) for elem in block.statements]),
-                "}",
-            ]
-        )
+        self.write("{")
+        self.newline()
+        self.write("  VAR_DECLS:")
+        self.newline()
+        yield from self.lines(block.var_decls, "    ")
+        self.newline()
+        self.write("  STMTS:")
+        outer = self._indent
+        if block.statements:
+            # statements are indented in full, a block without them leaves an empty line
+            self._indent += "    "
+        self.newline()
+        yield from self.lines(block.statements)
+        self._indent = outer
+        self.newline()
+        self.write("}")
 
     def visit_Print(self, printt: Print):
-        return f"print {self.visit(printt.expr)};"
+        self.write("print ")
+        yield printt.expr
+        self.write(";")
 
     def visit_IfElse(self, ifelse: IfElse):
-        else_branch = (
-            ""
-            if ifelse.else_branch is None
-            else f" else {self.visit(ifelse.else_branch)}"
-        )
-        return f"if {self.visit(ifelse.condition)} {self.visit(ifelse.if_branch)}{else_branch} endif"
+        self.write("if ")
+        yield ifelse.condition
+        self.write(" ")
+        yield ifelse.if_branch
+        if ifelse.else_branch is not None:
+            self.write(" else ")
+            yield ifelse.else_branch
+        self.write(" endif")
 
     def visit_LBinary(self, lbinary: LBinary):
-        return f"(L{lbinary.op} {self.visit(lbinary.left)} {self.visit(lbinary.right)})"
+        self.write(f"(L{lbinary.op} ")
+        yield lbinary.left
+        self.write(" ")
+        yield lbinary.right
+        self.write(")")
 
     def visit_Comparison(self, comparison: Comparison):
-        return f"(Lc{comparison.op} {self.visit(comparison.left)} {self.visit(comparison.right)})"
+        self.write(f"(Lc{comparison.op} ")
+        yield comparison.left
+        self.write(" ")
+        yield comparison.right
+        self.write(")")
 
     def visit_LLiteral(self, lliteral: LLiteral):
-        return f"{lliteral.value}"
+        self.write(f"{lliteral.value}")
 
     def visit_LPrimary(self, lprimary: LPrimary):
-        return f"#{self.visit(lprimary.primary)}"
+        self.write("#")
+        yield lprimary.primary
 
     def visit_GetVector(self, getvector: GetVector):
-        return f"{getvector.identifier.name}[{self.visit(getvector.vector_index)}]"
+        self.write(f"{getvector.identifier.name}[")
+        yield getvector.vector_index
+        self.write("]")
 
     def visit_Variable(self, variable: Variable):
-        return f"{variable.identifier.name}"
+        self.write(f"{variable.identifier.name}")
 
     def visit_LNot(self, lnot: LNot):
-        return f"!{self.visit(lnot.right)}"
+        self.write("!")
+        yield lnot.right
 
     def visit_ABinary(self, abinary: ABinary):
-        return f"(A{abinary.op} {self.visit(abinary.left)} {self.visit(abinary.right)})"
+        self.write(f"(A{abinary.op} ")
+        yield abinary.left
+        self.write(" ")
+        yield abinary.right
+        self.write(")")
 
     def visit_AUMinus(self, auminus: AUMinus):
-        return f"Au-{self.visit(auminus.right)}"
+        self.write("Au-")
+        yield auminus.right
 
     def visit_ALiteral(self, aliteral: ALiteral):
-        return f"{aliteral.value}"
+        self.write(f"{aliteral.value}")
 
     def visit_Call(self, call: Call):
-        return f"{call.callee.name}({', '.join([self.visit(elem) for elem in call.arguments])})"
+        self.write(f"{call.callee.name}(")
+        yield from self.separated(call.arguments)
+        self.write(")")
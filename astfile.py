@@ -0,0 +1,279 @@
+import gc
+import mmap
+import struct
+from collections.abc import Sequence
+from contextlib import contextmanager
+from ast_tools import *
+
+# binary AST files:
+#   header   MAGIC, version (u8), 0 (u8), then u32 offsets of the string table and of the index,
+#            and u32 lengths of the program's var_decls, fun_decls and statements lists
+#   nodes    every top level declaration and statement as a record, see below
+#   strings  varint count, then each string as varint length and utf-8 bytes
+#   index    u32 offset of each top level record, in the order of the three lists
+# records are in post order, the records of a node's fields or of a list's elements come before its own.
+# a record is a tag byte, then for LIST the varint length, for IDENT the varint string id, lineno and index,
+# for STR the varint string id and for FLOAT 8 bytes. all integers are little endian.
+MAGIC = b"VOXAST"
+VERSION = 1
+HEADER = struct.Struct("<6sBx5I")
+
+IDENT, LIST, NONE, STR, FLOAT, FALSE, TRUE = range(len(NODE_TYPES), len(NODE_TYPES) + 7)
+NODE_TAG = {node: tag for tag, node in enumerate(NODE_TYPES)}
+double = struct.Struct("<d")
+u32 = struct.Struct("<I")
+
+
+class FormatError(Exception):
+    pass
+
+
+def write_varint(out, n):
+    while n >= 0x80:
+        out.append(n & 0x7F | 0x80)
+        n >>= 7
+    out.append(n)
+
+
+def read_varint(data, pos):
+    n = shift = 0
+    while True:
+        b = data[pos]
+        pos += 1
+        n |= (b & 0x7F) << shift
+        if b < 0x80:
+            return n, pos
+        shift += 7
+
+
+class Encoder:
+    def __init__(self):
+        self.out = bytearray(HEADER.size)
+        self.strings = {}
+
+    def string_id(self, s):
+        sid = self.strings.get(s)
+        if sid is None:
+            sid = self.strings[s] = len(self.strings)
+        return sid
+
+    def record(self, value):
+        """writes the records of value and everything below it in post order, children before their parent.
+        an explicit stack is used so the depth of the tree is not limited."""
+        out = self.out
+        # (value, whether its children have been written)
+        stack = [(value, False)]
+        while stack:
+            value, done = stack.pop()
+            tag = NODE_TAG.get(type(value))
+            if tag is not None:
+                if done:
+                    out.append(tag)
+                else:
+                    stack.append((value, True))
+                    stack.extend((getattr(value, name), False) for name in reversed(value.__slots__))
+            elif type(value) is list:
+                if done:
+                    out.append(LIST)
+                    write_varint(out, len(value))
+                else:
+                    stack.append((value, True))
+                    stack.extend((elem, False) for elem in reversed(value))
+            elif type(value) is Identifier:
+                out.append(IDENT)
+                write_varint(out, self.string_id(value.name))
+                write_varint(out, value.lineno)
+                write_varint(out, value.index)
+            elif value is None:
+                out.append(NONE)
+            elif type(value) is str:
+                out.append(STR)
+                write_varint(out, self.string_id(value))
+            elif type(value) is bool:
+                out.append(TRUE if value else FALSE)
+            elif type(value) is float:
+                out.append(FLOAT)
+                out += double.pack(value)
+            else:
+                raise TypeError(f"can't encode {value!r}")
+
+    def program(self, program):
+        index = []
+        for elems in (program.var_decls, program.fun_decls, program.statements):
+            for elem in elems:
+                index.append(len(self.out))
+                self.record(elem)
+
+        strings_offset = len(self.out)
+        write_varint(self.out, len(self.strings))
+        for s in self.strings:
+            b = s.encode()
+            write_varint(self.out, len(b))
+            self.out += b
+
+        index_offset = len(self.out)
+        for offset in index:
+            self.out += u32.pack(offset)
+
+        counts = (len(program.var_decls), len(program.fun_decls), len(program.statements))
+        HEADER.pack_into(self.out, 0, MAGIC, VERSION, strings_offset, index_offset, *counts)
+        return bytes(self.out)
+
+
+def dumps(program: Program) -> bytes:
+    return Encoder().program(program)
+
+
+def dump(program: Program, path):
+    with open(path, "wb") as f:
+        f.write(dumps(program))
+
+
+@contextmanager
+def paused_gc():
+    """pauses the cyclic garbage collector, which the many nodes allocated while decoding
+    would set off over and over although they can't form cycles."""
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+class Decoder:
+    """reads the records of a binary AST from a bytes like object, such as an mmap of the file."""
+
+    def __init__(self, data):
+        if len(data) < HEADER.size:
+            raise FormatError("truncated header")
+        magic, version, self.strings_offset, self.index_offset, *self.counts = HEADER.unpack_from(data, 0)
+        if magic != MAGIC:
+            raise FormatError("not a binary AST file")
+        if version != VERSION:
+            raise FormatError(f"unsupported version {version}")
+        self.data = data
+
+        count, pos = read_varint(data, self.strings_offset)
+        self.strings = strings = []
+        for _ in range(count):
+            n, pos = read_varint(data, pos)
+            strings.append(bytes(data[pos:pos + n]).decode())
+            pos += n
+
+    def top_level(self, i):
+        """the i-th top level declaration or statement, counting through the three lists of the program."""
+        start = u32.unpack_from(self.data, self.index_offset + 4 * i)[0]
+        if i + 1 < sum(self.counts):
+            end = u32.unpack_from(self.data, self.index_offset + 4 * i + 4)[0]
+        else:
+            end = self.strings_offset
+        return self.record(start, end)
+
+    def record(self, pos, end):
+        """the value of the records from pos to end, which are in post order: a node or list takes
+        the values of its fields from the top of the stack."""
+        with paused_gc():
+            return self._record(pos, end)
+
+    def _record(self, pos, end):
+        data = self.data
+        strings = self.strings
+        node_types = NODE_TYPES
+        stack = []
+        push = stack.append
+        while pos < end:
+            tag = data[pos]
+            pos += 1
+            if tag < IDENT:
+                cls = node_types[tag]
+                n = len(cls.__slots__)
+                if n:
+                    args = stack[-n:]
+                    del stack[-n:]
+                    push(cls(*args))
+                else:
+                    push(cls())
+            elif tag == IDENT:
+                sid, pos = read_varint(data, pos)
+                lineno, pos = read_varint(data, pos)
+                index, pos = read_varint(data, pos)
+                push(Identifier(strings[sid], lineno, index))
+            elif tag == LIST:
+                n, pos = read_varint(data, pos)
+                if n:
+                    elems = stack[-n:]
+                    del stack[-n:]
+                    push(elems)
+                else:
+                    push([])
+            elif tag == NONE:
+                push(None)
+            elif tag == STR:
+                sid, pos = read_varint(data, pos)
+                push(strings[sid])
+            elif tag == FLOAT:
+                push(double.unpack_from(data, pos)[0])
+                pos += 8
+            elif tag == FALSE or tag == TRUE:
+                push(tag == TRUE)
+            else:
+                raise FormatError(f"bad tag {tag} at {pos - 1}")
+
+        if len(stack) != 1:
+            raise FormatError(f"malformed record ending at {end}")
+        return stack[0]
+
+
+class LazyNodes(Sequence):
+    """one of the program's lists, its elements are decoded the first time they are read."""
+
+    def __init__(self, decoder, start, length):
+        self._decoder = decoder
+        self._start = start
+        self._nodes = [None] * length
+        self._decoded = [False] * length
+
+    def __len__(self):
+        return len(self._nodes)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self._nodes)
+        if not self._decoded[i]:
+            self._nodes[i] = self._decoder.top_level(self._start + i)
+            self._decoded[i] = True
+        return self._nodes[i]
+
+    def __eq__(self, other):
+        if isinstance(other, (list, LazyNodes)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self):
+        return repr(list(self))
+
+
+def loads(data, lazy=False) -> Program:
+    decoder = Decoder(data)
+    lists = []
+    start = 0
+    for n in decoder.counts:
+        if lazy:
+            lists.append(LazyNodes(decoder, start, n))
+        else:
+            with paused_gc():
+                lists.append([decoder.top_level(i) for i in range(start, start + n)])
+        start += n
+    return Program(*lists)
+
+
+def load(path, lazy=True) -> Program:
+    """the program in the binary AST file at path. the file is mapped into memory, and unless lazy is False
+    its top level declarations and statements are only decoded when they are first read."""
+    with open(path, "rb") as f:
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return loads(data, lazy)
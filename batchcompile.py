@@ -0,0 +1,164 @@
+import argparse
+import multiprocessing
+import os
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import buildcache
+import misc
+# imported before the workers are forked, they share the LALR tables instead of each loading them
+import parser
+import voxc
+
+# set in each worker process by init_worker()
+assembler_slots = None
+fun_cache = None
+
+
+def init_worker(slots):
+    global assembler_slots, fun_cache
+    assembler_slots = slots
+    fun_cache = buildcache.FunctionCache()
+
+
+def compile_file(index, args):
+    """compiles one program with voxc.build(), args are its voxc.py options. returns index, whether it compiled,
+    what was written to stdout and stderr, and the time it took."""
+    start = time.perf_counter()
+    with voxc.captured_output() as output:
+        try:
+            ok = voxc.build(args, fun_cache, assembler_slots)
+        except Exception:
+            traceback.print_exc()
+            ok = False
+    return index, ok, output["stdout"] + output["stderr"], time.perf_counter() - start
+
+
+def read_manifest(path):
+    """the sources listed in the manifest at path, one on each line. blank lines and lines starting with # are
+    skipped, relative paths are relative to the manifest's directory."""
+    sources = []
+    base = os.path.dirname(path)
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith("#"):
+                sources.append(os.path.join(base, line))
+    return sources
+
+
+def outputs(sources, out_dir, asm):
+    """the binary and assembly (or "") paths of each source: the source's path without .vox and with .s, in
+    out_dir if it is given."""
+    result = []
+    for source in sources:
+        stem = os.path.splitext(source)[0]
+        if out_dir is not None:
+            stem = os.path.join(out_dir, os.path.basename(stem))
+        result.append((stem, stem + ".s" if asm else ""))
+    return result
+
+
+def conflict(sources, paths):
+    """why the outputs at paths, from outputs(), can't be written: an output that is a source or that two sources
+    share. None if they can."""
+    writers = {}
+    for source, outs in zip(sources, paths):
+        for path in outs:
+            if path:
+                writers.setdefault(os.path.abspath(path), []).append(source)
+    for source in sources:
+        if os.path.abspath(source) in writers:
+            return f"the output of {writers[os.path.abspath(source)][0]} would overwrite the source {source}"
+    for path, shared in writers.items():
+        if len(shared) > 1:
+            return f"{' and '.join(shared)} would have the same output {path}"
+    return None
+
+
+def report(source, ok, output, seconds):
+    """prints the result of a program, with its throughput and the messages of the compiler indented."""
+    status = "ok" if ok else "FAILED"
+    size = os.path.getsize(source)
+    print(f"{source:<40} {status:<6} {seconds * 1000:9.1f} ms {size / 1024 / seconds:9.1f} KiB/s")
+    for line in output.splitlines():
+        print("    " + line)
+    sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    argparser = argparse.ArgumentParser(
+        prog="batchcompile.py",
+        description="compiles many Vox programs on a pool of processes",
+    )
+    argparser.add_argument("sources", nargs="*", help="source files to be compiled")
+    argparser.add_argument("--manifest", help="file listing more sources, one on each line")
+    argparser.add_argument("--out-dir", help="where the outputs go, next to the sources by default")
+    argparser.add_argument("--asm", action="store_true", help="also write the assembly of every program")
+    argparser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(), help="number of worker processes")
+    argparser.add_argument(
+        "--assemblers", type=int,
+        help="number of gcc assemblers that run at once with --assembler gcc, --jobs by default")
+    argparser.add_argument(
+        "--ordered", action="store_true", help="report the programs in the order they are given")
+    argparser.add_argument(
+        "--lexer", choices=list(misc.LEXERS), default="dfa", help="scanner backend")
+    argparser.add_argument(
+        "--parser", choices=misc.PARSERS, default="rd", help="parser backend")
+    argparser.add_argument(
+        "--assembler", choices=voxc.ASSEMBLERS, default="builtin",
+        help="assemble and link in process, or with riscv64-linux-gnu-gcc and libc")
+    argparser.add_argument(
+        "-O", "--optimize", action="store_true", help="generate the code through the SSA IR")
+    argparser.add_argument(
+        "--no-cache", action="store_true", help="neither look the programs up in the compile cache nor add them")
+
+    args = argparser.parse_args()
+    sources = list(args.sources)
+    if args.manifest:
+        sources += read_manifest(args.manifest)
+    if not sources:
+        argparser.error("no sources given")
+    paths = outputs(sources, args.out_dir, args.asm)
+    message = conflict(sources, paths)
+    if message:
+        argparser.error(message)
+    if args.out_dir:
+        os.makedirs(args.out_dir, exist_ok=True)
+
+    jobs = []
+    for source, (binary, asm) in zip(sources, paths):
+        jobs.append(argparse.Namespace(
+            filename=source, o=binary, c=asm, lexer=args.lexer, parser=args.parser, stream=False, jobs=1,
+            assembler=args.assembler, optimize=args.optimize, no_cache=args.no_cache,
+        ))
+
+    # the workers are forked before any thread is started, and inherit the loaded modules
+    context = multiprocessing.get_context("fork")
+    slots = context.BoundedSemaphore(args.assemblers or args.jobs)
+    start = time.perf_counter()
+    failed = 0
+    with ProcessPoolExecutor(args.jobs, context, initializer=init_worker, initargs=(slots,)) as pool:
+        futures = [pool.submit(compile_file, i, job) for i, job in enumerate(jobs)]
+        results = [None] * len(jobs)
+        reported = 0
+        for future in as_completed(futures):
+            index, ok, output, seconds = future.result()
+            failed += not ok
+            if not args.ordered:
+                report(sources[index], ok, output, seconds)
+                continue
+            # everything up to the first program that isn't done yet
+            results[index] = (ok, output, seconds)
+            while reported < len(results) and results[reported] is not None:
+                report(sources[reported], *results[reported])
+                reported += 1
+
+    elapsed = time.perf_counter() - start
+    size = sum(os.path.getsize(source) for source in sources)
+    print(
+        f"{len(sources)} programs, {failed} failed, in {elapsed:.3f} s: "
+        f"{len(sources) / elapsed:.1f} programs/s, {size / 1024 / elapsed:.1f} KiB/s"
+    )
+    sys.exit(1 if failed else 0)
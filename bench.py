@@ -0,0 +1,612 @@
+#!/usr/bin/env python3
+
+import argparse
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def report(name, samples):
+    print(f"{name:<28} median {statistics.median(samples) * 1000:9.3f} ms   min {min(samples) * 1000:9.3f} ms")
+
+
+def bench_import(args):
+    """cold (empty table cache) vs warm import time of parser.py, each in a fresh interpreter."""
+    cache_dir = tempfile.mkdtemp(prefix="vox-bench-")
+    env = dict(os.environ, VOX_CACHE_DIR=cache_dir)
+    snippet = "import time;t=time.perf_counter();import parser;print(time.perf_counter()-t)"
+
+    def run():
+        out = subprocess.run(
+            [sys.executable, "-c", snippet], cwd=HERE, env=env, capture_output=True, text=True
+        )
+        return float(out.stdout)
+
+    cold, warm = [], []
+    for _ in range(args.n):
+        shutil.rmtree(cache_dir, ignore_errors=True)
+        cold.append(run())
+        warm.append(run())
+    shutil.rmtree(cache_dir, ignore_errors=True)
+
+    report("import parser (cold)", cold)
+    report("import parser (warm)", warm)
+
+
+def generated_source(size):
+    """concatenates the codegen tests until the source is about size bytes long."""
+    chunks = []
+    tests = sorted(os.listdir(os.path.join(HERE, "codegen_tests")))
+    for name in tests:
+        with open(os.path.join(HERE, "codegen_tests", name)) as f:
+            chunks.append(f.read() + "\n")
+    chunk = "".join(chunks)
+    return chunk * max(1, size // len(chunk))
+
+
+PROGRAM_FUN = """
+fun f{i}(a, b)
+{{
+	var x = a * 2 + b;
+	var v = [1, 2.5, a, -b];
+	if x > 10 and !(b == 3) {{
+		x = x - 1;
+	}} else {{
+		v[0] = #f{i}(x, 1);
+	}}
+	while x < 100 or # v[1] {{
+		x = x + v[0] * (a - 1) / 4;
+	}}
+	for (x = 0; x < b; x = x + 1) print "loop";
+	return x;
+}}
+"""
+
+
+def generated_program(size):
+    """a valid program of about size bytes: global variables, many functions and statements calling them."""
+    n = max(1, size // (len(PROGRAM_FUN) + 64))
+    parts = [f"var g{i} = {i};\n" for i in range(n)]
+    parts += [PROGRAM_FUN.format(i=i) for i in range(n)]
+    parts += [f"g{i} = f{i}(g{i}, {i});\nprint g{i};\n" for i in range(n)]
+    return "".join(parts)
+
+
+STREAM_STATEMENTS = """g{i} = f{i}(g{j}, {k});
+if g{i} > 10 {{
+	var t = g{i} - 1;
+	print t;
+}} else {{
+	print "small";
+}}
+"""
+
+
+def streamed_program(size):
+    """a program of about size bytes that the code generator compiles: a few globals and functions, and then
+    statements with blocks and string literals until the size is reached."""
+    parts = [f"var g{i} = {i};\n" for i in range(16)]
+    parts += [
+        f"fun f{i}(a, b)\n{{\n\tvar x = a * 2 + b;\n\twhile x < 100 {{\n\t\tx = x + b;\n\t}}\n\treturn x;\n}}\n"
+        for i in range(16)
+    ]
+    n = sum(map(len, parts))
+    k = 0
+    while n < size:
+        parts.append(STREAM_STATEMENTS.format(i=k % 16, j=(k + 3) % 16, k=k))
+        n += len(parts[-1])
+        k += 1
+    return "".join(parts)
+
+
+def timed(fn, n):
+    samples = []
+    for _ in range(n):
+        t = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - t)
+    return samples
+
+
+def peak_memory(fn):
+    tracemalloc.start()
+    result = fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak, result
+
+
+def bench_scan(args):
+    """tokenizes a generated source with every lexer backend, and compares the memory
+    of keeping all tokens as sly Token objects against a TokenBuffer."""
+    from misc import LEXERS
+    from tokenbuf import TokenBuffer
+
+    source = generated_source(args.size)
+    for name, lexer in LEXERS.items():
+        samples = timed(lambda: sum(1 for _ in lexer().tokenize(source)), args.n)
+        report(f"scan {name} ({len(source) >> 10} KiB)", samples)
+    report("scan into TokenBuffer", timed(lambda: TokenBuffer(source), args.n))
+
+    peak, tokens = peak_memory(lambda: list(LEXERS["sly"]().tokenize(source)))
+    print(f"Token list: {peak / len(tokens):.1f} bytes per token")
+    peak, tokens = peak_memory(lambda: TokenBuffer(source))
+    print(f"TokenBuffer: {peak / len(tokens):.1f} bytes per token")
+
+
+INGEST = """
+import resource, sys, time
+import misc
+
+def read_whole(path):
+    code = ""
+    with open(path) as f:
+        for line in f.readlines():
+            code += line
+    return misc.tokenize(code, "sly")
+
+def stream(path):
+    with open(path) as f:
+        yield from misc.tokenize(f, "dfa")
+
+t = time.perf_counter()
+toks = iter({reader}(sys.argv[1]))
+next(toks)
+first = time.perf_counter() - t
+for _ in toks:
+    pass
+total = time.perf_counter() - t
+print(first, total, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+"""
+
+
+def bench_ingest(args):
+    """time to first token, total time and peak RSS of tokenizing a generated file, reading it whole
+    (as voxc.py used to) against streaming it in bounded chunks. each run is a fresh interpreter."""
+    # written piecewise, a forked child starts with the peak RSS of its parent
+    chunk = generated_source(0)
+    fd, path = tempfile.mkstemp(suffix=".vox")
+    with os.fdopen(fd, "w") as f:
+        for _ in range(max(1, args.size // len(chunk))):
+            f.write(chunk)
+
+    for name, reader in (("whole file, sly", "read_whole"), ("streamed, dfa", "stream")):
+        out = subprocess.run(
+            [sys.executable, "-c", INGEST.format(reader=reader), path],
+            cwd=HERE, capture_output=True, text=True,
+        )
+        first, total, rss = out.stdout.split()
+        print(
+            f"{name:<18} first token {float(first) * 1000:9.3f} ms   all tokens {float(total) * 1000:9.3f} ms   "
+            f"peak RSS {int(rss) / 1024:8.2f} MiB"
+        )
+    os.remove(path)
+
+
+def bench_lists(args):
+    """parse time of long vector initializers and long blocks, growing tenfold per row."""
+    import misc
+
+    for n in (1000, 10000, 100000):
+        vector = "var v = [" + ", ".join(str(i) for i in range(n)) + "];"
+        block = "while true {" + "print 1;" * n + "}"
+        for name, source in ((f"{n} element vector", vector), (f"{n} statement block", block)):
+            samples = timed(lambda: misc.process(source, "dfa"), args.n)
+            report(name, samples)
+
+
+def bench_parse(args):
+    """parser throughput in tokens per second on a generated program, the tokens are scanned beforehand into a
+    TokenBuffer. the lalr parser reads views of its tokens, the rd parser reads it by index."""
+    import misc
+    from parser import Parser
+    from rdparser import RDParser
+
+    source = generated_program(args.size)
+    tokens = misc.tokenize(source, "dfa")
+    for name, parse in (("lalr", lambda: Parser().parse(iter(tokens))), ("rd", lambda: RDParser().parse(tokens))):
+        samples = timed(parse, args.n)
+        report(f"parse {name} ({len(tokens)} tokens)", samples)
+        print(f"{'':<28} {len(tokens) / statistics.median(samples) / 1e6:.3f} M tokens/s")
+
+
+def footprint(root):
+    """number of nodes (identifiers included) of an AST and the bytes held by its nodes, lists and values,
+    each object is counted once."""
+    from ast_tools import Slotted
+
+    seen = set()
+    nodes = size = 0
+    stack = [root]
+    while stack:
+        obj = stack.pop()
+        if obj is None or id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+        if isinstance(obj, list):
+            stack.extend(obj)
+        elif isinstance(obj, Slotted):
+            nodes += 1
+            stack.extend(getattr(obj, name) for name in obj.__slots__)
+        elif hasattr(obj, "__dict__"):
+            nodes += 1
+            size += sys.getsizeof(obj.__dict__)
+            stack.extend(vars(obj).values())
+    return nodes, size
+
+
+def dict_copy(obj, classes):
+    """copies an AST into plain classes with a per instance __dict__ and a string per identifier,
+    which is how the nodes were stored before they had slots."""
+    from ast_tools import Identifier, Slotted
+
+    if isinstance(obj, list):
+        return [dict_copy(elem, classes) for elem in obj]
+    if not isinstance(obj, Slotted):
+        return obj
+    cls = type(obj)
+    if cls not in classes:
+        classes[cls] = type(cls.__name__, (), {})
+    copy = classes[cls]()
+    for name in cls.__slots__:
+        value = getattr(obj, name)
+        if cls is Identifier and name == "name":
+            value = (value + " ")[:-1]
+        setattr(copy, name, dict_copy(value, classes))
+    return copy
+
+
+def bench_nodes(args):
+    """bytes per node of the AST of a generated program, with the slotted node classes
+    and with a copy of it into classes with a per instance __dict__."""
+    import misc
+    from rdparser import RDParser
+
+    ast = RDParser().parse(misc.tokenize(generated_program(args.size), "dfa"))
+    for name, root in (("__dict__ nodes", dict_copy(ast, {})), ("slotted nodes", ast)):
+        nodes, size = footprint(root)
+        print(f"{name:<15} {nodes} nodes   {size / nodes:6.1f} bytes per node")
+
+
+def bench_deep(args):
+    """the visitors on an assignment of a long chain of additions, a left leaning tree as deep as the chain."""
+    import misc
+    from ast_tools import PrintVisitor
+    from codegen import CodeGenerator
+
+    for n in (1000, 5000, 20000):
+        source = "var x = 1;\nx = " + " + ".join(["x"] * n) + ";\nprint x;\n"
+        intermediate = misc.process(source, "dfa", "rd")
+        ast = intermediate.ast
+        report(f"print {n} terms", timed(lambda: PrintVisitor().visit(ast), args.n))
+        report(f"analyze {n} terms", timed(lambda: intermediate.visit(ast), args.n))
+        report(f"codegen {n} terms", timed(lambda: CodeGenerator(ast, intermediate.bindings).code, args.n))
+
+
+def bench_scopes(args):
+    """analysis and codegen of programs with n globals and n functions, every statement refers to the last
+    declared ones so each lookup has to get past all the others."""
+    import misc
+    from codegen import CodeGenerator
+
+    for n in (100, 1000, 10000):
+        source = "".join(f"var g{i} = {i};\n" for i in range(n))
+        source += "".join(f"fun f{i}(a) {{\n\tvar l = a;\n\treturn l + g{i};\n}}\n" for i in range(n))
+        source += "".join(f"g{n - 1} = f{n - 1}(g{i});\n" for i in range(n))
+        intermediate = misc.process(source, "dfa", "rd")
+        report(f"parse+analyze {n} decls", timed(lambda: misc.process(source, "dfa", "rd"), args.n))
+        report(f"codegen {n} decls", timed(lambda: CodeGenerator(intermediate.ast, intermediate.bindings).code, args.n))
+
+
+def bench_astfile(args):
+    """round trips the pickled ASTs of parser_tests/ and the AST of a generated program through the binary
+    AST format, and compares file sizes and load times with pickle."""
+    import glob
+    import pickle
+    import astfile
+    import misc
+
+    asts = []
+    for path in sorted(glob.glob(os.path.join(HERE, "parser_tests", "*.ast.pkl"))):
+        with open(path, "rb") as f:
+            asts.append((os.path.basename(path)[: -len(".ast.pkl")], f.read()))
+    program = misc.parse(generated_program(args.size), "dfa", "rd")
+    asts.append(("generated", pickle.dumps(program)))
+
+    fd, path = tempfile.mkstemp(suffix=".ast.bin")
+    os.close(fd)
+    for name, pickled in asts:
+        ast = pickle.loads(pickled)
+        astfile.dump(ast, path)
+        assert astfile.load(path) == ast and astfile.load(path, lazy=False) == ast, f"{name} does not round trip"
+        with open(path, "rb") as f:
+            data = f.read()
+        print(f"{name}: pickle {len(pickled)} bytes, binary {len(data)} bytes")
+        report(f"  load pickle", timed(lambda: pickle.loads(pickled), args.n))
+        report(f"  load binary", timed(lambda: astfile.loads(data), args.n))
+        report(f"  mmap binary, lazy", timed(lambda: astfile.load(path), args.n))
+    os.remove(path)
+
+
+def bench_print(args):
+    """PrintVisitor on loops nested n deep, the time per byte of output should not grow with n."""
+    import misc
+    from ast_tools import PrintVisitor
+
+    for n in (200, 400, 800, 1600):
+        source = "while true {\n" * n + "print 1;\n" + "}\n" * n
+        ast = misc.parse(source, "dfa", "rd")
+        size = len(PrintVisitor().visit(ast))
+        samples = timed(lambda: PrintVisitor().visit(ast), args.n)
+        report(f"print {n} deep", samples)
+        print(f"{'':<28} {size >> 10} KiB, {statistics.median(samples) / size * 1e9:.2f} ns per byte")
+
+
+def bench_codegen(args):
+    """codegen, including rendering the assembly, of loops nested n deep and of n statements in a row, with the
+    peak memory of one run."""
+    import misc
+    from codegen import CodeGenerator
+
+    sources = []
+    for n in (100, 400, 1600):
+        sources.append((f"{n} deep", "var x = 0;\n" + "while x < 1 {\n" * n + "x = x + 1;\n" + "}\n" * n))
+    for n in (1000, 10000, 50000):
+        sources.append((f"{n} statements", "var x = 0;\n" + "x = x + 1;\nprint x;\n" * (n // 2)))
+    for name, source in sources:
+        intermediate = misc.process(source, "dfa", "rd")
+        run = lambda: CodeGenerator(intermediate.ast, intermediate.bindings).code
+        peak, code = peak_memory(run)
+        report(f"codegen {name}", timed(run, args.n))
+        print(f"{'':<28} {len(code) >> 10} KiB of assembly, peak {peak >> 10} KiB")
+
+
+FUNCTION_CACHE_FUN = """fun f{i}(a, b)
+{{
+	var x = a * 2 + g{i};
+	var v = [1, 2.5, a, -b];
+	while x < {limit} {{
+		x = x + v[1] * b;
+		if x > 10 and !(b == 3) {{
+			print "big";
+		}}
+	}}
+	return x;
+}}
+"""
+
+
+def bench_functions(args):
+    """codegen of a program of many functions with a buildcache.FunctionCache: empty, holding every function
+    and holding all but the one that was edited, against no cache."""
+    import misc
+    from buildcache import FunctionCache
+    from codegen import CodeGenerator
+
+    def program(edited=None):
+        parts = [f"var g{i} = {i};\n" for i in range(400)]
+        parts += [FUNCTION_CACHE_FUN.format(i=i, limit=101 if i == edited else 100) for i in range(400)]
+        parts += [f"g{i} = f{i}(g{i}, {i});\n" for i in range(400)]
+        return "".join(parts)
+
+    original = misc.process(program(), "dfa", "rd")
+    edited = misc.process(program(edited=200), "dfa", "rd")
+    warm = FunctionCache()
+    CodeGenerator(original.ast, original.bindings, warm).code
+
+    def run(intermediate, fun_cache):
+        return lambda: CodeGenerator(intermediate.ast, intermediate.bindings, fun_cache).code
+
+    report("400 functions, no cache", timed(run(original, None), args.n))
+    report("400 functions, cold cache", timed(lambda: run(original, FunctionCache())(), args.n))
+    report("400 functions, warm cache", timed(run(original, warm), args.n))
+    report("1 of 400 edited", timed(run(edited, warm), args.n))
+
+
+def bench_jobs(args):
+    """codegen of a program of 4000 functions by 1, 2 and 4 processes."""
+    import misc
+    from codegen import CodeGenerator
+
+    parts = [f"var g{i} = {i};\n" for i in range(4000)]
+    parts += [FUNCTION_CACHE_FUN.format(i=i, limit=100) for i in range(4000)]
+    intermediate = misc.process("".join(parts), "dfa", "rd")
+    print(f"{len(os.sched_getaffinity(0))} cores")
+    for jobs in (1, 2, 4):
+        run = lambda: CodeGenerator(intermediate.ast, intermediate.bindings, jobs=jobs).code
+        report(f"4000 functions, {jobs} jobs", timed(run, args.n))
+
+
+def bench_assemble(args):
+    """the builtin assembler on the code of a program of --size bytes, from the records of the code generator
+    and from its text, against riscv64-linux-gnu-gcc if it is installed."""
+    import misc
+    import rvasm
+    from codegen import CodeGenerator
+
+    intermediate = misc.process(streamed_program(args.size), "dfa", "rd")
+    generator = CodeGenerator(intermediate.ast, intermediate.bindings)
+    code = generator.code
+    print(f"{len(code) >> 10} KiB of assembly, {code.count(chr(10))} lines")
+
+    def records():
+        assembler = rvasm.Assembler()
+        assembler.add(generator.asm)
+        return assembler.link()
+
+    report("builtin, records", timed(records, args.n))
+    report("builtin, text", timed(lambda: rvasm.assemble(code), args.n))
+    if shutil.which("riscv64-linux-gnu-gcc") is None:
+        print("riscv64-linux-gnu-gcc not found, skipping gcc")
+        return
+    fd, binary = tempfile.mkstemp()
+    os.close(fd)
+    cmd = ["riscv64-linux-gnu-gcc", "-march=rv64gcv", "-static", "-o", binary, "-xassembler", "-"]
+    report("gcc", timed(lambda: subprocess.run(cmd, input=code, text=True, check=True), args.n))
+    os.remove(binary)
+
+
+def bench_stream(args):
+    """peak RSS of compiling programs of growing size as a whole and with voxc.compile_stream(), each in a fresh
+    interpreter that writes the assembly to /dev/null. the streaming one should stay flat."""
+    whole = (
+        "import misc, codegen\n"
+        "with open(path) as f:\n"
+        "    intermediate = misc.process(f, 'dfa', 'rd')\n"
+        "code = codegen.CodeGenerator(intermediate.ast, intermediate.bindings).code\n"
+        "with open(os.devnull, 'w') as out:\n"
+        "    out.write(code)\n"
+    )
+    streamed = (
+        "import voxc\n"
+        "with open(path) as f, open(os.devnull, 'w') as out:\n"
+        "    voxc.compile_stream(f, out)\n"
+    )
+    # VmHWM, unlike ru_maxrss, does not carry over the peak of this process through fork and exec
+    report_rss = "print(next(int(l.split()[1]) for l in open('/proc/self/status') if l.startswith('VmHWM')))\n"
+
+    fd, path = tempfile.mkstemp(suffix=".vox")
+    os.close(fd)
+    for size in (args.size, 4 * args.size, 16 * args.size):
+        with open(path, "w") as f:
+            f.write(streamed_program(size))
+        for name, snippet in (("whole", whole), ("stream", streamed)):
+            code = f"import os\npath = {path!r}\n" + snippet + report_rss
+            t = time.perf_counter()
+            out = subprocess.run([sys.executable, "-c", code], cwd=HERE, capture_output=True, text=True, check=True)
+            elapsed = time.perf_counter() - t
+            print(f"{name} {size >> 10} KiB".ljust(28), f"{elapsed:9.3f} s   peak RSS {int(out.stdout) >> 10} MiB")
+    os.remove(path)
+
+
+def bench_cache(args):
+    """voxc.py on a program of --size bytes with an empty compile cache, and again when it is cached and neither
+    the compiler nor the assembler runs."""
+    cache_dir = tempfile.mkdtemp(prefix="vox-bench-")
+    env = dict(os.environ, VOX_CACHE_DIR=cache_dir)
+    fd, path = tempfile.mkstemp(suffix=".vox")
+    os.close(fd)
+    with open(path, "w") as f:
+        f.write(streamed_program(args.size))
+    binary = path + ".out"
+
+    def run():
+        t = time.perf_counter()
+        subprocess.run([sys.executable, "voxc.py", path, "-o", binary], cwd=HERE, env=env, check=True)
+        return time.perf_counter() - t
+
+    miss, hit = [], []
+    for _ in range(args.n):
+        shutil.rmtree(cache_dir, ignore_errors=True)
+        miss.append(run())
+        hit.append(run())
+    shutil.rmtree(cache_dir, ignore_errors=True)
+    os.remove(path)
+    os.remove(binary)
+
+    report(f"voxc {args.size >> 10} KiB (miss)", miss)
+    report(f"voxc {args.size >> 10} KiB (hit)", hit)
+
+
+def bench_server(args):
+    """voxc.py against voxclient.py with a running compileserver.py, compiling a small program without the
+    compile cache, one at a time and 8 at once."""
+    tmp = tempfile.mkdtemp(prefix="vox-bench-")
+    env = dict(os.environ, VOX_SERVER_SOCKET=os.path.join(tmp, "server.sock"))
+    path = os.path.join(tmp, "program.vox")
+    with open(path, "w") as f:
+        f.write(streamed_program(args.size))
+    server = subprocess.Popen(
+        [sys.executable, "compileserver.py", "--workers", "4"], cwd=HERE, env=env, stderr=subprocess.DEVNULL
+    )
+
+    def start(script, i=0):
+        return subprocess.Popen(
+            [sys.executable, script, path, "-o", os.path.join(tmp, f"{i}.out"), "--no-cache"], cwd=HERE, env=env
+        )
+
+    def run(script, parallel):
+        t = time.perf_counter()
+        for p in [start(script, i) for i in range(parallel)]:
+            p.wait()
+        return time.perf_counter() - t
+
+    try:
+        while not os.path.exists(env["VOX_SERVER_SOCKET"]):
+            time.sleep(0.05)
+        run("voxclient.py", 4)
+        for parallel in (1, 8):
+            report(f"voxc.py x{parallel}", [run("voxc.py", parallel) for _ in range(args.n)])
+            report(f"voxclient.py x{parallel}", [run("voxclient.py", parallel) for _ in range(args.n)])
+        subprocess.run([sys.executable, "compileserver.py", "--stats"], cwd=HERE, env=env)
+    finally:
+        server.terminate()
+        server.wait()
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def bench_batch(args):
+    """the codegen tests copied 8 times, compiled without the compile cache by one voxc.py process each and by
+    batchcompile.py."""
+    tmp = tempfile.mkdtemp(prefix="vox-bench-")
+    sources = []
+    for name in sorted(os.listdir(os.path.join(HERE, "codegen_tests"))):
+        for i in range(8):
+            sources.append(os.path.join(tmp, f"{i}_{name}"))
+            shutil.copyfile(os.path.join(HERE, "codegen_tests", name), sources[-1])
+
+    def processes():
+        for source in sources:
+            subprocess.run(
+                [sys.executable, "voxc.py", source, "-o", source + ".out", "--no-cache"], cwd=HERE,
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+            )
+
+    def batch():
+        subprocess.run(
+            [sys.executable, "batchcompile.py", *sources, "--no-cache"], cwd=HERE,
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+
+    report(f"{len(sources)} programs, voxc.py", timed(processes, args.n))
+    report(f"{len(sources)} programs, batch", timed(batch, args.n))
+    shutil.rmtree(tmp, ignore_errors=True)
+
+
+BENCHMARKS = {
+    "import": bench_import,
+    "scan": bench_scan,
+    "ingest": bench_ingest,
+    "lists": bench_lists,
+    "parse": bench_parse,
+    "nodes": bench_nodes,
+    "deep": bench_deep,
+    "scopes": bench_scopes,
+    "astfile": bench_astfile,
+    "print": bench_print,
+    "codegen": bench_codegen,
+    "functions": bench_functions,
+    "jobs": bench_jobs,
+    "assemble": bench_assemble,
+    "stream": bench_stream,
+    "cache": bench_cache,
+    "server": bench_server,
+    "batch": bench_batch,
+}
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument("benchmark", choices=list(BENCHMARKS))
+    arg_parser.add_argument("-n", type=int, default=10, help="repetitions")
+    arg_parser.add_argument("--size", type=int, default=1 << 20, help="size of generated sources in bytes")
+
+    args = arg_parser.parse_args()
+    BENCHMARKS[args.benchmark](args)
@@ -0,0 +1,269 @@
+import fcntl
+import functools
+import glob
+import hashlib
+import json
+import marshal
+import os
+import shutil
+import tempfile
+import time
+from lrcache import CACHE_DIR
+
+# compiled programs, content addressed: every entry is a directory named by its key holding the assembly and the
+# binary. an entry is written in a private directory under tmp/ and renamed into place, and renamed back into
+# tmp/ before it is deleted, so readers only ever see whole entries. the mtime of an entry is its last use.
+ENTRIES_DIR = os.path.join(CACHE_DIR, "voxc")
+TMP_DIR = os.path.join(ENTRIES_DIR, "tmp")
+STATS_PATH = os.path.join(ENTRIES_DIR, "stats.json")
+MAX_SIZE = int(os.environ.get("VOX_CACHE_SIZE", 256 << 20))
+# a private directory this old was left by a writer that died
+STALE_TMP_AGE = 3600
+
+ASM = "out.s"
+BINARY = "a.out"
+# functions kept by a FunctionCache
+MAX_FUNCTIONS = 4096
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+@functools.cache
+def compiler_version():
+    """hash of the compiler's own sources, a changed module invalidates every entry."""
+    h = hashlib.sha256()
+    for path in sorted(glob.glob(os.path.join(HERE, "*.py"))) + [os.path.join(HERE, "vox_grammar.txt")]:
+        with open(path, "rb") as f:
+            h.update(os.path.basename(path).encode() + b"\0" + f.read())
+    return h.hexdigest()
+
+
+def cache_key(source_path, flags):
+    """hash of the source's bytes, the compiler version and the flags that change the output."""
+    h = hashlib.sha256()
+    h.update(compiler_version().encode())
+    h.update(json.dumps(flags, sort_keys=True).encode())
+    with open(source_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()[:32]
+
+
+def entry_path(key):
+    return os.path.join(ENTRIES_DIR, key)
+
+
+def lookup(key):
+    """(assembly path, binary path) of the entry for key, marked as just used, or None on a miss. the files
+    may be evicted by another process at any time, opening them can fail."""
+    path = entry_path(key)
+    try:
+        os.utime(path)
+    except OSError:
+        count("misses")
+        return None
+    count("hits")
+    return os.path.join(path, ASM), os.path.join(path, BINARY)
+
+
+def fetch(key, asm_out, binary_out):
+    """copies the entry for key to asm_out (unless it is empty) and binary_out. False on a miss."""
+    entry = lookup(key)
+    if entry is None:
+        return False
+    asm, binary = entry
+    try:
+        if asm_out:
+            shutil.copyfile(asm, asm_out)
+        shutil.copyfile(binary, binary_out)
+        shutil.copymode(binary, binary_out)
+    except OSError:
+        # evicted between the lookup and the copy
+        return False
+    return True
+
+
+class Pending:
+    """an entry being written. the assembly and the binary are written to asm_path and binary_path, and the
+    entry becomes visible with commit(). if another process committed the same key first, its entry is kept.
+    raises OSError if the cache directory can't be created."""
+
+    def __init__(self, key):
+        self.key = key
+        os.makedirs(TMP_DIR, exist_ok=True)
+        self.dir = tempfile.mkdtemp(prefix=f"{key}.", dir=TMP_DIR)
+        self.asm_path = os.path.join(self.dir, ASM)
+        self.binary_path = os.path.join(self.dir, BINARY)
+
+    def commit(self):
+        if sum(f.stat().st_size for f in os.scandir(self.dir)) > MAX_SIZE:
+            # it would evict everything else, itself included
+            self.abort()
+            return
+        try:
+            os.rename(self.dir, entry_path(self.key))
+        except OSError:
+            # the key is already cached, the entries are the same
+            self.abort()
+            return
+        count("stores")
+        evict()
+
+    def abort(self):
+        shutil.rmtree(self.dir, ignore_errors=True)
+
+
+def entries():
+    """(mtime, size, path) of every entry, none if the cache directory is missing."""
+    result = []
+    try:
+        it = os.scandir(ENTRIES_DIR)
+    except OSError:
+        return result
+    with it:
+        for entry in it:
+            if not entry.is_dir() or entry.name == "tmp":
+                continue
+            try:
+                size = sum(f.stat().st_size for f in os.scandir(entry.path))
+                result.append((entry.stat().st_mtime, size, entry.path))
+            except OSError:
+                # evicted by another process
+                continue
+    return result
+
+
+def evict(max_size=MAX_SIZE):
+    """removes the least recently used entries until the cache holds at most max_size bytes, and what writers
+    that died left in tmp/."""
+    current = entries()
+    total = sum(size for _, size, _ in current)
+    evicted = 0
+    for _, size, path in sorted(current):
+        if total <= max_size:
+            break
+        if remove(path):
+            evicted += 1
+        total -= size
+    if evicted:
+        count("evictions", evicted)
+
+    now = time.time()
+    with os.scandir(TMP_DIR) as it:
+        for entry in it:
+            try:
+                if now - entry.stat().st_mtime > STALE_TMP_AGE:
+                    shutil.rmtree(entry.path, ignore_errors=True)
+            except OSError:
+                continue
+
+
+def remove(path):
+    """deletes an entry, unless another process already did."""
+    trash = tempfile.mkdtemp(prefix="evicted.", dir=TMP_DIR)
+    try:
+        os.rename(path, os.path.join(trash, "entry"))
+    except OSError:
+        os.rmdir(trash)
+        return False
+    shutil.rmtree(trash, ignore_errors=True)
+    return True
+
+
+def count(name, n=1):
+    """adds n to a counter of the stats file, which is locked while it is updated."""
+    try:
+        os.makedirs(ENTRIES_DIR, exist_ok=True)
+        with open(STATS_PATH, "a+") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            f.seek(0)
+            try:
+                stats = json.loads(f.read() or "{}")
+            except ValueError:
+                stats = {}
+            stats[name] = stats.get(name, 0) + n
+            f.seek(0)
+            f.truncate()
+            f.write(json.dumps(stats))
+    except OSError:
+        pass
+
+
+def stats():
+    """the hit, miss, store and eviction counters, and the number and total size of the entries."""
+    try:
+        with open(STATS_PATH) as f:
+            fcntl.flock(f, fcntl.LOCK_SH)
+            result = json.loads(f.read() or "{}")
+    except (OSError, ValueError):
+        result = {}
+    for name in ("hits", "misses", "stores", "evictions"):
+        result.setdefault(name, 0)
+    current = entries()
+    result["entries"] = len(current)
+    result["size"] = sum(size for _, size, _ in current)
+    return result
+
+
+class FunctionCache:
+    """the code of functions for codegen.CodeGenerator, by the keys it computes. at most max_entries are kept, the
+    least recently used are dropped. with a path, the entries are loaded from the file and save() writes them back,
+    concurrent compilers may overwrite each other's entries but never leave a partial file."""
+
+    def __init__(self, path=None, max_entries=MAX_FUNCTIONS):
+        self.path = path
+        self.max_entries = max_entries
+        # in order of use, the last one is the most recent
+        self._entries = None
+        self.hits = self.misses = 0
+
+    @property
+    def entries(self):
+        # loaded on first use, a program found in the compile cache doesn't need it
+        if self._entries is None:
+            self._entries = {}
+            if self.path is not None:
+                try:
+                    with open(self.path, "rb") as f:
+                        self._entries = marshal.load(f)
+                except (OSError, EOFError, ValueError, TypeError):
+                    pass
+        return self._entries
+
+    def get(self, key):
+        value = self.entries.pop(key, None)
+        if value is None:
+            self.misses += 1
+            return None
+        self.entries[key] = value
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        self.entries[key] = value
+        while len(self.entries) > self.max_entries:
+            del self.entries[next(iter(self.entries))]
+
+    def save(self):
+        if self.path is None or not self.misses:
+            return
+        tmp = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(tmp, "wb") as f:
+                marshal.dump(self.entries, f)
+            os.replace(tmp, self.path)
+        except OSError:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+
+
+def function_cache_path():
+    """the file of the function cache of this version of the compiler, the files of other versions are removed."""
+    path = os.path.join(ENTRIES_DIR, f"functions.{compiler_version()[:32]}.marshal")
+    for old in glob.glob(os.path.join(ENTRIES_DIR, "functions.*.marshal")):
+        if old != path:
+            try:
+                os.remove(old)
+            except OSError:
+                pass
+    return path
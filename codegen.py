@@ -1,7 +1,27 @@
 from ast_tools import *
+from asm import Code, quoted
+from astfile import paused_gc
+from concurrent.futures import ProcessPoolExecutor
+import hashlib
+import multiprocessing
+import rvasm
 import struct
 
 
+# first lines of the assembly, and the formats of print at the end of its data section
+HEADER = ("#include <stdio.h>", ".align 2", ".section .text", ".global main", "", "")
+FORMATS = ('.strformat: .string "%s\\n"', '.intformat: .string "%d\\n"', '.floatformat: .string "%f\\n"')
+# where main continues after the functions when the program is streamed
+STATEMENTS_LABEL = ".Lstatements"
+# the namespace of the labels of the code outside the functions, see CodeGenerator.new_label()
+MAIN_NAMESPACE = "main"
+# temporaries, taken from the end
+FLT_TMPS = tuple(f"ft{i}" for i in range(7, -1, -1))
+INT_TMPS = tuple(f"t{i}" for i in range(7, -1, -1))
+# the address of a literal loaded from the constant pool, it is never live across an expression
+POOL_REG = "s1"
+
+
 @dataclass()
 class Symbol:
     name: str
@@ -11,42 +31,185 @@ class Symbol:
     vector_len: int
 
 
-class CodeGenerator(ASTNodeVisitor):
-    def __init__(self, source):
+def global_data(sym):
+    """the data of a global variable, a dword for each element."""
+    return f"{sym.location}: .dword 0{str('0'.join([','] * (sym.vector_len)))[:-1]}"
+
+
+def number_constant(value):
+    """the label and the directive of the double value in the constant pool, named by its bits."""
+    bits = int.from_bytes(struct.pack("d", value), "little")
+    return f".Ld.{bits:016x}", f".dword {bits}"
+
+
+def string_constant(text):
+    """the label and the directive of the string literal text in the constant pool, named by a hash of its bytes.
+    its escapes mean what they mean to the assembler, and the bytes are escaped again where they aren't printable."""
+    data = rvasm.escape(text)
+    return f".Ls.{hashlib.sha256(data).hexdigest()[:16]}", f".string {quoted(data)}"
+
+
+def constant_pool(constants):
+    """the code of the read only data of constants, the directives by their labels. the numbers come first, so
+    they are aligned. the labels are named by the literals, so a literal used by several functions is written once
+    and the code of a function doesn't depend on the others."""
+    code = Code()
+    code.directive(".section .rodata")
+    code.directive(".align 3")
+    for label, value in sorted(constants.items(), key=lambda item: not item[1].startswith(".dword")):
+        code.directive(f"{label}: {value}")
+    return code
+
+
+def exit_main(code):
+    code.directive()
+    code.emit("li", "a0", "0")
+    code.emit("li", "a7", "93")
+    code.emit("ecall")
+
+
+# the code generator and the functions its pool generates, the workers are forked with it
+_forked = None
+
+
+def _function_output(i):
+    generator, fun_decls = _forked
+    with paused_gc():
+        return generator.run(generator._function_output(fun_decls[i]))
+
+
+class CodeGenerator(IterativeVisitor):
+    def __init__(self, source=None, bindings=None, fun_cache=None, jobs=1):
+        """bindings is the side table of misc.Resolver for source, it is computed if it is not given. without a
+        source, the program is streamed with start_stream(), stream_item() and end_stream(). the code of
+        functions is looked up in and added to fun_cache, a buildcache.FunctionCache, if it is given. with more
+        than one job, the functions of source are generated by that many forked processes."""
         super().__init__()
 
-        self._symbol_table = [[[], 0]]
+        if bindings is None and source is not None:
+            from misc import Resolver
+
+            bindings = Resolver(source).bindings
+        self._bindings = bindings
+        # symbols by the identifier of their declaration
+        self._symbols = {}
+        # stack space of the frames of each scope and the ones enclosing it, so the space between two scopes is
+        # a difference instead of a sum over the scopes in between
+        self._frame_ends = [0]
         self._actual_params = []
         self._curr_scope_level = 0
-        self._funs = []
+        self._funs = set()
         self._infun = False
         self._return_load_regs = ([], 0)
         self._stack = []
         self._stack_record = []
         self._spill_offset = 0
+        self._frame_base = 0
         self._saved_regs = []
         self._fun_vars = []
-        self.str_literals = {}
+        # the directives of the literals in the constant pool by their labels
+        self.constants = {}
 
-        self._flt_tmps = [f"ft{i}" for i in range(7, -1, -1)]
-        self._int_tmps = [f"t{i}" for i in range(7, -1, -1)]
+        self._flt_tmps = list(FLT_TMPS)
+        self._int_tmps = list(INT_TMPS)
         self._flt_tmp_record = []
         self._int_tmp_record = []
+        # labels are numbered in the namespace of the function they are in
+        self._namespace = MAIN_NAMESPACE
         self._label_counter = 0
 
         self._vector_arithmetic_dest = ""
+        self._fun_cache = fun_cache
+        self._jobs = jobs
+
+        # the program as a buffer of instructions, rendered by the code property. the buffers hold no cycles,
+        # the collector would only scan them over and over while they grow
+        if source is not None:
+            with paused_gc():
+                self.asm = self.visit(source)
+
+    @property
+    def code(self):
+        """the assembly text of the program."""
+        return str(self.asm)
+
+    def start_stream(self, out):
+        """starts writing the program to the text stream out, one top level declaration or statement at a time.
+        the initializers of global variables are written at the start of main, the functions after them, and
+        main jumps over the functions to its statements."""
+        self._out = out
+        # symbols declared by the global variables, the ones after them are dropped after each node
+        self._global_symbols = 0
+        self._past_globals = False
+        self._at_statements = False
+        # labels of the constants already written
+        self._pooled = set()
+
+        code = Code()
+        for line in HEADER:
+            code.directive(line)
+        code.label("main")
+        code.write(out)
+
+    def stream_item(self, node, bindings):
+        """writes the code of node, the next top level declaration or statement, with the bindings of its
+        identifiers. the symbols of its locals are not kept after it is written, and of its literals only the
+        labels, so each one is written to the constant pool once."""
+        self._bindings = bindings
+        code = Code()
+        with paused_gc():
+            if type(node) is VarDecl:
+                sym, init = self.visit(node)
+                code.directive(".section .data")
+                code.directive(global_data(sym))
+                code.directive(".section .text")
+                code += init
+                self._global_symbols = len(self._symbols)
+            else:
+                if not self._past_globals:
+                    code.emit("j", STATEMENTS_LABEL)
+                    self._past_globals = True
+                if type(node) is not FunDecl and not self._at_statements:
+                    code.label(STATEMENTS_LABEL)
+                    self._at_statements = True
+                code += self.visit(node)
+
+            constants = {label: value for label, value in self.constants.items() if label not in self._pooled}
+            if constants:
+                code += constant_pool(constants)
+                code.directive(".section .text")
+                self._pooled.update(constants)
+            self.constants.clear()
+
+        code.write(self._out)
+        symbols = self._symbols
+        while len(symbols) > self._global_symbols:
+            symbols.popitem()
+
+    def end_stream(self):
+        code = Code()
+        if self._past_globals and not self._at_statements:
+            code.label(STATEMENTS_LABEL)
+        exit_main(code)
+        code.directive(".section .data")
+        for line in FORMATS:
+            code.directive(line)
+        code.write(self._out)
+
+    def new_label(self):
+        """a label for a branch. labels are numbered in the namespace of the function they are in, so the code of
+        a function doesn't depend on the code before it."""
+        label = f".L{self._namespace}.{self._label_counter}"
+        self._label_counter += 1
+        return label
 
-        self.code = self.visit(source)
-
-    def get_from_scope(self, var):
-        offset = 0
-        for scope, o in self._symbol_table[::-1]:
-            for sym in scope:
-                if sym.name == var:
-                    return sym, offset
-            offset += o
+    def get_from_scope(self, identifier):
+        """the symbol identifier is bound to and the stack space of the scopes nested in the one it is declared in."""
+        binding = self._bindings.get(identifier)
+        if binding is None:
+            return None
 
-        return None
+        return self._symbols[binding.decl], self._frame_ends[-1] - self._frame_ends[binding.level]
 
     def get_tmp(self, t):
         if t == "float" and self._flt_tmps != []:
@@ -71,37 +234,42 @@ class CodeGenerator(ASTNodeVisitor):
         return tmp in self._int_tmp_record
 
     def visit_SLiteral(self, sliteral: SLiteral):
-        label = ".S" + str(len(self.str_literals))
-        self.str_literals[label] = sliteral.value
-        return label, sliteral.value
+        label, value = string_constant(sliteral.value)
+        self.constants[label] = value
+        # the label is loaded where the literal is used, it takes no code of its own
+        return label, Code()
 
     def visit_Program(self, program: Program):
-        text = "#include <stdio.h>\n.align 2\n.section .text\n.global main\n\n\n"
-        main = "main:\n"
-        data = "\n\n.section .data\n"
+        text = Code()
+        for line in HEADER:
+            text.directive(line)
+        main = Code()
+        main.label("main")
+        data = Code()
+        data.directive()
+        data.directive()
+        data.directive(".section .data")
         for elem in program.var_decls:
-            sym, init = self.visit(elem)
-            data += f"{sym.location}: .dword 0{str('0'.join([','] * (sym.vector_len)))[:-1]}\n"
+            sym, init = yield elem
+            data.directive(global_data(sym))
             main += init
 
-        for elem in program.fun_decls:
-            text += self.visit(elem)
+        if self._jobs > 1 and len(program.fun_decls) > 1:
+            for output in self._parallel_functions(program.fun_decls):
+                text += self._splice(output)
+        else:
+            for elem in program.fun_decls:
+                text += yield elem
 
         for elem in program.statements:
-            main += self.visit(elem)
-
-        main += "\nli a0, 0\n"
-        main += "li a7, 93\n"
-        main += "ecall\n"
+            main += yield elem
 
-        for key, strl in self.str_literals.items():
-            data += f'{key}: .string "{strl}"\n'
+        exit_main(main)
 
-        data += '.strformat: .string "%s\\n"\n'
-        data += '.intformat: .string "%d\\n"\n'
-        data += '.floatformat: .string "%f\\n"\n'
+        for line in FORMATS:
+            data.directive(line)
 
-        return text + main + data
+        return Code((text, main, data, constant_pool(self.constants)))
 
     def visit_VarDecl(self, vardecl: VarDecl):
         addressing = ""
@@ -111,77 +279,194 @@ class CodeGenerator(ASTNodeVisitor):
             location = f".glob_{vardecl.identifier.name}"
         else:
             addressing = "sp"
-            location = f"{8 * len(self._stack)}"
+            location = f"{8 * (self._frame_base + self._bindings[vardecl.identifier].slot)}"
             self._stack.append(vardecl.identifier.name)
 
-        init = ""
+        init = Code()
         t = "float"
         vec_len = 0
         if isinstance(vardecl.initializer, List):
             t = "vec"
             vec_len = len(vardecl.initializer)
             if addressing == "global":
-                init += f"la a0, {location}\n"
+                init.emit("la", "a0", location)
             else:
                 self._stack.pop()
 
             for i, elem in enumerate(vardecl.initializer):
-                reg, code = self.visit(elem)
+                reg, code = yield elem
                 self.free_tmp(reg)
 
                 init += code
                 if isinstance(elem, LExpr):
-                    init += f"fcvt.d.w fa0, {reg}\n"
+                    init.emit("fcvt.d.w", "fa0", reg)
                     reg = "fa0"
 
                 if addressing == "global":
-                    init += f"fsd {reg}, {8 * i}(a0)\n"
+                    init.emit("fsd", reg, f"{8 * i}(a0)")
                 else:
                     self._stack.append(f"{vardecl.identifier.name}[{i}]")
-                    init += f"fsd {reg}, {int(location) + 8 * i}(sp)\n"
+                    init.emit("fsd", reg, f"{int(location) + 8 * i}(sp)")
 
         elif vardecl.initializer is not None:
-            reg, code = self.visit(vardecl.initializer)
+            reg, code = yield vardecl.initializer
             self.free_tmp(reg)
 
             init += code
             if isinstance(vardecl.initializer, LExpr):
-                init += f"fcvt.d.w fa0, {reg}\n"
+                init.emit("fcvt.d.w", "fa0", reg)
                 reg = "fa0"
 
             if addressing == "global":
-                init += f"la a0, {location}\n"
-                init += f"fsd {reg}, (a0)\n"
+                init.emit("la", "a0", location)
+                init.emit("fsd", reg, "(a0)")
             else:
-                init += f"fsd {reg}, {int(location)}(sp)\n"
+                init.emit("fsd", reg, f"{int(location)}(sp)")
 
         sym = Symbol(vardecl.identifier.name, addressing, location, t, vec_len)
-        self._symbol_table[self._curr_scope_level][0].append(sym)
+        self._symbols[vardecl.identifier] = sym
 
         return sym, init
 
+    def _fun_key(self, fundecl):
+        """hash of the function's AST, without the positions of its identifiers so a function that only moved in
+        the source keeps its key, and of the globals it uses."""
+        bindings = self._bindings
+        fields = []
+        used_globals = set()
+        stack = [fundecl]
+        while stack:
+            value = stack.pop()
+            t = type(value)
+            if t is Identifier:
+                fields.append(value.name)
+                binding = bindings.get(value)
+                if binding is not None and binding.kind == "global":
+                    sym = self._symbols[binding.decl]
+                    used_globals.add((sym.name, sym.type, sym.vector_len))
+            elif t is list:
+                fields.append(len(value))
+                stack.extend(value)
+            elif isinstance(value, ASTNode):
+                fields.append(t.__name__)
+                stack.extend(getattr(value, name) for name in t.__slots__)
+            else:
+                fields.append(value)
+        key = repr((fields, sorted(used_globals)))
+        return hashlib.sha256(key.encode()).hexdigest()
+
+    def _function(self, fundecl):
+        """generates the code of a function from the state of an empty program, with its labels in the namespace
+        of its name, so that it doesn't depend on the code around it. the state is restored afterwards."""
+        saved = (
+            self._namespace,
+            self._label_counter,
+            self._flt_tmps,
+            self._int_tmps,
+            self._flt_tmp_record,
+            self._int_tmp_record,
+            self._saved_regs,
+            self._spill_offset,
+        )
+        self._namespace = fundecl.identifier.name
+        self._label_counter = 0
+        self._flt_tmps = list(FLT_TMPS)
+        self._int_tmps = list(INT_TMPS)
+        self._flt_tmp_record = []
+        self._int_tmp_record = []
+        self._saved_regs = []
+        self._spill_offset = 0
+
+        code = yield from self._fun_code(fundecl)
+        (
+            self._namespace,
+            self._label_counter,
+            self._flt_tmps,
+            self._int_tmps,
+            self._flt_tmp_record,
+            self._int_tmp_record,
+            self._saved_regs,
+            self._spill_offset,
+        ) = saved
+        return code
+
+    def _function_output(self, fundecl):
+        """generates the text of a function, without its last newline, and returns it with the labels and
+        directives of the constants it uses."""
+        constants = self.constants
+        self.constants = {}
+        code = yield from self._function(fundecl)
+        output = str(code)[:-1], tuple(self.constants.items())
+        self.constants = constants
+        return output
+
+    def _splice(self, output):
+        text, constants = output
+        self.constants.update(constants)
+        code = Code()
+        code.directive(text)
+        return code
+
+    def _parallel_functions(self, fun_decls):
+        """the outputs of _function_output() for fun_decls in their order. the ones that aren't in the function
+        cache are generated by a pool of forked processes, each one takes a share of the functions."""
+        global _forked
+        fun_cache = self._fun_cache
+        keys = [self._fun_key(fundecl) for fundecl in fun_decls] if fun_cache is not None else None
+        outputs = [fun_cache.get(key) for key in keys] if fun_cache is not None else [None] * len(fun_decls)
+        missing = [i for i, output in enumerate(outputs) if output is None]
+        if missing:
+            jobs = min(self._jobs, len(missing))
+            _forked = self, fun_decls
+            try:
+                with ProcessPoolExecutor(jobs, multiprocessing.get_context("fork")) as pool:
+                    chunksize = max(1, len(missing) // (4 * jobs))
+                    for i, output in zip(missing, pool.map(_function_output, missing, chunksize=chunksize)):
+                        outputs[i] = output
+                        if fun_cache is not None:
+                            fun_cache.put(keys[i], output)
+            finally:
+                _forked = None
+        for fundecl in fun_decls:
+            self._funs.add(fundecl.identifier.name)
+        return outputs
+
     def visit_FunDecl(self, fundecl: FunDecl):
-        self._funs.append(fundecl.identifier.name)
+        if self._fun_cache is None:
+            return (yield from self._function(fundecl))
+
+        key = self._fun_key(fundecl)
+        output = self._fun_cache.get(key)
+        if output is None:
+            output = yield from self._function_output(fundecl)
+            self._fun_cache.put(key, output)
+        else:
+            self._funs.add(fundecl.identifier.name)
+        return self._splice(output)
+
+    def _fun_code(self, fundecl):
+        self._funs.add(fundecl.identifier.name)
         self._fun_vars = [elem for elem in fundecl.params]
 
         self._infun = True
         self._saved_regs.append("ra")
-        text = f"{fundecl.identifier.name}:\n"
-        text += self.visit(fundecl.body)
-        text += "li a0, 0\n"
-        text += "ret\n"
+        text = Code()
+        text.label(fundecl.identifier.name)
+        text += yield fundecl.body
+        text.emit("li", "a0", "0")
+        text.emit("ret")
 
         return text
 
     def visit_Assign(self, assign: Assign):
-        sym, offset = self.get_from_scope(assign.identifier.name)
+        sym, offset = self.get_from_scope(assign.identifier)
         if sym.type == "vec":
             self._vector_arithmetic_dest = sym
-            reg, (code, vlen) = self.visit(assign.expr)
+            reg, (code, vlen) = yield assign.expr
             self._vector_arithmetic_dest = ""
             return code
 
-        reg, code = self.visit(assign.expr)
+        reg, code = yield assign.expr
         self.free_tmp(reg)
 
         instr = "fsd"
@@ -189,136 +474,135 @@ class CodeGenerator(ASTNodeVisitor):
             instr = "sd"
 
         if sym.addressing == "global":
-            code += f"la s0, {sym.location}\n"
-            code += f"{instr} {reg}, (s0) # {assign.identifier.name}\n"
+            code.emit("la", "s0", sym.location)
+            code.emit(instr, reg, "(s0)", comment=assign.identifier.name)
         else:
             if sym.type == "param":
                 location = int(sym.location.split("/")[1])
             else:
                 location = int(sym.location)
-            code += f"{instr} {reg}, {location + offset + 8 * self._spill_offset}(sp) # {assign.identifier.name}\n"
+            code.emit(instr, reg, f"{location + offset + 8 * self._spill_offset}(sp)", comment=assign.identifier.name)
 
         return code
 
     def visit_SetVector(self, setvector: SetVector):
-        sym, offset = self.get_from_scope(setvector.identifier.name)
-        expr_reg, expr = self.visit(setvector.expr)
-        index_reg, index_expr = self.visit(setvector.vector_index)
+        sym, offset = self.get_from_scope(setvector.identifier)
+        expr_reg, expr = yield setvector.expr
+        index_reg, index_expr = yield setvector.vector_index
         self.free_tmp(index_reg)
         self.free_tmp(expr_reg)
 
         code = expr
+        code += index_expr
         if isinstance(setvector.expr, LExpr):
-            code += f"fcvt.d.w ft0, {expr_reg}\n"
-            expr_reg = "ft0"
+            # converted once the index is computed, which may take ft0
+            number_reg = "ft1" if index_reg == "ft0" else "ft0"
+            code.emit("fcvt.d.w", number_reg, expr_reg)
+            expr_reg = number_reg
 
-        code += index_expr
         if sym.addressing == "global":
-            code += f"la s0, {sym.location}\n"
-            code += f"fcvt.w.d s1, {index_reg}\n"
-            code += f"slli s1, s1, 3\n"
-            code += f"add s0, s0, s1\n"
+            code.emit("la", "s0", sym.location)
+            code.emit("fcvt.w.d", "s1", index_reg)
+            code.emit("slli", "s1", "s1", "3")
+            code.emit("add", "s0", "s0", "s1")
         else:
             if sym.type == "param":
                 location = int(sym.location.split("/")[1])
-                code += f"ld s0, {location}(sp)\n"
+                code.emit("ld", "s0", f"{location}(sp)")
                 ptr_reg = "s0"
             else:
                 ptr_reg = "sp"
 
-            code += f"fcvt.w.d s1, {index_reg}\n"
-            code += f"slli s1, s1, 3\n"
-            code += f"add s0, {ptr_reg}, s1\n"
+            code.emit("fcvt.w.d", "s1", index_reg)
+            code.emit("slli", "s1", "s1", "3")
+            code.emit("add", "s0", ptr_reg, "s1")
             if offset != 0:
-                code += f"addi s0, {offset + 8 * self._spill_offset}\n"
+                code.emit("addi", "s0", str(offset + 8 * self._spill_offset))
 
-        code += f"fsd {expr_reg}, (s0)\n"
+        code.emit("fsd", expr_reg, "(s0)")
 
         return code
 
     def visit_ForLoop(self, forloop: ForLoop):
-        init = ""
-        reg, cond = "", ""
-        incr = ""
+        init = Code()
+        reg, cond = "", Code()
+        incr = Code()
         if forloop.initializer is not None:
-            init = self.visit(forloop.initializer)
+            init = yield forloop.initializer
         if forloop.condition is not None:
-            reg, cond = self.visit(forloop.condition)
+            reg, cond = yield forloop.condition
         if forloop.increment is not None:
-            incr = self.visit(forloop.increment)
+            incr = yield forloop.increment
 
-        body = self.visit(forloop.body)
+        body = yield forloop.body
 
-        l1 = f".L{self._label_counter}"
-        self._label_counter += 1
-        test_label = f".L{self._label_counter}"
-        self._label_counter += 1
+        l1 = self.new_label()
+        test_label = self.new_label()
 
         code = init
-        code += f"j {test_label}\n"
-        code += f"{l1}:\n"
+        code.emit("j", test_label)
+        code.label(l1)
         code += body
         code += incr
-        code += f"{test_label}:\n"
+        code.label(test_label)
         code += cond
-        code += f"bnez {reg}, {l1}\n"
+        code.emit("bnez", reg, l1)
 
         return code
 
     def visit_Return(self, returnn: Return):
-        offset = 0
-        for _, o in self._symbol_table[:1:-1]:
-            offset += o
+        # the frames of the blocks nested in the function's body
+        offset = self._frame_ends[-1] - self._frame_ends[1] if len(self._frame_ends) > 1 else 0
 
-        reg, code = self.visit(returnn.expr)
+        reg, code = yield returnn.expr
         self.free_tmp(reg)
         if isinstance(returnn.expr, LExpr) or isinstance(returnn.expr, SLiteral):
-            code += f"mv a0, {reg}\n"
+            code.emit("mv", "a0", reg)
         else:
-            code += f"fmv.x.d a0, {reg}\n"
+            code.emit("fmv.x.d", "a0", reg)
 
         saved_regs, stack_size = self._return_load_regs
         for i, reg in enumerate(saved_regs):
             if reg[0] == "f":
                 if reg[1] == "a":
                     continue
-                code += f"fld {reg}, {8 * i + offset}(sp)\n"
+                code.emit("fld", reg, f"{8 * i + offset}(sp)")
             else:
                 if reg[0] == "a":
                     continue
-                code += f"ld {reg}, {8 * i + offset}(sp)\n"
-        code += f"addi sp, sp, {stack_size}\n"
-        code += "ret\n"
+                code.emit("ld", reg, f"{8 * i + offset}(sp)")
+        code.emit("addi", "sp", "sp", str(stack_size))
+        code.emit("ret")
 
         return code
 
     def visit_WhileLoop(self, whileloop: WhileLoop):
-        reg, cond = self.visit(whileloop.condition)
+        reg, cond = yield whileloop.condition
         self.free_tmp(reg)
-        body = self.visit(whileloop.body)
+        body = yield whileloop.body
 
-        l1 = f".L{self._label_counter}"
-        self._label_counter += 1
-        test_label = f".L{self._label_counter}"
-        self._label_counter += 1
+        l1 = self.new_label()
+        test_label = self.new_label()
 
-        code = f"j {test_label}\n"
-        code += f"{l1}:\n"
+        code = Code()
+        code.emit("j", test_label)
+        code.label(l1)
         code += body
-        code += f"{test_label}:\n"
+        code.label(test_label)
         code += cond
-        code += f"bnez {reg}, {l1}\n"
+        code.emit("bnez", reg, l1)
 
         return code
 
     def visit_Block(self, block: Block):
-        self._symbol_table.append([[], 0])
+        self._frame_ends.append(self._frame_ends[-1])
         self._stack_record.append(
             (
                 self._stack,
                 self._flt_tmp_record,
                 self._int_tmp_record,
                 self._return_load_regs,
+                self._frame_base,
             )
         )
         self._stack = []
@@ -342,15 +626,17 @@ class CodeGenerator(ASTNodeVisitor):
                     stack_size += 1
 
         stack_size *= 8
-        self._symbol_table[self._curr_scope_level][1] = stack_size
+        self._frame_ends[-1] += stack_size
 
-        reg_save = ""
+        reg_save = Code()
         for reg in saved_regs:
             if reg[0] == "f":
-                reg_save += f"fsd {reg}, {8 * len(self._stack)}(sp)\n"
+                reg_save.emit("fsd", reg, f"{8 * len(self._stack)}(sp)")
             else:
-                reg_save += f"sd {reg}, {8 * len(self._stack)}(sp)\n"
+                reg_save.emit("sd", reg, f"{8 * len(self._stack)}(sp)")
             self._stack.append(f"saved_{reg}")
+        # the block's locals and parameters are stored after the saved registers
+        self._frame_base = len(saved_regs)
 
         self._return_load_regs = (
             self._return_load_regs[0] + saved_regs,
@@ -361,129 +647,129 @@ class CodeGenerator(ASTNodeVisitor):
         for i, identifier in enumerate(fun_vars):
             if i < 7:
                 sym = Symbol(
-                    identifier.name, "sp", f"a{i}/{8 * len(self._stack)}", "param", 0
+                    identifier.name, "sp", f"a{i}/{8 * (self._frame_base + self._bindings[identifier].slot)}", "param", 0
                 )  # TODO: Change direct addressing from reg
             else:
                 # TODO: Place of arg > 7 should be set from the caller
                 sym = Symbol(
-                    identifier.name, "sp", f"{8 * len(self._stack)}", "param", 0
+                    identifier.name, "sp", f"{8 * (self._frame_base + self._bindings[identifier].slot)}", "param", 0
                 )
             self._stack.append(sym)
             saved_args.append(sym)
-            self._symbol_table[self._curr_scope_level][0].append(sym)
+            self._symbols[identifier] = sym
             self._actual_params.append(sym)
 
         for sym in saved_args:
             if sym.addressing == "sp":  # TODO
-                reg_save += f"sd {sym.location.split('/')[0]}, {sym.location.split('/')[1]}(sp)\n"
+                reg_save.emit("sd", sym.location.split('/')[0], f"{sym.location.split('/')[1]}(sp)")
 
-        code = ""
+        code = Code()
         for elem in block.var_decls:
-            sym, init = self.visit(elem)
+            sym, init = yield elem
             code += init
 
-        stack_init = ""
+        stack_init = Code()
         if stack_size != 0:
-            stack_init += f"addi sp, sp, -{stack_size}\n"
+            stack_init.emit("addi", "sp", "sp", f"-{stack_size}")
 
         for elem in block.statements:
-            code += self.visit(elem)
+            code += yield elem
 
-        reg_load = ""
+        reg_load = Code()
         for i, reg in enumerate(saved_regs):
             if reg[0] == "f":
                 if reg[1] == "a":
                     continue
-                reg_load += f"fld {reg}, {8 * i}(sp)\n"
+                reg_load.emit("fld", reg, f"{8 * i}(sp)")
             else:
                 if reg[0] == "a":
                     continue
-                reg_load += f"ld {reg}, {8 * i}(sp)\n"
+                reg_load.emit("ld", reg, f"{8 * i}(sp)")
 
         if stack_size != 0:
-            reg_load += f"addi sp, sp, {stack_size}\n"
+            reg_load.emit("addi", "sp", "sp", str(stack_size))
 
-        code = stack_init + reg_save + code + reg_load
+        code = Code((stack_init, reg_save, code, reg_load))
 
         (
             self._stack,
             self._flt_tmp_record,
             self._int_tmp_record,
             self._return_load_regs,
+            self._frame_base,
         ) = self._stack_record.pop()
         self._fun_vars = []
         self._saved_regs = []
         self._actual_params = []
-        self._symbol_table = self._symbol_table[:-1]
+        self._frame_ends.pop()
         self._curr_scope_level -= 1
 
         return code
 
     def visit_Print(self, printt: Print):
-        reg, code = self.visit(printt.expr)
+        reg, code = yield printt.expr
         for i in range(len(self._actual_params)):
             self._actual_params[i].addressing = "sp"
         if isinstance(printt.expr, AExpr):
-            code += f"la a0, .floatformat\n"
-            code += f"fmv.x.d a1, {reg}\n"
+            code.emit("la", "a0", ".floatformat")
+            code.emit("fmv.x.d", "a1", reg)
             self.free_tmp(reg)
         elif isinstance(printt.expr, LExpr):
-            code += f"la a0, .intformat\n"
-            code += f"mv a1, {reg}\n"
+            code.emit("la", "a0", ".intformat")
+            code.emit("mv", "a1", reg)
             self.free_tmp(reg)
         elif isinstance(printt.expr, SLiteral):
-            code = f"la a0, .strformat\n"
-            code += f"la a1, {reg}\n"
+            code.emit("la", "a0", ".strformat")
+            code.emit("la", "a1", reg)
 
-        code += "call printf\n"
+        code.emit("call", "printf")
         return code
 
     def visit_IfElse(self, ifelse: IfElse):
-        reg, cond = self.visit(ifelse.condition)
+        reg, cond = yield ifelse.condition
         self.free_tmp(reg)
-        if_code = self.visit(ifelse.if_branch)
+        if_code = yield ifelse.if_branch
 
-        else_code = ""
+        else_code = Code()
         if ifelse.else_branch is not None:
-            else_code = self.visit(ifelse.else_branch)
+            else_code = yield ifelse.else_branch
 
-        l1 = f".L{self._label_counter}"
-        self._label_counter += 1
+        l1 = self.new_label()
 
         code = cond
-        code += f"beqz {reg}, {l1}\n"
+        code.emit("beqz", reg, l1)
         code += if_code
         if else_code:
-            l2 = f".L{self._label_counter}"
-            self._label_counter += 1
+            l2 = self.new_label()
 
-            code += f"j {l2}\n"
-            code += f"{l1}:\n"
+            code.emit("j", l2)
+            code.label(l1)
             code += else_code
-            code += f"{l2}:\n"
+            code.label(l2)
         else:
-            code += f"{l1}:\n"
+            code.label(l1)
 
         return code
 
     def visit_LBinary(self, lbinary: LBinary):
-        lreg, lexpr = self.visit(lbinary.left)
-        rreg, rexpr = self.visit(lbinary.right)
+        lreg, lexpr = yield lbinary.left
+        rreg, rexpr = yield lbinary.right
         self.free_tmp(rreg)
 
+        end = self.new_label()
         code = lexpr
         if lbinary.op == "or":
-            code += f"bnez {lreg}, .L{self._label_counter}\n"
+            code.emit("bnez", lreg, end)
         elif lbinary.op == "and":
-            code += f"beqz {lreg}, .L{self._label_counter}\n"
+            code.emit("beqz", lreg, end)
 
         code += rexpr
         if self._stack != [] and self._stack[-1] == lreg:
             if lreg in self._int_tmps:
                 self._int_tmps.remove(lreg)
 
-            code += f"ld {lreg}, (sp)\n"
-            code += f"addi sp, sp, 8\n"
+            code.emit("ld", lreg, "(sp)")
+            code.emit("addi", "sp", "sp", "8")
             self._spill_offset -= 1
             self._stack.pop()
             if lreg in self._int_tmp_record:
@@ -491,28 +777,28 @@ class CodeGenerator(ASTNodeVisitor):
             self._int_tmp_record.append(lreg)
 
         if lbinary.op == "or":
-            code += f"or {lreg}, {lreg}, {rreg}\n"
+            code.emit("or", lreg, lreg, rreg)
         elif lbinary.op == "and":
-            code += f"and {lreg}, {lreg}, {rreg}\n"
+            code.emit("and", lreg, lreg, rreg)
 
-        code += f".L{self._label_counter}:\n"
-        self._label_counter += 1
+        code.label(end)
 
         return lreg, code
 
     def visit_Comparison(self, comparison: Comparison):
-        lreg, lexpr = self.visit(comparison.left)
-        rreg, rexpr = self.visit(comparison.right)
+        lreg, lexpr = yield comparison.left
+        rreg, rexpr = yield comparison.right
         self.free_tmp(lreg)
         self.free_tmp(rreg)
-        code = lexpr + rexpr
+        code = lexpr
+        code += rexpr
 
         if self._stack != [] and self._stack[-1] == lreg:
             if lreg in self._flt_tmps:
                 self._flt_tmps.remove(lreg)
 
-            code += f"fld {lreg}, (sp)\n"
-            code += f"addi sp, sp, 8\n"
+            code.emit("fld", lreg, "(sp)")
+            code.emit("addi", "sp", "sp", "8")
             self._spill_offset -= 1
             self._stack.pop()
             if lreg in self._flt_tmp_record:
@@ -523,205 +809,203 @@ class CodeGenerator(ASTNodeVisitor):
         if tmp is None:
             tmp = self._int_tmp_record.pop(0)
             self._stack.append(tmp)
-            code += f"addi sp, sp, -8\n"
-            code += f"sd {tmp}, (sp)\n"
+            code.emit("addi", "sp", "sp", "-8")
+            code.emit("sd", tmp, "(sp)")
             self._spill_offset += 1
         if tmp in self._int_tmp_record:
             self._int_tmp_record.remove(tmp)
         self._int_tmp_record.append(tmp)
 
         if comparison.op == "<":
-            code += f"flt.d {tmp}, {lreg}, {rreg}\n"
+            code.emit("flt.d", tmp, lreg, rreg)
         elif comparison.op == "<=":
-            code += f"fle.d {tmp}, {lreg}, {rreg}\n"
+            code.emit("fle.d", tmp, lreg, rreg)
         elif comparison.op == "==":
-            code += f"feq.d {tmp}, {lreg}, {rreg}\n"
+            code.emit("feq.d", tmp, lreg, rreg)
         elif comparison.op == "!=":
-            code += f"feq.d {tmp}, {lreg}, {rreg}\n"
-            code += f"xori {tmp}, {tmp}, 1\n"
+            code.emit("feq.d", tmp, lreg, rreg)
+            code.emit("xori", tmp, tmp, "1")
         elif comparison.op == ">":
-            code += f"flt.d {tmp}, {rreg}, {lreg}\n"
+            code.emit("flt.d", tmp, rreg, lreg)
         elif comparison.op == ">=":
-            code += f"fle.d {tmp}, {rreg}, {lreg}\n"
+            code.emit("fle.d", tmp, rreg, lreg)
 
         return tmp, code
 
     def visit_LLiteral(self, lliteral: LLiteral):
         tmp = self.get_tmp("bool")
-        code = ""
+        code = Code()
         if tmp is None:
             tmp = self._int_tmp_record.pop(0)
             self._stack.append(tmp)
-            code += f"addi sp, sp, -8\n"
-            code += f"sd {tmp}, (sp)\n"
+            code.emit("addi", "sp", "sp", "-8")
+            code.emit("sd", tmp, "(sp)")
             self._spill_offset += 1
         if tmp in self._int_tmp_record:
             self._int_tmp_record.remove(tmp)
         self._int_tmp_record.append(tmp)
 
-        return tmp, code + f"li {tmp}, {int(lliteral.value)}\n"
+        code.emit("li", tmp, str(int(lliteral.value)))
+        return tmp, code
 
     def visit_LPrimary(self, lprimary: LPrimary):
-        reg, code = self.visit(lprimary.primary)
+        reg, code = yield lprimary.primary
         self.free_tmp(reg)
 
         tmp = self.get_tmp("bool")
         if tmp is None:
             tmp = self._int_tmp_record.pop(0)
             self._stack.append(tmp)
-            code += f"addi sp, sp, -8\n"
-            code += f"sd {tmp}, (sp)\n"
+            code.emit("addi", "sp", "sp", "-8")
+            code.emit("sd", tmp, "(sp)")
             self._spill_offset += 1
         if tmp in self._int_tmp_record:
             self._int_tmp_record.remove(tmp)
         self._int_tmp_record.append(tmp)
 
-        code += f"fcvt.w.d {tmp}, {reg}\n"
-        code += f"snez {tmp}, {tmp}\n"
+        code.emit("fcvt.w.d", tmp, reg)
+        code.emit("snez", tmp, tmp)
 
         return tmp, code
 
     def visit_GetVector(self, getvector: GetVector):
-        sym, offset = self.get_from_scope(getvector.identifier.name)
-        reg, expr = self.visit(getvector.vector_index)
+        sym, offset = self.get_from_scope(getvector.identifier)
+        reg, expr = yield getvector.vector_index
 
         code = expr
         if sym.addressing == "global":
-            code += f"la s0, {sym.location}\n"
-            code += f"fcvt.w.d a1, {reg}\n"
-            code += f"slli s1, a1, 3\n"
+            code.emit("la", "s0", sym.location)
+            code.emit("fcvt.w.d", "a1", reg)
+            code.emit("slli", "s1", "a1", "3")
         else:
-            code += f"fcvt.w.d s1, {reg}\n"
-            code += f"slli s1, s1, 3\n"
+            code.emit("fcvt.w.d", "s1", reg)
+            code.emit("slli", "s1", "s1", "3")
             if sym.type == "param":
                 location = int(sym.location.split("/")[1])
-                code += f"ld s0, {location}(sp)\n"
+                code.emit("ld", "s0", f"{location}(sp)")
             else:
                 location = int(sym.location)
-                code += (
-                    f"addi s0, sp, {int(location) + offset + 8 * self._spill_offset}\n"
-                )
+                code.emit("addi", "s0", "sp", str(int(location) + offset + 8 * self._spill_offset))
 
-        code += f"add s0, s0, s1\n"
-        code += f"fld {reg}, (s0)\n"
+        code.emit("add", "s0", "s0", "s1")
+        code.emit("fld", reg, "(s0)")
         return reg, code
 
     def visit_Variable(self, variable: Variable):
-        sym, offset = self.get_from_scope(variable.identifier.name)
+        sym, offset = self.get_from_scope(variable.identifier)
         if sym.type == "vec":
             tmp = self.get_tmp("int")
-            code = ""
+            code = Code()
             if tmp is None:
                 tmp = self._int_tmp_record.pop(0)
                 self._stack.append(tmp)
-                code += f"addi sp, sp, -8\n"
-                code += f"sd {tmp}, (sp)\n"
+                code.emit("addi", "sp", "sp", "-8")
+                code.emit("sd", tmp, "(sp)")
                 self._spill_offset += 1
             if tmp in self._int_tmp_record:
                 self._int_tmp_record.remove(tmp)
             self._int_tmp_record.append(tmp)
 
             if sym.addressing == "global":
-                code += f"la {tmp}, {sym.location}\n"
+                code.emit("la", tmp, sym.location)
             elif sym.addressing == "sp":
                 if sym.type == "param":
                     location = int(sym.location.split("/")[1])
                 else:
                     location = int(sym.location)
-                code += (
-                    f"addi {tmp}, sp, {location + offset + 8 * self._spill_offset}\n"
-                )
+                code.emit("addi", tmp, "sp", str(location + offset + 8 * self._spill_offset))
             else:
-                code += f"mv {tmp}, {sym.location.split('/')[0]}\n"
+                code.emit("mv", tmp, sym.location.split('/')[0])
 
             return tmp, (code, sym.vector_len)
 
-        code = ""
+        code = Code()
         tmp = self.get_tmp("float")
         if tmp is None:
             tmp = self._flt_tmp_record.pop(0)
             self._stack.append(tmp)
-            code += f"addi sp, sp, -8\n"
-            code += f"fsd {tmp}, (sp)\n"
+            code.emit("addi", "sp", "sp", "-8")
+            code.emit("fsd", tmp, "(sp)")
             self._spill_offset += 1
         if tmp in self._flt_tmp_record:
             self._flt_tmp_record.remove(tmp)
         self._flt_tmp_record.append(tmp)
 
         if sym.addressing == "global":
-            code += f"la s0, {sym.location}\n"
-            code += f"fld {tmp}, (s0)\n"
+            code.emit("la", "s0", sym.location)
+            code.emit("fld", tmp, "(s0)")
         elif sym.addressing == "sp":
             if sym.type == "param":
                 location = int(sym.location.split("/")[1])
             else:
                 location = int(sym.location)
-            code += f"fld {tmp}, {location + offset + 8 * self._spill_offset}(sp)\n"
+            code.emit("fld", tmp, f"{location + offset + 8 * self._spill_offset}(sp)")
         else:
-            code += f"fmv.d.x {tmp}, {sym.location.split('/')[0]}\n"
+            code.emit("fmv.d.x", tmp, sym.location.split('/')[0])
 
         return tmp, code
 
     def visit_LNot(self, lnot: LNot):
-        tmp, code = self.visit(lnot.right)
-        code += f"xori {tmp}, {tmp}, 1\n"
+        tmp, code = yield lnot.right
+        code.emit("xori", tmp, tmp, "1")
 
         return tmp, code
 
     def visit_ABinary(self, abinary: ABinary):
-        lreg, lexpr = self.visit(abinary.left)
-        rreg, rexpr = self.visit(abinary.right)
+        lreg, lexpr = yield abinary.left
+        rreg, rexpr = yield abinary.right
         self.free_tmp(rreg)
 
         if isinstance(lexpr, tuple) and isinstance(rexpr, tuple):
             lexpr, lvlen = lexpr
             rexpr, rvlen = rexpr
 
-            code = lexpr + rexpr
+            code = lexpr
+            code += rexpr
 
             sym = self._vector_arithmetic_dest
             if sym.addressing == "global":
-                code += f"la s0, {sym.location}\n"
+                code.emit("la", "s0", sym.location)
             else:
                 if sym.type == "param":
                     location = int(sym.location.split('/')[1])
                 else:
                     location = int(sym.location)
-                code += f"addi s0, sp, {location}\n"
-
-            code += f"li s2, {lvlen}\n"
-            label = f".L{self._label_counter}"
-            self._label_counter += 1
-            code += f"{label}:\n"
-            code += f"vsetvli s1, s2, e64\n"
-            code += f"vle64.v v0, ({lreg})\n"
-            code += f"vle64.v v1, ({rreg})\n"
+                code.emit("addi", "s0", "sp", location)
+
+            code.emit("li", "s2", str(lvlen))
+            label = self.new_label()
+            code.label(label)
+            code.emit("vsetvli", "s1", "s2", "e64")
+            code.emit("vle64.v", "v0", f"({lreg})")
+            code.emit("vle64.v", "v1", f"({rreg})")
             if abinary.op == "+":
-                code += f"vfadd.vv v0, v0, v1\n"
+                code.emit("vfadd.vv", "v0", "v0", "v1")
             elif abinary.op == "-":
-                code += f"vfsub.vv v0, v0, v1\n"
+                code.emit("vfsub.vv", "v0", "v0", "v1")
             elif abinary.op == "*":
-                code += f"vfmul.vv v0, v0, v1\n"
+                code.emit("vfmul.vv", "v0", "v0", "v1")
             elif abinary.op == "/":
-                code += f"vfdiv.vv v0, v0, v1\n"
+                code.emit("vfdiv.vv", "v0", "v0", "v1")
 
-            code += f"vse64.v v0, (s0)\n"
-            code += f"sub s2, s2, s1\n"
-            code += f"slli s3, s1, 3\n"
-            code += f"add {lreg}, {lreg}, s3\n"
-            code += f"add {rreg}, {rreg}, s3\n"
-            code += f"add s0, s0, s3\n"
-            code += f"bgtz s2, {label}\n"
+            code.emit("vse64.v", "v0", "(s0)")
+            code.emit("sub", "s2", "s2", "s1")
+            code.emit("slli", "s3", "s1", "3")
+            code.emit("add", lreg, lreg, "s3")
+            code.emit("add", rreg, rreg, "s3")
+            code.emit("add", "s0", "s0", "s3")
+            code.emit("bgtz", "s2", label)
 
             return "s0", (code, lvlen)
 
-        code = lexpr + rexpr
+        code = lexpr
+        code += rexpr
         if self._stack != [] and self._stack[-1] == lreg:
             if lreg in self._flt_tmps:
                 self._flt_tmps.remove(lreg)
 
-            code += f"fld {lreg}, (sp)\n"
-            code += f"addi sp, sp, 8\n"
+            code.emit("fld", lreg, "(sp)")
+            code.emit("addi", "sp", "sp", "8")
             self._spill_offset -= 1
             self._stack.pop()
             if lreg in self._flt_tmp_record:
@@ -729,47 +1013,51 @@ class CodeGenerator(ASTNodeVisitor):
             self._flt_tmp_record.append(lreg)
 
         if abinary.op == "+":
-            code += f"fadd.d {lreg}, {lreg}, {rreg}\n"
+            code.emit("fadd.d", lreg, lreg, rreg)
         elif abinary.op == "-":
-            code += f"fsub.d {lreg}, {lreg}, {rreg}\n"
+            code.emit("fsub.d", lreg, lreg, rreg)
         elif abinary.op == "*":
-            code += f"fmul.d {lreg}, {lreg}, {rreg}\n"
+            code.emit("fmul.d", lreg, lreg, rreg)
         elif abinary.op == "/":
-            code += f"fdiv.d {lreg}, {lreg}, {rreg}\n"
+            code.emit("fdiv.d", lreg, lreg, rreg)
 
         return lreg, code
 
     def visit_AUMinus(self, auminus: AUMinus):
-        tmp, code = self.visit(auminus.right)
-        code += f"fsgnjn.d {tmp}, {tmp}, {tmp}\n"
+        tmp, code = yield auminus.right
+        code.emit("fsgnjn.d", tmp, tmp, tmp)
         return tmp, code
 
     def visit_ALiteral(self, aliteral: ALiteral):
-        code = ""
+        code = Code()
         tmp = self.get_tmp("float")
         if tmp is None:
             tmp = self._flt_tmp_record.pop(0)
             self._stack.append(tmp)
-            code += f"addi sp, sp, -8\n"
-            code += f"fsd {tmp}, (sp)\n"
+            code.emit("addi", "sp", "sp", "-8")
+            code.emit("fsd", tmp, "(sp)")
             self._spill_offset += 1
         if tmp in self._flt_tmp_record:
             self._flt_tmp_record.remove(tmp)
         self._flt_tmp_record.append(tmp)
 
-        val = int.from_bytes(struct.pack("d", aliteral.value), "little")
-        code += f"li t2, {val} # {aliteral.value}\n"
-        code += f"fmv.d.x {tmp}, t2\n"
+        label, value = number_constant(aliteral.value)
+        if value == ".dword 0":
+            # 0.0 is all zero bits, it takes no load
+            code.emit("fmv.d.x", tmp, "zero", comment=str(aliteral.value))
+        else:
+            self.constants[label] = value
+            code.emit("fld", tmp, label, POOL_REG, comment=str(aliteral.value))
         return tmp, code
 
     def visit_Call(self, call: Call):
-        code = ""
+        code = Code()
         tmp = self.get_tmp("float")
         if tmp is None:
             tmp = self._flt_tmp_record.pop(0)
             self._stack.append(tmp)
-            code += f"addi sp, sp, -8\n"
-            code += f"fsd {tmp}, (sp)\n"
+            code.emit("addi", "sp", "sp", "-8")
+            code.emit("fsd", tmp, "(sp)")
             self._spill_offset += 1
         if tmp in self._flt_tmp_record:
             self._flt_tmp_record.remove(tmp)
@@ -778,41 +1066,41 @@ class CodeGenerator(ASTNodeVisitor):
         for i, elem in enumerate(call.arguments):
             if i < len(self._actual_params):
                 self._actual_params[i].addressing = "sp"
-            reg, expr = self.visit(elem)
+            reg, expr = yield elem
             self.free_tmp(reg)
             if isinstance(expr, tuple):
                 expr, vlen = expr
             code += expr
             if reg[0] == "f":
-                code += f"fmv.x.d a{i}, {reg}\n"
+                code.emit("fmv.x.d", f"a{i}", reg)
             else:
-                code += f"mv a{i}, {reg}\n"
+                code.emit("mv", f"a{i}", reg)
 
         saved_regs = self._flt_tmp_record + self._int_tmp_record
-        code += f"addi sp, sp, -{8 * len(saved_regs)}\n"
+        code.emit("addi", "sp", "sp", f"-{8 * len(saved_regs)}")
         for i, reg in enumerate(saved_regs):
             if reg[0] == "f":
                 if reg[1] == "a":
                     continue
-                code += f"fsd {reg}, {8 * i}(sp)\n"
+                code.emit("fsd", reg, f"{8 * i}(sp)")
             else:
                 if reg[0] == "a" or reg[0] == "r":
                     continue
-                code += f"sd {reg}, {8 * i}(sp)\n"
+                code.emit("sd", reg, f"{8 * i}(sp)")
 
-        code += f"call {call.callee.name}\n"
+        code.emit("call", call.callee.name)
 
         for i, reg in enumerate(saved_regs):
             if reg[0] == "f":
                 if reg[1] == "a":
                     continue
-                code += f"fld {reg}, {8 * i}(sp)\n"
+                code.emit("fld", reg, f"{8 * i}(sp)")
             else:
                 if reg[0] == "a" or reg[0] == "r":
                     continue
-                code += f"ld {reg}, {8 * i}(sp)\n"
-        code += f"addi sp, sp, {8 * len(saved_regs)}\n"
-        code += f"fmv.d.x {tmp}, a0\n"
+                code.emit("ld", reg, f"{8 * i}(sp)")
+        code.emit("addi", "sp", "sp", str(8 * len(saved_regs)))
+        code.emit("fmv.d.x", tmp, "a0")
 
         return tmp, code
 
@@ -0,0 +1,194 @@
+#include <stdio.h>
+.align 2
+.section .text
+.global main
+
+
+sort:
+addi sp, sp, -16
+sd ra, 0(sp)
+mv t3, a0
+mv t4, a1
+fmv.d.x ft3, t3
+fmv.d.x ft4, t4
+fld ft5, .Ld.3ff0000000000000, t6
+feq.d t3, ft4, ft5
+bnez t3, .Lsort.8
+.Lsort.1:
+fld ft5, .Ld.3ff0000000000000, t6
+fsub.d ft5, ft4, ft5
+fmv.d.x ft6, zero
+flt.d t3, ft6, ft5
+fmv.d.x ft5, zero
+li t4, 0
+fmv.d.x ft6, zero
+beqz t3, .Lsort.5
+.Lsort.2:
+slli t3, t4, 3
+fmv.x.d t5, ft3
+add t3, t5, t3
+fld ft7, 0(t3)
+addi t3, t4, 1
+slli t3, t3, 3
+fmv.x.d t5, ft3
+add t3, t5, t3
+fld ft8, 0(t3)
+flt.d t3, ft8, ft7
+fmv.d ft7, ft5
+beqz t3, .Lsort.4
+.Lsort.3:
+slli t3, t4, 3
+fmv.x.d t5, ft3
+add t3, t5, t3
+fld ft8, 0(t3)
+addi t3, t4, 1
+slli t3, t3, 3
+fmv.x.d t5, ft3
+add t3, t5, t3
+fld ft9, 0(t3)
+slli t3, t4, 3
+fmv.x.d t5, ft3
+add t3, t5, t3
+fsd ft9, 0(t3)
+addi t3, t4, 1
+slli t3, t3, 3
+fmv.x.d t5, ft3
+add t3, t5, t3
+fsd ft8, 0(t3)
+fld ft8, .Ld.3ff0000000000000, t6
+fadd.d ft8, ft5, ft8
+fmv.d ft7, ft8
+.Lsort.4:
+addi t3, t4, 1
+fcvt.d.w ft8, t3
+fld ft9, .Ld.3ff0000000000000, t6
+fsub.d ft9, ft4, ft9
+flt.d t5, ft8, ft9
+fmv.d ft5, ft7
+mv t4, t3
+fmv.d ft6, ft7
+bnez t5, .Lsort.2
+.Lsort.5:
+fmv.d.x ft5, zero
+feq.d t3, ft6, ft5
+bnez t3, .Lsort.7
+.Lsort.6:
+fmv.x.d t3, ft3
+fld ft3, .Ld.3ff0000000000000, t6
+fsub.d ft3, ft4, ft3
+fmv.x.d t4, ft3
+mv a0, t3
+mv a1, t4
+call sort
+mv t3, a0
+li a0, 0
+ld ra, 0(sp)
+addi sp, sp, 16
+ret
+.Lsort.7:
+fmv.d.x ft3, zero
+fmv.x.d t3, ft3
+mv a0, t3
+ld ra, 0(sp)
+addi sp, sp, 16
+ret
+.Lsort.8:
+fmv.d.x ft3, zero
+fmv.x.d t3, ft3
+mv a0, t3
+ld ra, 0(sp)
+addi sp, sp, 16
+ret
+main:
+la t3, .glob_list
+fmv.d.x ft3, zero
+fsd ft3, 0(t3)
+la t3, .glob_list
+fld ft3, .Ld.4000000000000000, t6
+fsd ft3, 8(t3)
+la t3, .glob_list
+fld ft3, .Ld.4008000000000000, t6
+fsd ft3, 16(t3)
+la t3, .glob_list
+fld ft3, .Ld.3ff0000000000000, t6
+fsd ft3, 24(t3)
+la t3, .glob_list
+fld ft3, .Ld.3ff0000000000000, t6
+fsd ft3, 32(t3)
+la t3, .glob_list
+fld ft3, .Ld.401c000000000000, t6
+fsd ft3, 40(t3)
+la t3, .glob_list
+fld ft3, .Ld.4018000000000000, t6
+fsd ft3, 48(t3)
+la t3, .glob_list
+fld ft3, .Ld.4022000000000000, t6
+fsd ft3, 56(t3)
+la t3, .glob_r
+fmv.d.x ft3, zero
+fsd ft3, 0(t3)
+la t3, .glob_list
+fmv.d.x ft3, t3
+fmv.x.d t3, ft3
+fld ft3, .Ld.4020000000000000, t6
+fmv.x.d t4, ft3
+mv a0, t3
+mv a1, t4
+call sort
+mv t3, a0
+fmv.d.x ft3, t3
+la t3, .glob_r
+fsd ft3, 0(t3)
+la t3, .glob_r
+fmv.d.x ft3, zero
+fsd ft3, 0(t3)
+la t3, .glob_r
+fld ft3, 0(t3)
+fld ft4, .Ld.4020000000000000, t6
+flt.d t3, ft3, ft4
+beqz t3, .Lmain.2
+.Lmain.1:
+la t3, .glob_r
+fld ft3, 0(t3)
+fcvt.w.d t3, ft3
+slli t3, t3, 3
+la t4, .glob_list
+add t3, t4, t3
+fld ft3, 0(t3)
+la a0, .floatformat
+fmv.x.d a1, ft3
+call printf
+la t3, .glob_r
+fld ft3, 0(t3)
+fld ft4, .Ld.3ff0000000000000, t6
+fadd.d ft3, ft3, ft4
+la t3, .glob_r
+fsd ft3, 0(t3)
+la t3, .glob_r
+fld ft3, 0(t3)
+fld ft4, .Ld.4020000000000000, t6
+flt.d t3, ft3, ft4
+bnez t3, .Lmain.1
+.Lmain.2:
+li a0, 0
+
+li a0, 0
+li a7, 93
+ecall
+
+
+.section .data
+.glob_list: .dword 0,0,0,0,0,0,0,0
+.glob_r: .dword 0
+.strformat: .string "%s\n"
+.intformat: .string "%d\n"
+.floatformat: .string "%f\n"
+.section .rodata
+.align 3
+.Ld.3ff0000000000000: .dword 4607182418800017408
+.Ld.4000000000000000: .dword 4611686018427387904
+.Ld.4008000000000000: .dword 4613937818241073152
+.Ld.401c000000000000: .dword 4619567317775286272
+.Ld.4018000000000000: .dword 4618441417868443648
+.Ld.4022000000000000: .dword 4621256167635550208
+.Ld.4020000000000000: .dword 4620693217682128896
@@ -0,0 +1,29 @@
+#include <stdio.h>
+.align 2
+.section .text
+.global main
+
+
+main:
+la t3, .glob_a
+fmv.d.x ft3, zero
+fsd ft3, 0(t3)
+fld ft3, .Ld.4024000000000000, t6
+la a0, .floatformat
+fmv.x.d a1, ft3
+call printf
+li a0, 0
+
+li a0, 0
+li a7, 93
+ecall
+
+
+.section .data
+.glob_a: .dword 0
+.strformat: .string "%s\n"
+.intformat: .string "%d\n"
+.floatformat: .string "%f\n"
+.section .rodata
+.align 3
+.Ld.4024000000000000: .dword 4621819117588971520
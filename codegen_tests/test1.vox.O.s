@@ -0,0 +1,118 @@
+#include <stdio.h>
+.align 2
+.section .text
+.global main
+
+
+main:
+fld ft3, .Ld.4000000000000000, t6
+la a0, .floatformat
+fmv.x.d a1, ft3
+call printf
+fld ft3, .Ld.4025333333333333, t6
+la a0, .floatformat
+fmv.x.d a1, ft3
+call printf
+fld ft3, .Ld.3fec924924924925, t6
+la a0, .floatformat
+fmv.x.d a1, ft3
+call printf
+fld ft3, .Ld.403c000000000000, t6
+la a0, .floatformat
+fmv.x.d a1, ft3
+call printf
+fld ft3, .Ld.bfe3333333333330, t6
+la a0, .floatformat
+fmv.x.d a1, ft3
+call printf
+fld ft3, .Ld.3fe3333333333330, t6
+la a0, .floatformat
+fmv.x.d a1, ft3
+call printf
+fld ft3, .Ld.4011db22d0e56044, t6
+la a0, .floatformat
+fmv.x.d a1, ft3
+call printf
+fld ft3, .Ld.46a485df19208be3, t6
+la a0, .floatformat
+fmv.x.d a1, ft3
+call printf
+li t3, 1
+la a0, .intformat
+mv a1, t3
+call printf
+li t3, 0
+la a0, .intformat
+mv a1, t3
+call printf
+li t3, 0
+la a0, .intformat
+mv a1, t3
+call printf
+li t3, 1
+la a0, .intformat
+mv a1, t3
+call printf
+la t3, .Ls.cb1ad2119d8fafb6
+la a0, .strformat
+mv a1, t3
+call printf
+li t3, 1
+la a0, .intformat
+mv a1, t3
+call printf
+li t3, 1
+la a0, .intformat
+mv a1, t3
+call printf
+li t3, 0
+la a0, .intformat
+mv a1, t3
+call printf
+li t3, 1
+la a0, .intformat
+mv a1, t3
+call printf
+li t3, 0
+la a0, .intformat
+mv a1, t3
+call printf
+li t3, 0
+la a0, .intformat
+mv a1, t3
+call printf
+li t3, 1
+la a0, .intformat
+mv a1, t3
+call printf
+la t3, .Ls.51631634b450458f
+la a0, .strformat
+mv a1, t3
+call printf
+li t3, 0
+la a0, .intformat
+mv a1, t3
+call printf
+li a0, 0
+
+li a0, 0
+li a7, 93
+ecall
+
+
+.section .data
+.strformat: .string "%s\n"
+.intformat: .string "%d\n"
+.floatformat: .string "%f\n"
+.section .rodata
+.align 3
+.Ld.4000000000000000: .dword 4611686018427387904
+.Ld.4025333333333333: .dword 4622156887561024307
+.Ld.3fec924924924925: .dword 4606217361737009445
+.Ld.403c000000000000: .dword 4628574517030027264
+.Ld.bfe3333333333330: .dword 13826951575952896816
+.Ld.3fe3333333333330: .dword 4603579539098121008
+.Ld.4011db22d0e56044: .dword 4616712035611533380
+.Ld.46a485df19208be3: .dword 5090340672081267683
+.Ls.cb1ad2119d8fafb6: .string "AAA"
+.Ls.51631634b450458f: .string "fdaihfas"
@@ -0,0 +1,34 @@
+#include <stdio.h>
+.align 2
+.section .text
+.global main
+
+
+main:
+la t3, .glob_x
+fmv.d.x ft3, zero
+fsd ft3, 0(t3)
+la t3, .Ls.54a0e8c17ebb21a1
+la a0, .strformat
+mv a1, t3
+call printf
+la t3, .Ls.ea7a80e35e38b9e3
+la a0, .strformat
+mv a1, t3
+call printf
+li a0, 0
+
+li a0, 0
+li a7, 93
+ecall
+
+
+.section .data
+.glob_x: .dword 0
+.strformat: .string "%s\n"
+.intformat: .string "%d\n"
+.floatformat: .string "%f\n"
+.section .rodata
+.align 3
+.Ls.54a0e8c17ebb21a1: .string "Error"
+.Ls.ea7a80e35e38b9e3: .string "Result is 2"
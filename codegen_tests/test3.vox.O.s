@@ -0,0 +1,130 @@
+#include <stdio.h>
+.align 2
+.section .text
+.global main
+
+
+main:
+la t3, .glob_x
+fld ft3, .Ld.4024000000000000, t6
+fsd ft3, 0(t3)
+la t3, .glob_y
+fld ft3, .Ld.402e000000000000, t6
+fsd ft3, 0(t3)
+la t3, .glob_y
+fld ft3, .Ld.4059000000000000, t6
+fsd ft3, 0(t3)
+la t3, .glob_y
+fld ft3, .Ld.4059000000000000, t6
+fsd ft3, 0(t3)
+la t3, .glob_y
+fld ft3, .Ld.4059000000000000, t6
+fsd ft3, 0(t3)
+la t3, .glob_y
+fld ft3, .Ld.408f400000000000, t6
+fsd ft3, 0(t3)
+la t3, .glob_x
+fld ft3, 0(t3)
+la t3, .glob_y
+fld ft4, 0(t3)
+fadd.d ft3, ft3, ft4
+la a0, .floatformat
+fmv.x.d a1, ft3
+call printf
+la t3, .glob_x
+fld ft3, 0(t3)
+fld ft4, .Ld.4014000000000000, t6
+flt.d t3, ft4, ft3
+beqz t3, .Lmain.2
+.Lmain.1:
+la t3, .glob_x
+fld ft3, 0(t3)
+la a0, .floatformat
+fmv.x.d a1, ft3
+call printf
+la t3, .glob_x
+fld ft3, 0(t3)
+fld ft4, .Ld.3ff0000000000000, t6
+fsub.d ft3, ft3, ft4
+la t3, .glob_x
+fsd ft3, 0(t3)
+la t3, .glob_x
+fld ft3, 0(t3)
+fld ft4, .Ld.4014000000000000, t6
+flt.d t3, ft4, ft3
+bnez t3, .Lmain.1
+.Lmain.2:
+la t3, .glob_x
+fmv.d.x ft3, zero
+fsd ft3, 0(t3)
+la t3, .glob_x
+fld ft3, 0(t3)
+fld ft4, .Ld.4008000000000000, t6
+flt.d t3, ft3, ft4
+beqz t3, .Lmain.4
+.Lmain.3:
+la t3, .glob_x
+fld ft3, 0(t3)
+la a0, .floatformat
+fmv.x.d a1, ft3
+call printf
+la t3, .glob_x
+fld ft3, 0(t3)
+fld ft4, .Ld.3ff0000000000000, t6
+fadd.d ft3, ft3, ft4
+la t3, .glob_x
+fsd ft3, 0(t3)
+la t3, .glob_x
+fld ft3, 0(t3)
+fld ft4, .Ld.4008000000000000, t6
+flt.d t3, ft3, ft4
+bnez t3, .Lmain.3
+.Lmain.4:
+la t3, .glob_x
+fld ft3, .Ld.4024000000000000, t6
+fsd ft3, 0(t3)
+la t3, .glob_x
+fld ft3, 0(t3)
+fcvt.w.d t3, ft3
+snez t3, t3
+beqz t3, .Lmain.6
+.Lmain.5:
+la t3, .glob_x
+fld ft3, 0(t3)
+la a0, .floatformat
+fmv.x.d a1, ft3
+call printf
+la t3, .glob_x
+fld ft3, 0(t3)
+fld ft4, .Ld.3ff0000000000000, t6
+fsub.d ft3, ft3, ft4
+la t3, .glob_x
+fsd ft3, 0(t3)
+la t3, .glob_x
+fld ft3, 0(t3)
+fcvt.w.d t3, ft3
+snez t3, t3
+bnez t3, .Lmain.5
+.Lmain.6:
+li a0, 0
+
+li a0, 0
+li a7, 93
+ecall
+
+
+.section .data
+.glob_x: .dword 0
+.glob_y: .dword 0
+.strformat: .string "%s\n"
+.intformat: .string "%d\n"
+.floatformat: .string "%f\n"
+.section .rodata
+.align 3
+.Ld.4024000000000000: .dword 4621819117588971520
+.Ld.402e000000000000: .dword 4624633867356078080
+.Ld.4059000000000000: .dword 4636737291354636288
+.Ld.408f400000000000: .dword 4652007308841189376
+.Ld.4014000000000000: .dword 4617315517961601024
+.Ld.3ff0000000000000: .dword 4607182418800017408
+.Ld.4008000000000000: .dword 4613937818241073152
@@ -0,0 +1,105 @@
+#include <stdio.h>
+.align 2
+.section .text
+.global main
+
+
+main:
+la t3, .glob_x
+fld ft3, .Ld.3ff0000000000000, t6
+fsd ft3, 0(t3)
+la t3, .glob_y
+fld ft3, .Ld.4000000000000000, t6
+fsd ft3, 0(t3)
+li t3, 1
+fcvt.d.w ft3, t3
+la t3, .glob_z
+fsd ft3, 0(t3)
+fld ft3, .Ld.4059000000000000, t6
+fld ft4, .Ld.4069000000000000, t6
+fadd.d ft3, ft3, ft4
+la a0, .floatformat
+fmv.x.d a1, ft3
+call printf
+fld ft3, .Ld.4059000000000000, t6
+fld ft4, .Ld.4069000000000000, t6
+fadd.d ft3, ft3, ft4
+fld ft4, .Ld.406f400000000000, t6
+fadd.d ft3, ft3, ft4
+fld ft4, .Ld.4062c00000000000, t6
+fadd.d ft3, ft3, ft4
+fld ft4, .Ld.4034000000000000, t6
+fadd.d ft3, ft3, ft4
+la a0, .floatformat
+fmv.x.d a1, ft3
+call printf
+la t3, .glob_x
+fld ft3, 0(t3)
+la t3, .glob_y
+fld ft4, 0(t3)
+fadd.d ft3, ft3, ft4
+la a0, .floatformat
+fmv.x.d a1, ft3
+call printf
+la t3, .glob_z
+fld ft3, 0(t3)
+fld ft4, .Ld.3ff0000000000000, t6
+fadd.d ft3, ft3, ft4
+la t3, .glob_z
+fsd ft3, 0(t3)
+la t3, .glob_z
+fld ft3, 0(t3)
+fld ft4, .Ld.3ff0000000000000, t6
+fadd.d ft3, ft3, ft4
+la a0, .floatformat
+fmv.x.d a1, ft3
+call printf
+la t3, .glob_z
+fld ft3, 0(t3)
+fneg.d ft3, ft3
+la a0, .floatformat
+fmv.x.d a1, ft3
+call printf
+la t3, .glob_z
+fld ft3, 0(t3)
+fcvt.w.d t3, ft3
+snez t3, t3
+la a0, .intformat
+mv a1, t3
+call printf
+la t3, .glob_z
+fld ft3, 0(t3)
+fld ft4, .Ld.4000000000000000, t6
+fsub.d ft3, ft3, ft4
+la t3, .glob_z
+fsd ft3, 0(t3)
+la t3, .glob_z
+fld ft3, 0(t3)
+fcvt.w.d t3, ft3
+snez t3, t3
+la a0, .intformat
+mv a1, t3
+call printf
+li a0, 0
+
+li a0, 0
+li a7, 93
+ecall
+
+
+.section .data
+.glob_x: .dword 0
+.glob_y: .dword 0
+.glob_z: .dword 0
+.strformat: .string "%s\n"
+.intformat: .string "%d\n"
+.floatformat: .string "%f\n"
+.section .rodata
+.align 3
+.Ld.3ff0000000000000: .dword 4607182418800017408
+.Ld.4000000000000000: .dword 4611686018427387904
+.Ld.4059000000000000: .dword 4636737291354636288
+.Ld.4069000000000000: .dword 4641240890982006784
+.Ld.406f400000000000: .dword 4643000109586448384
+.Ld.4062c00000000000: .dword 4639481672377565184
+.Ld.4034000000000000: .dword 4626322717216342016
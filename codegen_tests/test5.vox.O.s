@@ -0,0 +1,300 @@
+#include <stdio.h>
+.align 2
+.section .text
+.global main
+
+
+main:
+addi sp, sp, -96
+la t3, .glob_x
+fld ft3, .Ld.3ff0000000000000, t6
+fsd ft3, 0(t3)
+la t3, .glob_x
+fld ft3, .Ld.4000000000000000, t6
+fsd ft3, 8(t3)
+la t3, .glob_x
+fld ft3, .Ld.4008000000000000, t6
+fsd ft3, 16(t3)
+la t3, .glob_x
+fld ft3, .Ld.4010000000000000, t6
+fsd ft3, 24(t3)
+la t3, .glob_x
+fmv.d.x ft3, zero
+fsd ft3, 32(t3)
+la t3, .glob_i
+fmv.d.x ft3, zero
+fsd ft3, 0(t3)
+la t3, .glob_i
+fld ft3, 0(t3)
+fld ft4, .Ld.4010000000000000, t6
+flt.d t3, ft3, ft4
+beqz t3, .Lmain.2
+.Lmain.1:
+la t3, .glob_i
+fld ft3, 0(t3)
+fcvt.w.d t3, ft3
+slli t3, t3, 3
+la t4, .glob_x
+add t3, t4, t3
+fld ft3, 0(t3)
+la a0, .floatformat
+fmv.x.d a1, ft3
+call printf
+la t3, .glob_i
+fld ft3, 0(t3)
+fld ft4, .Ld.3ff0000000000000, t6
+fadd.d ft3, ft3, ft4
+la t3, .glob_i
+fsd ft3, 0(t3)
+la t3, .glob_i
+fld ft3, 0(t3)
+fld ft4, .Ld.4010000000000000, t6
+flt.d t3, ft3, ft4
+bnez t3, .Lmain.1
+.Lmain.2:
+li t3, 0
+li t4, 3
+sll t3, t3, t4
+la t4, .glob_x
+add t3, t4, t3
+fld ft3, .Ld.4059000000000000, t6
+fsd ft3, 0(t3)
+li t3, 2
+li t4, 3
+sll t3, t3, t4
+la t4, .glob_x
+add t3, t4, t3
+fmv.d.x ft3, zero
+fsd ft3, 0(t3)
+li t3, 1
+fcvt.d.w ft3, t3
+li t3, 3
+li t4, 3
+sll t3, t3, t4
+la t4, .glob_x
+add t3, t4, t3
+fsd ft3, 0(t3)
+la t3, .glob_i
+fmv.d.x ft3, zero
+fsd ft3, 0(t3)
+la t3, .glob_i
+fld ft3, 0(t3)
+fld ft4, .Ld.4010000000000000, t6
+flt.d t3, ft3, ft4
+beqz t3, .Lmain.4
+.Lmain.3:
+la t3, .glob_i
+fld ft3, 0(t3)
+fcvt.w.d t3, ft3
+slli t3, t3, 3
+la t4, .glob_x
+add t3, t4, t3
+fld ft3, 0(t3)
+la a0, .floatformat
+fmv.x.d a1, ft3
+call printf
+la t3, .glob_i
+fld ft3, 0(t3)
+fld ft4, .Ld.3ff0000000000000, t6
+fadd.d ft3, ft3, ft4
+la t3, .glob_i
+fsd ft3, 0(t3)
+la t3, .glob_i
+fld ft3, 0(t3)
+fld ft4, .Ld.4010000000000000, t6
+flt.d t3, ft3, ft4
+bnez t3, .Lmain.3
+.Lmain.4:
+la t3, .glob_i
+fmv.d.x ft3, zero
+fsd ft3, 0(t3)
+la t3, .glob_i
+fld ft3, 0(t3)
+fld ft4, .Ld.4014000000000000, t6
+flt.d t3, ft3, ft4
+beqz t3, .Lmain.6
+.Lmain.5:
+la t3, .glob_i
+fld ft3, 0(t3)
+fcvt.w.d t3, ft3
+slli t3, t3, 3
+la t4, .glob_x
+add t3, t4, t3
+fld ft3, 0(t3)
+fcvt.w.d t3, ft3
+snez t3, t3
+la a0, .intformat
+mv a1, t3
+call printf
+la t3, .glob_i
+fld ft3, 0(t3)
+fld ft4, .Ld.3ff0000000000000, t6
+fadd.d ft3, ft3, ft4
+la t3, .glob_i
+fsd ft3, 0(t3)
+la t3, .glob_i
+fld ft3, 0(t3)
+fld ft4, .Ld.4014000000000000, t6
+flt.d t3, ft3, ft4
+bnez t3, .Lmain.5
+.Lmain.6:
+li t3, 0
+li t4, 3
+sll t3, t3, t4
+la t4, .glob_x
+add t3, t4, t3
+fld ft3, 0(t3)
+fcvt.w.d t3, ft3
+snez t3, t3
+beqz t3, .Lmain.16
+.Lmain.7:
+addi t3, sp, 0
+fld ft3, .Ld.3ff0000000000000, t6
+fsd ft3, 0(t3)
+addi t3, sp, 0
+fld ft3, .Ld.4000000000000000, t6
+fsd ft3, 8(t3)
+addi t3, sp, 0
+fld ft3, .Ld.4008000000000000, t6
+fsd ft3, 16(t3)
+addi t3, sp, 0
+fld ft3, .Ld.4010000000000000, t6
+fsd ft3, 24(t3)
+addi t3, sp, 0
+fld ft3, .Ld.4014000000000000, t6
+fsd ft3, 32(t3)
+addi t3, sp, 40
+fld ft3, .Ld.3ff8000000000000, t6
+fsd ft3, 0(t3)
+addi t3, sp, 40
+fld ft3, .Ld.4020000000000000, t6
+fsd ft3, 8(t3)
+fld ft3, .Ld.4024000000000000, t6
+la a0, .floatformat
+fmv.x.d a1, ft3
+call printf
+li t3, 1
+li t4, 3
+sll t3, t3, t4
+addi t4, sp, 40
+add t3, t4, t3
+fld ft3, 0(t3)
+fcvt.w.d t3, ft3
+snez t3, t3
+li s0, 10
+beqz t3, .Lmain.13
+.Lmain.8:
+addi t3, sp, 56
+fld ft3, .Ld.4014000000000000, t6
+fsd ft3, 0(t3)
+addi t3, sp, 56
+fld ft3, .Ld.4010000000000000, t6
+fsd ft3, 8(t3)
+addi t3, sp, 56
+fld ft3, .Ld.4008000000000000, t6
+fsd ft3, 16(t3)
+addi t3, sp, 56
+fld ft3, .Ld.4000000000000000, t6
+fsd ft3, 24(t3)
+addi t3, sp, 56
+fld ft3, .Ld.3ff0000000000000, t6
+fsd ft3, 32(t3)
+fld ft3, .Ld.4034000000000000, t6
+la a0, .floatformat
+fmv.x.d a1, ft3
+call printf
+li t3, 0
+li t4, 2
+slt t3, t3, t4
+li s1, 0
+beqz t3, .Lmain.10
+.Lmain.9:
+slli t3, s1, 3
+addi t4, sp, 40
+add t3, t4, t3
+fld ft3, 0(t3)
+la a0, .floatformat
+fmv.x.d a1, ft3
+call printf
+addi t3, s1, 1
+slti t4, t3, 2
+mv s1, t3
+bnez t4, .Lmain.9
+.Lmain.10:
+li t3, 0
+li t4, 4
+slt t3, t3, t4
+li s1, 0
+beqz t3, .Lmain.12
+.Lmain.11:
+slli t3, s1, 3
+addi t4, sp, 56
+add t3, t4, t3
+fld ft3, 0(t3)
+la a0, .floatformat
+fmv.x.d a1, ft3
+call printf
+addi t3, s1, 1
+slti t4, t3, 4
+mv s1, t3
+bnez t4, .Lmain.11
+.Lmain.12:
+li s0, 20
+.Lmain.13:
+fcvt.d.w fs0, s0
+li t3, 0
+li t4, 4
+slt t3, t3, t4
+li s0, 0
+beqz t3, .Lmain.15
+.Lmain.14:
+slli t3, s0, 3
+addi t4, sp, 0
+add t3, t4, t3
+fld ft3, 0(t3)
+la a0, .floatformat
+fmv.x.d a1, ft3
+call printf
+addi t3, s0, 1
+slti t4, t3, 4
+mv s0, t3
+bnez t4, .Lmain.14
+.Lmain.15:
+la a0, .floatformat
+fmv.x.d a1, fs0
+call printf
+.Lmain.16:
+li t3, 0
+li t4, 3
+sll t3, t3, t4
+la t4, .glob_x
+add t3, t4, t3
+fld ft3, 0(t3)
+la a0, .floatformat
+fmv.x.d a1, ft3
+call printf
+li a0, 0
+
+li a0, 0
+li a7, 93
+ecall
+
+
+.section .data
+.glob_x: .dword 0,0,0,0,0
+.glob_i: .dword 0
+.strformat: .string "%s\n"
+.intformat: .string "%d\n"
+.floatformat: .string "%f\n"
+.section .rodata
+.align 3
+.Ld.3ff0000000000000: .dword 4607182418800017408
+.Ld.4000000000000000: .dword 4611686018427387904
+.Ld.4008000000000000: .dword 4613937818241073152
+.Ld.4010000000000000: .dword 4616189618054758400
+.Ld.4059000000000000: .dword 4636737291354636288
+.Ld.4014000000000000: .dword 4617315517961601024
+.Ld.3ff8000000000000: .dword 4609434218613702656
+.Ld.4020000000000000: .dword 4620693217682128896
+.Ld.4024000000000000: .dword 4621819117588971520
+.Ld.4034000000000000: .dword 4626322717216342016
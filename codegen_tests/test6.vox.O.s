@@ -0,0 +1,136 @@
+#include <stdio.h>
+.align 2
+.section .text
+.global main
+
+
+fibonnacci:
+addi sp, sp, -32
+sd ra, 0(sp)
+fsd fs0, 8(sp)
+fsd fs1, 16(sp)
+mv t3, a0
+fmv.d.x fs0, t3
+la a0, .floatformat
+fmv.x.d a1, fs0
+call printf
+fld ft3, .Ld.4000000000000000, t6
+flt.d t3, fs0, ft3
+bnez t3, .Lfibonnacci.2
+.Lfibonnacci.1:
+fld ft3, .Ld.3ff0000000000000, t6
+fsub.d ft3, fs0, ft3
+fmv.x.d t3, ft3
+mv a0, t3
+call fibonnacci
+mv t3, a0
+fmv.d.x fs1, t3
+fld ft3, .Ld.4000000000000000, t6
+fsub.d ft3, fs0, ft3
+fmv.x.d t3, ft3
+mv a0, t3
+call fibonnacci
+mv t3, a0
+fmv.d.x ft3, t3
+fadd.d ft3, fs1, ft3
+fmv.x.d t3, ft3
+mv a0, t3
+ld ra, 0(sp)
+fld fs0, 8(sp)
+fld fs1, 16(sp)
+addi sp, sp, 32
+ret
+.Lfibonnacci.2:
+fmv.x.d t3, fs0
+mv a0, t3
+ld ra, 0(sp)
+fld fs0, 8(sp)
+fld fs1, 16(sp)
+addi sp, sp, 32
+ret
+fibo_with_var:
+addi sp, sp, -32
+sd ra, 0(sp)
+fsd fs0, 8(sp)
+fsd fs1, 16(sp)
+mv t3, a0
+fmv.d.x fs0, t3
+fld ft3, .Ld.4000000000000000, t6
+flt.d t3, fs0, ft3
+bnez t3, .Lfibo_with_var.2
+.Lfibo_with_var.1:
+fld ft3, .Ld.3ff0000000000000, t6
+fsub.d ft3, fs0, ft3
+fmv.x.d t3, ft3
+mv a0, t3
+call fibo_with_var
+mv t3, a0
+fmv.d.x fs1, t3
+fld ft3, .Ld.4000000000000000, t6
+fsub.d ft3, fs0, ft3
+fmv.x.d t3, ft3
+mv a0, t3
+call fibo_with_var
+mv t3, a0
+fmv.d.x ft3, t3
+fadd.d ft3, fs1, ft3
+fmv.x.d t3, ft3
+mv a0, t3
+ld ra, 0(sp)
+fld fs0, 8(sp)
+fld fs1, 16(sp)
+addi sp, sp, 32
+ret
+.Lfibo_with_var.2:
+fmv.x.d t3, fs0
+mv a0, t3
+ld ra, 0(sp)
+fld fs0, 8(sp)
+fld fs1, 16(sp)
+addi sp, sp, 32
+ret
+main:
+fld ft3, .Ld.4024000000000000, t6
+fmv.x.d t3, ft3
+mv a0, t3
+call fibonnacci
+mv t3, a0
+fmv.d.x ft3, t3
+la t3, .glob_x
+fsd ft3, 0(t3)
+la t3, .Ls.ccfbca6507781cd9
+la a0, .strformat
+mv a1, t3
+call printf
+la t3, .glob_x
+fld ft3, 0(t3)
+la a0, .floatformat
+fmv.x.d a1, ft3
+call printf
+fld ft3, .Ld.4024000000000000, t6
+fmv.x.d t3, ft3
+mv a0, t3
+call fibo_with_var
+mv t3, a0
+fmv.d.x ft3, t3
+la a0, .floatformat
+fmv.x.d a1, ft3
+call printf
+li a0, 0
+
+li a0, 0
+li a7, 93
+ecall
+
+
+.section .data
+.glob_x: .dword 0
+.strformat: .string "%s\n"
+.intformat: .string "%d\n"
+.floatformat: .string "%f\n"
+.section .rodata
+.align 3
+.Ld.4000000000000000: .dword 4611686018427387904
+.Ld.3ff0000000000000: .dword 4607182418800017408
+.Ld.4024000000000000: .dword 4621819117588971520
+.Ls.ccfbca6507781cd9: .string "Result:"
@@ -0,0 +1,2937 @@
+#include <stdio.h>
+.align 2
+.section .text
+.global main
+
+
+get_x:
+addi sp, sp, -16
+sd ra, 0(sp)
+mv t3, a0
+fmv.d.x ft3, t3
+fmv.x.d t3, ft3
+mv a0, t3
+ld ra, 0(sp)
+addi sp, sp, 16
+ret
+get_y:
+addi sp, sp, -16
+sd ra, 0(sp)
+mv t3, a0
+fmv.d.x ft3, t3
+fmv.x.d t3, ft3
+mv a0, t3
+ld ra, 0(sp)
+addi sp, sp, 16
+ret
+long_aexpr:
+addi sp, sp, -32
+sd ra, 0(sp)
+fsd fs0, 8(sp)
+fsd fs1, 16(sp)
+mv t3, a0
+mv t4, a1
+fmv.d.x fs0, t3
+fmv.d.x fs1, t4
+la a0, .floatformat
+fmv.x.d a1, fs0
+call printf
+la a0, .floatformat
+fmv.x.d a1, fs1
+call printf
+fadd.d ft3, fs0, fs1
+fld ft4, .Ld.4020000000000000, t6
+fadd.d ft4, fs1, ft4
+fmul.d ft3, ft3, ft4
+fadd.d ft4, fs0, fs1
+fld ft5, .Ld.4020000000000000, t6
+fadd.d ft5, fs1, ft5
+fmul.d ft4, ft4, ft5
+fadd.d ft3, ft3, ft4
+fadd.d ft4, fs0, fs1
+fld ft5, .Ld.4020000000000000, t6
+fadd.d ft5, fs1, ft5
+fmul.d ft4, ft4, ft5
+fadd.d ft5, fs0, fs1
+fld ft6, .Ld.4020000000000000, t6
+fadd.d ft6, fs1, ft6
+fmul.d ft5, ft5, ft6
+fadd.d ft4, ft4, ft5
+fadd.d ft3, ft3, ft4
+fadd.d ft4, fs0, fs1
+fadd.d ft5, fs0, fs1
+fld ft6, .Ld.4020000000000000, t6
+fadd.d ft6, fs1, ft6
+fmul.d ft5, ft5, ft6
+fadd.d ft6, fs0, fs1
+fld ft7, .Ld.4020000000000000, t6
+fadd.d ft7, fs1, ft7
+fmul.d ft6, ft6, ft7
+fadd.d ft5, ft5, ft6
+fadd.d ft6, fs0, fs1
+fld ft7, .Ld.4020000000000000, t6
+fadd.d ft7, fs1, ft7
+fmul.d ft6, ft6, ft7
+fadd.d ft7, fs0, fs1
+fld ft8, .Ld.4020000000000000, t6
+fadd.d ft8, fs1, ft8
+fmul.d ft7, ft7, ft8
+fadd.d ft6, ft6, ft7
+fadd.d ft5, ft5, ft6
+fadd.d ft6, fs0, fs1
+fld ft7, .Ld.4020000000000000, t6
+fadd.d ft7, fs1, ft7
+fmul.d ft6, ft6, ft7
+fadd.d ft7, fs0, fs1
+fld ft8, .Ld.4020000000000000, t6
+fadd.d ft8, fs1, ft8
+fmul.d ft7, ft7, ft8
+fadd.d ft6, ft6, ft7
+fadd.d ft7, fs0, fs1
+fld ft8, .Ld.4020000000000000, t6
+fadd.d ft8, fs1, ft8
+fmul.d ft7, ft7, ft8
+fadd.d ft8, fs0, fs1
+fld ft9, .Ld.4020000000000000, t6
+fadd.d ft9, fs1, ft9
+fmul.d ft8, ft8, ft9
+fadd.d ft7, ft7, ft8
+fadd.d ft6, ft6, ft7
+fmul.d ft5, ft5, ft6
+fld ft6, .Ld.4020000000000000, t6
+fadd.d ft6, fs1, ft6
+fmul.d ft5, ft5, ft6
+fadd.d ft6, fs0, fs1
+fld ft7, .Ld.4020000000000000, t6
+fadd.d ft7, fs1, ft7
+fmul.d ft6, ft6, ft7
+fadd.d ft5, ft5, ft6
+fadd.d ft6, fs0, fs1
+fld ft7, .Ld.4020000000000000, t6
+fadd.d ft7, fs1, ft7
+fmul.d ft6, ft6, ft7
+fadd.d ft7, fs0, fs1
+fld ft8, .Ld.4020000000000000, t6
+fadd.d ft8, fs1, ft8
+fmul.d ft7, ft7, ft8
+fadd.d ft6, ft6, ft7
+fadd.d ft5, ft5, ft6
+fadd.d ft6, fs0, fs1
+fadd.d ft7, fs0, fs1
+fld ft8, .Ld.4020000000000000, t6
+fadd.d ft8, fs1, ft8
+fmul.d ft7, ft7, ft8
+fadd.d ft8, fs0, fs1
+fld ft9, .Ld.4020000000000000, t6
+fadd.d ft9, fs1, ft9
+fmul.d ft8, ft8, ft9
+fadd.d ft7, ft7, ft8
+fadd.d ft8, fs0, fs1
+fld ft9, .Ld.4020000000000000, t6
+fadd.d ft9, fs1, ft9
+fmul.d ft8, ft8, ft9
+fadd.d ft9, fs0, fs1
+fld ft10, .Ld.4020000000000000, t6
+fadd.d ft10, fs1, ft10
+fmul.d ft9, ft9, ft10
+fadd.d ft8, ft8, ft9
+fadd.d ft7, ft7, ft8
+fadd.d ft8, fs0, fs1
+fld ft9, .Ld.4020000000000000, t6
+fadd.d ft9, fs1, ft9
+fmul.d ft8, ft8, ft9
+fadd.d ft9, fs0, fs1
+fld ft10, .Ld.4020000000000000, t6
+fadd.d ft10, fs1, ft10
+fmul.d ft9, ft9, ft10
+fadd.d ft8, ft8, ft9
+fadd.d ft9, fs0, fs1
+fld ft10, .Ld.4020000000000000, t6
+fadd.d ft10, fs1, ft10
+fmul.d ft9, ft9, ft10
+fadd.d ft10, fs0, fs1
+fld ft11, .Ld.4020000000000000, t6
+fadd.d ft11, fs1, ft11
+fmul.d ft10, ft10, ft11
+fadd.d ft9, ft9, ft10
+fadd.d ft8, ft8, ft9
+fmul.d ft7, ft7, ft8
+fld ft8, .Ld.4020000000000000, t6
+fadd.d ft8, fs1, ft8
+fmul.d ft7, ft7, ft8
+fadd.d ft8, fs0, fs1
+fld ft9, .Ld.4020000000000000, t6
+fadd.d ft9, fs1, ft9
+fmul.d ft8, ft8, ft9
+fadd.d ft7, ft7, ft8
+fadd.d ft8, fs0, fs1
+fld ft9, .Ld.4020000000000000, t6
+fadd.d ft9, fs1, ft9
+fmul.d ft8, ft8, ft9
+fadd.d ft9, fs0, fs1
+fld ft10, .Ld.4020000000000000, t6
+fadd.d ft10, fs1, ft10
+fmul.d ft9, ft9, ft10
+fadd.d ft8, ft8, ft9
+fadd.d ft7, ft7, ft8
+fadd.d ft8, fs0, fs1
+fld ft9, .Ld.4020000000000000, t6
+fadd.d ft9, fs1, ft9
+fmul.d ft8, ft8, ft9
+fadd.d ft9, fs0, fs1
+fld ft10, .Ld.4020000000000000, t6
+fadd.d ft10, fs1, ft10
+fmul.d ft9, ft9, ft10
+fadd.d ft8, ft8, ft9
+fadd.d ft9, fs0, fs1
+fld ft10, .Ld.4020000000000000, t6
+fadd.d ft10, fs1, ft10
+fmul.d ft9, ft9, ft10
+fadd.d ft10, fs0, fs1
+fld ft11, .Ld.4020000000000000, t6
+fadd.d ft11, fs1, ft11
+fmul.d ft10, ft10, ft11
+fadd.d ft9, ft9, ft10
+fadd.d ft8, ft8, ft9
+fmul.d ft7, ft7, ft8
+fmul.d ft6, ft6, ft7
+fadd.d ft7, fs0, fs1
+fld ft8, .Ld.4020000000000000, t6
+fadd.d ft8, fs1, ft8
+fmul.d ft7, ft7, ft8
+fadd.d ft6, ft6, ft7
+fadd.d ft7, fs0, fs1
+fld ft8, .Ld.4020000000000000, t6
+fadd.d ft8, fs1, ft8
+fmul.d ft7, ft7, ft8
+fadd.d ft8, fs0, fs1
+fld ft9, .Ld.4020000000000000, t6
+fadd.d ft9, fs1, ft9
+fmul.d ft8, ft8, ft9
+fadd.d ft7, ft7, ft8
+fadd.d ft6, ft6, ft7
+fmul.d ft5, ft5, ft6
+fmul.d ft4, ft4, ft5
+fadd.d ft5, fs0, fs1
+fld ft6, .Ld.4020000000000000, t6
+fadd.d ft6, fs1, ft6
+fmul.d ft5, ft5, ft6
+fadd.d ft4, ft4, ft5
+fadd.d ft5, fs0, fs1
+fld ft6, .Ld.4020000000000000, t6
+fadd.d ft6, fs1, ft6
+fmul.d ft5, ft5, ft6
+fadd.d ft6, fs0, fs1
+fld ft7, .Ld.4020000000000000, t6
+fadd.d ft7, fs1, ft7
+fmul.d ft6, ft6, ft7
+fadd.d ft5, ft5, ft6
+fadd.d ft4, ft4, ft5
+fmul.d ft3, ft3, ft4
+fld ft4, .Ld.4020000000000000, t6
+fadd.d ft4, fs1, ft4
+fmul.d ft3, ft3, ft4
+fadd.d ft4, fs0, fs1
+fld ft5, .Ld.4020000000000000, t6
+fadd.d ft5, fs1, ft5
+fmul.d ft4, ft4, ft5
+fadd.d ft3, ft3, ft4
+fadd.d ft4, fs0, fs1
+fld ft5, .Ld.4020000000000000, t6
+fadd.d ft5, fs1, ft5
+fmul.d ft4, ft4, ft5
+fadd.d ft5, fs0, fs1
+fld ft6, .Ld.4020000000000000, t6
+fadd.d ft6, fs1, ft6
+fmul.d ft5, ft5, ft6
+fadd.d ft4, ft4, ft5
+fadd.d ft3, ft3, ft4
+fadd.d ft4, fs0, fs1
+fadd.d ft5, fs0, fs1
+fld ft6, .Ld.4020000000000000, t6
+fadd.d ft6, fs1, ft6
+fmul.d ft5, ft5, ft6
+fadd.d ft6, fs0, fs1
+fld ft7, .Ld.4020000000000000, t6
+fadd.d ft7, fs1, ft7
+fmul.d ft6, ft6, ft7
+fadd.d ft5, ft5, ft6
+fadd.d ft6, fs0, fs1
+fld ft7, .Ld.4020000000000000, t6
+fadd.d ft7, fs1, ft7
+fmul.d ft6, ft6, ft7
+fadd.d ft7, fs0, fs1
+fld ft8, .Ld.4020000000000000, t6
+fadd.d ft8, fs1, ft8
+fmul.d ft7, ft7, ft8
+fadd.d ft6, ft6, ft7
+fadd.d ft5, ft5, ft6
+fadd.d ft6, fs0, fs1
+fld ft7, .Ld.4020000000000000, t6
+fadd.d ft7, fs1, ft7
+fmul.d ft6, ft6, ft7
+fadd.d ft7, fs0, fs1
+fld ft8, .Ld.4020000000000000, t6
+fadd.d ft8, fs1, ft8
+fmul.d ft7, ft7, ft8
+fadd.d ft6, ft6, ft7
+fadd.d ft7, fs0, fs1
+fld ft8, .Ld.4020000000000000, t6
+fadd.d ft8, fs1, ft8
+fmul.d ft7, ft7, ft8
+fadd.d ft8, fs0, fs1
+fld ft9, .Ld.4020000000000000, t6
+fadd.d ft9, fs1, ft9
+fmul.d ft8, ft8, ft9
+fadd.d ft7, ft7, ft8
+fadd.d ft6, ft6, ft7
+fmul.d ft5, ft5, ft6
+fld ft6, .Ld.4020000000000000, t6
+fadd.d ft6, fs1, ft6
+fmul.d ft5, ft5, ft6
+fadd.d ft6, fs0, fs1
+fld ft7, .Ld.4020000000000000, t6
+fadd.d ft7, fs1, ft7
+fmul.d ft6, ft6, ft7
+fadd.d ft5, ft5, ft6
+fadd.d ft6, fs0, fs1
+fld ft7, .Ld.4020000000000000, t6
+fadd.d ft7, fs1, ft7
+fmul.d ft6, ft6, ft7
+fadd.d ft7, fs0, fs1
+fld ft8, .Ld.4020000000000000, t6
+fadd.d ft8, fs1, ft8
+fmul.d ft7, ft7, ft8
+fadd.d ft6, ft6, ft7
+fadd.d ft5, ft5, ft6
+fadd.d ft6, fs0, fs1
+fld ft7, .Ld.4020000000000000, t6
+fadd.d ft7, fs1, ft7
+fmul.d ft6, ft6, ft7
+fadd.d ft7, fs0, fs1
+fld ft8, .Ld.4020000000000000, t6
+fadd.d ft8, fs1, ft8
+fmul.d ft7, ft7, ft8
+fadd.d ft6, ft6, ft7
+fadd.d ft7, fs0, fs1
+fld ft8, .Ld.4020000000000000, t6
+fadd.d ft8, fs1, ft8
+fmul.d ft7, ft7, ft8
+fadd.d ft8, fs0, fs1
+fld ft9, .Ld.4020000000000000, t6
+fadd.d ft9, fs1, ft9
+fmul.d ft8, ft8, ft9
+fadd.d ft7, ft7, ft8
+fadd.d ft6, ft6, ft7
+fmul.d ft5, ft5, ft6
+fmul.d ft4, ft4, ft5
+fadd.d ft5, fs0, fs1
+fld ft6, .Ld.4020000000000000, t6
+fadd.d ft6, fs1, ft6
+fmul.d ft5, ft5, ft6
+fadd.d ft4, ft4, ft5
+fadd.d ft5, fs0, fs1
+fld ft6, .Ld.4020000000000000, t6
+fadd.d ft6, fs1, ft6
+fmul.d ft5, ft5, ft6
+fadd.d ft6, fs0, fs1
+fld ft7, .Ld.4020000000000000, t6
+fadd.d ft7, fs1, ft7
+fmul.d ft6, ft6, ft7
+fadd.d ft5, ft5, ft6
+fadd.d ft4, ft4, ft5
+fmul.d ft3, ft3, ft4
+la a0, .floatformat
+fmv.x.d a1, ft3
+call printf
+fadd.d ft3, fs0, fs1
+fld ft4, .Ld.4020000000000000, t6
+fadd.d ft4, fs1, ft4
+fmul.d ft3, ft3, ft4
+fadd.d ft4, fs0, fs1
+fld ft5, .Ld.4020000000000000, t6
+fadd.d ft5, fs1, ft5
+fmul.d ft4, ft4, ft5
+fadd.d ft3, ft3, ft4
+fadd.d ft4, fs0, fs1
+fld ft5, .Ld.4020000000000000, t6
+fadd.d ft5, fs1, ft5
+fmul.d ft4, ft4, ft5
+fadd.d ft5, fs0, fs1
+fld ft6, .Ld.4020000000000000, t6
+fadd.d ft6, fs1, ft6
+fmul.d ft5, ft5, ft6
+fadd.d ft4, ft4, ft5
+fadd.d ft3, ft3, ft4
+fadd.d ft4, fs0, fs1
+fadd.d ft5, fs0, fs1
+fld ft6, .Ld.4020000000000000, t6
+fadd.d ft6, fs1, ft6
+fmul.d ft5, ft5, ft6
+fadd.d ft6, fs0, fs1
+fld ft7, .Ld.4020000000000000, t6
+fadd.d ft7, fs1, ft7
+fmul.d ft6, ft6, ft7
+fadd.d ft5, ft5, ft6
+fadd.d ft6, fs0, fs1
+fld ft7, .Ld.4020000000000000, t6
+fadd.d ft7, fs1, ft7
+fmul.d ft6, ft6, ft7
+fadd.d ft7, fs0, fs1
+fld ft8, .Ld.4020000000000000, t6
+fadd.d ft8, fs1, ft8
+fmul.d ft7, ft7, ft8
+fadd.d ft6, ft6, ft7
+fadd.d ft5, ft5, ft6
+fadd.d ft6, fs0, fs1
+fld ft7, .Ld.4020000000000000, t6
+fadd.d ft7, fs1, ft7
+fmul.d ft6, ft6, ft7
+fadd.d ft7, fs0, fs1
+fld ft8, .Ld.4020000000000000, t6
+fadd.d ft8, fs1, ft8
+fmul.d ft7, ft7, ft8
+fadd.d ft6, ft6, ft7
+fadd.d ft7, fs0, fs1
+fld ft8, .Ld.4020000000000000, t6
+fadd.d ft8, fs1, ft8
+fmul.d ft7, ft7, ft8
+fadd.d ft8, fs0, fs1
+fld ft9, .Ld.4020000000000000, t6
+fadd.d ft9, fs1, ft9
+fmul.d ft8, ft8, ft9
+fadd.d ft7, ft7, ft8
+fadd.d ft6, ft6, ft7
+fmul.d ft5, ft5, ft6
+fld ft6, .Ld.4020000000000000, t6
+fadd.d ft6, fs1, ft6
+fmul.d ft5, ft5, ft6
+fadd.d ft6, fs0, fs1
+fld ft7, .Ld.4020000000000000, t6
+fadd.d ft7, fs1, ft7
+fmul.d ft6, ft6, ft7
+fadd.d ft5, ft5, ft6
+fadd.d ft6, fs0, fs1
+fld ft7, .Ld.4020000000000000, t6
+fadd.d ft7, fs1, ft7
+fmul.d ft6, ft6, ft7
+fadd.d ft7, fs0, fs1
+fld ft8, .Ld.4020000000000000, t6
+fadd.d ft8, fs1, ft8
+fmul.d ft7, ft7, ft8
+fadd.d ft6, ft6, ft7
+fadd.d ft5, ft5, ft6
+fadd.d ft6, fs0, fs1
+fadd.d ft7, fs0, fs1
+fld ft8, .Ld.4020000000000000, t6
+fadd.d ft8, fs1, ft8
+fmul.d ft7, ft7, ft8
+fadd.d ft8, fs0, fs1
+fld ft9, .Ld.4020000000000000, t6
+fadd.d ft9, fs1, ft9
+fmul.d ft8, ft8, ft9
+fadd.d ft7, ft7, ft8
+fadd.d ft8, fs0, fs1
+fld ft9, .Ld.4020000000000000, t6
+fadd.d ft9, fs1, ft9
+fmul.d ft8, ft8, ft9
+fadd.d ft9, fs0, fs1
+fld ft10, .Ld.4020000000000000, t6
+fadd.d ft10, fs1, ft10
+fmul.d ft9, ft9, ft10
+fadd.d ft8, ft8, ft9
+fadd.d ft7, ft7, ft8
+fadd.d ft8, fs0, fs1
+fld ft9, .Ld.4020000000000000, t6
+fadd.d ft9, fs1, ft9
+fmul.d ft8, ft8, ft9
+fadd.d ft9, fs0, fs1
+fld ft10, .Ld.4020000000000000, t6
+fadd.d ft10, fs1, ft10
+fmul.d ft9, ft9, ft10
+fadd.d ft8, ft8, ft9
+fadd.d ft9, fs0, fs1
+fld ft10, .Ld.4020000000000000, t6
+fadd.d ft10, fs1, ft10
+fmul.d ft9, ft9, ft10
+fadd.d ft10, fs0, fs1
+fld ft11, .Ld.4020000000000000, t6
+fadd.d ft11, fs1, ft11
+fmul.d ft10, ft10, ft11
+fadd.d ft9, ft9, ft10
+fadd.d ft8, ft8, ft9
+fmul.d ft7, ft7, ft8
+fld ft8, .Ld.4020000000000000, t6
+fadd.d ft8, fs1, ft8
+fmul.d ft7, ft7, ft8
+fadd.d ft8, fs0, fs1
+fld ft9, .Ld.4020000000000000, t6
+fadd.d ft9, fs1, ft9
+fmul.d ft8, ft8, ft9
+fadd.d ft7, ft7, ft8
+fadd.d ft8, fs0, fs1
+fld ft9, .Ld.4020000000000000, t6
+fadd.d ft9, fs1, ft9
+fmul.d ft8, ft8, ft9
+fadd.d ft9, fs0, fs1
+fld ft10, .Ld.4020000000000000, t6
+fadd.d ft10, fs1, ft10
+fmul.d ft9, ft9, ft10
+fadd.d ft8, ft8, ft9
+fadd.d ft7, ft7, ft8
+fadd.d ft8, fs0, fs1
+fld ft9, .Ld.4020000000000000, t6
+fadd.d ft9, fs1, ft9
+fmul.d ft8, ft8, ft9
+fadd.d ft9, fs0, fs1
+fld ft10, .Ld.4020000000000000, t6
+fadd.d ft10, fs1, ft10
+fmul.d ft9, ft9, ft10
+fadd.d ft8, ft8, ft9
+fadd.d ft9, fs0, fs1
+fld ft10, .Ld.4020000000000000, t6
+fadd.d ft10, fs1, ft10
+fmul.d ft9, ft9, ft10
+fadd.d ft10, fs0, fs1
+fld ft11, .Ld.4020000000000000, t6
+fadd.d ft11, fs1, ft11
+fmul.d ft10, ft10, ft11
+fadd.d ft9, ft9, ft10
+fadd.d ft8, ft8, ft9
+fmul.d ft7, ft7, ft8
+fmul.d ft6, ft6, ft7
+fadd.d ft7, fs0, fs1
+fld ft8, .Ld.4020000000000000, t6
+fadd.d ft8, fs1, ft8
+fmul.d ft7, ft7, ft8
+fadd.d ft6, ft6, ft7
+fadd.d ft7, fs0, fs1
+fld ft8, .Ld.4020000000000000, t6
+fadd.d ft8, fs1, ft8
+fmul.d ft7, ft7, ft8
+fadd.d ft8, fs0, fs1
+fld ft9, .Ld.4020000000000000, t6
+fadd.d ft9, fs1, ft9
+fmul.d ft8, ft8, ft9
+fadd.d ft7, ft7, ft8
+fadd.d ft6, ft6, ft7
+fmul.d ft5, ft5, ft6
+fmul.d ft4, ft4, ft5
+fadd.d ft5, fs0, fs1
+fld ft6, .Ld.4020000000000000, t6
+fadd.d ft6, fs1, ft6
+fmul.d ft5, ft5, ft6
+fadd.d ft4, ft4, ft5
+fadd.d ft5, fs0, fs1
+fld ft6, .Ld.4020000000000000, t6
+fadd.d ft6, fs1, ft6
+fmul.d ft5, ft5, ft6
+fadd.d ft6, fs0, fs1
+fld ft7, .Ld.4020000000000000, t6
+fadd.d ft7, fs1, ft7
+fmul.d ft6, ft6, ft7
+fadd.d ft5, ft5, ft6
+fadd.d ft4, ft4, ft5
+fmul.d ft3, ft3, ft4
+fld ft4, .Ld.4020000000000000, t6
+fadd.d ft4, fs1, ft4
+fmul.d ft3, ft3, ft4
+fadd.d ft4, fs0, fs1
+fld ft5, .Ld.4020000000000000, t6
+fadd.d ft5, fs1, ft5
+fmul.d ft4, ft4, ft5
+fadd.d ft3, ft3, ft4
+fadd.d ft4, fs0, fs1
+fld ft5, .Ld.4020000000000000, t6
+fadd.d ft5, fs1, ft5
+fmul.d ft4, ft4, ft5
+fadd.d ft5, fs0, fs1
+fld ft6, .Ld.4020000000000000, t6
+fadd.d ft6, fs1, ft6
+fmul.d ft5, ft5, ft6
+fadd.d ft4, ft4, ft5
+fadd.d ft3, ft3, ft4
+fadd.d ft4, fs0, fs1
+fadd.d ft5, fs0, fs1
+fld ft6, .Ld.4020000000000000, t6
+fadd.d ft6, fs1, ft6
+fmul.d ft5, ft5, ft6
+fadd.d ft6, fs0, fs1
+fld ft7, .Ld.4020000000000000, t6
+fadd.d ft7, fs1, ft7
+fmul.d ft6, ft6, ft7
+fadd.d ft5, ft5, ft6
+fadd.d ft6, fs0, fs1
+fld ft7, .Ld.4020000000000000, t6
+fadd.d ft7, fs1, ft7
+fmul.d ft6, ft6, ft7
+fadd.d ft7, fs0, fs1
+fld ft8, .Ld.4020000000000000, t6
+fadd.d ft8, fs1, ft8
+fmul.d ft7, ft7, ft8
+fadd.d ft6, ft6, ft7
+fadd.d ft5, ft5, ft6
+fadd.d ft6, fs0, fs1
+fld ft7, .Ld.4020000000000000, t6
+fadd.d ft7, fs1, ft7
+fmul.d ft6, ft6, ft7
+fadd.d ft7, fs0, fs1
+fld ft8, .Ld.4020000000000000, t6
+fadd.d ft8, fs1, ft8
+fmul.d ft7, ft7, ft8
+fadd.d ft6, ft6, ft7
+fadd.d ft7, fs0, fs1
+fld ft8, .Ld.4020000000000000, t6
+fadd.d ft8, fs1, ft8
+fmul.d ft7, ft7, ft8
+fadd.d ft8, fs0, fs1
+fld ft9, .Ld.4020000000000000, t6
+fadd.d ft9, fs1, ft9
+fmul.d ft8, ft8, ft9
+fadd.d ft7, ft7, ft8
+fadd.d ft6, ft6, ft7
+fmul.d ft5, ft5, ft6
+fld ft6, .Ld.4020000000000000, t6
+fadd.d ft6, fs1, ft6
+fmul.d ft5, ft5, ft6
+fadd.d ft6, fs0, fs1
+fld ft7, .Ld.4020000000000000, t6
+fadd.d ft7, fs1, ft7
+fmul.d ft6, ft6, ft7
+fadd.d ft5, ft5, ft6
+fadd.d ft6, fs0, fs1
+fld ft7, .Ld.4020000000000000, t6
+fadd.d ft7, fs1, ft7
+fmul.d ft6, ft6, ft7
+fadd.d ft7, fs0, fs1
+fld ft8, .Ld.4020000000000000, t6
+fadd.d ft8, fs1, ft8
+fmul.d ft7, ft7, ft8
+fadd.d ft6, ft6, ft7
+fadd.d ft5, ft5, ft6
+fadd.d ft6, fs0, fs1
+fld ft7, .Ld.4020000000000000, t6
+fadd.d ft7, fs1, ft7
+fmul.d ft6, ft6, ft7
+fadd.d ft7, fs0, fs1
+fld ft8, .Ld.4020000000000000, t6
+fadd.d ft8, fs1, ft8
+fmul.d ft7, ft7, ft8
+fadd.d ft6, ft6, ft7
+fadd.d ft7, fs0, fs1
+fld ft8, .Ld.4020000000000000, t6
+fadd.d ft8, fs1, ft8
+fmul.d ft7, ft7, ft8
+fadd.d ft8, fs0, fs1
+fld ft9, .Ld.4020000000000000, t6
+fadd.d ft9, fs1, ft9
+fmul.d ft8, ft8, ft9
+fadd.d ft7, ft7, ft8
+fadd.d ft6, ft6, ft7
+fmul.d ft5, ft5, ft6
+fmul.d ft4, ft4, ft5
+fadd.d ft5, fs0, fs1
+fld ft6, .Ld.4020000000000000, t6
+fadd.d ft6, fs1, ft6
+fmul.d ft5, ft5, ft6
+fadd.d ft4, ft4, ft5
+fadd.d ft5, fs0, fs1
+fld ft6, .Ld.4020000000000000, t6
+fadd.d ft6, fs1, ft6
+fmul.d ft5, ft5, ft6
+fadd.d ft6, fs0, fs1
+fld ft7, .Ld.4020000000000000, t6
+fadd.d ft7, fs1, ft7
+fmul.d ft6, ft6, ft7
+fadd.d ft5, ft5, ft6
+fadd.d ft4, ft4, ft5
+fmul.d ft3, ft3, ft4
+fmv.x.d t3, ft3
+mv a0, t3
+ld ra, 0(sp)
+fld fs0, 8(sp)
+fld fs1, 16(sp)
+addi sp, sp, 32
+ret
+main:
+la t3, .glob_x
+fld ft3, .Ld.4010000000000000, t6
+fsd ft3, 0(t3)
+la t3, .glob_y
+fld ft3, .Ld.4018000000000000, t6
+fsd ft3, 0(t3)
+la t3, .glob_z
+fld ft3, .Ld.4020000000000000, t6
+fsd ft3, 0(t3)
+la t3, .glob_x
+fld ft3, 0(t3)
+la t3, .glob_y
+fld ft4, 0(t3)
+fadd.d ft3, ft3, ft4
+la t3, .glob_y
+fld ft4, 0(t3)
+fld ft5, .Ld.4020000000000000, t6
+fadd.d ft4, ft4, ft5
+fmul.d ft3, ft3, ft4
+la t3, .glob_x
+fld ft4, 0(t3)
+la t3, .glob_y
+fld ft5, 0(t3)
+fadd.d ft4, ft4, ft5
+la t3, .glob_y
+fld ft5, 0(t3)
+fld ft6, .Ld.4020000000000000, t6
+fadd.d ft5, ft5, ft6
+fmul.d ft4, ft4, ft5
+fadd.d ft3, ft3, ft4
+la t3, .glob_x
+fld ft4, 0(t3)
+la t3, .glob_y
+fld ft5, 0(t3)
+fadd.d ft4, ft4, ft5
+la t3, .glob_y
+fld ft5, 0(t3)
+fld ft6, .Ld.4020000000000000, t6
+fadd.d ft5, ft5, ft6
+fmul.d ft4, ft4, ft5
+la t3, .glob_x
+fld ft5, 0(t3)
+la t3, .glob_y
+fld ft6, 0(t3)
+fadd.d ft5, ft5, ft6
+la t3, .glob_y
+fld ft6, 0(t3)
+fld ft7, .Ld.4020000000000000, t6
+fadd.d ft6, ft6, ft7
+fmul.d ft5, ft5, ft6
+fadd.d ft4, ft4, ft5
+fadd.d ft3, ft3, ft4
+la t3, .glob_x
+fld ft4, 0(t3)
+la t3, .glob_y
+fld ft5, 0(t3)
+fadd.d ft4, ft4, ft5
+la t3, .glob_x
+fld ft5, 0(t3)
+la t3, .glob_y
+fld ft6, 0(t3)
+fadd.d ft5, ft5, ft6
+la t3, .glob_y
+fld ft6, 0(t3)
+fld ft7, .Ld.4020000000000000, t6
+fadd.d ft6, ft6, ft7
+fmul.d ft5, ft5, ft6
+la t3, .glob_x
+fld ft6, 0(t3)
+la t3, .glob_y
+fld ft7, 0(t3)
+fadd.d ft6, ft6, ft7
+la t3, .glob_y
+fld ft7, 0(t3)
+fld ft8, .Ld.4020000000000000, t6
+fadd.d ft7, ft7, ft8
+fmul.d ft6, ft6, ft7
+fadd.d ft5, ft5, ft6
+la t3, .glob_x
+fld ft6, 0(t3)
+la t3, .glob_y
+fld ft7, 0(t3)
+fadd.d ft6, ft6, ft7
+la t3, .glob_y
+fld ft7, 0(t3)
+fld ft8, .Ld.4020000000000000, t6
+fadd.d ft7, ft7, ft8
+fmul.d ft6, ft6, ft7
+la t3, .glob_x
+fld ft7, 0(t3)
+la t3, .glob_y
+fld ft8, 0(t3)
+fadd.d ft7, ft7, ft8
+la t3, .glob_y
+fld ft8, 0(t3)
+fld ft9, .Ld.4020000000000000, t6
+fadd.d ft8, ft8, ft9
+fmul.d ft7, ft7, ft8
+fadd.d ft6, ft6, ft7
+fadd.d ft5, ft5, ft6
+la t3, .glob_x
+fld ft6, 0(t3)
+la t3, .glob_y
+fld ft7, 0(t3)
+fadd.d ft6, ft6, ft7
+la t3, .glob_y
+fld ft7, 0(t3)
+fld ft8, .Ld.4020000000000000, t6
+fadd.d ft7, ft7, ft8
+fmul.d ft6, ft6, ft7
+la t3, .glob_x
+fld ft7, 0(t3)
+la t3, .glob_y
+fld ft8, 0(t3)
+fadd.d ft7, ft7, ft8
+la t3, .glob_y
+fld ft8, 0(t3)
+fld ft9, .Ld.4020000000000000, t6
+fadd.d ft8, ft8, ft9
+fmul.d ft7, ft7, ft8
+fadd.d ft6, ft6, ft7
+la t3, .glob_x
+fld ft7, 0(t3)
+la t3, .glob_y
+fld ft8, 0(t3)
+fadd.d ft7, ft7, ft8
+la t3, .glob_y
+fld ft8, 0(t3)
+fld ft9, .Ld.4020000000000000, t6
+fadd.d ft8, ft8, ft9
+fmul.d ft7, ft7, ft8
+la t3, .glob_x
+fld ft8, 0(t3)
+la t3, .glob_y
+fld ft9, 0(t3)
+fadd.d ft8, ft8, ft9
+la t3, .glob_y
+fld ft9, 0(t3)
+fld ft10, .Ld.4020000000000000, t6
+fadd.d ft9, ft9, ft10
+fmul.d ft8, ft8, ft9
+fadd.d ft7, ft7, ft8
+fadd.d ft6, ft6, ft7
+fmul.d ft5, ft5, ft6
+la t3, .glob_y
+fld ft6, 0(t3)
+fld ft7, .Ld.4020000000000000, t6
+fadd.d ft6, ft6, ft7
+fmul.d ft5, ft5, ft6
+la t3, .glob_x
+fld ft6, 0(t3)
+la t3, .glob_y
+fld ft7, 0(t3)
+fadd.d ft6, ft6, ft7
+la t3, .glob_y
+fld ft7, 0(t3)
+fld ft8, .Ld.4020000000000000, t6
+fadd.d ft7, ft7, ft8
+fmul.d ft6, ft6, ft7
+fadd.d ft5, ft5, ft6
+la t3, .glob_x
+fld ft6, 0(t3)
+la t3, .glob_y
+fld ft7, 0(t3)
+fadd.d ft6, ft6, ft7
+la t3, .glob_y
+fld ft7, 0(t3)
+fld ft8, .Ld.4020000000000000, t6
+fadd.d ft7, ft7, ft8
+fmul.d ft6, ft6, ft7
+la t3, .glob_x
+fld ft7, 0(t3)
+la t3, .glob_y
+fld ft8, 0(t3)
+fadd.d ft7, ft7, ft8
+la t3, .glob_y
+fld ft8, 0(t3)
+fld ft9, .Ld.4020000000000000, t6
+fadd.d ft8, ft8, ft9
+fmul.d ft7, ft7, ft8
+fadd.d ft6, ft6, ft7
+fadd.d ft5, ft5, ft6
+la t3, .glob_x
+fld ft6, 0(t3)
+la t3, .glob_y
+fld ft7, 0(t3)
+fadd.d ft6, ft6, ft7
+la t3, .glob_x
+fld ft7, 0(t3)
+la t3, .glob_y
+fld ft8, 0(t3)
+fadd.d ft7, ft7, ft8
+la t3, .glob_y
+fld ft8, 0(t3)
+fld ft9, .Ld.4020000000000000, t6
+fadd.d ft8, ft8, ft9
+fmul.d ft7, ft7, ft8
+la t3, .glob_x
+fld ft8, 0(t3)
+la t3, .glob_y
+fld ft9, 0(t3)
+fadd.d ft8, ft8, ft9
+la t3, .glob_y
+fld ft9, 0(t3)
+fld ft10, .Ld.4020000000000000, t6
+fadd.d ft9, ft9, ft10
+fmul.d ft8, ft8, ft9
+fadd.d ft7, ft7, ft8
+la t3, .glob_x
+fld ft8, 0(t3)
+la t3, .glob_y
+fld ft9, 0(t3)
+fadd.d ft8, ft8, ft9
+la t3, .glob_y
+fld ft9, 0(t3)
+fld ft10, .Ld.4020000000000000, t6
+fadd.d ft9, ft9, ft10
+fmul.d ft8, ft8, ft9
+la t3, .glob_x
+fld ft9, 0(t3)
+la t3, .glob_y
+fld ft10, 0(t3)
+fadd.d ft9, ft9, ft10
+la t3, .glob_y
+fld ft10, 0(t3)
+fld ft11, .Ld.4020000000000000, t6
+fadd.d ft10, ft10, ft11
+fmul.d ft9, ft9, ft10
+fadd.d ft8, ft8, ft9
+fadd.d ft7, ft7, ft8
+la t3, .glob_x
+fld ft8, 0(t3)
+la t3, .glob_y
+fld ft9, 0(t3)
+fadd.d ft8, ft8, ft9
+la t3, .glob_y
+fld ft9, 0(t3)
+fld ft10, .Ld.4020000000000000, t6
+fadd.d ft9, ft9, ft10
+fmul.d ft8, ft8, ft9
+la t3, .glob_x
+fld ft9, 0(t3)
+la t3, .glob_y
+fld ft10, 0(t3)
+fadd.d ft9, ft9, ft10
+la t3, .glob_y
+fld ft10, 0(t3)
+fld ft11, .Ld.4020000000000000, t6
+fadd.d ft10, ft10, ft11
+fmul.d ft9, ft9, ft10
+fadd.d ft8, ft8, ft9
+la t3, .glob_x
+fld ft9, 0(t3)
+la t3, .glob_y
+fld ft10, 0(t3)
+fadd.d ft9, ft9, ft10
+la t3, .glob_y
+fld ft10, 0(t3)
+fld ft11, .Ld.4020000000000000, t6
+fadd.d ft10, ft10, ft11
+fmul.d ft9, ft9, ft10
+la t3, .glob_x
+fld ft10, 0(t3)
+la t3, .glob_y
+fld ft11, 0(t3)
+fadd.d ft10, ft10, ft11
+la t3, .glob_y
+fld ft11, 0(t3)
+fld fa0, .Ld.4020000000000000, t6
+fadd.d ft11, ft11, fa0
+fmul.d ft10, ft10, ft11
+fadd.d ft9, ft9, ft10
+fadd.d ft8, ft8, ft9
+fmul.d ft7, ft7, ft8
+la t3, .glob_y
+fld ft8, 0(t3)
+fld ft9, .Ld.4020000000000000, t6
+fadd.d ft8, ft8, ft9
+fmul.d ft7, ft7, ft8
+la t3, .glob_x
+fld ft8, 0(t3)
+la t3, .glob_y
+fld ft9, 0(t3)
+fadd.d ft8, ft8, ft9
+la t3, .glob_y
+fld ft9, 0(t3)
+fld ft10, .Ld.4020000000000000, t6
+fadd.d ft9, ft9, ft10
+fmul.d ft8, ft8, ft9
+fadd.d ft7, ft7, ft8
+la t3, .glob_x
+fld ft8, 0(t3)
+la t3, .glob_y
+fld ft9, 0(t3)
+fadd.d ft8, ft8, ft9
+la t3, .glob_y
+fld ft9, 0(t3)
+fld ft10, .Ld.4020000000000000, t6
+fadd.d ft9, ft9, ft10
+fmul.d ft8, ft8, ft9
+la t3, .glob_x
+fld ft9, 0(t3)
+la t3, .glob_y
+fld ft10, 0(t3)
+fadd.d ft9, ft9, ft10
+la t3, .glob_y
+fld ft10, 0(t3)
+fld ft11, .Ld.4020000000000000, t6
+fadd.d ft10, ft10, ft11
+fmul.d ft9, ft9, ft10
+fadd.d ft8, ft8, ft9
+fadd.d ft7, ft7, ft8
+la t3, .glob_x
+fld ft8, 0(t3)
+la t3, .glob_y
+fld ft9, 0(t3)
+fadd.d ft8, ft8, ft9
+la t3, .glob_y
+fld ft9, 0(t3)
+fld ft10, .Ld.4020000000000000, t6
+fadd.d ft9, ft9, ft10
+fmul.d ft8, ft8, ft9
+la t3, .glob_x
+fld ft9, 0(t3)
+la t3, .glob_y
+fld ft10, 0(t3)
+fadd.d ft9, ft9, ft10
+la t3, .glob_y
+fld ft10, 0(t3)
+fld ft11, .Ld.4020000000000000, t6
+fadd.d ft10, ft10, ft11
+fmul.d ft9, ft9, ft10
+fadd.d ft8, ft8, ft9
+la t3, .glob_x
+fld ft9, 0(t3)
+la t3, .glob_y
+fld ft10, 0(t3)
+fadd.d ft9, ft9, ft10
+la t3, .glob_y
+fld ft10, 0(t3)
+fld ft11, .Ld.4020000000000000, t6
+fadd.d ft10, ft10, ft11
+fmul.d ft9, ft9, ft10
+la t3, .glob_x
+fld ft10, 0(t3)
+la t3, .glob_y
+fld ft11, 0(t3)
+fadd.d ft10, ft10, ft11
+la t3, .glob_y
+fld ft11, 0(t3)
+fld fa0, .Ld.4020000000000000, t6
+fadd.d ft11, ft11, fa0
+fmul.d ft10, ft10, ft11
+fadd.d ft9, ft9, ft10
+fadd.d ft8, ft8, ft9
+fmul.d ft7, ft7, ft8
+fmul.d ft6, ft6, ft7
+la t3, .glob_x
+fld ft7, 0(t3)
+la t3, .glob_y
+fld ft8, 0(t3)
+fadd.d ft7, ft7, ft8
+la t3, .glob_y
+fld ft8, 0(t3)
+fld ft9, .Ld.4020000000000000, t6
+fadd.d ft8, ft8, ft9
+fmul.d ft7, ft7, ft8
+fadd.d ft6, ft6, ft7
+la t3, .glob_x
+fld ft7, 0(t3)
+la t3, .glob_y
+fld ft8, 0(t3)
+fadd.d ft7, ft7, ft8
+la t3, .glob_y
+fld ft8, 0(t3)
+fld ft9, .Ld.4020000000000000, t6
+fadd.d ft8, ft8, ft9
+fmul.d ft7, ft7, ft8
+la t3, .glob_x
+fld ft8, 0(t3)
+la t3, .glob_y
+fld ft9, 0(t3)
+fadd.d ft8, ft8, ft9
+la t3, .glob_y
+fld ft9, 0(t3)
+fld ft10, .Ld.4020000000000000, t6
+fadd.d ft9, ft9, ft10
+fmul.d ft8, ft8, ft9
+fadd.d ft7, ft7, ft8
+fadd.d ft6, ft6, ft7
+fmul.d ft5, ft5, ft6
+fmul.d ft4, ft4, ft5
+la t3, .glob_x
+fld ft5, 0(t3)
+la t3, .glob_y
+fld ft6, 0(t3)
+fadd.d ft5, ft5, ft6
+la t3, .glob_y
+fld ft6, 0(t3)
+fld ft7, .Ld.4020000000000000, t6
+fadd.d ft6, ft6, ft7
+fmul.d ft5, ft5, ft6
+fadd.d ft4, ft4, ft5
+la t3, .glob_x
+fld ft5, 0(t3)
+la t3, .glob_y
+fld ft6, 0(t3)
+fadd.d ft5, ft5, ft6
+la t3, .glob_y
+fld ft6, 0(t3)
+fld ft7, .Ld.4020000000000000, t6
+fadd.d ft6, ft6, ft7
+fmul.d ft5, ft5, ft6
+la t3, .glob_x
+fld ft6, 0(t3)
+la t3, .glob_y
+fld ft7, 0(t3)
+fadd.d ft6, ft6, ft7
+la t3, .glob_y
+fld ft7, 0(t3)
+fld ft8, .Ld.4020000000000000, t6
+fadd.d ft7, ft7, ft8
+fmul.d ft6, ft6, ft7
+fadd.d ft5, ft5, ft6
+fadd.d ft4, ft4, ft5
+fmul.d ft3, ft3, ft4
+la t3, .glob_y
+fld ft4, 0(t3)
+fld ft5, .Ld.4020000000000000, t6
+fadd.d ft4, ft4, ft5
+fmul.d ft3, ft3, ft4
+la t3, .glob_x
+fld ft4, 0(t3)
+la t3, .glob_y
+fld ft5, 0(t3)
+fadd.d ft4, ft4, ft5
+la t3, .glob_y
+fld ft5, 0(t3)
+fld ft6, .Ld.4020000000000000, t6
+fadd.d ft5, ft5, ft6
+fmul.d ft4, ft4, ft5
+fadd.d ft3, ft3, ft4
+la t3, .glob_x
+fld ft4, 0(t3)
+la t3, .glob_y
+fld ft5, 0(t3)
+fadd.d ft4, ft4, ft5
+la t3, .glob_y
+fld ft5, 0(t3)
+fld ft6, .Ld.4020000000000000, t6
+fadd.d ft5, ft5, ft6
+fmul.d ft4, ft4, ft5
+la t3, .glob_x
+fld ft5, 0(t3)
+la t3, .glob_y
+fld ft6, 0(t3)
+fadd.d ft5, ft5, ft6
+la t3, .glob_y
+fld ft6, 0(t3)
+fld ft7, .Ld.4020000000000000, t6
+fadd.d ft6, ft6, ft7
+fmul.d ft5, ft5, ft6
+fadd.d ft4, ft4, ft5
+fadd.d ft3, ft3, ft4
+la t3, .glob_x
+fld ft4, 0(t3)
+la t3, .glob_y
+fld ft5, 0(t3)
+fadd.d ft4, ft4, ft5
+la t3, .glob_x
+fld ft5, 0(t3)
+la t3, .glob_y
+fld ft6, 0(t3)
+fadd.d ft5, ft5, ft6
+la t3, .glob_y
+fld ft6, 0(t3)
+fld ft7, .Ld.4020000000000000, t6
+fadd.d ft6, ft6, ft7
+fmul.d ft5, ft5, ft6
+la t3, .glob_x
+fld ft6, 0(t3)
+la t3, .glob_y
+fld ft7, 0(t3)
+fadd.d ft6, ft6, ft7
+la t3, .glob_y
+fld ft7, 0(t3)
+fld ft8, .Ld.4020000000000000, t6
+fadd.d ft7, ft7, ft8
+fmul.d ft6, ft6, ft7
+fadd.d ft5, ft5, ft6
+la t3, .glob_x
+fld ft6, 0(t3)
+la t3, .glob_y
+fld ft7, 0(t3)
+fadd.d ft6, ft6, ft7
+la t3, .glob_y
+fld ft7, 0(t3)
+fld ft8, .Ld.4020000000000000, t6
+fadd.d ft7, ft7, ft8
+fmul.d ft6, ft6, ft7
+la t3, .glob_x
+fld ft7, 0(t3)
+la t3, .glob_y
+fld ft8, 0(t3)
+fadd.d ft7, ft7, ft8
+la t3, .glob_y
+fld ft8, 0(t3)
+fld ft9, .Ld.4020000000000000, t6
+fadd.d ft8, ft8, ft9
+fmul.d ft7, ft7, ft8
+fadd.d ft6, ft6, ft7
+fadd.d ft5, ft5, ft6
+la t3, .glob_x
+fld ft6, 0(t3)
+la t3, .glob_y
+fld ft7, 0(t3)
+fadd.d ft6, ft6, ft7
+la t3, .glob_y
+fld ft7, 0(t3)
+fld ft8, .Ld.4020000000000000, t6
+fadd.d ft7, ft7, ft8
+fmul.d ft6, ft6, ft7
+la t3, .glob_x
+fld ft7, 0(t3)
+la t3, .glob_y
+fld ft8, 0(t3)
+fadd.d ft7, ft7, ft8
+la t3, .glob_y
+fld ft8, 0(t3)
+fld ft9, .Ld.4020000000000000, t6
+fadd.d ft8, ft8, ft9
+fmul.d ft7, ft7, ft8
+fadd.d ft6, ft6, ft7
+la t3, .glob_x
+fld ft7, 0(t3)
+la t3, .glob_y
+fld ft8, 0(t3)
+fadd.d ft7, ft7, ft8
+la t3, .glob_y
+fld ft8, 0(t3)
+fld ft9, .Ld.4020000000000000, t6
+fadd.d ft8, ft8, ft9
+fmul.d ft7, ft7, ft8
+la t3, .glob_x
+fld ft8, 0(t3)
+la t3, .glob_y
+fld ft9, 0(t3)
+fadd.d ft8, ft8, ft9
+la t3, .glob_y
+fld ft9, 0(t3)
+fld ft10, .Ld.4020000000000000, t6
+fadd.d ft9, ft9, ft10
+fmul.d ft8, ft8, ft9
+fadd.d ft7, ft7, ft8
+fadd.d ft6, ft6, ft7
+fmul.d ft5, ft5, ft6
+la t3, .glob_y
+fld ft6, 0(t3)
+fld ft7, .Ld.4020000000000000, t6
+fadd.d ft6, ft6, ft7
+fmul.d ft5, ft5, ft6
+la t3, .glob_x
+fld ft6, 0(t3)
+la t3, .glob_y
+fld ft7, 0(t3)
+fadd.d ft6, ft6, ft7
+la t3, .glob_y
+fld ft7, 0(t3)
+fld ft8, .Ld.4020000000000000, t6
+fadd.d ft7, ft7, ft8
+fmul.d ft6, ft6, ft7
+fadd.d ft5, ft5, ft6
+la t3, .glob_x
+fld ft6, 0(t3)
+la t3, .glob_y
+fld ft7, 0(t3)
+fadd.d ft6, ft6, ft7
+la t3, .glob_y
+fld ft7, 0(t3)
+fld ft8, .Ld.4020000000000000, t6
+fadd.d ft7, ft7, ft8
+fmul.d ft6, ft6, ft7
+la t3, .glob_x
+fld ft7, 0(t3)
+la t3, .glob_y
+fld ft8, 0(t3)
+fadd.d ft7, ft7, ft8
+la t3, .glob_y
+fld ft8, 0(t3)
+fld ft9, .Ld.4020000000000000, t6
+fadd.d ft8, ft8, ft9
+fmul.d ft7, ft7, ft8
+fadd.d ft6, ft6, ft7
+fadd.d ft5, ft5, ft6
+la t3, .glob_x
+fld ft6, 0(t3)
+la t3, .glob_y
+fld ft7, 0(t3)
+fadd.d ft6, ft6, ft7
+la t3, .glob_y
+fld ft7, 0(t3)
+fld ft8, .Ld.4020000000000000, t6
+fadd.d ft7, ft7, ft8
+fmul.d ft6, ft6, ft7
+la t3, .glob_x
+fld ft7, 0(t3)
+la t3, .glob_y
+fld ft8, 0(t3)
+fadd.d ft7, ft7, ft8
+la t3, .glob_y
+fld ft8, 0(t3)
+fld ft9, .Ld.4020000000000000, t6
+fadd.d ft8, ft8, ft9
+fmul.d ft7, ft7, ft8
+fadd.d ft6, ft6, ft7
+la t3, .glob_x
+fld ft7, 0(t3)
+la t3, .glob_y
+fld ft8, 0(t3)
+fadd.d ft7, ft7, ft8
+la t3, .glob_y
+fld ft8, 0(t3)
+fld ft9, .Ld.4020000000000000, t6
+fadd.d ft8, ft8, ft9
+fmul.d ft7, ft7, ft8
+la t3, .glob_x
+fld ft8, 0(t3)
+la t3, .glob_y
+fld ft9, 0(t3)
+fadd.d ft8, ft8, ft9
+la t3, .glob_y
+fld ft9, 0(t3)
+fld ft10, .Ld.4020000000000000, t6
+fadd.d ft9, ft9, ft10
+fmul.d ft8, ft8, ft9
+fadd.d ft7, ft7, ft8
+fadd.d ft6, ft6, ft7
+fmul.d ft5, ft5, ft6
+fmul.d ft4, ft4, ft5
+la t3, .glob_x
+fld ft5, 0(t3)
+la t3, .glob_y
+fld ft6, 0(t3)
+fadd.d ft5, ft5, ft6
+la t3, .glob_y
+fld ft6, 0(t3)
+fld ft7, .Ld.4020000000000000, t6
+fadd.d ft6, ft6, ft7
+fmul.d ft5, ft5, ft6
+fadd.d ft4, ft4, ft5
+la t3, .glob_x
+fld ft5, 0(t3)
+la t3, .glob_y
+fld ft6, 0(t3)
+fadd.d ft5, ft5, ft6
+la t3, .glob_y
+fld ft6, 0(t3)
+fld ft7, .Ld.4020000000000000, t6
+fadd.d ft6, ft6, ft7
+fmul.d ft5, ft5, ft6
+la t3, .glob_x
+fld ft6, 0(t3)
+la t3, .glob_y
+fld ft7, 0(t3)
+fadd.d ft6, ft6, ft7
+la t3, .glob_y
+fld ft7, 0(t3)
+fld ft8, .Ld.4020000000000000, t6
+fadd.d ft7, ft7, ft8
+fmul.d ft6, ft6, ft7
+fadd.d ft5, ft5, ft6
+fadd.d ft4, ft4, ft5
+fmul.d ft3, ft3, ft4
+la a0, .floatformat
+fmv.x.d a1, ft3
+call printf
+la t3, .glob_x
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_x
+mv t3, a0
+fmv.d.x fs0, t3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fadd.d fs0, fs0, ft3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fld ft4, .Ld.4020000000000000, t6
+fadd.d ft3, ft3, ft4
+fmul.d fs0, fs0, ft3
+la t3, .glob_x
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_x
+mv t3, a0
+fmv.d.x fs1, t3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fadd.d fs1, fs1, ft3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fld ft4, .Ld.4020000000000000, t6
+fadd.d ft3, ft3, ft4
+fmul.d ft3, fs1, ft3
+fadd.d fs0, fs0, ft3
+la t3, .glob_x
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_x
+mv t3, a0
+fmv.d.x fs1, t3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fadd.d fs1, fs1, ft3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fld ft4, .Ld.4020000000000000, t6
+fadd.d ft3, ft3, ft4
+fmul.d fs1, fs1, ft3
+la t3, .glob_x
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_x
+mv t3, a0
+fmv.d.x fs2, t3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fadd.d fs2, fs2, ft3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fld ft4, .Ld.4020000000000000, t6
+fadd.d ft3, ft3, ft4
+fmul.d ft3, fs2, ft3
+fadd.d ft3, fs1, ft3
+fadd.d fs0, fs0, ft3
+la t3, .glob_x
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_x
+mv t3, a0
+fmv.d.x fs1, t3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fadd.d fs1, fs1, ft3
+la t3, .glob_x
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_x
+mv t3, a0
+fmv.d.x fs2, t3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fadd.d fs2, fs2, ft3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fld ft4, .Ld.4020000000000000, t6
+fadd.d ft3, ft3, ft4
+fmul.d fs2, fs2, ft3
+la t3, .glob_x
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_x
+mv t3, a0
+fmv.d.x fs3, t3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fadd.d fs3, fs3, ft3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fld ft4, .Ld.4020000000000000, t6
+fadd.d ft3, ft3, ft4
+fmul.d ft3, fs3, ft3
+fadd.d fs2, fs2, ft3
+la t3, .glob_x
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_x
+mv t3, a0
+fmv.d.x fs3, t3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fadd.d fs3, fs3, ft3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fld ft4, .Ld.4020000000000000, t6
+fadd.d ft3, ft3, ft4
+fmul.d fs3, fs3, ft3
+la t3, .glob_x
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_x
+mv t3, a0
+fmv.d.x fs4, t3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fadd.d fs4, fs4, ft3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fld ft4, .Ld.4020000000000000, t6
+fadd.d ft3, ft3, ft4
+fmul.d ft3, fs4, ft3
+fadd.d ft3, fs3, ft3
+fadd.d fs2, fs2, ft3
+la t3, .glob_x
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_x
+mv t3, a0
+fmv.d.x fs3, t3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fadd.d fs3, fs3, ft3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fld ft4, .Ld.4020000000000000, t6
+fadd.d ft3, ft3, ft4
+fmul.d fs3, fs3, ft3
+la t3, .glob_x
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_x
+mv t3, a0
+fmv.d.x fs4, t3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fadd.d fs4, fs4, ft3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fld ft4, .Ld.4020000000000000, t6
+fadd.d ft3, ft3, ft4
+fmul.d ft3, fs4, ft3
+fadd.d fs3, fs3, ft3
+la t3, .glob_x
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_x
+mv t3, a0
+fmv.d.x fs4, t3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fadd.d fs4, fs4, ft3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fld ft4, .Ld.4020000000000000, t6
+fadd.d ft3, ft3, ft4
+fmul.d fs4, fs4, ft3
+la t3, .glob_x
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_x
+mv t3, a0
+fmv.d.x fs5, t3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fadd.d fs5, fs5, ft3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fld ft4, .Ld.4020000000000000, t6
+fadd.d ft3, ft3, ft4
+fmul.d ft3, fs5, ft3
+fadd.d ft3, fs4, ft3
+fadd.d ft3, fs3, ft3
+fmul.d fs2, fs2, ft3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fld ft4, .Ld.4020000000000000, t6
+fadd.d ft3, ft3, ft4
+fmul.d fs2, fs2, ft3
+la t3, .glob_x
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_x
+mv t3, a0
+fmv.d.x fs3, t3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fadd.d fs3, fs3, ft3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fld ft4, .Ld.4020000000000000, t6
+fadd.d ft3, ft3, ft4
+fmul.d ft3, fs3, ft3
+fadd.d fs2, fs2, ft3
+la t3, .glob_x
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_x
+mv t3, a0
+fmv.d.x fs3, t3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fadd.d fs3, fs3, ft3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fld ft4, .Ld.4020000000000000, t6
+fadd.d ft3, ft3, ft4
+fmul.d fs3, fs3, ft3
+la t3, .glob_x
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_x
+mv t3, a0
+fmv.d.x fs4, t3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fadd.d fs4, fs4, ft3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fld ft4, .Ld.4020000000000000, t6
+fadd.d ft3, ft3, ft4
+fmul.d ft3, fs4, ft3
+fadd.d ft3, fs3, ft3
+fadd.d fs2, fs2, ft3
+la t3, .glob_x
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_x
+mv t3, a0
+fmv.d.x fs3, t3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fadd.d fs3, fs3, ft3
+la t3, .glob_x
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_x
+mv t3, a0
+fmv.d.x fs4, t3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fadd.d fs4, fs4, ft3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fld ft4, .Ld.4020000000000000, t6
+fadd.d ft3, ft3, ft4
+fmul.d fs4, fs4, ft3
+la t3, .glob_x
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_x
+mv t3, a0
+fmv.d.x fs5, t3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fadd.d fs5, fs5, ft3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fld ft4, .Ld.4020000000000000, t6
+fadd.d ft3, ft3, ft4
+fmul.d ft3, fs5, ft3
+fadd.d fs4, fs4, ft3
+la t3, .glob_x
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_x
+mv t3, a0
+fmv.d.x fs5, t3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fadd.d fs5, fs5, ft3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fld ft4, .Ld.4020000000000000, t6
+fadd.d ft3, ft3, ft4
+fmul.d fs5, fs5, ft3
+la t3, .glob_x
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_x
+mv t3, a0
+fmv.d.x fs6, t3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fadd.d fs6, fs6, ft3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fld ft4, .Ld.4020000000000000, t6
+fadd.d ft3, ft3, ft4
+fmul.d ft3, fs6, ft3
+fadd.d ft3, fs5, ft3
+fadd.d fs4, fs4, ft3
+la t3, .glob_x
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_x
+mv t3, a0
+fmv.d.x fs5, t3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fadd.d fs5, fs5, ft3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fld ft4, .Ld.4020000000000000, t6
+fadd.d ft3, ft3, ft4
+fmul.d fs5, fs5, ft3
+la t3, .glob_x
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_x
+mv t3, a0
+fmv.d.x fs6, t3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fadd.d fs6, fs6, ft3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fld ft4, .Ld.4020000000000000, t6
+fadd.d ft3, ft3, ft4
+fmul.d ft3, fs6, ft3
+fadd.d fs5, fs5, ft3
+la t3, .glob_x
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_x
+mv t3, a0
+fmv.d.x fs6, t3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fadd.d fs6, fs6, ft3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fld ft4, .Ld.4020000000000000, t6
+fadd.d ft3, ft3, ft4
+fmul.d fs6, fs6, ft3
+la t3, .glob_x
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_x
+mv t3, a0
+fmv.d.x fs7, t3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fadd.d fs7, fs7, ft3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fld ft4, .Ld.4020000000000000, t6
+fadd.d ft3, ft3, ft4
+fmul.d ft3, fs7, ft3
+fadd.d ft3, fs6, ft3
+fadd.d ft3, fs5, ft3
+fmul.d fs4, fs4, ft3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fld ft4, .Ld.4020000000000000, t6
+fadd.d ft3, ft3, ft4
+fmul.d fs4, fs4, ft3
+la t3, .glob_x
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_x
+mv t3, a0
+fmv.d.x fs5, t3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fadd.d fs5, fs5, ft3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fld ft4, .Ld.4020000000000000, t6
+fadd.d ft3, ft3, ft4
+fmul.d ft3, fs5, ft3
+fadd.d fs4, fs4, ft3
+la t3, .glob_x
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_x
+mv t3, a0
+fmv.d.x fs5, t3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fadd.d fs5, fs5, ft3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fld ft4, .Ld.4020000000000000, t6
+fadd.d ft3, ft3, ft4
+fmul.d fs5, fs5, ft3
+la t3, .glob_x
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_x
+mv t3, a0
+fmv.d.x fs6, t3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fadd.d fs6, fs6, ft3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fld ft4, .Ld.4020000000000000, t6
+fadd.d ft3, ft3, ft4
+fmul.d ft3, fs6, ft3
+fadd.d ft3, fs5, ft3
+fadd.d fs4, fs4, ft3
+la t3, .glob_x
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_x
+mv t3, a0
+fmv.d.x fs5, t3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fadd.d fs5, fs5, ft3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fld ft4, .Ld.4020000000000000, t6
+fadd.d ft3, ft3, ft4
+fmul.d fs5, fs5, ft3
+la t3, .glob_x
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_x
+mv t3, a0
+fmv.d.x fs6, t3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fadd.d fs6, fs6, ft3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fld ft4, .Ld.4020000000000000, t6
+fadd.d ft3, ft3, ft4
+fmul.d ft3, fs6, ft3
+fadd.d fs5, fs5, ft3
+la t3, .glob_x
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_x
+mv t3, a0
+fmv.d.x fs6, t3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fadd.d fs6, fs6, ft3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fld ft4, .Ld.4020000000000000, t6
+fadd.d ft3, ft3, ft4
+fmul.d fs6, fs6, ft3
+la t3, .glob_x
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_x
+mv t3, a0
+fmv.d.x fs7, t3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fadd.d fs7, fs7, ft3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fld ft4, .Ld.4020000000000000, t6
+fadd.d ft3, ft3, ft4
+fmul.d ft3, fs7, ft3
+fadd.d ft3, fs6, ft3
+fadd.d ft3, fs5, ft3
+fmul.d ft3, fs4, ft3
+fmul.d fs3, fs3, ft3
+la t3, .glob_x
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_x
+mv t3, a0
+fmv.d.x fs4, t3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fadd.d fs4, fs4, ft3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fld ft4, .Ld.4020000000000000, t6
+fadd.d ft3, ft3, ft4
+fmul.d ft3, fs4, ft3
+fadd.d fs3, fs3, ft3
+la t3, .glob_x
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_x
+mv t3, a0
+fmv.d.x fs4, t3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fadd.d fs4, fs4, ft3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fld ft4, .Ld.4020000000000000, t6
+fadd.d ft3, ft3, ft4
+fmul.d fs4, fs4, ft3
+la t3, .glob_x
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_x
+mv t3, a0
+fmv.d.x fs5, t3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fadd.d fs5, fs5, ft3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fld ft4, .Ld.4020000000000000, t6
+fadd.d ft3, ft3, ft4
+fmul.d ft3, fs5, ft3
+fadd.d ft3, fs4, ft3
+fadd.d ft3, fs3, ft3
+fmul.d ft3, fs2, ft3
+fmul.d fs1, fs1, ft3
+la t3, .glob_x
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_x
+mv t3, a0
+fmv.d.x fs2, t3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fadd.d fs2, fs2, ft3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fld ft4, .Ld.4020000000000000, t6
+fadd.d ft3, ft3, ft4
+fmul.d ft3, fs2, ft3
+fadd.d fs1, fs1, ft3
+la t3, .glob_x
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_x
+mv t3, a0
+fmv.d.x fs2, t3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fadd.d fs2, fs2, ft3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fld ft4, .Ld.4020000000000000, t6
+fadd.d ft3, ft3, ft4
+fmul.d fs2, fs2, ft3
+la t3, .glob_x
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_x
+mv t3, a0
+fmv.d.x fs3, t3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fadd.d fs3, fs3, ft3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fld ft4, .Ld.4020000000000000, t6
+fadd.d ft3, ft3, ft4
+fmul.d ft3, fs3, ft3
+fadd.d ft3, fs2, ft3
+fadd.d ft3, fs1, ft3
+fmul.d fs0, fs0, ft3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fld ft4, .Ld.4020000000000000, t6
+fadd.d ft3, ft3, ft4
+fmul.d fs0, fs0, ft3
+la t3, .glob_x
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_x
+mv t3, a0
+fmv.d.x fs1, t3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fadd.d fs1, fs1, ft3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fld ft4, .Ld.4020000000000000, t6
+fadd.d ft3, ft3, ft4
+fmul.d ft3, fs1, ft3
+fadd.d fs0, fs0, ft3
+la t3, .glob_x
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_x
+mv t3, a0
+fmv.d.x fs1, t3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fadd.d fs1, fs1, ft3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fld ft4, .Ld.4020000000000000, t6
+fadd.d ft3, ft3, ft4
+fmul.d fs1, fs1, ft3
+la t3, .glob_x
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_x
+mv t3, a0
+fmv.d.x fs2, t3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fadd.d fs2, fs2, ft3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fld ft4, .Ld.4020000000000000, t6
+fadd.d ft3, ft3, ft4
+fmul.d ft3, fs2, ft3
+fadd.d ft3, fs1, ft3
+fadd.d fs0, fs0, ft3
+la t3, .glob_x
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_x
+mv t3, a0
+fmv.d.x fs1, t3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fadd.d fs1, fs1, ft3
+la t3, .glob_x
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_x
+mv t3, a0
+fmv.d.x fs2, t3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fadd.d fs2, fs2, ft3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fld ft4, .Ld.4020000000000000, t6
+fadd.d ft3, ft3, ft4
+fmul.d fs2, fs2, ft3
+la t3, .glob_x
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_x
+mv t3, a0
+fmv.d.x fs3, t3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fadd.d fs3, fs3, ft3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fld ft4, .Ld.4020000000000000, t6
+fadd.d ft3, ft3, ft4
+fmul.d ft3, fs3, ft3
+fadd.d fs2, fs2, ft3
+la t3, .glob_x
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_x
+mv t3, a0
+fmv.d.x fs3, t3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fadd.d fs3, fs3, ft3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fld ft4, .Ld.4020000000000000, t6
+fadd.d ft3, ft3, ft4
+fmul.d fs3, fs3, ft3
+la t3, .glob_x
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_x
+mv t3, a0
+fmv.d.x fs4, t3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fadd.d fs4, fs4, ft3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fld ft4, .Ld.4020000000000000, t6
+fadd.d ft3, ft3, ft4
+fmul.d ft3, fs4, ft3
+fadd.d ft3, fs3, ft3
+fadd.d fs2, fs2, ft3
+la t3, .glob_x
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_x
+mv t3, a0
+fmv.d.x fs3, t3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fadd.d fs3, fs3, ft3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fld ft4, .Ld.4020000000000000, t6
+fadd.d ft3, ft3, ft4
+fmul.d fs3, fs3, ft3
+la t3, .glob_x
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_x
+mv t3, a0
+fmv.d.x fs4, t3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fadd.d fs4, fs4, ft3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fld ft4, .Ld.4020000000000000, t6
+fadd.d ft3, ft3, ft4
+fmul.d ft3, fs4, ft3
+fadd.d fs3, fs3, ft3
+la t3, .glob_x
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_x
+mv t3, a0
+fmv.d.x fs4, t3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fadd.d fs4, fs4, ft3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fld ft4, .Ld.4020000000000000, t6
+fadd.d ft3, ft3, ft4
+fmul.d fs4, fs4, ft3
+la t3, .glob_x
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_x
+mv t3, a0
+fmv.d.x fs5, t3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fadd.d fs5, fs5, ft3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fld ft4, .Ld.4020000000000000, t6
+fadd.d ft3, ft3, ft4
+fmul.d ft3, fs5, ft3
+fadd.d ft3, fs4, ft3
+fadd.d ft3, fs3, ft3
+fmul.d fs2, fs2, ft3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fld ft4, .Ld.4020000000000000, t6
+fadd.d ft3, ft3, ft4
+fmul.d fs2, fs2, ft3
+la t3, .glob_x
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_x
+mv t3, a0
+fmv.d.x fs3, t3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fadd.d fs3, fs3, ft3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fld ft4, .Ld.4020000000000000, t6
+fadd.d ft3, ft3, ft4
+fmul.d ft3, fs3, ft3
+fadd.d fs2, fs2, ft3
+la t3, .glob_x
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_x
+mv t3, a0
+fmv.d.x fs3, t3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fadd.d fs3, fs3, ft3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fld ft4, .Ld.4020000000000000, t6
+fadd.d ft3, ft3, ft4
+fmul.d fs3, fs3, ft3
+la t3, .glob_x
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_x
+mv t3, a0
+fmv.d.x fs4, t3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fadd.d fs4, fs4, ft3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fld ft4, .Ld.4020000000000000, t6
+fadd.d ft3, ft3, ft4
+fmul.d ft3, fs4, ft3
+fadd.d ft3, fs3, ft3
+fadd.d fs2, fs2, ft3
+la t3, .glob_x
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_x
+mv t3, a0
+fmv.d.x fs3, t3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fadd.d fs3, fs3, ft3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fld ft4, .Ld.4020000000000000, t6
+fadd.d ft3, ft3, ft4
+fmul.d fs3, fs3, ft3
+la t3, .glob_x
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_x
+mv t3, a0
+fmv.d.x fs4, t3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fadd.d fs4, fs4, ft3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fld ft4, .Ld.4020000000000000, t6
+fadd.d ft3, ft3, ft4
+fmul.d ft3, fs4, ft3
+fadd.d fs3, fs3, ft3
+la t3, .glob_x
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_x
+mv t3, a0
+fmv.d.x fs4, t3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fadd.d fs4, fs4, ft3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fld ft4, .Ld.4020000000000000, t6
+fadd.d ft3, ft3, ft4
+fmul.d fs4, fs4, ft3
+la t3, .glob_x
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_x
+mv t3, a0
+fmv.d.x fs5, t3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fadd.d fs5, fs5, ft3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fld ft4, .Ld.4020000000000000, t6
+fadd.d ft3, ft3, ft4
+fmul.d ft3, fs5, ft3
+fadd.d ft3, fs4, ft3
+fadd.d ft3, fs3, ft3
+fmul.d ft3, fs2, ft3
+fmul.d fs1, fs1, ft3
+la t3, .glob_x
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_x
+mv t3, a0
+fmv.d.x fs2, t3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fadd.d fs2, fs2, ft3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fld ft4, .Ld.4020000000000000, t6
+fadd.d ft3, ft3, ft4
+fmul.d ft3, fs2, ft3
+fadd.d fs1, fs1, ft3
+la t3, .glob_x
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_x
+mv t3, a0
+fmv.d.x fs2, t3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fadd.d fs2, fs2, ft3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fld ft4, .Ld.4020000000000000, t6
+fadd.d ft3, ft3, ft4
+fmul.d fs2, fs2, ft3
+la t3, .glob_x
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_x
+mv t3, a0
+fmv.d.x fs3, t3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fadd.d fs3, fs3, ft3
+la t3, .glob_y
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call get_y
+mv t3, a0
+fmv.d.x ft3, t3
+fld ft4, .Ld.4020000000000000, t6
+fadd.d ft3, ft3, ft4
+fmul.d ft3, fs3, ft3
+fadd.d ft3, fs2, ft3
+fadd.d ft3, fs1, ft3
+fmul.d ft3, fs0, ft3
+la a0, .floatformat
+fmv.x.d a1, ft3
+call printf
+la t3, .glob_x
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+la t4, .glob_y
+fld ft3, 0(t4)
+fmv.x.d t4, ft3
+mv a0, t3
+mv a1, t4
+call long_aexpr
+mv t3, a0
+fmv.d.x ft3, t3
+la a0, .floatformat
+fmv.x.d a1, ft3
+call printf
+li a0, 0
+
+li a0, 0
+li a7, 93
+ecall
+
+
+.section .data
+.glob_x: .dword 0
+.glob_y: .dword 0
+.glob_z: .dword 0
+.strformat: .string "%s\n"
+.intformat: .string "%d\n"
+.floatformat: .string "%f\n"
+.section .rodata
+.align 3
+.Ld.4020000000000000: .dword 4620693217682128896
+.Ld.4010000000000000: .dword 4616189618054758400
+.Ld.4018000000000000: .dword 4618441417868443648
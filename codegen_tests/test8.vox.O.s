@@ -0,0 +1,153 @@
+#include <stdio.h>
+.align 2
+.section .text
+.global main
+
+
+main:
+la t3, .glob_i
+fmv.d.x ft3, zero
+fsd ft3, 0(t3)
+la t3, .glob_x
+fld ft3, .Ld.3ff0000000000000, t6
+fsd ft3, 0(t3)
+la t3, .glob_x
+fld ft3, .Ld.4000000000000000, t6
+fsd ft3, 8(t3)
+la t3, .glob_x
+fld ft3, .Ld.4008000000000000, t6
+fsd ft3, 16(t3)
+la t3, .glob_x
+fld ft3, .Ld.4010000000000000, t6
+fsd ft3, 24(t3)
+la t3, .glob_y
+fld ft3, .Ld.4014000000000000, t6
+fsd ft3, 0(t3)
+la t3, .glob_y
+fld ft3, .Ld.4018000000000000, t6
+fsd ft3, 8(t3)
+la t3, .glob_y
+fld ft3, .Ld.401c000000000000, t6
+fsd ft3, 16(t3)
+la t3, .glob_y
+fld ft3, .Ld.4020000000000000, t6
+fsd ft3, 24(t3)
+la t3, .glob_z
+fmv.d.x ft3, zero
+fsd ft3, 0(t3)
+la t3, .glob_z
+fmv.d.x ft3, zero
+fsd ft3, 8(t3)
+la t3, .glob_z
+fmv.d.x ft3, zero
+fsd ft3, 16(t3)
+la t3, .glob_z
+fmv.d.x ft3, zero
+fsd ft3, 24(t3)
+la t3, .glob_z1
+fmv.d.x ft3, zero
+fsd ft3, 0(t3)
+la t3, .glob_z1
+fmv.d.x ft3, zero
+fsd ft3, 8(t3)
+la t3, .glob_z1
+fmv.d.x ft3, zero
+fsd ft3, 16(t3)
+la t3, .glob_z1
+fmv.d.x ft3, zero
+fsd ft3, 24(t3)
+la t3, .glob_z
+la t4, .glob_x
+la t5, .glob_y
+mv a0, t3
+mv a1, t4
+mv a2, t5
+li t0, 4
+.Lmain.v0:
+vsetvli t1, t0, e64, m1, tu, mu
+vle64.v v0, (a1)
+vle64.v v1, (a2)
+vfadd.vv v0, v0, v1
+vse64.v v0, (a0)
+sub t0, t0, t1
+slli t2, t1, 3
+add a1, a1, t2
+add a2, a2, t2
+add a0, a0, t2
+bgtz t0, .Lmain.v0
+la t3, .glob_z1
+la t4, .glob_z
+la t5, .glob_y
+mv a0, t3
+mv a1, t4
+mv a2, t5
+li t0, 4
+.Lmain.v1:
+vsetvli t1, t0, e64, m1, tu, mu
+vle64.v v0, (a1)
+vle64.v v1, (a2)
+vfmul.vv v0, v0, v1
+vse64.v v0, (a0)
+sub t0, t0, t1
+slli t2, t1, 3
+add a1, a1, t2
+add a2, a2, t2
+add a0, a0, t2
+bgtz t0, .Lmain.v1
+la t3, .glob_i
+fmv.d.x ft3, zero
+fsd ft3, 0(t3)
+la t3, .glob_i
+fld ft3, 0(t3)
+fld ft4, .Ld.4010000000000000, t6
+flt.d t3, ft3, ft4
+beqz t3, .Lmain.2
+.Lmain.1:
+la t3, .glob_i
+fld ft3, 0(t3)
+fcvt.w.d t3, ft3
+slli t3, t3, 3
+la t4, .glob_z1
+add t3, t4, t3
+fld ft3, 0(t3)
+la a0, .floatformat
+fmv.x.d a1, ft3
+call printf
+la t3, .glob_i
+fld ft3, 0(t3)
+fld ft4, .Ld.3ff0000000000000, t6
+fadd.d ft3, ft3, ft4
+la t3, .glob_i
+fsd ft3, 0(t3)
+la t3, .glob_i
+fld ft3, 0(t3)
+fld ft4, .Ld.4010000000000000, t6
+flt.d t3, ft3, ft4
+bnez t3, .Lmain.1
+.Lmain.2:
+li a0, 0
+
+li a0, 0
+li a7, 93
+ecall
+
+
+.section .data
+.glob_i: .dword 0
+.glob_x: .dword 0,0,0,0
+.glob_y: .dword 0,0,0,0
+.glob_z: .dword 0,0,0,0
+.glob_z1: .dword 0,0,0,0
+.strformat: .string "%s\n"
+.intformat: .string "%d\n"
+.floatformat: .string "%f\n"
+.section .rodata
+.align 3
+.Ld.3ff0000000000000: .dword 4607182418800017408
+.Ld.4000000000000000: .dword 4611686018427387904
+.Ld.4008000000000000: .dword 4613937818241073152
+.Ld.4010000000000000: .dword 4616189618054758400
+.Ld.4014000000000000: .dword 4617315517961601024
+.Ld.4018000000000000: .dword 4618441417868443648
+.Ld.401c000000000000: .dword 4619567317775286272
+.Ld.4020000000000000: .dword 4620693217682128896
@@ -0,0 +1,178 @@
+import argparse
+import json
+import multiprocessing
+import os
+import signal
+import socketserver
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+import buildcache
+# imported by the forkserver before the workers are forked, the LALR tables are built or loaded once
+import parser
+import voxc
+import voxclient
+
+# latencies kept for the percentiles, the oldest are dropped
+MAX_SAMPLES = 10000
+PERCENTILES = (50, 90, 99)
+
+# the functions compiled by this worker process, kept for its later requests
+fun_cache = None
+
+
+def init_worker():
+    global fun_cache
+    fun_cache = buildcache.FunctionCache()
+
+
+def compile_request(argv, cwd):
+    """runs voxc.py with the command line argv in the directory cwd. returns its exit status, what it and the
+    assembler wrote to stdout and stderr, and the time it took."""
+    start = time.perf_counter()
+    status = 0
+    with voxc.captured_output() as output:
+        try:
+            os.chdir(cwd)
+            args = voxc.parse_args(argv)
+            if args.watch:
+                sys.exit("--watch can't be used with the compile server")
+            if not voxc.run(args, fun_cache):
+                status = 1
+        except SystemExit as e:
+            if isinstance(e.code, str):
+                print(e.code, file=sys.stderr)
+                status = 1
+            else:
+                status = e.code or 0
+        except Exception:
+            traceback.print_exc()
+            status = 1
+    return status, output["stdout"], output["stderr"], time.perf_counter() - start
+
+
+def percentiles(samples):
+    """the PERCENTILES and the maximum of samples in milliseconds, the nearest rank of each."""
+    ordered = sorted(samples)
+    if not ordered:
+        return {}
+    result = {f"p{p}": ordered[min(len(ordered) - 1, len(ordered) * p // 100)] * 1000 for p in PERCENTILES}
+    result["max"] = ordered[-1] * 1000
+    return result
+
+
+class Latencies:
+    """the latency of every request from when it is read to when its reply is ready, and the part of it spent
+    compiling in a worker, the rest is the wait for a free worker."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.total = deque(maxlen=MAX_SAMPLES)
+        self.compile = deque(maxlen=MAX_SAMPLES)
+
+    def add(self, total, compile_time):
+        with self.lock:
+            self.requests += 1
+            self.total.append(total)
+            self.compile.append(compile_time)
+
+    def stats(self):
+        with self.lock:
+            return {
+                "requests": self.requests,
+                "latency_ms": percentiles(self.total),
+                "compile_ms": percentiles(self.compile),
+            }
+
+
+class Handler(socketserver.StreamRequestHandler):
+    """one JSON request per connection: {"argv": [...], "cwd": "..."} compiles, {"stats": true} returns the
+    latency percentiles and {"stop": true} shuts the server down."""
+
+    def handle(self):
+        start = time.perf_counter()
+        try:
+            message = json.loads(self.rfile.read())
+        except ValueError:
+            return
+        server = self.server
+        if message.get("stats"):
+            reply = server.latencies.stats()
+        elif message.get("stop"):
+            threading.Thread(target=server.shutdown).start()
+            reply = {}
+        else:
+            status, stdout, stderr, compile_time = server.pool.submit(
+                compile_request, message["argv"], message["cwd"]
+            ).result()
+            reply = {"status": status, "stdout": stdout, "stderr": stderr}
+            server.latencies.add(time.perf_counter() - start, compile_time)
+        self.wfile.write(json.dumps(reply).encode())
+
+
+class CompileServer(socketserver.ThreadingUnixStreamServer):
+    """serves the requests of voxclient.py, each connection in a thread that hands the compilation to a pool of
+    worker processes. the workers are forked from a server process that has already imported the compiler,
+    so none of them pays for the imports or the parser tables."""
+
+    daemon_threads = True
+
+    def __init__(self, path, workers):
+        if os.path.exists(path):
+            try:
+                voxclient.request({"stats": True}, path)
+            except OSError:
+                # left by a server that died
+                os.remove(path)
+            else:
+                raise SystemExit(f"a compile server is already listening at {path}")
+        super().__init__(path, Handler)
+        context = multiprocessing.get_context("forkserver")
+        context.set_forkserver_preload(["compileserver"])
+        self.pool = ProcessPoolExecutor(workers, context, initializer=init_worker)
+        self.latencies = Latencies()
+
+    def server_close(self):
+        super().server_close()
+        self.pool.shutdown()
+        os.remove(self.server_address)
+
+
+if __name__ == "__main__":
+    argparser = argparse.ArgumentParser(
+        prog="compileserver.py",
+        description="keeps the Vox compiler loaded and compiles the requests of voxclient.py",
+    )
+    argparser.add_argument("--socket", default=voxclient.SOCKET_PATH, help="path of the Unix domain socket")
+    argparser.add_argument(
+        "--workers", type=int, default=os.cpu_count(), help="number of worker processes")
+    argparser.add_argument(
+        "--stats", action="store_true", help="print the latency percentiles of a running server and exit")
+    argparser.add_argument("--stop", action="store_true", help="stop a running server")
+
+    args = argparser.parse_args()
+    if args.stats or args.stop:
+        try:
+            reply = voxclient.request({"stats": True} if args.stats else {"stop": True}, args.socket)
+        except OSError:
+            sys.exit(f"no compile server at {args.socket}")
+        for name, value in reply.items():
+            if isinstance(value, dict):
+                value = "  ".join(f"{p} {ms:.3f}" for p, ms in value.items())
+            print(f"{name}: {value}")
+        sys.exit()
+
+    # stopped by SIGTERM like by ^C, the socket is removed either way
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    with CompileServer(args.socket, args.workers) as server:
+        # every worker is started and warmed up before the first request
+        for _ in range(args.workers):
+            server.pool.submit(time.sleep, 0.1)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
@@ -0,0 +1,187 @@
+import re
+from sly.lex import Token
+from lexer import Lexer
+
+(
+    C_ERROR,
+    C_SPACE,
+    C_NEWLINE,
+    C_ALPHA,
+    C_DIGIT,
+    C_QUOTE,
+    C_SLASH,
+    C_SINGLE,
+    C_DOUBLE,
+) = range(9)
+
+CHAR_CLASS = [C_ERROR] * 128
+for c in " \t":
+    CHAR_CLASS[ord(c)] = C_SPACE
+CHAR_CLASS[ord("\n")] = C_NEWLINE
+for c in "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ_":
+    CHAR_CLASS[ord(c)] = C_ALPHA
+for c in "0123456789":
+    CHAR_CLASS[ord(c)] = C_DIGIT
+CHAR_CLASS[ord('"')] = C_QUOTE
+CHAR_CLASS[ord("/")] = C_SLASH
+for c in "+-*":
+    CHAR_CLASS[ord(c)] = C_SINGLE
+for c in "=!<>":
+    CHAR_CLASS[ord(c)] = C_DOUBLE
+for c in Lexer.literals:
+    CHAR_CLASS[ord(c)] = C_SINGLE
+
+# tokens that are complete after one character, literals are their own type
+SINGLE = {"+": "PLUS", "-": "MINUS", "*": "TIMES"}
+SINGLE.update((c, c) for c in Lexer.literals)
+# operators that may be followed by "=": (type alone, type with "=")
+DOUBLE = {"=": ("ASSIGN", "EQ"), "!": ("NOT", "NE"), "<": ("LT", "LE"), ">": ("GT", "GE")}
+
+# perfect hash over the keywords: (2 * first + 6 * last + length) % 20 is collision free
+KEYWORD_TABLE = [None] * 20
+for word, tok_type in Lexer._remapping["ID"].items():
+    h = (2 * ord(word[0]) + 6 * ord(word[-1]) + len(word)) % 20
+    assert KEYWORD_TABLE[h] is None, "keyword hash collision"
+    KEYWORD_TABLE[h] = (word, tok_type)
+
+ident_tail = re.compile(r"[a-zA-Z0-9_]*").match
+number_tail = re.compile(r"[0-9]*(?:\.[0-9]+)?").match
+string_tail = re.compile(r'(?:[^"\\]|\\.)*"').match
+newline_run = re.compile(r"\n*").match
+
+
+def keyword_type(word):
+    h = (2 * ord(word[0]) + 6 * ord(word[-1]) + len(word)) % 20
+    entry = KEYWORD_TABLE[h]
+    if entry is not None and entry[0] == word:
+        return entry[1]
+    return "ID"
+
+
+class DFALexer:
+    """table driven scanner that produces exactly the token stream of lexer.Lexer. the class of the first
+    character decides which lexeme is scanned, instead of trying the alternatives of sly's master regex in order."""
+
+    tokens = Lexer.tokens
+    literals = Lexer.literals
+
+    def scan(self, text, lineno=1, index=0, final=True):
+        """yields (type, start, end, lineno) for each token. values are left undecoded, see token_value().
+        if text is not final, more text follows it and scanning stops before a lexeme that may continue
+        past the end, self.index is where the next scan has to resume."""
+        char_class = CHAR_CLASS
+        n = len(text)
+        while index < n:
+            c = text[index]
+            o = ord(c)
+            cls = char_class[o] if o < 128 else C_ERROR
+
+            if cls == C_SPACE:
+                index += 1
+            elif cls == C_ALPHA:
+                end = ident_tail(text, index + 1).end()
+                if end == n and not final:
+                    break
+                yield keyword_type(text[index:end]), index, end, lineno
+                index = end
+            elif cls == C_SINGLE:
+                yield SINGLE[c], index, index + 1, lineno
+                index += 1
+            elif cls == C_NEWLINE:
+                end = newline_run(text, index + 1).end()
+                lineno += end - index
+                index = end
+            elif cls == C_DIGIT:
+                end = number_tail(text, index + 1).end()
+                if end >= n - 1 and not final:
+                    # a "." and more digits may follow
+                    break
+                yield "NUMBER", index, end, lineno
+                index = end
+            elif cls == C_SLASH:
+                if index + 1 == n and not final:
+                    break
+                if text.startswith("/", index + 1):
+                    end = text.find("\n", index)
+                    if end < 0 and not final:
+                        break
+                    index = n if end < 0 else end
+                else:
+                    yield "DIVIDE", index, index + 1, lineno
+                    index += 1
+            elif cls == C_DOUBLE:
+                if index + 1 == n and not final:
+                    break
+                if text.startswith("=", index + 1):
+                    yield DOUBLE[c][1], index, index + 2, lineno
+                    index += 2
+                else:
+                    yield DOUBLE[c][0], index, index + 1, lineno
+                    index += 1
+            elif cls == C_QUOTE:
+                m = string_tail(text, index + 1)
+                if m:
+                    yield "STRING", index, m.end(), lineno
+                    index = m.end()
+                elif not final:
+                    break
+                else:
+                    # unterminated string, the quote is an error like in lexer.Lexer
+                    yield "ERROR", index, index + 1, lineno
+                    index += 1
+            else:
+                yield "ERROR", index, index + 1, lineno
+                index += 1
+
+        self.index = index
+        self.lineno = lineno
+
+    @staticmethod
+    def token_value(tok_type, lexeme):
+        if tok_type == "NUMBER":
+            return float(lexeme)
+        elif tok_type == "STRING":
+            return lexeme[1:-1]
+        elif tok_type == "TRUE":
+            return True
+        elif tok_type == "FALSE":
+            return False
+        return lexeme
+
+    def tokenize(self, text, lineno=1, index=0):
+        token_value = self.token_value
+        for tok_type, start, end, line in self.scan(text, lineno, index):
+            tok = Token()
+            tok.type = tok_type
+            tok.value = token_value(tok_type, text[start:end])
+            tok.lineno = line
+            tok.index = start
+            tok.end = end
+            yield tok
+
+    def tokenize_stream(self, chunks, lineno=1):
+        """tokenize() over text that arrives in pieces, such as bounded reads of a file. only the unfinished
+        lexeme at the end of a piece is carried over to the next one, index and end are offsets in the whole text."""
+        token_value = self.token_value
+        chunks = iter(chunks)
+        text = ""
+        base = 0
+        final = False
+        while not final:
+            chunk = next(chunks, None)
+            final = chunk is None
+            if chunk:
+                text += chunk
+
+            for tok_type, start, end, line in self.scan(text, lineno, 0, final):
+                tok = Token()
+                tok.type = tok_type
+                tok.value = token_value(tok_type, text[start:end])
+                tok.lineno = line
+                tok.index = base + start
+                tok.end = base + end
+                yield tok
+
+            lineno = self.lineno
+            base += self.index
+            text = text[self.index:]
@@ -0,0 +1,283 @@
+"""constant folding and algebraic simplification of the AST, before either backend generates its code. operations
+on literals are computed at compile time the way the RISC-V instructions compute them: IEEE doubles rounded to
+nearest, where a nan result is the canonical nan and unary minus only flips the sign. an operation that gives back
+one of its operands, like x * 1, is replaced by that operand when the operand can't be a nan the instruction would
+make canonical, a branch whose condition is a literal by the statement it runs, and a loop whose condition is false
+by what runs before its test."""
+
+import math
+import operator
+from ast_tools import *
+
+# fadd.d, fsub.d, fmul.d and fdiv.d return this nan whatever the nans of their operands are
+NAN = math.nan
+COMPARISONS = {
+    "<": operator.lt, "<=": operator.le, ">": operator.gt, ">=": operator.ge, "==": operator.eq, "!=": operator.ne,
+}
+# the comparison that is false where one is true, also for nan
+NEGATIONS = {"==": "!=", "!=": "=="}
+# an empty statement, in place of a removed one where a statement is required
+EMPTY = Block([], [])
+
+
+def arithmetic(op, a, b):
+    """the double the instruction of op computes from a and b."""
+    if op == "+":
+        result = a + b
+    elif op == "-":
+        result = a - b
+    elif op == "*":
+        result = a * b
+    elif b != 0:
+        result = a / b
+    elif a == 0 or math.isnan(a):
+        result = NAN
+    else:
+        result = math.copysign(math.inf, a) * math.copysign(1.0, b)
+    return NAN if math.isnan(result) else result
+
+
+def is_literal(expr, value):
+    """whether expr is the number literal value, telling 0.0 and -0.0 apart."""
+    return (
+        type(expr) is ALiteral
+        and expr.value == value
+        and math.copysign(1.0, expr.value) == math.copysign(1.0, value)
+    )
+
+
+def canonical(expr):
+    """whether expr can't be a nan other than the canonical one: it is computed by an arithmetic instruction, or
+    a literal that isn't a nan. a variable, an element, a call or a negation may be a nan of either sign."""
+    t = type(expr)
+    return t is ABinary or t is ALiteral and not math.isnan(expr.value)
+
+
+def negate(expr):
+    """-expr, without a double negation."""
+    if type(expr) is ALiteral:
+        return ALiteral(-expr.value)
+    if type(expr) is AUMinus:
+        return expr.right
+    return AUMinus(expr)
+
+
+def has_call(expr):
+    """whether evaluating expr calls a function, the only expressions that do more than compute a value."""
+    stack = [expr]
+    while stack:
+        node = stack.pop()
+        t = type(node)
+        if t is Call:
+            return True
+        if t is list:
+            stack.extend(node)
+        elif isinstance(node, Expr):
+            stack.extend(getattr(node, name) for name in t.__slots__)
+    return False
+
+
+class Folder(IterativeVisitor):
+    """visiting a node returns it folded, the same node if nothing in it changed. a statement that does nothing
+    is None. identifiers are kept, so the bindings of misc.Resolver still hold for the folded tree."""
+
+    def _statements(self, statements):
+        folded = []
+        for elem in statements:
+            stmt = yield elem
+            if stmt is not None:
+                folded.append(stmt)
+        return folded
+
+    def _statement(self, stmt):
+        """stmt folded where a statement is required."""
+        folded = yield stmt
+        return EMPTY if folded is None else folded
+
+    def visit_Program(self, program: Program):
+        var_decls = []
+        for elem in program.var_decls:
+            var_decls.append((yield elem))
+        fun_decls = []
+        for elem in program.fun_decls:
+            fun_decls.append((yield elem))
+        statements = yield from self._statements(program.statements)
+        return Program(var_decls, fun_decls, statements)
+
+    def visit_ErrorStmt(self, errorstmt: ErrorStmt):
+        return errorstmt
+
+    def visit_VarDecl(self, vardecl: VarDecl):
+        initializer = vardecl.initializer
+        if isinstance(initializer, list):
+            elems = []
+            for elem in initializer:
+                elems.append((yield elem))
+            initializer = elems
+        elif initializer is not None:
+            initializer = yield initializer
+        return VarDecl(vardecl.identifier, initializer)
+
+    def visit_FunDecl(self, fundecl: FunDecl):
+        return FunDecl(fundecl.identifier, fundecl.params, (yield fundecl.body))
+
+    def visit_Assign(self, assign: Assign):
+        expr = yield assign.expr
+        return assign if expr is assign.expr else Assign(assign.identifier, expr)
+
+    def visit_SetVector(self, setvector: SetVector):
+        vector_index = yield setvector.vector_index
+        expr = yield setvector.expr
+        if vector_index is setvector.vector_index and expr is setvector.expr:
+            return setvector
+        return SetVector(setvector.identifier, vector_index, expr)
+
+    def visit_ForLoop(self, forloop: ForLoop):
+        initializer = forloop.initializer
+        if initializer is not None:
+            initializer = yield initializer
+        condition = forloop.condition
+        if condition is not None:
+            condition = yield condition
+            if type(condition) is LLiteral and not condition.value:
+                return initializer
+        increment = forloop.increment
+        if increment is not None:
+            increment = yield increment
+        body = yield from self._statement(forloop.body)
+        return ForLoop(initializer, condition, increment, body)
+
+    def visit_Return(self, returnn: Return):
+        expr = yield returnn.expr
+        return returnn if expr is returnn.expr else Return(expr)
+
+    def visit_WhileLoop(self, whileloop: WhileLoop):
+        condition = yield whileloop.condition
+        if type(condition) is LLiteral and not condition.value:
+            return None
+        body = yield from self._statement(whileloop.body)
+        return WhileLoop(condition, body)
+
+    def visit_Block(self, block: Block):
+        var_decls = []
+        for elem in block.var_decls:
+            var_decls.append((yield elem))
+        statements = yield from self._statements(block.statements)
+        return Block(var_decls, statements)
+
+    def visit_Print(self, printt: Print):
+        expr = yield printt.expr
+        return printt if expr is printt.expr else Print(expr)
+
+    def visit_IfElse(self, ifelse: IfElse):
+        condition = yield ifelse.condition
+        if type(condition) is LLiteral:
+            branch = ifelse.if_branch if condition.value else ifelse.else_branch
+            return None if branch is None else (yield branch)
+        if_branch = yield from self._statement(ifelse.if_branch)
+        else_branch = ifelse.else_branch
+        if else_branch is not None:
+            else_branch = yield else_branch
+        return IfElse(condition, if_branch, else_branch)
+
+    def visit_LBinary(self, lbinary: LBinary):
+        left = yield lbinary.left
+        right = yield lbinary.right
+        # the value that decides the result, the right operand isn't evaluated after it
+        decisive = lbinary.op == "or"
+        if type(left) is LLiteral:
+            return left if left.value == decisive else right
+        if type(right) is LLiteral:
+            if right.value != decisive:
+                return left
+            if not has_call(left):
+                return right
+        if left is lbinary.left and right is lbinary.right:
+            return lbinary
+        return LBinary(lbinary.op, left, right)
+
+    def visit_Comparison(self, comparison: Comparison):
+        left = yield comparison.left
+        right = yield comparison.right
+        if type(left) is ALiteral and type(right) is ALiteral:
+            return LLiteral(COMPARISONS[comparison.op](left.value, right.value))
+        if left is comparison.left and right is comparison.right:
+            return comparison
+        return Comparison(comparison.op, left, right)
+
+    def visit_LLiteral(self, lliteral: LLiteral):
+        return lliteral
+
+    def visit_LPrimary(self, lprimary: LPrimary):
+        primary = yield lprimary.primary
+        return lprimary if primary is lprimary.primary else LPrimary(primary)
+
+    def visit_GetVector(self, getvector: GetVector):
+        vector_index = yield getvector.vector_index
+        if vector_index is getvector.vector_index:
+            return getvector
+        return GetVector(getvector.identifier, vector_index)
+
+    def visit_Variable(self, variable: Variable):
+        return variable
+
+    def visit_LNot(self, lnot: LNot):
+        right = yield lnot.right
+        if type(right) is LLiteral:
+            return LLiteral(not right.value)
+        if type(right) is LNot:
+            return right.right
+        if type(right) is Comparison and right.op in NEGATIONS:
+            return Comparison(NEGATIONS[right.op], right.left, right.right)
+        return lnot if right is lnot.right else LNot(right)
+
+    def visit_ABinary(self, abinary: ABinary):
+        left = yield abinary.left
+        right = yield abinary.right
+        op = abinary.op
+        if type(left) is ALiteral and type(right) is ALiteral:
+            return ALiteral(arithmetic(op, left.value, right.value))
+
+        # x + -0.0, x - 0.0, x * 1 and x / 1 are x, also for x = -0.0, which x + 0.0 isn't, but the instruction
+        # makes a nan canonical, so x must already be. x * -1 isn't -x, that would make the canonical nan negative
+        if canonical(left):
+            if op == "+" and is_literal(right, -0.0) or op == "-" and is_literal(right, 0.0):
+                return left
+            if op in ("*", "/") and is_literal(right, 1.0):
+                return left
+        if canonical(right):
+            if op == "+" and is_literal(left, -0.0) or op == "*" and is_literal(left, 1.0):
+                return right
+        # subtracting is adding the negated operand
+        if op in ("+", "-") and type(right) is AUMinus:
+            return ABinary("-" if op == "+" else "+", left, right.right)
+
+        if left is abinary.left and right is abinary.right:
+            return abinary
+        return ABinary(op, left, right)
+
+    def visit_AUMinus(self, auminus: AUMinus):
+        right = yield auminus.right
+        if right is auminus.right and type(right) not in (ALiteral, AUMinus):
+            return auminus
+        return negate(right)
+
+    def visit_ALiteral(self, aliteral: ALiteral):
+        return aliteral
+
+    def visit_Call(self, call: Call):
+        arguments = []
+        for elem in call.arguments:
+            arguments.append((yield elem))
+        if all(new is old for new, old in zip(arguments, call.arguments)):
+            return call
+        return Call(call.callee, arguments)
+
+    def visit_SLiteral(self, sliteral: SLiteral):
+        return sliteral
+
+
+def fold(node):
+    """node, a program or one of its top level declarations or statements, folded. None for a statement that
+    does nothing."""
+    return Folder().visit(node)
@@ -0,0 +1,630 @@
+"""the SSA form intermediate representation of the optimizing backend (voxc.py -O), between the AST and the RISC-V
+code. lowering.py builds a Function for every Vox function and one for main, irgen.py selects the instructions of
+their code from it.
+
+a Function is a control flow graph of Blocks. a block holds its phis, then its instructions, the last of which is
+its terminator: br, jmp or ret. an instruction is also the value it computes, its args are Consts, Params or other
+instructions, and every value keeps the list of its users. numbers are f64, and logical values, addresses and the
+words functions pass and return are i64."""
+
+import struct
+
+F64 = "f64"
+I64 = "i64"
+
+# ops of the instructions, with the type of their value
+FLOAT_BINARY = {"fadd", "fsub", "fmul", "fdiv"}
+FLOAT_COMPARE = {"flt", "fle", "feq"}
+INT_BINARY = {"add", "sub", "mul", "and", "or", "xor", "sll", "slt"}
+CONVERSIONS = {"f2i": I64, "i2f": F64, "f2bits": I64, "bits2f": F64}
+TERMINATORS = {"br", "jmp", "ret"}
+# instructions that can be removed when their value isn't used
+PURE = FLOAT_BINARY | FLOAT_COMPARE | INT_BINARY | set(CONVERSIONS) | {"fneg", "snez", "seqz", "addr", "frame", "load", "get"}
+
+
+class Value:
+    """an operand of instructions. users has the instructions that take it, once for every operand it is."""
+
+    __slots__ = ("type", "users")
+
+    def __init__(self, type):
+        self.type = type
+        self.users = []
+
+    def replace_uses(self, value):
+        """makes the users of this value take value instead."""
+        if value is self:
+            return
+        for user in set(self.users):
+            value.users += [user] * sum(arg is self for arg in user.args)
+            user.args = [value if arg is self else arg for arg in user.args]
+        self.users = []
+
+
+class Const(Value):
+    __slots__ = ("value",)
+
+    def __init__(self, type, value):
+        super().__init__(type)
+        self.value = value
+
+    def __str__(self):
+        return repr(self.value) if self.type == F64 else str(self.value)
+
+
+class Param(Value):
+    """the word the function was called with as its index-th argument."""
+
+    __slots__ = ("index",)
+
+    def __init__(self, index):
+        super().__init__(I64)
+        self.index = index
+
+
+class Instr(Value):
+    """attr is what else the op needs: the callee of call, the label of addr, the StackObject of frame, the offset
+    of load and store, the format of print ("f", "d" or "s"), the operator and length of vop, and the variable of get
+    and set."""
+
+    __slots__ = ("op", "args", "attr", "block")
+
+    def __init__(self, op, type, args=(), attr=None):
+        super().__init__(type)
+        self.op = op
+        self.args = list(args)
+        self.attr = attr
+        self.block = None
+        for arg in self.args:
+            arg.users.append(self)
+
+    def drop(self):
+        """removes the instruction from its block, and from the users of its operands."""
+        for arg in self.args:
+            arg.users.remove(self)
+        self.args = []
+        if self.op == "phi":
+            self.block.phis.remove(self)
+        else:
+            self.block.instrs.remove(self)
+        self.block = None
+
+
+class StackObject:
+    """memory in the frame of a function, a local vector of size words."""
+
+    __slots__ = ("name", "size")
+
+    def __init__(self, name, size):
+        self.name = name
+        self.size = size
+
+
+class Block:
+    __slots__ = ("index", "phis", "instrs", "preds", "succs")
+
+    def __init__(self, index):
+        self.index = index
+        self.phis = []
+        self.instrs = []
+        self.preds = []
+        self.succs = []
+
+    @property
+    def name(self):
+        return f"b{self.index}"
+
+    @property
+    def terminator(self):
+        if self.instrs and self.instrs[-1].op in TERMINATORS:
+            return self.instrs[-1]
+        return None
+
+    def add(self, instr):
+        instr.block = self
+        if instr.op == "phi":
+            self.phis.append(instr)
+        else:
+            self.instrs.append(instr)
+        return instr
+
+    def insert(self, i, instr):
+        instr.block = self
+        self.instrs.insert(i, instr)
+        return instr
+
+
+class Function:
+    """params are the Params of the function's arguments, frame its StackObjects, and strings the labels and
+    directives in the constant pool of the string literals it prints."""
+
+    def __init__(self, name, nparams=0):
+        self.name = name
+        self.params = [Param(i) for i in range(nparams)]
+        self.blocks = []
+        self.frame = []
+        self.strings = {}
+        self._consts = {}
+        self._block_count = 0
+        self.entry = self.new_block()
+
+    def new_block(self):
+        block = Block(self._block_count)
+        self._block_count += 1
+        self.blocks.append(block)
+        return block
+
+    def const(self, type, value):
+        """the constant of the value, one object for each one. floats are told apart by their bits, so 0.0 and -0.0
+        are different constants."""
+        key = (type, struct.pack("d", value) if type == F64 else value)
+        const = self._consts.get(key)
+        if const is None:
+            const = self._consts[key] = Const(type, float(value) if type == F64 else int(value))
+        return const
+
+    def __str__(self):
+        return render(self)
+
+
+def link(pred, succ):
+    pred.succs.append(succ)
+    succ.preds.append(pred)
+
+
+def terminate(block, op, args=(), succs=()):
+    """ends block with a terminator going to succs."""
+    block.add(Instr(op, None, args))
+    for succ in succs:
+        link(block, succ)
+
+
+def render(fn):
+    """the text of the function, its values numbered in the order they are defined."""
+    names = {param: f"%{param.index}" for param in fn.params}
+    for block in fn.blocks:
+        for instr in block.phis + block.instrs:
+            if instr.type is not None:
+                names[instr] = f"%{len(names)}"
+
+    def name(value):
+        return names.get(value) or (str(value) if type(value) is Const else "%?")
+
+    lines = [f"fun {fn.name}({', '.join(names[param] for param in fn.params)})"]
+    for obj in fn.frame:
+        lines.append(f"  frame {obj.name}: {obj.size} words")
+    for block in fn.blocks:
+        preds = f"  ; preds {', '.join(pred.name for pred in block.preds)}" if block.preds else ""
+        lines.append(f"{block.name}:{preds}")
+        for phi in block.phis:
+            incoming = ", ".join(f"[{name(arg)}, {pred.name}]" for arg, pred in zip(phi.args, block.preds))
+            lines.append(f"    {names[phi]} = phi {phi.type} {incoming}")
+        for instr in block.instrs:
+            line = f"{names[instr]} = {instr.op} {instr.type}" if instr.type is not None else instr.op
+            operands = [name(arg) for arg in instr.args]
+            if instr.op in ("br", "jmp"):
+                operands += [succ.name for succ in block.succs]
+            if instr.attr is not None:
+                attr = instr.attr
+                operands.append(attr.name if type(attr) is StackObject else str(attr))
+            lines.append(f"    {line} {', '.join(operands)}".rstrip())
+    return "\n".join(lines) + "\n"
+
+
+# the control flow graph
+
+
+def reverse_postorder(fn):
+    """the blocks reachable from the entry, each one before its successors except along back edges."""
+    order = []
+    seen = {fn.entry}
+    stack = [(fn.entry, iter(fn.entry.succs))]
+    while stack:
+        block, succs = stack[-1]
+        for succ in succs:
+            if succ not in seen:
+                seen.add(succ)
+                stack.append((succ, iter(succ.succs)))
+                break
+        else:
+            stack.pop()
+            order.append(block)
+    order.reverse()
+    return order
+
+
+def remove_unreachable(fn):
+    """drops the blocks that can't be reached from the entry, and their edges to the rest."""
+    reachable = set(reverse_postorder(fn))
+    for block in fn.blocks:
+        if block in reachable:
+            continue
+        for succ in block.succs:
+            if succ in reachable:
+                remove_pred(succ, block)
+        for instr in block.phis + block.instrs:
+            for arg in instr.args:
+                arg.users.remove(instr)
+            instr.args = []
+    fn.blocks = [block for block in fn.blocks if block in reachable]
+
+
+def remove_pred(block, pred):
+    """removes the edge from pred to block, with its operand of block's phis."""
+    i = block.preds.index(pred)
+    del block.preds[i]
+    for phi in block.phis:
+        phi.args[i].users.remove(phi)
+        del phi.args[i]
+
+
+def split_edge(fn, pred, succ):
+    """puts a new block on the edge from pred to succ and returns it."""
+    middle = fn.new_block()
+    pred.succs[pred.succs.index(succ)] = middle
+    middle.preds.append(pred)
+    succ.preds[succ.preds.index(pred)] = middle
+    terminate(middle, "jmp")
+    middle.succs.append(succ)
+    return middle
+
+
+def split_critical_edges(fn):
+    """puts a block on every edge from a block with more than one successor to one with more than one
+    predecessor, so that code for the edge alone has a place. returns whether there were any."""
+    split = False
+    for block in list(fn.blocks):
+        if len(block.succs) < 2:
+            continue
+        for succ in list(block.succs):
+            if len(succ.preds) > 1:
+                split_edge(fn, block, succ)
+                split = True
+    return split
+
+
+# dominators
+
+
+def dominators(fn):
+    """the immediate dominator of every reachable block, None for the entry. the iterative algorithm of Cooper,
+    Harvey and Kennedy over the reverse postorder."""
+    order = reverse_postorder(fn)
+    number = {block: i for i, block in enumerate(order)}
+    idom = {fn.entry: fn.entry}
+    changed = True
+    while changed:
+        changed = False
+        for block in order[1:]:
+            new = None
+            for pred in block.preds:
+                if pred not in idom:
+                    continue
+                if new is None:
+                    new = pred
+                    continue
+                a, b = pred, new
+                while a is not b:
+                    while number[a] > number[b]:
+                        a = idom[a]
+                    while number[b] > number[a]:
+                        b = idom[b]
+                new = a
+            if idom.get(block) is not new:
+                idom[block] = new
+                changed = True
+    idom[fn.entry] = None
+    return idom
+
+
+class DominatorTree:
+    """the dominator tree of fn. the blocks are numbered in a depth first walk of the tree, so a block dominates
+    the ones numbered from its own up to the end of its subtree."""
+
+    def __init__(self, fn):
+        self.idom = dominators(fn)
+        self.children = {block: [] for block in self.idom}
+        for block, parent in self.idom.items():
+            if parent is not None:
+                self.children[parent].append(block)
+        self._pre = {}
+        self._last = {}
+        stack = [(fn.entry, False)]
+        while stack:
+            block, done = stack.pop()
+            if done:
+                self._last[block] = len(self._pre) - 1
+                continue
+            self._pre[block] = len(self._pre)
+            stack.append((block, True))
+            stack.extend((child, False) for child in reversed(self.children[block]))
+
+    def dominates(self, a, b):
+        """whether every path from the entry to b goes through a, or a is b."""
+        return self._pre[a] <= self._pre[b] <= self._last[a]
+
+    def preorder(self):
+        """the blocks, each one before the ones it dominates."""
+        return sorted(self._pre, key=self._pre.get)
+
+
+def dominance_frontiers(fn, idom):
+    """the blocks where the dominance of each block ends: the ones it doesn't strictly dominate but that have a
+    predecessor it dominates."""
+    frontiers = {block: set() for block in idom}
+    for block in idom:
+        if len(block.preds) < 2:
+            continue
+        for pred in block.preds:
+            if pred not in idom:
+                continue
+            runner = pred
+            while runner is not idom[block]:
+                frontiers[runner].add(block)
+                runner = idom[runner]
+    return frontiers
+
+
+def loop_depths(fn, tree=None):
+    """the number of natural loops each reachable block is in. a loop is the blocks that reach an edge back to a
+    block dominating them, its header, without going through the header. the loops of the edges back to the same
+    header are one loop."""
+    tree = tree or DominatorTree(fn)
+    bodies = {}
+    for block in tree.idom:
+        for succ in block.succs:
+            if tree.dominates(succ, block):
+                body = bodies.setdefault(succ, {succ})
+                stack = [block]
+                while stack:
+                    member = stack.pop()
+                    if member not in body:
+                        body.add(member)
+                        stack.extend(pred for pred in member.preds if pred in tree.idom)
+    depths = dict.fromkeys(tree.idom, 0)
+    for body in bodies.values():
+        for block in body:
+            depths[block] += 1
+    return depths
+
+
+# SSA construction
+
+
+def construct_ssa(fn):
+    """turns the local variables, read by get and written by set instructions, into SSA values. phis are placed at
+    the iterated dominance frontiers of the blocks that set a variable read in another block than the one it is set
+    in (semi-pruned SSA, Briggs et al.), then the gets are renamed walking the dominator tree. a variable read before
+    it is set anywhere reads the constant zero of its type."""
+    remove_unreachable(fn)
+    tree = DominatorTree(fn)
+    frontiers = dominance_frontiers(fn, tree.idom)
+
+    # variables read in a block before they are set in it, in the order they are first read, and the blocks setting
+    # each variable. the variables are declarations, a set of them would place the phis in the order of their ids
+    upward = {}
+    def_blocks = {}
+    types = {}
+    for block in fn.blocks:
+        killed = set()
+        for instr in block.instrs:
+            if instr.op == "get" and instr.attr not in killed:
+                upward[instr.attr] = None
+            elif instr.op == "set":
+                killed.add(instr.attr)
+                def_blocks.setdefault(instr.attr, set()).add(block)
+                types[instr.attr] = instr.args[0].type
+
+    phi_vars = {}
+    for var in upward:
+        if var not in def_blocks:
+            continue
+        work = list(def_blocks[var])
+        placed = set()
+        while work:
+            block = work.pop()
+            for frontier in frontiers[block]:
+                if frontier in placed:
+                    continue
+                placed.add(frontier)
+                phi = frontier.add(Instr("phi", types[var]))
+                # the operands are filled in from the predecessors as the walk below passes them
+                phi.args = [None] * len(frontier.preds)
+                phi_vars[phi] = var
+                if frontier not in def_blocks[var]:
+                    work.append(frontier)
+
+    # the values of the variables where the walk is, innermost last
+    current = {}
+
+    def value_of(var, type):
+        values = current.get(var)
+        if values:
+            return values[-1]
+        return fn.const(type, 0)
+
+    # the walk of the dominator tree with an explicit stack, the variables set by a block are popped after its
+    # subtree is renamed
+    stack = [(fn.entry, None)]
+    while stack:
+        block, defined = stack.pop()
+        if defined is not None:
+            for var in defined:
+                current[var].pop()
+            continue
+        defined = []
+        for phi in block.phis:
+            var = phi_vars.get(phi)
+            if var is not None:
+                current.setdefault(var, []).append(phi)
+                defined.append(var)
+        for instr in list(block.instrs):
+            if instr.op == "get":
+                instr.replace_uses(value_of(instr.attr, instr.type))
+                instr.drop()
+            elif instr.op == "set":
+                current.setdefault(instr.attr, []).append(instr.args[0])
+                defined.append(instr.attr)
+                instr.drop()
+        for succ in dict.fromkeys(block.succs):
+            for i, pred in enumerate(succ.preds):
+                if pred is not block:
+                    continue
+                for phi in succ.phis:
+                    var = phi_vars.get(phi)
+                    if var is not None:
+                        value = phi.args[i] = value_of(var, phi.type)
+                        value.users.append(phi)
+        stack.append((block, defined))
+        stack.extend((child, None) for child in reversed(tree.children[block]))
+    remove_useless_phis(fn)
+
+
+def remove_useless_phis(fn):
+    """removes the phis whose value is only used by phis that are themselves useless, and replaces the ones that
+    merge a single value with it."""
+    phis = [phi for block in fn.blocks for phi in block.phis]
+    live = set()
+    work = [phi for phi in phis if any(user.op != "phi" for user in phi.users)]
+    while work:
+        phi = work.pop()
+        if phi in live:
+            continue
+        live.add(phi)
+        work.extend(arg for arg in phi.args if type(arg) is Instr and arg.op == "phi")
+    for phi in phis:
+        if phi not in live:
+            phi.replace_uses(fn.const(phi.type, 0))
+    for phi in phis:
+        if phi not in live:
+            phi.drop()
+
+    work = [phi for phi in phis if phi in live]
+    while work:
+        phi = work.pop()
+        if phi.block is None:
+            continue
+        values = {arg for arg in phi.args if arg is not phi}
+        if len(values) != 1:
+            continue
+        value = values.pop()
+        users = [user for user in phi.users if user is not phi and user.op == "phi"]
+        phi.replace_uses(value)
+        phi.drop()
+        work.extend(users)
+
+
+# liveness and uses
+
+
+def liveness(fn):
+    """the values live at the start and at the end of every block, as dicts of sets. an operand of a phi is live
+    at the end of the predecessor it comes from, not at the start of the phi's block."""
+    order = reverse_postorder(fn)
+    uses = {}
+    defs = {}
+    for block in order:
+        used = set()
+        defined = set(block.phis)
+        for instr in block.instrs:
+            for arg in instr.args:
+                if type(arg) is not Const and arg not in defined:
+                    used.add(arg)
+            defined.add(instr)
+        uses[block] = used
+        defs[block] = defined
+
+    live_in = {block: set() for block in order}
+    live_out = {block: set() for block in order}
+    changed = True
+    while changed:
+        changed = False
+        for block in reversed(order):
+            out = set()
+            for succ in block.succs:
+                out |= live_in[succ] - set(succ.phis)
+                for i, pred in enumerate(succ.preds):
+                    if pred is block:
+                        out.update(phi.args[i] for phi in succ.phis if type(phi.args[i]) is not Const)
+            live = uses[block] | (out - defs[block])
+            if out != live_out[block] or live != live_in[block]:
+                live_out[block] = out
+                live_in[block] = live
+                changed = True
+    return live_in, live_out
+
+
+def definitions(fn):
+    """every value defined in the function: its parameters, phis and instructions with a value."""
+    values = list(fn.params)
+    for block in fn.blocks:
+        values += block.phis
+        values += [instr for instr in block.instrs if instr.type is not None]
+    return values
+
+
+def eliminate_dead_code(fn):
+    """removes the pure instructions whose values aren't used, and then the ones only they used."""
+    work = [instr for block in fn.blocks for instr in block.instrs if instr.op in PURE]
+    work += [phi for block in fn.blocks for phi in block.phis]
+    while work:
+        instr = work.pop()
+        if instr.block is None or instr.users:
+            continue
+        args = [arg for arg in instr.args if type(arg) is Instr and (arg.op in PURE or arg.op == "phi")]
+        instr.drop()
+        work.extend(args)
+
+
+def verify(fn):
+    """raises ValueError if fn isn't well formed SSA: every block ends with its only terminator, the edges agree
+    with each other, phis have an operand for every predecessor and every value dominates its uses."""
+    tree = DominatorTree(fn)
+    blocks = set(fn.blocks)
+
+    def fail(block, message):
+        raise ValueError(f"{fn.name}, {block.name}: {message}")
+
+    for block in fn.blocks:
+        if block not in tree.idom:
+            fail(block, "unreachable")
+        if block.terminator is None:
+            fail(block, "no terminator")
+        if any(instr.op in TERMINATORS for instr in block.instrs[:-1]):
+            fail(block, "terminator before the end")
+        op = block.terminator.op
+        if len(block.succs) != {"br": 2, "jmp": 1, "ret": 0}[op]:
+            fail(block, f"{op} with {len(block.succs)} successors")
+        for succ in block.succs:
+            if succ not in blocks or succ.preds.count(block) != block.succs.count(succ):
+                fail(block, f"edge to {succ.name} is missing a predecessor")
+        for pred in block.preds:
+            if pred not in blocks or block not in pred.succs:
+                fail(block, f"edge from {pred.name} is missing a successor")
+
+        position = {}
+        for i, instr in enumerate(block.phis + block.instrs):
+            position[instr] = i
+        for phi in block.phis:
+            if len(phi.args) != len(block.preds):
+                fail(block, f"phi with {len(phi.args)} operands and {len(block.preds)} predecessors")
+        for instr in block.phis + block.instrs:
+            if instr.block is not block:
+                fail(block, f"{instr.op} of another block")
+            if instr.op in ("get", "set"):
+                fail(block, f"{instr.op} of a variable")
+            for i, arg in enumerate(instr.args):
+                if instr not in arg.users:
+                    fail(block, f"{instr.op} is not a user of its operand")
+                if type(arg) is not Instr:
+                    continue
+                if arg.block is None or arg.block not in blocks:
+                    fail(block, f"{instr.op} uses a removed {arg.op}")
+                if instr.op == "phi":
+                    if not tree.dominates(arg.block, block.preds[i]):
+                        fail(block, f"phi operand from {block.preds[i].name} doesn't dominate it")
+                elif arg.block is block:
+                    if position[arg] >= position[instr]:
+                        fail(block, f"{instr.op} uses {arg.op} before it is defined")
+                elif not tree.dominates(arg.block, block):
+                    fail(block, f"{instr.op} uses {arg.op} from {arg.block.name}, which doesn't dominate it")
@@ -0,0 +1,693 @@
+"""the backend of the optimizing compiler (voxc.py -O). it selects the RISC-V instructions of the IR that
+lowering.py builds, with virtual registers, takes the code out of SSA form with parallel copies into the phis at the
+ends of their predecessors, allocates registers to the virtual registers by linear scan and lays out the frames."""
+
+import bisect
+from asm import Code
+from codegen import FORMATS, HEADER, constant_pool, exit_main, number_constant
+import ir
+from ir import F64, I64, Const
+from lowering import MAIN, lower
+from ranges import use_integers
+import rvasm
+
+REGISTERS = set(rvasm.INT_REGS) | set(rvasm.FLT_REGS)
+ARG_REGS = tuple(f"a{i}" for i in range(8))
+# what a call may change
+CALLER_SAVED = (
+    ("ra",) + tuple(f"t{i}" for i in range(7)) + ARG_REGS
+    + tuple(f"ft{i}" for i in range(12)) + tuple(f"fa{i}" for i in range(8))
+)
+# registers the code between two instructions of the IR takes for itself. the operands of an instruction are
+# loaded into the scratch registers, and FAR_REG holds addresses too far from sp for an offset and the addresses of
+# the numbers loaded from the constant pool
+SCRATCH = {"x": ("t0", "t1", "t2"), "f": ("ft0", "ft1", "ft2")}
+FAR_REG = "t6"
+# the registers values are allocated to: the temporaries are taken first by the values that aren't live across a
+# call, which changes them, and the callee-saved ones by the others
+TEMPORARIES = {"x": ("t3", "t4", "t5"), "f": tuple(f"ft{i}" for i in range(3, 12)) + tuple(f"fa{i}" for i in range(8))}
+CALLEE_SAVED = {"x": tuple(f"s{i}" for i in range(12)), "f": tuple(f"fs{i}" for i in range(12))}
+# how many times more a use or definition of a value in a loop costs than one outside it, when choosing the value
+# to spill
+LOOP_WEIGHT = 10
+# registers vop takes the addresses of the destination and of its operands in, and the ones it changes
+VOP_REGS = ("a0", "a1", "a2")
+VOP_CLOBBERS = VOP_REGS + ("t0", "t1", "t2")
+
+FORMAT_LABELS = {"f": ".floatformat", "d": ".intformat", "s": ".strformat"}
+VECTOR_OPS = {"+": "vfadd.vv", "-": "vfsub.vv", "*": "vfmul.vv", "/": "vfdiv.vv"}
+IMMEDIATE_OPS = {"add": "addi", "and": "andi", "or": "ori", "xor": "xori", "sll": "slli", "slt": "slti"}
+COMMUTATIVE = {"add", "mul", "and", "or", "xor"}
+CONVERSION_OPS = {"f2i": "fcvt.w.d", "i2f": "fcvt.d.w", "f2bits": "fmv.x.d", "bits2f": "fmv.d.x"}
+# instructions whose register operands are all read, the others write the first one
+STORES = {"sd", "fsd"}
+MEMORY = {"ld", "sd", "fld", "fsd"}
+MOVES = {"x": "mv", "f": "fmv.d"}
+
+
+def fits(imm):
+    """whether imm fits the 12 bits of an immediate."""
+    return -2048 <= imm < 2048
+
+
+class VReg:
+    """a virtual register of the class "x", integer, or "f", float."""
+
+    __slots__ = ("cls", "n")
+
+    def __init__(self, cls, n):
+        self.cls = cls
+        self.n = n
+
+    def __repr__(self):
+        return f"%{self.cls}{self.n}"
+
+
+def is_register(arg):
+    return type(arg) is VReg or arg in REGISTERS
+
+
+class MInstr:
+    """a machine instruction, whose registers may be VRegs. a memory operand is the base register and the offset
+    after the register that is loaded or stored. defs and uses are the registers the instruction writes and reads,
+    with the ones a call changes or takes its arguments in. br, jmp, ret, call and vop are expanded when the code
+    is written."""
+
+    __slots__ = ("op", "args", "defs", "uses")
+
+    def __init__(self, op, *args, defs=None, uses=None):
+        self.op = op
+        self.args = list(args)
+        if defs is None:
+            registers = [arg for arg in args if is_register(arg)]
+            if op in STORES or op == "br":
+                defs, uses = [], registers
+            else:
+                defs, uses = registers[:1], registers[1:]
+        self.defs = list(defs)
+        self.uses = list(uses)
+
+    def __repr__(self):
+        return f"MInstr({self.op!r}, {', '.join(map(repr, self.args))})"
+
+
+class MFunction:
+    """the machine code of a function: its blocks as (label, instructions) in the order they are laid out.
+    objects_size is the bytes of its StackObjects at the bottom of the frame, slots the number of words after them
+    that hold spilled values, and saved the registers the function saves above them."""
+
+    def __init__(self, name):
+        self.name = name
+        self.blocks = []
+        self.objects_size = 0
+        self.slots = 0
+        self.saved = [] if name == MAIN else ["ra"]
+        self.vreg_count = 0
+        # the labels and directives of the numbers it loads from the constant pool
+        self.constants = {}
+        # the loop depth of each block
+        self.depths = []
+        # the Spills of the function before and after its registers are allocated
+        self.before = None
+        self.after = None
+
+    def frame_size(self):
+        size = self.objects_size + 8 * (self.slots + len(self.saved))
+        return (size + 15) & ~15
+
+
+def stack_access(op, reg, offset, base="sp"):
+    """the instructions that load or store reg at offset from base, through FAR_REG if it is too far."""
+    if fits(offset):
+        return [MInstr(op, reg, base, str(offset))]
+    return [
+        MInstr("li", FAR_REG, str(offset)),
+        MInstr("add", FAR_REG, base, FAR_REG),
+        MInstr(op, reg, FAR_REG, "0"),
+    ]
+
+
+def place_copies(fn):
+    """splits the edges into blocks with phis from blocks with more than one successor, unless the phis are dead
+    along the other edges. the copies into the phis then go at the end of the predecessor, and a loop taken back to
+    its start by a conditional branch needs no jump of its own."""
+    live_in, _ = ir.liveness(fn)
+    for block in list(fn.blocks):
+        if len(block.succs) < 2:
+            continue
+        terminator = block.terminator
+        for succ in list(dict.fromkeys(block.succs)):
+            if not succ.phis:
+                continue
+            others = [other for other in block.succs if other is not succ]
+            if any(phi in live_in[other] for phi in succ.phis for other in others) or any(
+                arg in succ.phis for arg in terminator.args
+            ):
+                ir.split_edge(fn, block, succ)
+
+
+class Selector:
+    """selects the instructions of an IR function."""
+
+    def __init__(self, fn):
+        self.fn = fn
+        self.mfn = MFunction(fn.name)
+        self.vregs = {}
+        self.code = None
+        self.frame = {}
+
+    def new_vreg(self, cls):
+        self.mfn.vreg_count += 1
+        return VReg(cls, self.mfn.vreg_count)
+
+    def vreg(self, value):
+        """the virtual register of an instruction's or a parameter's value."""
+        reg = self.vregs.get(value)
+        if reg is None:
+            reg = self.vregs[value] = self.new_vreg("f" if value.type == F64 else "x")
+        return reg
+
+    def emit(self, op, *args, **kwargs):
+        self.code.append(MInstr(op, *args, **kwargs))
+
+    def materialize(self, const, reg=None):
+        """loads the constant into reg, a new virtual register if it is None."""
+        if const.type == I64:
+            reg = reg or self.new_vreg("x")
+            self.emit("li", reg, str(const.value))
+            return reg
+        reg = reg or self.new_vreg("f")
+        label, value = number_constant(const.value)
+        if value == ".dword 0":
+            self.emit("fmv.d.x", reg, "zero")
+        else:
+            # a PC relative load, which writes the address into FAR_REG
+            self.mfn.constants[label] = value
+            self.emit("fld", reg, label, FAR_REG, defs=[reg, FAR_REG], uses=[])
+        return reg
+
+    def reg(self, value):
+        """a register holding the value of an operand."""
+        if type(value) is Const:
+            return self.materialize(value)
+        return self.vreg(value)
+
+    def copy(self, dst, src):
+        self.emit(MOVES[dst.cls], dst, src)
+
+    def parallel_copy(self, moves):
+        """copies the values of moves, pairs of a VReg and the value it takes, as if all at once: a register is
+        only written after every copy of its old value, and a cycle of copies goes through a new register."""
+        pending = {}
+        consts = []
+        for dst, src in moves:
+            if type(src) is Const:
+                consts.append((dst, src))
+            elif self.vreg(src) is not dst:
+                pending[dst] = self.vreg(src)
+        while pending:
+            sources = set(pending.values())
+            ready = next((dst for dst in pending if dst not in sources), None)
+            if ready is not None:
+                self.copy(ready, pending.pop(ready))
+                continue
+            dst = next(iter(pending))
+            tmp = self.new_vreg(dst.cls)
+            self.copy(tmp, dst)
+            pending = {key: tmp if src is dst else src for key, src in pending.items()}
+        for dst, src in consts:
+            self.materialize(src, dst)
+
+    def phi_copies(self, block):
+        moves = []
+        for succ in dict.fromkeys(block.succs):
+            for i, pred in enumerate(succ.preds):
+                if pred is block:
+                    moves += [(self.vreg(phi), phi.args[i]) for phi in succ.phis]
+        self.parallel_copy(moves)
+
+    def address(self, base, offset):
+        """a base register and an offset that fits an immediate, for the address base + offset."""
+        reg = self.reg(base)
+        if fits(offset):
+            return reg, offset
+        far = self.new_vreg("x")
+        self.emit("li", far, str(offset))
+        self.emit("add", far, reg, far)
+        return far, 0
+
+    def call(self, label, args):
+        for reg, arg in zip(ARG_REGS, args):
+            if type(arg) is Const:
+                self.emit("li", reg, str(arg.value))
+            else:
+                self.emit("mv", reg, self.reg(arg))
+        self.emit("call", label, defs=CALLER_SAVED, uses=ARG_REGS[:len(args)])
+
+    def select(self):
+        fn = self.fn
+        place_copies(fn)
+        order = ir.reverse_postorder(fn)
+        depths = ir.loop_depths(fn)
+        labels = {block: f".L{fn.name}.{i}" for i, block in enumerate(order)}
+        labels[fn.entry] = fn.name
+        offset = 0
+        for obj in fn.frame:
+            self.frame[obj] = offset
+            offset += 8 * obj.size
+        self.mfn.objects_size = offset
+
+        for block in order:
+            self.code = []
+            self.mfn.blocks.append((labels[block], self.code))
+            self.mfn.depths.append(depths[block])
+            if block is fn.entry:
+                for param in fn.params:
+                    self.emit("mv", self.vreg(param), ARG_REGS[param.index])
+            for instr in block.instrs:
+                self.instruction(instr, labels)
+        return self.mfn
+
+    def instruction(self, instr, labels):
+        op = instr.op
+        args = instr.args
+        if op in ir.FLOAT_BINARY or op in ir.FLOAT_COMPARE:
+            self.emit(f"{op}.d", self.vreg(instr), self.reg(args[0]), self.reg(args[1]))
+        elif op == "fneg":
+            self.emit("fneg.d", self.vreg(instr), self.reg(args[0]))
+        elif op in ir.INT_BINARY:
+            self.int_binary(instr)
+        elif op in ("snez", "seqz"):
+            self.emit(op, self.vreg(instr), self.reg(args[0]))
+        elif op in CONVERSION_OPS:
+            self.emit(CONVERSION_OPS[op], self.vreg(instr), self.reg(args[0]))
+        elif op == "addr":
+            self.emit("la", self.vreg(instr), instr.attr)
+        elif op == "frame":
+            offset = self.frame[instr.attr]
+            if fits(offset):
+                self.emit("addi", self.vreg(instr), "sp", str(offset))
+            else:
+                self.emit("li", self.vreg(instr), str(offset))
+                self.emit("add", self.vreg(instr), "sp", self.vreg(instr))
+        elif op == "load":
+            base, offset = self.address(args[0], instr.attr)
+            self.emit("fld", self.vreg(instr), base, str(offset))
+        elif op == "store":
+            value = self.reg(args[0])
+            base, offset = self.address(args[1], instr.attr)
+            self.emit("fsd", value, base, str(offset))
+        elif op == "call":
+            self.call(instr.attr, args)
+            self.emit("mv", self.vreg(instr), "a0")
+        elif op == "print":
+            value = self.reg(args[0])
+            self.emit("la", "a0", FORMAT_LABELS[instr.attr])
+            self.emit("fmv.x.d" if instr.attr == "f" else "mv", "a1", value)
+            self.emit("call", "printf", defs=CALLER_SAVED, uses=ARG_REGS[:2])
+        elif op == "vop":
+            for reg, arg in zip(VOP_REGS, args):
+                self.emit("mv", reg, self.reg(arg))
+            self.emit("vop", *instr.attr, defs=VOP_CLOBBERS, uses=VOP_REGS)
+        elif op == "br":
+            cond = self.reg(args[0])
+            self.phi_copies(instr.block)
+            if_true, if_false = instr.block.succs
+            self.emit("br", cond, labels[if_true], labels[if_false])
+        elif op == "jmp":
+            self.phi_copies(instr.block)
+            self.emit("jmp", labels[instr.block.succs[0]], defs=(), uses=())
+        elif op == "ret":
+            if type(args[0]) is Const:
+                self.emit("li", "a0", str(args[0].value))
+            else:
+                self.emit("mv", "a0", self.reg(args[0]))
+            self.emit("ret", defs=(), uses=("a0",))
+        else:
+            raise ValueError(f"{self.fn.name}: no instruction for {op}")
+
+    def int_binary(self, instr):
+        op = instr.op
+        left, right = instr.args
+        if type(left) is Const and op in COMMUTATIVE:
+            left, right = right, left
+        if type(right) is Const and type(left) is not Const:
+            imm = right.value
+            if op == "sub" and fits(-imm):
+                self.emit("addi", self.vreg(instr), self.reg(left), str(-imm))
+                return
+            if op in IMMEDIATE_OPS and (0 <= imm < 64 if op == "sll" else fits(imm)):
+                self.emit(IMMEDIATE_OPS[op], self.vreg(instr), self.reg(left), str(imm))
+                return
+        self.emit(op, self.vreg(instr), self.reg(left), self.reg(right))
+
+
+class Interval:
+    """the positions from the first to the last one where a virtual register is live, in the order the
+    instructions are laid out: an instruction reads its operands at an even position and writes its results at the
+    odd one after it. cost is the number of its uses and definitions, each weighted by the loop depth of its block,
+    and hint the virtual register it is copied from, whose register it takes if that is free."""
+
+    __slots__ = ("vreg", "start", "end", "cost", "hint", "reg")
+
+    def __init__(self, vreg, position):
+        self.vreg = vreg
+        self.start = position
+        self.end = position
+        self.cost = 0
+        self.hint = None
+        self.reg = None
+
+
+class Spills:
+    """the values of a function that live in its frame, and the loads and stores of them in its code."""
+
+    __slots__ = ("values", "loads", "stores")
+
+    def __init__(self, values=0, loads=0, stores=0):
+        self.values = values
+        self.loads = loads
+        self.stores = stores
+
+
+def successors(mfn):
+    """the indexes of the blocks each block of mfn may continue to."""
+    index = {label: i for i, (label, _) in enumerate(mfn.blocks)}
+    succs = []
+    for _, instrs in mfn.blocks:
+        last = instrs[-1]
+        if last.op == "br":
+            succs.append((index[last.args[1]], index[last.args[2]]))
+        elif last.op == "jmp":
+            succs.append((index[last.args[0]],))
+        else:
+            succs.append(())
+    return succs
+
+
+def machine_liveness(mfn):
+    """the virtual registers live at the start and at the end of every block of mfn, as lists of sets."""
+    succs = successors(mfn)
+    uses = []
+    defs = []
+    for _, instrs in mfn.blocks:
+        used = set()
+        defined = set()
+        for minstr in instrs:
+            used.update(reg for reg in minstr.uses if type(reg) is VReg and reg not in defined)
+            defined.update(reg for reg in minstr.defs if type(reg) is VReg)
+        uses.append(used)
+        defs.append(defined)
+
+    live_in = [set() for _ in mfn.blocks]
+    live_out = [set() for _ in mfn.blocks]
+    changed = True
+    while changed:
+        changed = False
+        for i in reversed(range(len(mfn.blocks))):
+            out = set()
+            for succ in succs[i]:
+                out |= live_in[succ]
+            live = uses[i] | (out - defs[i])
+            if out != live_out[i] or live != live_in[i]:
+                live_out[i] = out
+                live_in[i] = live
+                changed = True
+    return live_in, live_out
+
+
+def live_intervals(mfn):
+    """the Intervals of the virtual registers of mfn, and the positions where calls write their results."""
+    live_in, live_out = machine_liveness(mfn)
+    intervals = {}
+    calls = []
+
+    def cover(reg, position, cost=0):
+        interval = intervals.get(reg)
+        if interval is None:
+            interval = intervals[reg] = Interval(reg, position)
+        interval.start = min(interval.start, position)
+        interval.end = max(interval.end, position)
+        interval.cost += cost
+        return interval
+
+    position = 0
+    for i, (_, instrs) in enumerate(mfn.blocks):
+        weight = LOOP_WEIGHT ** mfn.depths[i]
+        for reg in live_in[i]:
+            cover(reg, position)
+        for minstr in instrs:
+            if minstr.op == "call":
+                calls.append(position + 1)
+            for reg in minstr.uses:
+                if type(reg) is VReg:
+                    cover(reg, position, weight)
+            for reg in minstr.defs:
+                if type(reg) is VReg:
+                    interval = cover(reg, position + 1, weight)
+                    if minstr.op == MOVES[reg.cls] and type(minstr.args[1]) is VReg:
+                        interval.hint = minstr.args[1]
+            position += 2
+        for reg in live_out[i]:
+            cover(reg, position - 1)
+    return intervals, calls
+
+
+def linear_scan(intervals, calls):
+    """gives the intervals registers, in the order they start, and returns the ones that are spilled. a value
+    live across a call only gets a callee-saved register. when there is no register left, the value that is
+    spilled is the cheapest one of the interval and the ones that hold a register it could take, the one that
+    ends last if they cost the same."""
+    spilled = []
+    for cls in ("x", "f"):
+        free = list(TEMPORARIES[cls] + CALLEE_SAVED[cls])
+        active = []
+        for interval in sorted((i for i in intervals.values() if i.vreg.cls == cls), key=lambda i: i.start):
+            for other in [other for other in active if other.end < interval.start]:
+                active.remove(other)
+                free.append(other.reg)
+            across = bisect.bisect_right(calls, interval.start)
+            if across < len(calls) and calls[across] <= interval.end:
+                allowed = CALLEE_SAVED[cls]
+            else:
+                allowed = TEMPORARIES[cls] + CALLEE_SAVED[cls]
+            choices = [reg for reg in allowed if reg in free]
+            hint = intervals.get(interval.hint)
+            if hint is not None and hint.reg in choices:
+                reg = hint.reg
+            elif choices:
+                reg = choices[0]
+            else:
+                candidates = [other for other in active if other.reg in allowed] + [interval]
+                victim = min(candidates, key=lambda i: (i.cost, -i.end))
+                spilled.append(victim)
+                if victim is interval:
+                    continue
+                active.remove(victim)
+                reg = victim.reg
+                victim.reg = None
+                free.append(reg)
+            free.remove(reg)
+            interval.reg = reg
+            active.append(interval)
+    return spilled
+
+
+def allocate(mfn):
+    """replaces the virtual registers of mfn with the registers linear_scan() gives them. a spilled one gets a stack
+    slot of its own, an instruction loads it into a scratch register before it reads it and stores it after it
+    writes it. the callee-saved registers taken are saved by the function, but main, which never returns. records
+    what the function spills in mfn.before, when every value was spilled, and in mfn.after."""
+    intervals, calls = live_intervals(mfn)
+    spilled = linear_scan(intervals, calls)
+    slots = {interval.vreg: mfn.objects_size + 8 * i for i, interval in enumerate(spilled)}
+    mfn.slots = len(slots)
+    mfn.before = Spills(len(intervals))
+    mfn.after = Spills(len(spilled))
+
+    for i, (label, instrs) in enumerate(mfn.blocks):
+        code = []
+        for minstr in instrs:
+            scratch = {cls: iter(regs) for cls, regs in SCRATCH.items()}
+            assigned = {}
+            # a copy from a stack slot loads the register it writes, and a copy to one stores the register it reads
+            move = minstr.op in MOVES.values()
+            for reg in minstr.uses:
+                if type(reg) is VReg and reg not in assigned:
+                    mfn.before.loads += 1
+                    if reg in slots:
+                        dst = minstr.args[0]
+                        if move and type(dst) is VReg and dst not in slots:
+                            assigned[reg] = intervals[dst].reg
+                        else:
+                            assigned[reg] = next(scratch[reg.cls])
+                        code += stack_access("fld" if reg.cls == "f" else "ld", assigned[reg], slots[reg])
+                        mfn.after.loads += 1
+                    else:
+                        assigned[reg] = intervals[reg].reg
+            for reg in minstr.defs:
+                if type(reg) is VReg and reg not in assigned:
+                    if reg not in slots:
+                        assigned[reg] = intervals[reg].reg
+                    elif move:
+                        assigned[reg] = assigned.get(minstr.args[1], minstr.args[1])
+                    else:
+                        assigned[reg] = SCRATCH[reg.cls][0]
+            minstr.args = [assigned.get(arg, arg) if type(arg) is VReg else arg for arg in minstr.args]
+            # a copy between two values given the same register is left out, the stores after it are not
+            if not move or minstr.args[0] != minstr.args[1]:
+                code.append(minstr)
+            for reg in minstr.defs:
+                if type(reg) is VReg:
+                    mfn.before.stores += 1
+                    if reg in slots:
+                        code += stack_access("fsd" if reg.cls == "f" else "sd", assigned[reg], slots[reg])
+                        mfn.after.stores += 1
+        mfn.blocks[i] = (label, code)
+
+    if mfn.name != MAIN:
+        taken = {interval.reg for interval in intervals.values()}
+        mfn.saved += [reg for cls in ("x", "f") for reg in CALLEE_SAVED[cls] if reg in taken]
+
+
+def adjust_sp(code, amount):
+    if fits(amount):
+        code.emit("addi", "sp", "sp", str(amount))
+    else:
+        code.emit("li", FAR_REG, str(amount))
+        code.emit("add", "sp", "sp", FAR_REG)
+
+
+def write_access(code, minstr):
+    for access in minstr:
+        # a load of a constant has a label in place of the base
+        if access.op in MEMORY and is_register(access.args[1]):
+            reg, base, offset = access.args
+            code.emit(access.op, reg, f"{offset}({base})")
+        else:
+            code.emit(access.op, *access.args)
+
+
+def write_function(mfn, code):
+    """writes the function to the Code buffer code, with its prologue and the expansions of the pseudo
+    instructions."""
+    size = mfn.frame_size()
+    saved_offset = mfn.objects_size + 8 * mfn.slots
+    code.label(mfn.name)
+    if size:
+        adjust_sp(code, -size)
+    for i, reg in enumerate(mfn.saved):
+        write_access(code, stack_access("fsd" if reg[0] == "f" else "sd", reg, saved_offset + 8 * i))
+
+    vop_count = 0
+    for i, (label, instrs) in enumerate(mfn.blocks):
+        if i:
+            code.label(label)
+        following = mfn.blocks[i + 1][0] if i + 1 < len(mfn.blocks) else None
+        for minstr in instrs:
+            op = minstr.op
+            args = minstr.args
+            if op == "br":
+                cond, if_true, if_false = args
+                if if_false == following:
+                    code.emit("bnez", cond, if_true)
+                elif if_true == following:
+                    code.emit("beqz", cond, if_false)
+                else:
+                    code.emit("bnez", cond, if_true)
+                    code.emit("j", if_false)
+            elif op == "jmp":
+                if args[0] != following:
+                    code.emit("j", args[0])
+            elif op == "ret":
+                if mfn.name == MAIN:
+                    exit_main(code)
+                    continue
+                for j, reg in enumerate(mfn.saved):
+                    write_access(code, stack_access("fld" if reg[0] == "f" else "ld", reg, saved_offset + 8 * j))
+                if size:
+                    adjust_sp(code, size)
+                code.emit("ret")
+            elif op == "vop":
+                vector_op, length = args
+                loop = f".L{mfn.name}.v{vop_count}"
+                vop_count += 1
+                dst, left, right = VOP_REGS
+                code.emit("li", "t0", str(length))
+                code.label(loop)
+                code.emit("vsetvli", "t1", "t0", "e64", "m1", "tu", "mu")
+                code.emit("vle64.v", "v0", f"({left})")
+                code.emit("vle64.v", "v1", f"({right})")
+                code.emit(VECTOR_OPS[vector_op], "v0", "v0", "v1")
+                code.emit("vse64.v", "v0", f"({dst})")
+                code.emit("sub", "t0", "t0", "t1")
+                code.emit("slli", "t2", "t1", "3")
+                code.emit("add", left, left, "t2")
+                code.emit("add", right, right, "t2")
+                code.emit("add", dst, dst, "t2")
+                code.emit("bgtz", "t0", loop)
+            else:
+                write_access(code, [minstr])
+
+
+def machine_function(fn):
+    """the MFunction of an IR function, with its registers allocated."""
+    mfn = Selector(fn).select()
+    allocate(mfn)
+    return mfn
+
+
+def program_code(module, mfns):
+    """the Code of a lowering.Module whose functions are mfns, laid out like the one of codegen.CodeGenerator: the
+    functions, main, the data, then the constant pool."""
+    text = Code()
+    for line in HEADER:
+        text.directive(line)
+    for mfn in mfns:
+        write_function(mfn, text)
+
+    data = Code()
+    data.directive()
+    data.directive()
+    data.directive(".section .data")
+    for label, words in module.globals.items():
+        data.directive(f"{label}: .dword {','.join(['0'] * words)}")
+    for line in FORMATS:
+        data.directive(line)
+    constants = {}
+    for fn, mfn in zip(module.functions, mfns):
+        constants.update(fn.strings)
+        constants.update(mfn.constants)
+    return Code((text, data, constant_pool(constants)))
+
+
+class IRGenerator:
+    """generates the code of a program through the IR, like codegen.CodeGenerator does from the AST. bindings is
+    the side table of misc.Resolver for source, it is computed if it is not given."""
+
+    def __init__(self, source, bindings=None):
+        if bindings is None:
+            from misc import Resolver
+
+            bindings = Resolver(source).bindings
+        self.module = lower(source, bindings)
+        use_integers(self.module)
+        self.functions = [machine_function(fn) for fn in self.module.functions]
+        self.asm = program_code(self.module, self.functions)
+
+    @property
+    def code(self):
+        """the assembly text of the program."""
+        return str(self.asm)
+
+    def spill_report(self):
+        """the lines of a table of the values each function spills, and the loads and stores of them in its code,
+        when every value was spilled and with the registers allocated."""
+        lines = [f"{'function':<20}{'values':>8}{'spilled':>16}{'loads':>16}{'stores':>16}"]
+        for mfn in self.functions:
+            before, after = mfn.before, mfn.after
+            lines.append(
+                f"{mfn.name:<20}{before.values:>8}{f'{before.values} -> {after.values}':>16}"
+                f"{f'{before.loads} -> {after.loads}':>16}{f'{before.stores} -> {after.stores}':>16}"
+            )
+        return lines
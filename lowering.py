@@ -0,0 +1,317 @@
+from ast_tools import *
+from codegen import string_constant
+from ir import F64, I64, Function, Instr, StackObject, construct_ssa, eliminate_dead_code, terminate
+
+# the name of the function of the statements outside the functions, and the namespace of its labels
+MAIN = "main"
+# the most arguments a call passes, in a0 to a6
+MAX_ARGS = 7
+
+
+class Module:
+    """the functions of a program, main last, and its global variables as the number of words at each label."""
+
+    def __init__(self):
+        self.functions = []
+        self.globals = {}
+
+
+def global_label(binding):
+    return f".glob_{binding.decl.name}"
+
+
+class Lowering(IterativeVisitor):
+    """builds the IR of a program from its AST and the bindings of misc.Resolver. the local variables and
+    parameters of a function become SSA values, its vectors live in its frame and the global variables in memory.
+    expressions are lowered to the value they compute: an f64 number or an i64 logical value, 0 or 1. a vector
+    or a string literal used as a number is its address."""
+
+    def __init__(self, bindings):
+        super().__init__()
+        self._bindings = bindings
+        self._fn = None
+        self._block = None
+        # StackObjects of the local vectors by their declarations
+        self._objects = {}
+
+    def _emit(self, op, type, args=(), attr=None):
+        return self._block.add(Instr(op, type, args, attr))
+
+    def _const(self, type, value):
+        return self._fn.const(type, value)
+
+    def _number(self, value):
+        """value as a number, a logical value is 0 or 1."""
+        if value.type == I64:
+            return self._emit("i2f", F64, [value])
+        return value
+
+    def _word(self, value):
+        """the bits of value as a number, how it is passed to and returned from functions."""
+        return self._emit("f2bits", I64, [self._number(value)])
+
+    def _jump(self, target):
+        terminate(self._block, "jmp", succs=[target])
+
+    def _branch(self, cond, if_true, if_false):
+        terminate(self._block, "br", [cond], [if_true, if_false])
+
+    def _start(self, fn):
+        self._fn = fn
+        self._block = fn.entry
+        self._objects = {}
+
+    def _finish(self):
+        """ends the function's last block if it falls through, and builds its SSA form."""
+        fn = self._fn
+        if self._block.terminator is None:
+            terminate(self._block, "ret", [self._const(I64, 0)])
+        construct_ssa(fn)
+        eliminate_dead_code(fn)
+        return fn
+
+    def _load(self, binding):
+        if binding.vector_len:
+            return self._emit("bits2f", F64, [self._address(binding)])
+        if binding.kind == "global":
+            address = self._emit("addr", I64, attr=global_label(binding))
+            return self._emit("load", F64, [address], 0)
+        return self._emit("get", F64, attr=binding.decl)
+
+    def _store(self, binding, value):
+        if binding.kind == "global":
+            address = self._emit("addr", I64, attr=global_label(binding))
+            self._emit("store", None, [value, address], 0)
+        else:
+            self._emit("set", None, [value], binding.decl)
+
+    def _address(self, binding):
+        """the address of the vector of binding. a variable that isn't a vector holds the address as a number."""
+        if not binding.vector_len:
+            return self._emit("f2bits", I64, [self._load(binding)])
+        if binding.kind == "global":
+            return self._emit("addr", I64, attr=global_label(binding))
+        return self._emit("frame", I64, attr=self._objects[binding.decl])
+
+    def _element(self, binding, index):
+        """the address of the element of the vector of binding at the number index."""
+        offset = self._emit("sll", I64, [self._emit("f2i", I64, [index]), self._const(I64, 3)])
+        return self._emit("add", I64, [self._address(binding), offset])
+
+    def _string(self, text):
+        label, value = string_constant(text)
+        self._fn.strings[label] = value
+        return self._emit("addr", I64, attr=label)
+
+    def _loop(self, condition, body, increment=None):
+        """a loop tested before the body, inverted so that each iteration takes one branch: the condition is
+        lowered once before the loop and once after the body."""
+        loop = self._fn.new_block()
+        exit = self._fn.new_block()
+        if condition is None:
+            self._jump(loop)
+        else:
+            cond = yield condition
+            self._branch(cond, loop, exit)
+        self._block = loop
+        yield body
+        if increment is not None:
+            yield increment
+        if condition is None:
+            self._jump(loop)
+        else:
+            cond = yield condition
+            self._branch(cond, loop, exit)
+        self._block = exit
+
+    def visit_Program(self, program: Program):
+        module = Module()
+        for elem in program.var_decls:
+            binding = self._bindings[elem.identifier]
+            module.globals[global_label(binding)] = max(binding.vector_len, 1)
+        for elem in program.fun_decls:
+            module.functions.append((yield elem))
+
+        self._start(Function(MAIN))
+        for elem in program.var_decls:
+            yield elem
+        for elem in program.statements:
+            yield elem
+        module.functions.append(self._finish())
+        return module
+
+    def visit_ErrorStmt(self, errorstmt: ErrorStmt):
+        pass
+
+    def visit_VarDecl(self, vardecl: VarDecl):
+        binding = self._bindings[vardecl.identifier]
+        if isinstance(vardecl.initializer, list):
+            if binding.kind != "global":
+                obj = StackObject(vardecl.identifier.name, len(vardecl.initializer))
+                self._fn.frame.append(obj)
+                self._objects[binding.decl] = obj
+            for i, elem in enumerate(vardecl.initializer):
+                value = self._number((yield elem))
+                self._emit("store", None, [value, self._address(binding)], 8 * i)
+        elif vardecl.initializer is not None:
+            self._store(binding, self._number((yield vardecl.initializer)))
+        elif binding.kind != "global":
+            self._store(binding, self._const(F64, 0))
+
+    def visit_FunDecl(self, fundecl: FunDecl):
+        if len(fundecl.params) > MAX_ARGS:
+            raise ValueError(f"{fundecl.identifier.name} has more than {MAX_ARGS} parameters")
+        fn = Function(fundecl.identifier.name, len(fundecl.params))
+        self._start(fn)
+        for identifier, param in zip(fundecl.params, fn.params):
+            self._emit("set", None, [self._emit("bits2f", F64, [param])], identifier)
+        yield fundecl.body
+        return self._finish()
+
+    def visit_Assign(self, assign: Assign):
+        binding = self._bindings[assign.identifier]
+        if not binding.vector_len:
+            self._store(binding, self._number((yield assign.expr)))
+            return
+
+        expr = assign.expr
+        operands = []
+        if type(expr) is ABinary:
+            operands = [self._bindings[operand.identifier] for operand in (expr.left, expr.right)
+                        if type(operand) is Variable]
+        if len(operands) != 2 or not all(operand.vector_len for operand in operands):
+            raise ValueError(f"line {assign.identifier.lineno}: a vector can only be assigned an operation on two vectors")
+        left, right = operands
+        args = [self._address(binding), self._address(left), self._address(right)]
+        self._emit("vop", None, args, (expr.op, left.vector_len))
+
+    def visit_SetVector(self, setvector: SetVector):
+        value = self._number((yield setvector.expr))
+        index = self._number((yield setvector.vector_index))
+        binding = self._bindings[setvector.identifier]
+        self._emit("store", None, [value, self._element(binding, index)], 0)
+
+    def visit_ForLoop(self, forloop: ForLoop):
+        if forloop.initializer is not None:
+            yield forloop.initializer
+        yield from self._loop(forloop.condition, forloop.body, forloop.increment)
+
+    def visit_Return(self, returnn: Return):
+        value = self._word((yield returnn.expr))
+        terminate(self._block, "ret", [value])
+        # whatever follows in the block is unreachable
+        self._block = self._fn.new_block()
+
+    def visit_WhileLoop(self, whileloop: WhileLoop):
+        yield from self._loop(whileloop.condition, whileloop.body)
+
+    def visit_Block(self, block: Block):
+        for elem in block.var_decls:
+            yield elem
+        for elem in block.statements:
+            yield elem
+
+    def visit_Print(self, printt: Print):
+        if isinstance(printt.expr, SLiteral):
+            self._emit("print", None, [self._string(printt.expr.value)], "s")
+        elif isinstance(printt.expr, LExpr):
+            self._emit("print", None, [(yield printt.expr)], "d")
+        else:
+            self._emit("print", None, [self._number((yield printt.expr))], "f")
+
+    def visit_IfElse(self, ifelse: IfElse):
+        cond = yield ifelse.condition
+        if_block = self._fn.new_block()
+        else_block = self._fn.new_block() if ifelse.else_branch is not None else None
+        join = self._fn.new_block()
+        self._branch(cond, if_block, else_block or join)
+
+        self._block = if_block
+        yield ifelse.if_branch
+        self._jump(join)
+        if else_block is not None:
+            self._block = else_block
+            yield ifelse.else_branch
+            self._jump(join)
+        self._block = join
+
+    def visit_LBinary(self, lbinary: LBinary):
+        """the right operand is only evaluated if the left one doesn't decide the result, which is then the
+        left one's."""
+        left = yield lbinary.left
+        right_block = self._fn.new_block()
+        join = self._fn.new_block()
+        if lbinary.op == "or":
+            self._branch(left, join, right_block)
+        else:
+            self._branch(left, right_block, join)
+
+        self._block = right_block
+        right = yield lbinary.right
+        self._jump(join)
+        self._block = join
+        return self._emit("phi", I64, [left, right])
+
+    def visit_Comparison(self, comparison: Comparison):
+        left = self._number((yield comparison.left))
+        right = self._number((yield comparison.right))
+        op = comparison.op
+        if op == "<":
+            return self._emit("flt", I64, [left, right])
+        if op == "<=":
+            return self._emit("fle", I64, [left, right])
+        if op == ">":
+            return self._emit("flt", I64, [right, left])
+        if op == ">=":
+            return self._emit("fle", I64, [right, left])
+        equal = self._emit("feq", I64, [left, right])
+        if op == "!=":
+            return self._emit("xor", I64, [equal, self._const(I64, 1)])
+        return equal
+
+    def visit_LLiteral(self, lliteral: LLiteral):
+        return self._const(I64, int(lliteral.value))
+
+    def visit_LPrimary(self, lprimary: LPrimary):
+        value = self._number((yield lprimary.primary))
+        return self._emit("snez", I64, [self._emit("f2i", I64, [value])])
+
+    def visit_GetVector(self, getvector: GetVector):
+        index = self._number((yield getvector.vector_index))
+        binding = self._bindings[getvector.identifier]
+        return self._emit("load", F64, [self._element(binding, index)], 0)
+
+    def visit_Variable(self, variable: Variable):
+        return self._load(self._bindings[variable.identifier])
+
+    def visit_LNot(self, lnot: LNot):
+        return self._emit("xor", I64, [(yield lnot.right), self._const(I64, 1)])
+
+    def visit_ABinary(self, abinary: ABinary):
+        left = self._number((yield abinary.left))
+        right = self._number((yield abinary.right))
+        op = {"+": "fadd", "-": "fsub", "*": "fmul", "/": "fdiv"}[abinary.op]
+        return self._emit(op, F64, [left, right])
+
+    def visit_AUMinus(self, auminus: AUMinus):
+        return self._emit("fneg", F64, [self._number((yield auminus.right))])
+
+    def visit_ALiteral(self, aliteral: ALiteral):
+        return self._const(F64, aliteral.value)
+
+    def visit_Call(self, call: Call):
+        if len(call.arguments) > MAX_ARGS:
+            raise ValueError(f"line {call.callee.lineno}: {call.callee.name} is called with more than {MAX_ARGS} arguments")
+        args = []
+        for elem in call.arguments:
+            args.append(self._word((yield elem)))
+        result = self._emit("call", I64, args, call.callee.name)
+        return self._emit("bits2f", F64, [result])
+
+    def visit_SLiteral(self, sliteral: SLiteral):
+        return self._emit("bits2f", F64, [self._string(sliteral.value)])
+
+
+def lower(source, bindings):
+    """the Module of the program source, with the bindings of misc.Resolver."""
+    return Lowering(bindings).visit(source)
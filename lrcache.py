@@ -0,0 +1,64 @@
+import hashlib
+import marshal
+import os
+import sly
+
+CACHE_DIR = os.environ.get(
+    "VOX_CACHE_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "__pycache__")
+)
+
+
+class CachedLRTable:
+    """the parts of sly's LRTable that Parser.parse() reads, restored from the on-disk cache."""
+
+    def __init__(self, lr_action, lr_goto, defaulted_states, num_sr, num_rr):
+        self.lr_action = lr_action
+        self.lr_goto = lr_goto
+        self.defaulted_states = defaulted_states
+        # only the conflict counts are kept, they are used for the build warnings
+        self.sr_conflicts = [None] * num_sr
+        self.rr_conflicts = [None] * num_rr
+
+
+def grammar_signature(grammar, tokens):
+    """hash of everything the LALR tables depend on: the sly version, the tokens and the productions."""
+    h = hashlib.sha256()
+    h.update(sly.__version__.encode())
+    h.update(" ".join(sorted(tokens)).encode())
+    for p in grammar.Productions:
+        h.update(f"\n{p} {p.prec}".encode())
+    h.update(f"\nstart={grammar.Start}".encode())
+    return h.hexdigest()[:32]
+
+
+def table_path(signature):
+    return os.path.join(CACHE_DIR, f"parsetab.{signature}.marshal")
+
+
+def load_tables(signature):
+    try:
+        with open(table_path(signature), "rb") as f:
+            return CachedLRTable(*marshal.load(f))
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+
+
+def save_tables(signature, lrtable):
+    data = (
+        lrtable.lr_action,
+        lrtable.lr_goto,
+        lrtable.defaulted_states,
+        len(lrtable.sr_conflicts),
+        len(lrtable.rr_conflicts),
+    )
+    path = table_path(signature)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(tmp, "wb") as f:
+            marshal.dump(data, f)
+        # concurrent compilers may race here, replace is atomic so readers never see a partial table
+        os.replace(tmp, path)
+    except OSError:
+        if os.path.exists(tmp):
+            os.remove(tmp)
@@ -1,187 +1,279 @@
 from ast_tools import *
 from typing import List
-from parser import Parser
 from lexer import Lexer
+from dfalexer import DFALexer
+from tokenbuf import TokenBuffer
+from rdparser import RDParser, ParseError
+from symtab import Binding, ScopedTable
 
+LEXERS = {"sly": Lexer, "dfa": DFALexer}
+PARSERS = ["lalr", "rd"]
 
-class Intermediate(ASTNodeVisitor):
-    def __init__(self, source):
-        super().__init__()
 
-        lexer = Lexer()
-        parser = Parser()
+# characters read at a time when the source is a file
+CHUNK_SIZE = 1 << 20
+
+
+def tokenize(source, lexer="sly"):
+    """token stream of the source, a string or a text file. the dfa backend scans a string into a TokenBuffer,
+    which the rd parser reads by index and iterating over gives views of its tokens, and reads a file in CHUNK_SIZE
+    pieces so it is never held in memory as a whole."""
+    lexer = LEXERS[lexer]()
+    if isinstance(lexer, DFALexer):
+        if hasattr(source, "read"):
+            return lexer.tokenize_stream(iter(lambda: source.read(CHUNK_SIZE), ""))
+        return TokenBuffer(source, lexer)
+    if hasattr(source, "read"):
+        source = source.read()
+    return lexer.tokenize(source)
+
+
+def parse(source, lexer="sly", parser="lalr"):
+    """AST of the source, a string or a text file. the rd parser has no error recovery, on a syntax error
+    the source is parsed again by the lalr parser, which reports and recovers from it. so are sources nested
+    too deep for the recursion of the rd parser."""
+    if parser == "rd":
+        try:
+            return RDParser().parse(tokenize(source, lexer))
+        except (ParseError, RecursionError):
+            if hasattr(source, "seek"):
+                source.seek(0)
+
+    # imported here so that the rd parser never builds or loads the LALR tables
+    from parser import Parser
 
-        self.tokens = lexer.tokenize(source)
-        self.ast = parser.parse(self.tokens)
+    return Parser().parse(iter(tokenize(source, lexer)))
 
-        self._symbol_table = [[]]
-        self._curr_scope_level = 0
-        self._funs = []
+
+class Resolver(IterativeVisitor):
+    """finds undeclared and redeclared names, and binds every identifier of the AST to its declaration.
+    bindings maps identifiers to symtab.Binding, code generation looks names up there. without an AST,
+    the program is resolved one top level declaration or statement at a time with resolve()."""
+
+    def __init__(self, ast=None):
+        super().__init__()
+
+        self._symbol_table = ScopedTable()
+        self._funs = {}
         self._fun_vars = []
+        # binding of the variable whose initializer is visited and the one it shadows, see visit_VarDecl
+        self._declaring = None
+        self._shadowed = None
+        # frame slots taken in the current block
+        self._slots = 0
 
         self.undeclared_vars = []
         self.multiple_declarations = []
+        self.bindings = {}
 
-        self.visit(self.ast)
+        if ast is not None:
+            self.visit(ast)
 
-    def in_scope(self, var, scan_curr_scope=False):
-        if not scan_curr_scope:
-            for scope in self._symbol_table:
-                if var in scope:
-                    return True
-        else:
-            if var in self._symbol_table[self._curr_scope_level]:
-                return True
+    def resolve(self, node):
+        """binds the identifiers of node, the next top level declaration or statement of the program, and
+        returns the bindings of node alone. the ones of earlier nodes are dropped."""
+        self.bindings = {}
+        self.visit(node)
+        return self.bindings
 
-        return False
+    def in_scope(self, var, scan_curr_scope=False):
+        if scan_curr_scope:
+            return self._symbol_table.declared_here(var)
+        return var in self._symbol_table
+
+    def bind(self, identifier):
+        binding = self._symbol_table.lookup(identifier.name)
+        if binding is None:
+            self.undeclared_vars.append(identifier)
+            return
+        if binding is self._declaring:
+            binding = self._shadowed
+        if binding is not None:
+            self.bindings[identifier] = binding
 
     def visit_SLiteral(self, sliteral: SLiteral):
         pass
 
     def visit_Program(self, program: Program):
         for elem in program.var_decls:
-            self.visit(elem)
+            yield elem
         for elem in program.fun_decls:
-            self.visit(elem)
+            yield elem
         for elem in program.statements:
-            self.visit(elem)
+            yield elem
 
     def visit_ErrorStmt(self, errorstmt: ErrorStmt):
         pass
 
     def visit_VarDecl(self, vardecl: VarDecl):
-        if not self.in_scope(vardecl.identifier.name, True):
-            self._symbol_table[self._curr_scope_level].append(
-                vardecl.identifier.name)
+        identifier = vardecl.identifier
+        vector_len = len(vardecl.initializer) if type(vardecl.initializer) == list else 0
+        level = self._symbol_table.level
+        if level == 0:
+            binding = Binding("global", identifier, 0, vector_len=vector_len)
+        else:
+            binding = Binding("local", identifier, level, self._slots, vector_len)
+            self._slots += max(vector_len, 1)
+        self.bindings[identifier] = binding
+
+        shadowed = self._symbol_table.lookup(identifier.name)
+        if self._symbol_table.declare(identifier.name, binding):
+            # the variable is in scope in its initializer, but the generated code reads the one it shadows
+            self._declaring = binding
+            self._shadowed = shadowed
         else:
-            self.multiple_declarations.append(vardecl.identifier)
+            self.multiple_declarations.append(identifier)
 
         if type(vardecl.initializer) == list:
             for elem in vardecl.initializer:
-                self.visit(elem)
+                yield elem
         elif vardecl.initializer is not None:
-            self.visit(vardecl.initializer)
+            yield vardecl.initializer
+        self._declaring = self._shadowed = None
 
     def visit_FunDecl(self, fundecl: FunDecl):
         if fundecl.identifier.name not in self._funs and not self.in_scope(
             fundecl.identifier.name, True
         ):
-            self._funs.append(fundecl.identifier.name)
+            self._funs[fundecl.identifier.name] = Binding("function", fundecl.identifier, 0)
         else:
             self.multiple_declarations.append(fundecl.identifier)
         self._fun_vars = [elem for elem in fundecl.params]
 
-        self.visit(fundecl.body)
+        yield fundecl.body
 
     def visit_Assign(self, assign: Assign):
-        if not self.in_scope(assign.identifier.name):
-            self.undeclared_vars.append(assign.identifier)
+        self.bind(assign.identifier)
 
-        self.visit(assign.expr)
+        yield assign.expr
 
     def visit_SetVector(self, setvector: SetVector):
-        if not self.in_scope(setvector.identifier.name):
-            self.undeclared_vars.append(setvector.identifier)
+        self.bind(setvector.identifier)
 
-        self.visit(setvector.vector_index)
-        self.visit(setvector.expr)
+        yield setvector.vector_index
+        yield setvector.expr
 
     def visit_ForLoop(self, forloop: ForLoop):
         if forloop.initializer is not None:
-            self.visit(forloop.initializer)
+            yield forloop.initializer
         if forloop.condition is not None:
-            self.visit(forloop.condition)
+            yield forloop.condition
         if forloop.increment is not None:
-            self.visit(forloop.increment)
+            yield forloop.increment
 
-        self.visit(forloop.body)
+        yield forloop.body
 
     def visit_Return(self, returnn: Return):
-        self.visit(returnn.expr)
+        yield returnn.expr
 
     def visit_WhileLoop(self, whileloop: WhileLoop):
-        self.visit(whileloop.condition)
-        self.visit(whileloop.body)
+        yield whileloop.condition
+        yield whileloop.body
 
     def visit_Block(self, block: Block):
-        self._symbol_table.append([])
-        self._curr_scope_level += 1
-
-        for identifier in self._fun_vars:
-            if not self.in_scope(identifier.name, True):
-                self._symbol_table[self._curr_scope_level].append(
-                    identifier.name)
-            else:
+        self._symbol_table.push()
+        outer_slots = self._slots
+        self._slots = len(self._fun_vars)
+
+        level = self._symbol_table.level
+        for i, identifier in enumerate(self._fun_vars):
+            binding = Binding("param", identifier, level, i)
+            self.bindings[identifier] = binding
+            if not self._symbol_table.declare(identifier.name, binding):
                 self.multiple_declarations.append(identifier)
 
         self._fun_vars = []
 
         for elem in block.var_decls:
-            self.visit(elem)
+            yield elem
         for elem in block.statements:
-            self.visit(elem)
+            yield elem
 
-        self._symbol_table = self._symbol_table[:-1]
-        self._curr_scope_level -= 1
+        self._symbol_table.pop()
+        self._slots = outer_slots
 
     def visit_Print(self, printt: Print):
-        self.visit(printt.expr)
+        yield printt.expr
 
     def visit_IfElse(self, ifelse: IfElse):
-        self.visit(ifelse.condition)
-        self.visit(ifelse.if_branch)
+        yield ifelse.condition
+        yield ifelse.if_branch
 
         if ifelse.else_branch is not None:
-            self.visit(ifelse.else_branch)
+            yield ifelse.else_branch
 
     def visit_LBinary(self, lbinary: LBinary):
-        self.visit(lbinary.left)
-        self.visit(lbinary.right)
+        yield lbinary.left
+        yield lbinary.right
 
     def visit_Comparison(self, comparison: Comparison):
-        self.visit(comparison.left)
-        self.visit(comparison.right)
+        yield comparison.left
+        yield comparison.right
 
     def visit_LLiteral(self, lliteral: LLiteral):
         pass
 
     def visit_LPrimary(self, lprimary: LPrimary):
-        self.visit(lprimary.primary)
+        yield lprimary.primary
 
     def visit_GetVector(self, getvector: GetVector):
-        if not self.in_scope(getvector.identifier.name):
-            self.undeclared_vars.append(getvector.identifier)
+        self.bind(getvector.identifier)
 
-        self.visit(getvector.vector_index)
+        yield getvector.vector_index
 
     def visit_Variable(self, variable: Variable):
-        if not self.in_scope(variable.identifier.name):
-            self.undeclared_vars.append(variable.identifier)
+        self.bind(variable.identifier)
 
     def visit_LNot(self, lnot: LNot):
-        self.visit(lnot.right)
+        yield lnot.right
 
     def visit_ABinary(self, abinary: ABinary):
-        self.visit(abinary.left)
-        self.visit(abinary.right)
+        yield abinary.left
+        yield abinary.right
 
     def visit_AUMinus(self, auminus: AUMinus):
-        self.visit(auminus.right)
+        yield auminus.right
 
     def visit_ALiteral(self, aliteral: ALiteral):
         pass
 
     def visit_Call(self, call: Call):
-        if call.callee.name not in self._funs:
+        binding = self._funs.get(call.callee.name)
+        if binding is None:
             self.undeclared_vars.append(call.callee)
+        else:
+            self.bindings[call.callee] = binding
 
         for elem in call.arguments:
-            self.visit(elem)
+            yield elem
+
+
+class Intermediate(Resolver):
+    def __init__(self, source, lexer="sly", parser="lalr"):
+        self.ast = parse(source, lexer, parser)
+        super().__init__(self.ast)
+
+
+class StreamingIntermediate(Resolver):
+    """Intermediate that never holds the whole source or AST. iterating over it parses the source with the rd
+    parser one top level declaration or statement at a time, and yields each with its bindings. the
+    undeclared and redeclared names found so far can be checked before each one is compiled. the rd parser's
+    ParseError is not recovered from."""
+
+    def __init__(self, source, lexer="dfa"):
+        super().__init__()
+        self._source = source
+        self._lexer = lexer
+
+    def __iter__(self):
+        for node in RDParser().items(tokenize(self._source, self._lexer)):
+            yield node, self.resolve(node)
 
 
-def process(source):
-    """parse the source text here. you may return the AST specified in ast_tools.py or something else."""
-    return Intermediate(source)
+def process(source, lexer="sly", parser="lalr"):
+    """parse the source text here. you may return the AST specified in ast_tools.py or something else.
+    source may also be an open text file. lexer and parser select the backends, from LEXERS and PARSERS."""
+    return Intermediate(source, lexer, parser)
 
 
 def generate_ast(intermediate) -> Program:
@@ -1,11 +1,51 @@
 from sly import Parser
+from sly.yacc import LRTable, YaccError
 from lexer import Lexer
 from ast_tools import *
+import lrcache
 
 
 class Parser(Parser):
     #debugfile = "parser.debug"
     tokens = Lexer.tokens
+    # positions are only read from tokens (p.lineno/p.index), don't record them for every reduction.
+    # the left recursive sequence rules rely on nonterminals not having positions
+    track_positions = False
+
+    @classmethod
+    def _build(cls, definitions):
+        """same steps as sly's Parser._build, but the LALR tables are loaded from lrcache if the grammar is unchanged."""
+        rules = cls._Parser__collect_rules(definitions)
+        if not cls._Parser__validate_specification():
+            raise YaccError("Invalid parser specification")
+
+        cls._Parser__build_grammar(rules)
+
+        signature = lrcache.grammar_signature(cls._grammar, cls.tokens)
+        lrtable = None if cls.debugfile else lrcache.load_tables(signature)
+        if lrtable is None:
+            lrtable = LRTable(cls._grammar)
+            lrcache.save_tables(signature, lrtable)
+
+        num_sr = len(lrtable.sr_conflicts)
+        if num_sr == 1:
+            cls.log.warning("1 shift/reduce conflict")
+        elif num_sr > 1:
+            cls.log.warning("%d shift/reduce conflicts", num_sr)
+
+        num_rr = len(lrtable.rr_conflicts)
+        if num_rr == 1:
+            cls.log.warning("1 reduce/reduce conflict")
+        elif num_rr > 1:
+            cls.log.warning("%d reduce/reduce conflicts", num_rr)
+
+        cls._lrtable = lrtable
+
+        if cls.debugfile:
+            with open(cls.debugfile, "w") as f:
+                f.write(str(cls._grammar))
+                f.write("\n")
+                f.write(str(cls._lrtable))
 
     """
     Program syntax
@@ -19,15 +59,20 @@ class Parser(Parser):
     Global Variable Declarations
     """
 
-    @_('VAR ID ";" varDecl')
+    # sequences are left recursive and appended to in place, so they are built in linear time
+    # and the parser stack does not grow with their length
+
+    @_('varDecl VAR ID ";"')
     def varDecl(self, p):
         id = Identifier(p.ID, p.lineno, p.index)
-        return [VarDecl(id, None)] + p.varDecl
+        p.varDecl.append(VarDecl(id, None))
+        return p.varDecl
 
-    @_('VAR ID ASSIGN init ";" varDecl')
+    @_('varDecl VAR ID ASSIGN init ";"')
     def varDecl(self, p):
         id = Identifier(p.ID, p.lineno, p.index)
-        return [VarDecl(id, p.init)] + p.varDecl
+        p.varDecl.append(VarDecl(id, p.init))
+        return p.varDecl
 
     @_("empty")
     def varDecl(self, p):
@@ -37,9 +82,10 @@ class Parser(Parser):
     Global Function Declarations
     """
 
-    @_("FUN function funDecl")
+    @_("funDecl FUN function")
     def funDecl(self, p):
-        return [p.function] + p.funDecl
+        p.funDecl.append(p.function)
+        return p.funDecl
 
     @_("empty")
     def funDecl(self, p):
@@ -57,9 +103,10 @@ class Parser(Parser):
     def free_statement(self, p):
         return p.compoundStmt
 
-    @_("free_statement fStatement")
+    @_("fStatement free_statement")
     def fStatement(self, p):
-        return [p.free_statement] + p.fStatement
+        p.fStatement.append(p.free_statement)
+        return p.fStatement
 
     @_("empty")
     def fStatement(self, p):
@@ -73,17 +120,18 @@ class Parser(Parser):
     def init(self, p):
         return p.expr
 
-    @_('"[" expr subarrinit "]"')
+    @_('"[" subarrinit "]"')
     def init(self, p):
-        return [p.expr] + p.subarrinit
+        return p.subarrinit
 
-    @_('"," expr subarrinit')
+    @_("expr")
     def subarrinit(self, p):
-        return [p.expr] + p.subarrinit
+        return [p.expr]
 
-    @_("empty")
+    @_('subarrinit "," expr')
     def subarrinit(self, p):
-        return []
+        p.subarrinit.append(p.expr)
+        return p.subarrinit
 
     """
     Simple-Compound Statements
@@ -207,9 +255,10 @@ class Parser(Parser):
     def block(self, p):
         return Block(p.varDecl, p.blockStmt)
 
-    @_("statement blockStmt")
+    @_("blockStmt statement")
     def blockStmt(self, p):
-        return [p.statement] + p.blockStmt
+        p.blockStmt.append(p.statement)
+        return p.blockStmt
 
     @_("empty")
     def blockStmt(self, p):
@@ -368,19 +417,21 @@ class Parser(Parser):
         id = Identifier(p.ID, p.lineno, p.index)
         return FunDecl(id, p.parameters, p.block)
 
-    @_("ID subparameters")
+    @_("subparameters")
     def parameters(self, p):
-        id = Identifier(p.ID, p.lineno, p.index)
-        return [id] + p.subparameters
+        return p.subparameters
 
-    @_('"," ID subparameters')
+    @_("ID")
     def subparameters(self, p):
         id = Identifier(p.ID, p.lineno, p.index)
-        return [id] + p.subparameters
+        return [id]
 
-    @_("empty")
+    @_('subparameters "," ID')
     def subparameters(self, p):
-        return []
+        # p.lineno/p.index are the ones of ",", as they were in the right recursive rule
+        id = Identifier(p.ID, p.lineno, p.index)
+        p.subparameters.append(id)
+        return p.subparameters
 
     @_("empty")
     def parameters(self, p):
@@ -390,17 +441,18 @@ class Parser(Parser):
     Function Call - Definition
     """
 
-    @_("expr subargument")
+    @_("subargument")
     def arguments(self, p):
-        return [p.expr] + p.subargument
+        return p.subargument
 
-    @_('"," expr subargument')
+    @_("expr")
     def subargument(self, p):
-        return [p.expr] + p.subargument
+        return [p.expr]
 
-    @_("empty")
+    @_('subargument "," expr')
     def subargument(self, p):
-        return []
+        p.subargument.append(p.expr)
+        return p.subargument
 
     @_("empty")
     def arguments(self, p):
@@ -0,0 +1,359 @@
+"""integer inference over the IR of voxc.py -O. every Vox number is a double, but counters and indexes only hold
+small integers. infer_ranges() bounds the numbers of a module by interval analysis, and use_integers() moves the
+ones proven to be integers that fit a 32 bit word into i64 values, which are added, compared and used as indexes
+on the integer registers. such a number is converted back to a double only where one is needed, and every
+conversion is exact, so the program computes and prints the same."""
+
+import math
+from ir import F64, FLOAT_COMPARE, I64, Const, Instr, Param, eliminate_dead_code, reverse_postorder
+
+INF = math.inf
+# the integers a 32 bit word holds
+WORD = (-2.0 ** 31, 2.0 ** 31 - 1)
+# a phi or parameter whose range changes more often than this has its changing bounds widened to infinity
+WIDEN_AFTER = 2
+# passes that narrow the ranges again after they are widened
+NARROWING_PASSES = 2
+# the number instructions that have integer counterparts on the same operands
+INTEGER_OPS = {"fadd": "add", "fsub": "sub", "fmul": "mul"}
+
+
+class Range:
+    """the doubles a number may be: between lo and hi, or nan unless integral. an integral number is an integer or
+    an infinity that is one of the bounds, never -0.0 nor nan."""
+
+    __slots__ = ("lo", "hi", "integral")
+
+    def __init__(self, lo, hi, integral=False):
+        if math.isnan(lo) or math.isnan(hi):
+            lo, hi, integral = -INF, INF, False
+        self.lo = lo
+        self.hi = hi
+        self.integral = integral
+
+    def __eq__(self, other):
+        return type(other) is Range and (self.lo, self.hi, self.integral) == (other.lo, other.hi, other.integral)
+
+    def __repr__(self):
+        return f"Range({self.lo}, {self.hi}{', integral' if self.integral else ''})"
+
+    def in_word(self):
+        return self.integral and WORD[0] <= self.lo and self.hi <= WORD[1]
+
+    def infinite(self):
+        """whether the number may be -inf and whether it may be inf."""
+        return self.lo == -INF, self.hi == INF
+
+
+TOP = Range(-INF, INF)
+
+
+def join(a, b):
+    """the smallest range of both, None is an unknown range, of a value that hasn't been computed or is never."""
+    if a is None:
+        return b
+    if b is None:
+        return a
+    return Range(min(a.lo, b.lo), max(a.hi, b.hi), a.integral and b.integral)
+
+
+def const_range(const):
+    value = const.value
+    return Range(value, value, value.is_integer() and math.copysign(1, value) > 0)
+
+
+def is_word_const(value):
+    return type(value) is Const and value.type == F64 and const_range(value).in_word()
+
+
+class RangeAnalysis:
+    """the ranges of the numbers of a lowering.Module, in ranges by value. a parameter's range is the one of the
+    arguments of all the calls of its function."""
+
+    def __init__(self, module):
+        self.module = module
+        self.ranges = {}
+        self._changes = {}
+        self._calls = {fn.name: [] for fn in module.functions}
+        self._orders = {fn: reverse_postorder(fn) for fn in module.functions}
+        for order in self._orders.values():
+            for block in order:
+                for instr in block.instrs:
+                    if instr.op == "call" and instr.attr in self._calls:
+                        self._calls[instr.attr].append(instr)
+
+        changed = True
+        while changed:
+            changed = self._pass(widen=True)
+        for _ in range(NARROWING_PASSES):
+            self._pass(widen=False)
+
+    def range(self, value):
+        if type(value) is Const:
+            return const_range(value) if value.type == F64 else TOP
+        return self.ranges.get(value)
+
+    def _pass(self, widen):
+        """computes every range once, joined with the old one and widened if widen, returns whether any changed."""
+        changed = False
+        for fn in self.module.functions:
+            for param in fn.params:
+                changed |= self._update(param, self._param(fn, param), widen)
+            for block in self._orders[fn]:
+                for phi in block.phis:
+                    if phi.type == F64:
+                        new = None
+                        for pred, arg in zip(block.preds, phi.args):
+                            new = join(new, self.refine(self.range(arg), arg, pred, block))
+                        changed |= self._update(phi, new, widen)
+                for instr in block.instrs:
+                    if instr.type == F64:
+                        changed |= self._update(instr, self._compute(instr), widen)
+        return changed
+
+    def _update(self, value, new, widen):
+        old = self.ranges.get(value)
+        if widen:
+            new = join(old, new)
+            if new == old:
+                return False
+            if type(value) is Param or value.op == "phi":
+                self._changes[value] = self._changes.get(value, 0) + 1
+                if old is not None and self._changes[value] > WIDEN_AFTER:
+                    new = Range(-INF if new.lo < old.lo else new.lo, INF if new.hi > old.hi else new.hi, new.integral)
+        elif new == old:
+            return False
+        self.ranges[value] = new
+        return True
+
+    def _param(self, fn, param):
+        """the range of the numbers passed as param, whose words are the bits of a double."""
+        new = None
+        for call in self._calls[fn.name]:
+            if param.index >= len(call.args):
+                return TOP
+            arg = call.args[param.index]
+            if type(arg) is Instr and arg.op == "f2bits" and arg.args[0].type == F64:
+                new = join(new, self.range(arg.args[0]))
+            else:
+                new = join(new, TOP)
+        return new
+
+    def _compute(self, instr):
+        op = instr.op
+        args = [self.range(arg) for arg in instr.args]
+        if op in INTEGER_OPS or op == "fdiv":
+            a, b = args
+            if a is None or b is None:
+                return None
+            # the sum of integers is an integer, or an infinity when it is too large, and nan only as inf - inf
+            integral = a.integral and b.integral
+            (a_neg, a_pos), (b_neg, b_pos) = a.infinite(), b.infinite()
+            if op == "fadd":
+                return Range(a.lo + b.lo, a.hi + b.hi, integral and not (a_neg and b_pos or a_pos and b_neg))
+            if op == "fsub":
+                return Range(a.lo - b.hi, a.hi - b.lo, integral and not (a_neg and b_neg or a_pos and b_pos))
+            if op == "fmul":
+                if a_neg or a_pos or b_neg or b_pos:
+                    return TOP
+                products = [x * y for x in (a.lo, a.hi) for y in (b.lo, b.hi)]
+                # a product of integers is only -0.0 if one of them is 0 and the other negative
+                return Range(min(products), max(products), integral and a.lo >= 0 and b.lo >= 0)
+            return TOP
+        if op == "fneg":
+            a = args[0]
+            if a is None:
+                return None
+            return Range(-a.hi, -a.lo, a.integral and (a.lo > 0 or a.hi < 0))
+        if op == "i2f":
+            # fcvt.d.w of a word, +0.0 for 0
+            return Range(WORD[0], WORD[1], True)
+        if op == "bits2f" and type(instr.args[0]) is Param:
+            return self.ranges.get(instr.args[0])
+        return TOP
+
+    def refine(self, rng, value, pred, succ):
+        """rng narrowed by what the branch at the end of pred tells of value when it goes to succ."""
+        term = pred.terminator
+        if rng is None or term.op != "br" or pred.succs[0] is pred.succs[1]:
+            return rng
+        taken = succ is pred.succs[0]
+        cond = term.args[0]
+        if type(cond) is Instr and cond.op == "xor" and type(cond.args[1]) is Const and cond.args[1].value == 1:
+            cond = cond.args[0]
+            taken = not taken
+        if type(cond) is not Instr or cond.op not in FLOAT_COMPARE:
+            return rng
+        left, right = cond.args
+        if value is left:
+            relation, other = {"flt": "<", "fle": "<=", "feq": "=="}[cond.op], right
+        elif value is right:
+            relation, other = {"flt": ">", "fle": ">=", "feq": "=="}[cond.op], left
+        else:
+            return rng
+        bound = self.range(other)
+        if bound is None:
+            return rng
+        if not taken:
+            # a comparison with nan is false, so the other way around only holds between integral numbers
+            if relation == "==" or not (rng.integral and bound.integral):
+                return rng
+            relation = {"<": ">=", "<=": ">", ">": "<=", ">=": "<"}[relation]
+
+        lo, hi = rng.lo, rng.hi
+        if relation in ("<", "<=", "=="):
+            limit = bound.hi
+            if rng.integral and math.isfinite(limit):
+                limit = float(math.ceil(limit) - 1 if relation == "<" else math.floor(limit))
+            hi = min(hi, limit)
+        if relation in (">", ">=", "=="):
+            limit = bound.lo
+            if rng.integral and math.isfinite(limit):
+                limit = float(math.floor(limit) + 1 if relation == ">" else math.ceil(limit))
+            lo = max(lo, limit)
+        if lo > hi:
+            # the branch never goes to succ with this value
+            return None
+        return Range(lo, hi, rng.integral)
+
+
+def infer_ranges(module):
+    """the Ranges of the numbers of module by value."""
+    return RangeAnalysis(module).ranges
+
+
+def integer_candidates(fn, ranges):
+    """the numbers of fn worth computing as integers: the integral ones in the range of a word that the integer
+    instructions compute from other such numbers, when they are phis or used as integers themselves, and the numbers
+    these are computed from."""
+    def convertible(value):
+        rng = ranges.get(value)
+        if rng is None or not rng.in_word():
+            return False
+        if value.op == "phi" or value.op in INTEGER_OPS:
+            return True
+        return value.op == "i2f" or value.op == "bits2f" and type(value.args[0]) is Param
+
+    candidates = {
+        value for block in fn.blocks for value in block.phis + block.instrs
+        if value.type == F64 and convertible(value)
+    }
+    # an integer is only computed from integers
+    changed = True
+    while changed:
+        changed = False
+        for value in list(candidates):
+            if value.op in INTEGER_OPS or value.op == "phi":
+                if not all(arg in candidates or is_word_const(arg) for arg in value.args):
+                    candidates.discard(value)
+                    changed = True
+
+    def integer(value):
+        return value in candidates or is_word_const(value)
+
+    work = [
+        value for value in candidates
+        if value.op == "phi" or any(
+            user.op == "f2i" or user.op in FLOAT_COMPARE and all(integer(arg) for arg in user.args)
+            for user in value.users
+        )
+    ]
+    worth = set()
+    while work:
+        value = work.pop()
+        if value in worth:
+            continue
+        worth.add(value)
+        if value.op in INTEGER_OPS or value.op == "phi":
+            work.extend(arg for arg in value.args if arg in candidates)
+    return worth
+
+
+def use_integers(module, ranges=None):
+    """computes the integer_candidates() of the functions of module as i64 values. their other users take them
+    converted back with i2f, an index or a test of one takes the integer, and comparisons of two of them compare the
+    integers."""
+    ranges = infer_ranges(module) if ranges is None else ranges
+    for fn in module.functions:
+        numbers = integer_candidates(fn, ranges)
+        if not numbers:
+            continue
+        integers = {}
+        for value in numbers:
+            block = value.block
+            if value.op == "phi":
+                integers[value] = block.add(Instr("phi", I64))
+            elif value.op == "i2f":
+                integers[value] = value.args[0]
+            elif value.op == "bits2f":
+                integers[value] = block.insert(block.instrs.index(value) + 1, Instr("f2i", I64, [value]))
+            else:
+                integers[value] = block.insert(block.instrs.index(value) + 1, Instr(INTEGER_OPS[value.op], I64))
+
+        def integer(value):
+            return integers[value] if type(value) is not Const else fn.const(I64, int(value.value))
+
+        for value in numbers:
+            if value.op in INTEGER_OPS or value.op == "phi":
+                twin = integers[value]
+                twin.args = [integer(arg) for arg in value.args]
+                for arg in twin.args:
+                    arg.users.append(twin)
+
+        # the other users take the number converted back, right after its integer
+        for value in numbers:
+            twin = integers[value]
+            if value.op == "phi":
+                block, position = value.block, 0
+            elif value.op == "i2f":
+                continue
+            else:
+                block, position = twin.block, twin.block.instrs.index(twin) + 1
+            users = [user for user in value.users if user is not twin]
+            if not users:
+                continue
+            number = block.insert(position, Instr("i2f", F64, [twin]))
+            ranges[number] = ranges[value]
+            for user in set(users):
+                user.args = [number if arg is value else arg for arg in user.args]
+                number.users += [user] * user.args.count(number)
+            value.users = [user for user in value.users if user is twin]
+
+        twins = set(integers.values())
+        for block in fn.blocks:
+            for instr in list(block.instrs):
+                integer_use(fn, instr, twins)
+        eliminate_dead_code(fn)
+
+
+def integer_use(fn, instr, integers):
+    """makes instr take the integers of its operands that are numbers converted from one of integers, if it has an
+    integer form."""
+    def integer(value):
+        if type(value) is Instr and value.op == "i2f" and value.args[0] in integers:
+            return value.args[0]
+        if is_word_const(value):
+            return fn.const(I64, int(value.value))
+        return None
+
+    if instr.op == "f2i":
+        replacement = integer(instr.args[0])
+        if replacement is not None:
+            instr.replace_uses(replacement)
+        return
+    if instr.op not in FLOAT_COMPARE:
+        return
+    left, right = (integer(arg) for arg in instr.args)
+    if left is None or right is None:
+        return
+    block = instr.block
+    position = block.instrs.index(instr)
+    if instr.op == "flt":
+        result = block.insert(position, Instr("slt", I64, [left, right]))
+    elif instr.op == "fle":
+        less = block.insert(position, Instr("slt", I64, [right, left]))
+        result = block.insert(position + 1, Instr("xor", I64, [less, fn.const(I64, 1)]))
+    else:
+        difference = block.insert(position, Instr("xor", I64, [left, right]))
+        result = block.insert(position + 1, Instr("seqz", I64, [difference]))
+    instr.replace_uses(result)
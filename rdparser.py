@@ -0,0 +1,360 @@
+from ast_tools import *
+from operator import attrgetter
+from tokenbuf import TYPES, TokenBuffer
+
+# binary operators by token type: (precedence, op). or/and take logical operands, the others arithmetic ones.
+# every level is left associative except the comparisons, whose operands are arithmetic so they can't chain.
+BINARY = {
+    "OR": (1, "or"),
+    "AND": (2, "and"),
+    "NE": (3, "!="),
+    "EQ": (3, "=="),
+    "GT": (3, ">"),
+    "GE": (3, ">="),
+    "LE": (3, "<="),
+    "LT": (3, "<"),
+    "PLUS": (4, "+"),
+    "MINUS": (4, "-"),
+    "TIMES": (5, "*"),
+    "DIVIDE": (5, "/"),
+}
+LOGICAL_PREC = 2
+COMPARISON_PREC = 3
+UNARY_PREC = 6
+
+
+class ParseError(Exception):
+    """raised at the first token that does not fit the grammar. RDParser does no error recovery of its own."""
+
+    def __init__(self, token):
+        super().__init__(f"unexpected token {token!r}")
+        self.token = token
+
+
+class RDParser:
+    """hand written recursive descent parser for vox_grammar.txt, building the same AST as parser.Parser.
+    expressions are parsed by precedence climbing over BINARY, the grammar's split into lexpr and aexpr
+    is enforced by checking whether operands are LExpr nodes."""
+
+    def parse(self, tokens):
+        self._start(tokens)
+        return self.program()
+
+    def items(self, tokens):
+        """the program's top level declarations and statements, each yielded as soon as it is parsed. they come
+        in the order of the grammar: variable declarations, then function declarations, then statements."""
+        self._start(tokens)
+        while self.type == "VAR":
+            yield self.var_decl()
+
+        while self.type == "FUN":
+            self._advance()
+            yield self.function()
+
+        while self.type != "$end":
+            yield self.free_statement()
+
+    def _start(self, tokens):
+        """tokens is a TokenBuffer, which is read by the index of a token in its arrays without an object for each
+        token, or any other iterable of tokens. a token the parser has consumed is its index or the token, the
+        methods that read one are bound here for the kind of tokens."""
+        if isinstance(tokens, TokenBuffer):
+            self._buffer = tokens
+            self._kinds = tokens.kinds
+            self._starts = tokens.starts
+            self._linenos = tokens.linenos
+            self._advance = self._advance_index
+            self._value = tokens.value
+            self._identifier = self._identifier_index
+            self.tok = -1
+        else:
+            self._buffer = None
+            self._tokens = iter(tokens)
+            self._advance = self._advance_token
+            self._value = attrgetter("value")
+            self._identifier = self._identifier_token
+            self.tok = None
+        self._advance()
+
+    def _advance_index(self):
+        tok = self.tok
+        self.tok = tok + 1
+        try:
+            self.type = TYPES[self._kinds[tok + 1]]
+        except IndexError:
+            self.type = "$end"
+        return tok
+
+    def _advance_token(self):
+        tok = self.tok
+        self.tok = next(self._tokens, None)
+        self.type = "$end" if self.tok is None else self.tok.type
+        return tok
+
+    def _identifier_index(self, name, position):
+        """the Identifier of the name token, at the position of the position token. its name is its lexeme."""
+        start = self._starts[name]
+        return Identifier(
+            self._buffer.text[start:self._buffer.ends[name]], self._linenos[position], self._starts[position]
+        )
+
+    def _identifier_token(self, name, position):
+        return Identifier(name.value, position.lineno, position.index)
+
+    def _expect(self, tok_type):
+        if self.type != tok_type:
+            raise self._error(self.tok)
+        return self._advance()
+
+    def _error(self, tok):
+        """the ParseError at tok, with a view of it when it is an index in the buffer."""
+        if self._buffer is not None:
+            tok = self._buffer[tok] if tok < len(self._buffer) else None
+        return ParseError(tok)
+
+    def program(self):
+        var_decls = []
+        while self.type == "VAR":
+            var_decls.append(self.var_decl())
+
+        fun_decls = []
+        while self.type == "FUN":
+            self._advance()
+            fun_decls.append(self.function())
+
+        statements = []
+        while self.type != "$end":
+            statements.append(self.free_statement())
+
+        return Program(var_decls, fun_decls, statements)
+
+    def var_decl(self):
+        # the identifier carries the position of the "var" token, like in parser.Parser
+        var = self._advance()
+        id = self._identifier(self._expect("ID"), var)
+        initializer = None
+        if self.type == "ASSIGN":
+            self._advance()
+            initializer = self.init()
+        self._expect(";")
+        return VarDecl(id, initializer)
+
+    def init(self):
+        if self.type != "[":
+            return self.expr()
+
+        self._advance()
+        elems = [self.expr()]
+        while self.type == ",":
+            self._advance()
+            elems.append(self.expr())
+        self._expect("]")
+        return elems
+
+    def function(self):
+        name = self._expect("ID")
+        id = self._identifier(name, name)
+        self._expect("(")
+        params = []
+        if self.type == "ID":
+            tok = self._advance()
+            params.append(self._identifier(tok, tok))
+            while self.type == ",":
+                # later parameters carry the position of the preceding ","
+                comma = self._advance()
+                params.append(self._identifier(self._expect("ID"), comma))
+        self._expect(")")
+        return FunDecl(id, params, self.block())
+
+    """
+    Statements
+    """
+
+    def free_statement(self):
+        t = self.type
+        if t == "ID":
+            stmt = self.asgn_stmt()
+        elif t == "PRINT":
+            self._advance()
+            stmt = Print(self.expr())
+        elif t == "RETURN":
+            self._advance()
+            stmt = Return(self.expr())
+        elif t == "IF":
+            return self.if_stmt()
+        elif t == "WHILE":
+            self._advance()
+            condition = self.lexpr()
+            return WhileLoop(condition, self.statement())
+        elif t == "FOR":
+            return self.for_stmt()
+        else:
+            raise self._error(self.tok)
+
+        self._expect(";")
+        return stmt
+
+    def statement(self):
+        if self.type == "{":
+            return self.block()
+        return self.free_statement()
+
+    def block(self):
+        self._expect("{")
+        var_decls = []
+        while self.type == "VAR":
+            var_decls.append(self.var_decl())
+
+        statements = []
+        while self.type != "}":
+            statements.append(self.statement())
+        self._advance()
+        return Block(var_decls, statements)
+
+    def asgn_stmt(self):
+        name = self._advance()
+        id = self._identifier(name, name)
+        if self.type == "[":
+            self._advance()
+            index = self.aexpr()
+            self._expect("]")
+            self._expect("ASSIGN")
+            return SetVector(id, index, self.expr())
+
+        self._expect("ASSIGN")
+        return Assign(id, self.expr())
+
+    def if_stmt(self):
+        self._advance()
+        condition = self.lexpr()
+        if_branch = self.statement()
+        else_branch = None
+        # a dangling else belongs to the innermost if
+        if self.type == "ELSE":
+            self._advance()
+            else_branch = self.statement()
+        return IfElse(condition, if_branch, else_branch)
+
+    def for_stmt(self):
+        self._advance()
+        self._expect("(")
+        initializer = self.asgn_stmt() if self.type == "ID" else None
+        self._expect(";")
+        condition = None if self.type == ";" else self.lexpr()
+        self._expect(";")
+        increment = self.asgn_stmt() if self.type == "ID" else None
+        self._expect(")")
+        return ForLoop(initializer, condition, increment, self.statement())
+
+    """
+    Expressions
+    """
+
+    def expr(self):
+        if self.type == "STRING":
+            return SLiteral(self._value(self._advance()))
+        return self.climb(1)
+
+    def lexpr(self):
+        tok = self.tok
+        node = self.climb(1)
+        if not isinstance(node, LExpr):
+            raise self._error(tok)
+        return node
+
+    def aexpr(self):
+        tok = self.tok
+        node = self.climb(COMPARISON_PREC + 1)
+        if isinstance(node, LExpr):
+            raise self._error(tok)
+        return node
+
+    def climb(self, min_prec):
+        left = self.prefix()
+        while self.type in BINARY:
+            prec, op = BINARY[self.type]
+            if prec < min_prec:
+                break
+
+            logical = prec <= LOGICAL_PREC
+            if isinstance(left, LExpr) != logical:
+                raise self._error(self.tok)
+            self._advance()
+
+            tok = self.tok
+            right = self.climb(prec + 1)
+            if isinstance(right, LExpr) != logical:
+                raise self._error(tok)
+
+            if logical:
+                left = LBinary(op, left, right)
+            elif prec == COMPARISON_PREC:
+                left = Comparison(op, left, right)
+            else:
+                left = ABinary(op, left, right)
+
+        return left
+
+    def prefix(self):
+        t = self.type
+        if t == "NUMBER":
+            return ALiteral(self._value(self._advance()))
+        elif t == "ID":
+            return self.primary(self._advance())
+        elif t == "(":
+            # "(" aexpr ")" is a fact, "(" lexpr ")" an lfact
+            self._advance()
+            node = self.climb(1)
+            self._expect(")")
+            return node
+        elif t == "MINUS":
+            self._advance()
+            tok = self.tok
+            right = self.climb(UNARY_PREC)
+            if isinstance(right, LExpr):
+                raise self._error(tok)
+            return AUMinus(right)
+        elif t == "NOT":
+            self._advance()
+            tok = self.tok
+            right = self.climb(COMPARISON_PREC)
+            if not isinstance(right, LExpr):
+                raise self._error(tok)
+            return LNot(right)
+        elif t == "TRUE" or t == "FALSE":
+            return LLiteral(self._value(self._advance()))
+        elif t == "#":
+            # the identifier of # ID carries the position of "#", a call the one of its name
+            sharp = self._advance()
+            name = self._expect("ID")
+            if self.type == "(":
+                return LPrimary(self.primary(name))
+            id = self._identifier(name, sharp)
+            if self.type == "[":
+                self._advance()
+                index = self.aexpr()
+                self._expect("]")
+                return LPrimary(GetVector(id, index))
+            return LPrimary(Variable(id))
+
+        raise self._error(self.tok)
+
+    def primary(self, name):
+        """call, vector access or variable, after its identifier token."""
+        id = self._identifier(name, name)
+        if self.type == "(":
+            self._advance()
+            arguments = []
+            if self.type != ")":
+                arguments.append(self.expr())
+                while self.type == ",":
+                    self._advance()
+                    arguments.append(self.expr())
+            self._expect(")")
+            return Call(id, arguments)
+        elif self.type == "[":
+            self._advance()
+            index = self.aexpr()
+            self._expect("]")
+            return GetVector(id, index)
+        return Variable(id)
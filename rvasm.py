@@ -0,0 +1,1207 @@
+import argparse
+import functools
+import os
+import re
+import struct
+import sys
+
+# registers by name, the x and f names and the ABI names
+INT_REGS = {f"x{i}": i for i in range(32)}
+INT_REGS.update((name, i) for i, name in enumerate((
+    "zero", "ra", "sp", "gp", "tp", "t0", "t1", "t2", "s0", "s1", "a0", "a1", "a2", "a3", "a4", "a5",
+    "a6", "a7", "s2", "s3", "s4", "s5", "s6", "s7", "s8", "s9", "s10", "s11", "t3", "t4", "t5", "t6",
+)))
+INT_REGS["fp"] = 8
+FLT_REGS = {f"f{i}": i for i in range(32)}
+FLT_REGS.update((name, i) for i, name in enumerate(
+    [f"ft{i}" for i in range(8)] + ["fs0", "fs1"] + [f"fa{i}" for i in range(8)]
+    + [f"fs{i}" for i in range(2, 12)] + [f"ft{i}" for i in range(8, 12)]
+))
+VEC_REGS = {f"v{i}": i for i in range(32)}
+ROUNDING_MODES = {"rne": 0, "rtz": 1, "rdn": 2, "rup": 3, "rmm": 4, "dyn": 7}
+# the fields of the vtype operand of vsetvli
+ELEMENT_WIDTHS = {"e8": 0, "e16": 1, "e32": 2, "e64": 3}
+GROUP_MULTIPLIERS = {"m1": 0, "m2": 1, "m4": 2, "m8": 3, "mf8": 5, "mf4": 6, "mf2": 7}
+
+# the formats of the instructions and their fixed fields. x, f and v are the classes of the register operands
+R = {
+    "add": (0x33, 0, 0x00), "sub": (0x33, 0, 0x20), "sll": (0x33, 1, 0x00), "slt": (0x33, 2, 0x00),
+    "sltu": (0x33, 3, 0x00), "xor": (0x33, 4, 0x00), "srl": (0x33, 5, 0x00), "sra": (0x33, 5, 0x20),
+    "or": (0x33, 6, 0x00), "and": (0x33, 7, 0x00),
+    "mul": (0x33, 0, 0x01), "mulh": (0x33, 1, 0x01), "mulhsu": (0x33, 2, 0x01), "mulhu": (0x33, 3, 0x01),
+    "div": (0x33, 4, 0x01), "divu": (0x33, 5, 0x01), "rem": (0x33, 6, 0x01), "remu": (0x33, 7, 0x01),
+    "addw": (0x3B, 0, 0x00), "subw": (0x3B, 0, 0x20), "sllw": (0x3B, 1, 0x00), "srlw": (0x3B, 5, 0x00),
+    "sraw": (0x3B, 5, 0x20), "mulw": (0x3B, 0, 0x01), "divw": (0x3B, 4, 0x01), "divuw": (0x3B, 5, 0x01),
+    "remw": (0x3B, 6, 0x01), "remuw": (0x3B, 7, 0x01),
+}
+I = {
+    "addi": (0x13, 0), "slti": (0x13, 2), "sltiu": (0x13, 3), "xori": (0x13, 4), "ori": (0x13, 6),
+    "andi": (0x13, 7), "addiw": (0x1B, 0),
+}
+# shifts by an immediate: opcode, funct3, the upper bits of the immediate and the width of the shift amount
+SHIFTS = {
+    "slli": (0x13, 1, 0x00, 6), "srli": (0x13, 5, 0x00, 6), "srai": (0x13, 5, 0x10, 6),
+    "slliw": (0x1B, 1, 0x00, 5), "srliw": (0x1B, 5, 0x00, 5), "sraiw": (0x1B, 5, 0x20, 5),
+}
+LOADS = {
+    "lb": (0x03, 0, INT_REGS), "lh": (0x03, 1, INT_REGS), "lw": (0x03, 2, INT_REGS), "ld": (0x03, 3, INT_REGS),
+    "lbu": (0x03, 4, INT_REGS), "lhu": (0x03, 5, INT_REGS), "lwu": (0x03, 6, INT_REGS),
+    "fld": (0x07, 3, FLT_REGS),
+}
+STORES = {
+    "sb": (0x23, 0, INT_REGS), "sh": (0x23, 1, INT_REGS), "sw": (0x23, 2, INT_REGS), "sd": (0x23, 3, INT_REGS),
+    "fsd": (0x27, 3, FLT_REGS),
+}
+BRANCHES = {"beq": 0, "bne": 1, "blt": 4, "bge": 5, "bltu": 6, "bgeu": 7}
+# branches against zero and with swapped operands: the branch, and the positions of its operands, -1 being zero
+BRANCH_PSEUDOS = {
+    "beqz": ("beq", 0, -1), "bnez": ("bne", 0, -1), "blez": ("bge", -1, 0), "bgez": ("bge", 0, -1),
+    "bltz": ("blt", 0, -1), "bgtz": ("blt", -1, 0), "bgt": ("blt", 1, 0), "ble": ("bge", 1, 0),
+    "bgtu": ("bltu", 1, 0), "bleu": ("bgeu", 1, 0),
+}
+# double precision arithmetic with a rounding mode: funct7 and whether it takes a second source
+FLOAT_ARITHMETIC = {
+    "fadd.d": (0x01, True), "fsub.d": (0x05, True), "fmul.d": (0x09, True), "fdiv.d": (0x0D, True),
+    "fsqrt.d": (0x2D, False),
+}
+# the rest of the double precision instructions of opcode OP-FP: funct7, funct3, and the classes of rd and the
+# sources
+FLOAT_OPS = {
+    "fsgnj.d": (0x11, 0, "fff"), "fsgnjn.d": (0x11, 1, "fff"), "fsgnjx.d": (0x11, 2, "fff"),
+    "fmin.d": (0x15, 0, "fff"), "fmax.d": (0x15, 1, "fff"),
+    "feq.d": (0x51, 2, "xff"), "flt.d": (0x51, 1, "xff"), "fle.d": (0x51, 0, "xff"),
+    "fmv.x.d": (0x71, 0, "xf"), "fclass.d": (0x71, 1, "xf"), "fmv.d.x": (0x79, 0, "fx"),
+}
+# conversions: funct7, rs2, the classes of rd and rs1, and the rounding mode if none is given
+CONVERSIONS = {
+    "fcvt.w.d": (0x61, 0, "xf", 7), "fcvt.wu.d": (0x61, 1, "xf", 7),
+    "fcvt.l.d": (0x61, 2, "xf", 7), "fcvt.lu.d": (0x61, 3, "xf", 7),
+    # these are exact
+    "fcvt.d.w": (0x69, 0, "fx", 0), "fcvt.d.wu": (0x69, 1, "fx", 0),
+    "fcvt.d.l": (0x69, 2, "fx", 7), "fcvt.d.lu": (0x69, 3, "fx", 7),
+}
+FUSED = {"fmadd.d": 0x43, "fmsub.d": 0x47, "fnmsub.d": 0x4B, "fnmadd.d": 0x4F}
+# unit stride vector loads and stores by the width of their elements
+VECTOR_MEMORY = {
+    "vle8.v": (0x07, 0), "vle16.v": (0x07, 5), "vle32.v": (0x07, 6), "vle64.v": (0x07, 7),
+    "vse8.v": (0x27, 0), "vse16.v": (0x27, 5), "vse32.v": (0x27, 6), "vse64.v": (0x27, 7),
+}
+# floating point vector arithmetic: funct6 and funct3, OPFVV for two vectors and OPFVF for a vector and a scalar
+VECTOR_ARITHMETIC = {}
+for _name, _funct6 in (("vfadd", 0x00), ("vfsub", 0x02), ("vfmin", 0x04), ("vfmax", 0x06), ("vfdiv", 0x20),
+                       ("vfmul", 0x24)):
+    VECTOR_ARITHMETIC[_name + ".vv"] = (_funct6, 1, VEC_REGS)
+    VECTOR_ARITHMETIC[_name + ".vf"] = (_funct6, 5, FLT_REGS)
+SYSTEM = {"ecall": 0x00000073, "ebreak": 0x00100073}
+# pseudoinstructions that are one instruction with other operands
+ALIASES = {
+    "nop": lambda: ("addi", "zero", "zero", "0"),
+    "mv": lambda rd, rs: ("addi", rd, rs, "0"),
+    "not": lambda rd, rs: ("xori", rd, rs, "-1"),
+    "neg": lambda rd, rs: ("sub", rd, "zero", rs),
+    "negw": lambda rd, rs: ("subw", rd, "zero", rs),
+    "sext.w": lambda rd, rs: ("addiw", rd, rs, "0"),
+    "seqz": lambda rd, rs: ("sltiu", rd, rs, "1"),
+    "snez": lambda rd, rs: ("sltu", rd, "zero", rs),
+    "sltz": lambda rd, rs: ("slt", rd, rs, "zero"),
+    "sgtz": lambda rd, rs: ("slt", rd, "zero", rs),
+    "fmv.d": lambda rd, rs: ("fsgnj.d", rd, rs, rs),
+    "fabs.d": lambda rd, rs: ("fsgnjx.d", rd, rs, rs),
+    "fneg.d": lambda rd, rs: ("fsgnjn.d", rd, rs, rs),
+    "jr": lambda rs: ("jalr", "zero", f"0({rs})"),
+    "ret": lambda: ("jalr", "zero", "0(ra)"),
+}
+MEMORY_OPERAND = re.compile(r"(.*)\((\w+)\)$")
+# the instructions that may refer to a label
+LABEL_OPS = {*BRANCHES, *BRANCH_PSEUDOS, *LOADS, *STORES, "j", "jal", "call", "tail", "la", "lla"}
+
+# the executable: the ELF header and the program headers, then the code, the read only data and the data
+BASE_ADDRESS = 0x10000
+PAGE_SIZE = 0x1000
+ELF_HEADER_SIZE = 64
+PROGRAM_HEADER_SIZE = 56
+SECTION_HEADER_SIZE = 64
+SYMBOL_SIZE = 24
+EM_RISCV = 243
+EF_RISCV_FLOAT_ABI_DOUBLE = 0x4
+SECTIONS = (".text", ".rodata", ".data")
+
+# what a program is linked with instead of libc: _start calls main, which exits by itself, and printf handles a
+# format with at most one conversion of a1, %s, %d or %f, like libc's. the output of a call is written when it
+# returns, so nothing is lost when the program exits with the exit system call. it uses none of the registers
+# the code generator keeps values in across a call
+RUNTIME = r"""
+.section .text
+_start:
+call main
+li a0, 0
+li a7, 93
+ecall
+
+printf:
+mv t6, a0
+mv t4, a1
+la t0, .Lrt.buffer
+.Lrt.format:
+# every step adds at most 330 bytes to the buffer
+la t2, .Lrt.buffer
+sub t2, t0, t2
+li t3, 512
+blt t2, t3, .Lrt.room
+la a1, .Lrt.buffer
+mv t3, t0
+jal t5, .Lrt.write
+la t0, .Lrt.buffer
+.Lrt.room:
+lbu t1, 0(t6)
+beqz t1, .Lrt.done
+addi t6, t6, 1
+li t2, 37
+beq t1, t2, .Lrt.conversion
+.Lrt.char:
+sb t1, 0(t0)
+addi t0, t0, 1
+j .Lrt.format
+.Lrt.conversion:
+lbu t1, 0(t6)
+beqz t1, .Lrt.done
+addi t6, t6, 1
+li t2, 37
+beq t1, t2, .Lrt.char
+li t2, 115
+beq t1, t2, .Lrt.string
+li t2, 100
+beq t1, t2, .Lrt.int
+li t2, 102
+beq t1, t2, .Lrt.float
+j .Lrt.format
+.Lrt.done:
+la a1, .Lrt.buffer
+mv t3, t0
+jal t5, .Lrt.write
+li a0, 0
+ret
+
+# the string is written after what is in the buffer, without copying it
+.Lrt.string:
+la a1, .Lrt.buffer
+mv t3, t0
+jal t5, .Lrt.write
+mv a1, t4
+mv t3, t4
+.Lrt.length:
+lbu t1, 0(t3)
+beqz t1, .Lrt.end
+addi t3, t3, 1
+j .Lrt.length
+.Lrt.end:
+jal t5, .Lrt.write
+la t0, .Lrt.buffer
+j .Lrt.format
+
+# %d takes an int
+.Lrt.int:
+sext.w t1, t4
+bgez t1, .Lrt.unsigned
+li t2, 45
+sb t2, 0(t0)
+addi t0, t0, 1
+neg t1, t1
+.Lrt.unsigned:
+jal t5, .Lrt.digits
+j .Lrt.format
+
+.Lrt.float:
+bgez t4, .Lrt.positive
+li t2, 45
+sb t2, 0(t0)
+addi t0, t0, 1
+.Lrt.positive:
+slli t1, t4, 1
+srli t1, t1, 53
+li t2, 2047
+beq t1, t2, .Lrt.special
+li t2, 1086
+bge t1, t2, .Lrt.big
+# below 2^63 the integer part fits a register and the fraction is exact. the fraction times 10^6 is y * 15625
+# with y = fraction * 64, p + e exactly with p = y * 15625 rounded and e its error. the nearest integer n of p
+# is the nearest of p + e too, unless p is halfway between two integers, then the sign of e decides
+fmv.d.x ft8, t4
+fabs.d ft8, ft8
+fcvt.l.d t1, ft8, rtz
+fcvt.d.l ft9, t1
+fsub.d ft8, ft8, ft9
+li t2, 0x4050000000000000
+fmv.d.x ft9, t2
+fmul.d ft8, ft8, ft9
+li t2, 0x40ce848000000000
+fmv.d.x ft9, t2
+fmul.d ft10, ft8, ft9, rne
+fmsub.d ft11, ft8, ft9, ft10, rne
+fcvt.l.d t3, ft10, rne
+fcvt.d.l ft9, t3
+fsub.d ft9, ft10, ft9
+li t2, 0x3fe0000000000000
+fmv.d.x ft8, t2
+fmv.d.x ft10, zero
+feq.d t2, ft9, ft8
+beqz t2, .Lrt.above
+flt.d t2, ft10, ft11
+add t3, t3, t2
+.Lrt.above:
+fneg.d ft8, ft8
+feq.d t2, ft9, ft8
+beqz t2, .Lrt.rounded
+flt.d t2, ft11, ft10
+sub t3, t3, t2
+.Lrt.rounded:
+li t2, 1000000
+bne t3, t2, .Lrt.fixed
+addi t1, t1, 1
+li t3, 0
+.Lrt.fixed:
+mv a3, t3
+jal t5, .Lrt.digits
+li t2, 46
+sb t2, 0(t0)
+addi t0, t0, 1
+addi a4, t0, 6
+mv t3, a4
+li a2, 10
+.Lrt.fraction:
+addi t3, t3, -1
+remu t2, a3, a2
+divu a3, a3, a2
+addi t2, t2, 48
+sb t2, 0(t3)
+bne t3, t0, .Lrt.fraction
+mv t0, a4
+j .Lrt.format
+
+# from 2^63 on the value is m * 2^k with k > 0 and no fraction: the decimal digits of m, the least
+# significant first, doubled k times
+.Lrt.big:
+slli t2, t4, 12
+srli t2, t2, 12
+li t3, 1
+slli t3, t3, 52
+or t2, t2, t3
+addi a3, t1, -1075
+la a4, .Lrt.bignum
+mv a5, a4
+li a2, 10
+.Lrt.mantissa:
+remu t3, t2, a2
+divu t2, t2, a2
+sb t3, 0(a5)
+addi a5, a5, 1
+bnez t2, .Lrt.mantissa
+.Lrt.double:
+mv t3, a4
+li t1, 0
+.Lrt.digit2:
+lbu t2, 0(t3)
+slli t2, t2, 1
+add t2, t2, t1
+li t1, 0
+blt t2, a2, .Lrt.nocarry
+addi t2, t2, -10
+li t1, 1
+.Lrt.nocarry:
+sb t2, 0(t3)
+addi t3, t3, 1
+bne t3, a5, .Lrt.digit2
+beqz t1, .Lrt.doubled
+sb t1, 0(a5)
+addi a5, a5, 1
+.Lrt.doubled:
+addi a3, a3, -1
+bnez a3, .Lrt.double
+.Lrt.bigdigits:
+addi a5, a5, -1
+lbu t2, 0(a5)
+addi t2, t2, 48
+sb t2, 0(t0)
+addi t0, t0, 1
+bne a5, a4, .Lrt.bigdigits
+la t3, .Lrt.zeros
+j .Lrt.copy
+
+.Lrt.special:
+slli t1, t4, 12
+la t3, .Lrt.inf
+beqz t1, .Lrt.copy
+la t3, .Lrt.nan
+.Lrt.copy:
+lbu t1, 0(t3)
+beqz t1, .Lrt.format
+sb t1, 0(t0)
+addi t0, t0, 1
+addi t3, t3, 1
+j .Lrt.copy
+
+# writes t1 in unsigned decimal at t0 and moves t0 past it, returns to t5
+.Lrt.digits:
+mv t3, t0
+li a2, 10
+.Lrt.digit:
+remu t2, t1, a2
+divu t1, t1, a2
+addi t2, t2, 48
+sb t2, 0(t3)
+addi t3, t3, 1
+bnez t1, .Lrt.digit
+mv a2, t3
+addi t3, t3, -1
+.Lrt.reverse:
+bgeu t0, t3, .Lrt.reversed
+lbu t1, 0(t0)
+lbu t2, 0(t3)
+sb t2, 0(t0)
+sb t1, 0(t3)
+addi t0, t0, 1
+addi t3, t3, -1
+j .Lrt.reverse
+.Lrt.reversed:
+mv t0, a2
+jr t5
+
+# writes the bytes from a1 up to t3 to stdout, returns to t5
+.Lrt.write:
+sub a2, t3, a1
+blez a2, .Lrt.written
+li a0, 1
+li a7, 64
+ecall
+blez a0, .Lrt.written
+add a1, a1, a0
+j .Lrt.write
+.Lrt.written:
+jr t5
+
+.section .rodata
+.Lrt.zeros: .string ".000000"
+.Lrt.inf: .string "inf"
+.Lrt.nan: .string "nan"
+
+.section .data
+.Lrt.buffer: .zero 1024
+.Lrt.bignum: .zero 320
+"""
+ENTRY = "_start"
+
+
+class AsmError(Exception):
+    """raised for a line that can't be assembled or a label that isn't defined, with the number of the line."""
+
+
+def immediate(text):
+    try:
+        return int(text, 0)
+    except ValueError:
+        pass
+    try:
+        # a leading zero is octal
+        return int(text, 8)
+    except ValueError:
+        raise AsmError(f"invalid immediate {text}") from None
+
+
+def register(regs, text):
+    try:
+        return regs[text]
+    except KeyError:
+        raise AsmError(f"invalid register {text}") from None
+
+
+def memory(text):
+    """the offset and base register of a memory operand like 8(sp) or (a0), or None for anything else."""
+    m = MEMORY_OPERAND.match(text)
+    if m is None:
+        return None
+    offset = m.group(1).strip()
+    return immediate(offset) if offset else 0, register(INT_REGS, m.group(2))
+
+
+def check(value, bits, what="immediate"):
+    if not -(1 << (bits - 1)) <= value < 1 << (bits - 1):
+        raise AsmError(f"{what} {value} out of range")
+
+
+def is_symbol(text):
+    return bool(text) and (text[0].isalpha() or text[0] in "._$")
+
+
+def r_type(opcode, funct3, funct7, rd, rs1, rs2):
+    return funct7 << 25 | rs2 << 20 | rs1 << 15 | funct3 << 12 | rd << 7 | opcode
+
+
+def i_type(opcode, funct3, rd, rs1, imm):
+    check(imm, 12)
+    return (imm & 0xFFF) << 20 | rs1 << 15 | funct3 << 12 | rd << 7 | opcode
+
+
+def s_type(opcode, funct3, rs1, rs2, imm):
+    check(imm, 12)
+    return (imm >> 5 & 0x7F) << 25 | rs2 << 20 | rs1 << 15 | funct3 << 12 | (imm & 0x1F) << 7 | opcode
+
+
+def b_type(funct3, rs1, rs2, offset):
+    check(offset, 13, "branch offset")
+    if offset & 1:
+        raise AsmError(f"branch offset {offset} is odd")
+    return (
+        (offset >> 12 & 1) << 31 | (offset >> 5 & 0x3F) << 25 | rs2 << 20 | rs1 << 15 | funct3 << 12
+        | (offset >> 1 & 0xF) << 8 | (offset >> 11 & 1) << 7 | 0x63
+    )
+
+
+def u_type(opcode, rd, imm):
+    if not -(1 << 19) <= imm < 1 << 20:
+        raise AsmError(f"immediate {imm} out of range")
+    return (imm & 0xFFFFF) << 12 | rd << 7 | opcode
+
+
+def j_type(rd, offset):
+    check(offset, 21, "jump offset")
+    if offset & 1:
+        raise AsmError(f"jump offset {offset} is odd")
+    return (
+        (offset >> 20 & 1) << 31 | (offset >> 1 & 0x3FF) << 21 | (offset >> 11 & 1) << 20
+        | (offset >> 12 & 0xFF) << 12 | rd << 7 | 0x6F
+    )
+
+
+def pcrel(offset):
+    """the upper 20 bits for auipc and the lower 12 for the instruction after it of a pc relative offset."""
+    check(offset, 32, "pc relative offset")
+    hi = (offset + 0x800) >> 12
+    return hi & 0xFFFFF, offset - (hi << 12)
+
+
+def sign_extend(value, bits):
+    value &= (1 << bits) - 1
+    return value - (1 << bits) if value >> (bits - 1) else value
+
+
+def li_sequence(value):
+    """the instructions that load value into a register, as (op, immediate): lui and addiw for 32 bits, and
+    for more the sequence of the upper bits shifted into place. a positive value is also tried shifted left
+    over its leading zeros, with ones or zeros shifted in, and shifted back with srli. these are the sequences
+    of LLVM."""
+    seq = shifted_sequence(value)
+    if value > 0 and len(seq) > 2:
+        zeros = 64 - value.bit_length()
+        for filled in (value << zeros | (1 << zeros) - 1, value << zeros):
+            candidate = shifted_sequence(sign_extend(filled, 64)) + [("srli", zeros)]
+            if len(candidate) < len(seq):
+                seq = candidate
+                if len(seq) <= 2:
+                    break
+    return seq
+
+
+def shifted_sequence(value):
+    lo = sign_extend(value, 12)
+    if -(1 << 31) <= value < 1 << 31:
+        hi = (value + 0x800) >> 12 & 0xFFFFF
+        seq = [("lui", hi)] if hi else []
+        if lo or not hi:
+            seq.append(("addiw" if hi else "addi", lo))
+        return seq
+    hi = (value + 0x800) % (1 << 64) >> 12
+    shift = 12
+    while not hi & 1:
+        hi >>= 1
+        shift += 1
+    hi = sign_extend(hi, 64 - shift)
+    if shift > 12 and not -2048 <= hi < 2048 and -(1 << 31) <= hi << 12 < 1 << 31:
+        # a shorter shift leaves zeros at the bottom for lui
+        shift -= 12
+        hi <<= 12
+    seq = shifted_sequence(hi)
+    seq.append(("slli", shift))
+    if lo:
+        seq.append(("addi", lo))
+    return seq
+
+
+def li(args):
+    rd, value = args
+    rd = register(INT_REGS, rd)
+    value = immediate(value)
+    if not -(1 << 63) <= value < 1 << 64:
+        raise AsmError(f"immediate {value} out of range")
+    words = []
+    src = 0
+    for op, imm in li_sequence(sign_extend(value, 64)):
+        if op == "lui":
+            words.append(u_type(0x37, rd, imm))
+        elif op in SHIFTS:
+            opcode, funct3, _, _ = SHIFTS[op]
+            words.append(imm << 20 | src << 15 | funct3 << 12 | rd << 7 | opcode)
+        else:
+            words.append(i_type(I[op][0], I[op][1], rd, src, imm))
+        src = rd
+    return words
+
+
+def rounding_mode(args, n, default):
+    """the rounding mode given after the n register operands, or default."""
+    if len(args) == n:
+        return default
+    if len(args) == n + 1 and args[n] in ROUNDING_MODES:
+        return ROUNDING_MODES[args[n]]
+    raise AsmError("invalid operands")
+
+
+def vector_mask(args, n):
+    """the vm bit: 0 if the n operands are followed by v0.t, the instruction is masked."""
+    if len(args) == n:
+        return 1
+    if len(args) == n + 1 and args[n] == "v0.t":
+        return 0
+    raise AsmError("invalid operands")
+
+
+def vtype(fields):
+    """the vtype immediate of vsetvli from e8..e64, m1..m8 or mf2..mf8, ta or tu and ma or mu. the ones that
+    aren't given are m1, tu and mu."""
+    sew = lmul = ta = ma = None
+    for field in fields:
+        if field in ELEMENT_WIDTHS and sew is None:
+            sew = ELEMENT_WIDTHS[field]
+        elif field in GROUP_MULTIPLIERS and lmul is None and sew is not None:
+            lmul = GROUP_MULTIPLIERS[field]
+        elif field in ("ta", "tu") and ta is None and sew is not None:
+            ta = field == "ta"
+        elif field in ("ma", "mu") and ma is None and ta is not None:
+            ma = field == "ma"
+        else:
+            raise AsmError(f"invalid vtype {', '.join(fields)}")
+    if sew is None:
+        raise AsmError("vsetvli needs an element width")
+    return bool(ma) << 7 | bool(ta) << 6 | sew << 3 | (lmul or 0)
+
+
+def encode(op, args):
+    """the machine words of an instruction that refers to no label, op with its operands args. raises AsmError
+    if it isn't one of the instructions the assembler knows or its operands don't fit."""
+    alias = ALIASES.get(op)
+    if alias is not None:
+        try:
+            op, *args = alias(*args)
+        except TypeError:
+            raise AsmError("invalid operands") from None
+
+    try:
+        if op in R:
+            opcode, funct3, funct7 = R[op]
+            rd, rs1, rs2 = args
+            return [r_type(opcode, funct3, funct7, INT_REGS[rd], INT_REGS[rs1], INT_REGS[rs2])]
+        if op in I:
+            opcode, funct3 = I[op]
+            rd, rs1, imm = args
+            return [i_type(opcode, funct3, INT_REGS[rd], INT_REGS[rs1], immediate(imm))]
+        if op in SHIFTS:
+            opcode, funct3, upper, width = SHIFTS[op]
+            rd, rs1, shamt = args
+            shamt = immediate(shamt)
+            if not 0 <= shamt < 1 << width:
+                raise AsmError(f"shift amount {shamt} out of range")
+            return [(upper << width | shamt) << 20 | INT_REGS[rs1] << 15 | funct3 << 12 | INT_REGS[rd] << 7 | opcode]
+        if op in LOADS:
+            opcode, funct3, regs = LOADS[op]
+            rd, address = args
+            offset, rs1 = memory(address)
+            return [i_type(opcode, funct3, regs[rd], rs1, offset)]
+        if op in STORES:
+            opcode, funct3, regs = STORES[op]
+            rs2, address = args
+            offset, rs1 = memory(address)
+            return [s_type(opcode, funct3, rs1, regs[rs2], offset)]
+        if op in BRANCHES or op in BRANCH_PSEUDOS:
+            funct3, rs1, rs2, target = branch(op, args)
+            return [b_type(funct3, rs1, rs2, immediate(target))]
+        if op == "jal":
+            rd, target = args if len(args) == 2 else ("ra", *args)
+            return [j_type(INT_REGS[rd], immediate(target))]
+        if op == "j":
+            (target,) = args
+            return [j_type(0, immediate(target))]
+        if op == "jalr":
+            if len(args) == 1:
+                rd, offset, rs1 = "ra", 0, INT_REGS[args[0]]
+            elif len(args) == 2:
+                rd = args[0]
+                offset, rs1 = memory(args[1])
+            else:
+                rd, rs1, offset = args[0], INT_REGS[args[1]], immediate(args[2])
+            return [i_type(0x67, 0, INT_REGS[rd], rs1, offset)]
+        if op in ("lui", "auipc"):
+            rd, imm = args
+            return [u_type(0x37 if op == "lui" else 0x17, INT_REGS[rd], immediate(imm))]
+        if op == "li":
+            return li(args)
+        if op in SYSTEM:
+            if args:
+                raise AsmError("invalid operands")
+            return [SYSTEM[op]]
+        if op in FLOAT_ARITHMETIC:
+            funct7, binary = FLOAT_ARITHMETIC[op]
+            n = 3 if binary else 2
+            rm = rounding_mode(args, n, 7)
+            rs2 = FLT_REGS[args[2]] if binary else 0
+            return [r_type(0x53, rm, funct7, FLT_REGS[args[0]], FLT_REGS[args[1]], rs2)]
+        if op in FLOAT_OPS:
+            funct7, funct3, classes = FLOAT_OPS[op]
+            if len(args) != len(classes):
+                raise AsmError("invalid operands")
+            regs = [INT_REGS[arg] if c == "x" else FLT_REGS[arg] for c, arg in zip(classes, args)]
+            rs2 = regs[2] if len(regs) == 3 else 0
+            return [r_type(0x53, funct3, funct7, regs[0], regs[1], rs2)]
+        if op in CONVERSIONS:
+            funct7, rs2, classes, default = CONVERSIONS[op]
+            rm = rounding_mode(args, 2, default)
+            rd = INT_REGS[args[0]] if classes[0] == "x" else FLT_REGS[args[0]]
+            rs1 = INT_REGS[args[1]] if classes[1] == "x" else FLT_REGS[args[1]]
+            return [r_type(0x53, rm, funct7, rd, rs1, rs2)]
+        if op in FUSED:
+            rm = rounding_mode(args, 4, 7)
+            rd, rs1, rs2, rs3 = (FLT_REGS[arg] for arg in args[:4])
+            # the format of double precision is 01
+            return [r_type(FUSED[op], rm, rs3 << 2 | 1, rd, rs1, rs2)]
+        if op == "vsetvli":
+            rd, rs1, *fields = args
+            return [vtype(fields) << 20 | INT_REGS[rs1] << 15 | 7 << 12 | INT_REGS[rd] << 7 | 0x57]
+        if op in VECTOR_MEMORY:
+            opcode, width = VECTOR_MEMORY[op]
+            vm = vector_mask(args, 2)
+            offset, rs1 = memory(args[1])
+            if offset:
+                raise AsmError("vector loads and stores take no offset")
+            return [vm << 25 | rs1 << 15 | width << 12 | VEC_REGS[args[0]] << 7 | opcode]
+        if op in VECTOR_ARITHMETIC:
+            funct6, funct3, regs = VECTOR_ARITHMETIC[op]
+            vm = vector_mask(args, 3)
+            vd, vs2, rs1 = VEC_REGS[args[0]], VEC_REGS[args[1]], regs[args[2]]
+            return [funct6 << 26 | vm << 25 | vs2 << 20 | rs1 << 15 | funct3 << 12 | vd << 7 | 0x57]
+    except (KeyError, ValueError, TypeError):
+        # a register of the wrong class, the wrong number of operands or a missing memory operand
+        raise AsmError("invalid operands") from None
+    raise AsmError(f"unknown instruction {op}")
+
+
+@functools.lru_cache(maxsize=4096)
+def encoded(op, args):
+    """the bytes of encode(op, args), the code generator repeats most of its instructions."""
+    return b"".join(word.to_bytes(4, "little") for word in encode(op, args))
+
+
+def branch(op, args):
+    """funct3, rs1, rs2 and target of a conditional branch or of its pseudoinstructions."""
+    pseudo = BRANCH_PSEUDOS.get(op)
+    if pseudo is not None:
+        op, first, second = pseudo
+        *regs, target = args
+        if len(regs) != (1 if -1 in (first, second) else 2):
+            raise AsmError("invalid operands")
+        regs.append("zero")
+        args = regs[first], regs[second], target
+    if len(args) != 3:
+        raise AsmError("invalid operands")
+    rs1, rs2, target = args
+    return BRANCHES[op], register(INT_REGS, rs1), register(INT_REGS, rs2), target
+
+
+def escape(text):
+    """the bytes of the contents of a string literal, with the escapes of gas."""
+    out = bytearray()
+    i = 0
+    n = len(text)
+    simple = {"b": 8, "f": 12, "n": 10, "r": 13, "t": 9, '"': 34, "\\": 92}
+    while i < n:
+        c = text[i]
+        i += 1
+        if c != "\\" or i == n:
+            out += c.encode()
+            continue
+        c = text[i]
+        i += 1
+        if c in simple:
+            out.append(simple[c])
+        elif c in "01234567":
+            j = i
+            while j < n and j < i + 2 and text[j] in "01234567":
+                j += 1
+            out.append(int(text[i - 1:j], 8) & 0xFF)
+            i = j
+        elif c in "xX":
+            j = i
+            while j < n and text[j] in "0123456789abcdefABCDEF":
+                j += 1
+            out.append(int(text[i:j] or "0", 16) & 0xFF)
+            i = j
+        else:
+            out += c.encode()
+    return bytes(out)
+
+
+def strings(text):
+    """the string literals of a comma separated list of them."""
+    result = []
+    i = 0
+    text = text.strip()
+    while i < len(text):
+        if text[i] != '"':
+            raise AsmError("expected a string")
+        j = i + 1
+        while j < len(text) and text[j] != '"':
+            j += 2 if text[j] == "\\" else 1
+        if j >= len(text):
+            raise AsmError("unterminated string")
+        result.append(escape(text[i + 1:j]))
+        i = j + 1
+        while i < len(text) and text[i] in " \t,":
+            i += 1
+    return result
+
+
+def strip_comment(line):
+    """the line without its # comment, a # inside a string literal doesn't start one."""
+    if '"' not in line:
+        return line.partition("#")[0]
+    quoted = False
+    i = 0
+    while i < len(line):
+        c = line[i]
+        if c == "\\" and quoted:
+            i += 1
+        elif c == '"':
+            quoted = not quoted
+        elif c == "#" and not quoted:
+            return line[:i]
+        i += 1
+    return line
+
+
+class Reloc:
+    """an instruction that refers to a label, encoded once the labels have addresses. a branch to a label out
+    of its range grows into the opposite branch over a jump."""
+
+    __slots__ = ("kind", "args", "size", "line")
+
+    def __init__(self, kind, args, size, line):
+        self.kind = kind
+        self.args = args
+        self.size = size
+        self.line = line
+
+
+class Section:
+    """the contents of a section: runs of encoded bytes, and the Reloc between them. the last item is always
+    bytes, where the next instruction or data goes."""
+
+    __slots__ = ("name", "items")
+
+    def __init__(self, name):
+        self.name = name
+        self.items = [bytearray()]
+
+    def position(self):
+        return len(self.items) - 1, len(self.items[-1])
+
+    def reloc(self, reloc):
+        self.items.append(reloc)
+        self.items.append(bytearray())
+
+
+class Assembler:
+    """assembles RISC-V assembly text, the subset of gas syntax the code generator writes, into a static ELF
+    executable linked with RUNTIME instead of libc. the text is given in any number of pieces to write(), or as
+    asm.Code records to add(), and link() returns the executable."""
+
+    def __init__(self):
+        self.sections = {name: Section(name) for name in SECTIONS}
+        self.section = self.sections[".text"]
+        # (section, item, offset in the item) of every label
+        self.labels = {}
+        self.globals = {ENTRY}
+        self.line = 0
+        self._partial = ""
+
+    def write(self, text):
+        lines = (self._partial + text).split("\n")
+        self._partial = lines.pop()
+        for line in lines:
+            self.feed(line)
+
+    def add(self, code):
+        """assembles the records of an asm.Code buffer without rendering them."""
+        from asm import Instr, Label
+
+        for record in code.records():
+            if type(record) is Instr:
+                self.line += 1
+                try:
+                    self.instruction(record.op, record.args)
+                except AsmError as e:
+                    raise AsmError(f"line {self.line}: {e}: {record.render().strip()}") from None
+            elif type(record) is Label:
+                self.line += 1
+                try:
+                    self.label(record.name)
+                except AsmError as e:
+                    raise AsmError(f"line {self.line}: {e}") from None
+            else:
+                self.write(record.text + "\n")
+
+    def feed(self, line):
+        """assembles one line."""
+        self.line += 1
+        line = strip_comment(line).strip()
+        if not line:
+            return
+        try:
+            while True:
+                # labels, possibly followed by a directive or an instruction
+                head, sep, rest = line.partition(":")
+                if not sep or not head or '"' in head or " " in head or "\t" in head:
+                    break
+                self.label(head)
+                line = rest.strip()
+                if not line:
+                    return
+            op, *rest = line.split(None, 1)
+            rest = rest[0] if rest else ""
+            if op.startswith("."):
+                self.directive(op, rest.strip())
+            else:
+                args = tuple(arg.strip() for arg in rest.split(",")) if rest.strip() else ()
+                self.instruction(op, args)
+        except AsmError as e:
+            raise AsmError(f"line {self.line}: {e}: {line}") from None
+
+    def label(self, name):
+        if name in self.labels:
+            raise AsmError(f"label {name} defined twice")
+        self.labels[name] = (self.section, *self.section.position())
+
+    def directive(self, name, rest):
+        data = self.section.items[-1]
+        if name == ".section" and rest.split(",")[0].strip() in SECTIONS:
+            name = rest.split(",")[0].strip()
+        if name in (".text", ".data", ".rodata"):
+            self.section = self.sections[name]
+        elif name == ".section":
+            raise AsmError(f"unknown section {rest}")
+        elif name in (".global", ".globl"):
+            self.globals.update(arg.strip() for arg in rest.split(","))
+        elif name in (".align", ".p2align", ".balign"):
+            alignment = immediate(rest) if name == ".balign" else 1 << immediate(rest)
+            self.section.reloc(Reloc("align", alignment, 0, self.line))
+        elif name in (".string", ".asciz"):
+            for s in strings(rest):
+                data += s + b"\0"
+        elif name == ".ascii":
+            for s in strings(rest):
+                data += s
+        elif name in (".byte", ".half", ".word", ".dword"):
+            size = {".byte": 1, ".half": 2, ".word": 4, ".dword": 8}[name]
+            for value in rest.split(","):
+                value = immediate(value.strip())
+                if not -(1 << (8 * size - 1)) <= value < 1 << (8 * size):
+                    raise AsmError(f"value {value} out of range")
+                data += (value & ((1 << (8 * size)) - 1)).to_bytes(size, "little")
+        elif name == ".double":
+            for value in rest.split(","):
+                try:
+                    data += struct.pack("<d", float(value))
+                except ValueError:
+                    raise AsmError(f"invalid number {value.strip()}") from None
+        elif name == ".zero":
+            data += bytes(immediate(rest))
+        elif name not in (".type", ".size", ".file", ".option", ".attribute"):
+            raise AsmError(f"unknown directive {name}")
+
+    def instruction(self, op, args):
+        """assembles an instruction, args is the tuple of its operands."""
+        if op in LABEL_OPS:
+            reloc = self.reloc(op, args)
+            if reloc is not None:
+                self.section.reloc(reloc)
+                return
+        self.section.items[-1] += encoded(op, args)
+
+    def reloc(self, op, args):
+        """the Reloc of an instruction that refers to a label, None if it doesn't."""
+        if op in BRANCHES or op in BRANCH_PSEUDOS:
+            funct3, rs1, rs2, target = branch(op, args)
+            if is_symbol(target):
+                return Reloc("branch", (funct3, rs1, rs2, target), 4, self.line)
+        elif op in ("j", "jal"):
+            if args and is_symbol(args[-1]):
+                rd = 0 if op == "j" else register(INT_REGS, args[0]) if len(args) == 2 else 1
+                return Reloc("jal", (rd, args[-1]), 4, self.line)
+        elif op in ("call", "tail"):
+            if len(args) != 1:
+                raise AsmError("invalid operands")
+            # through ra for a call, t1 for a tail call
+            rd, tmp = (1, 1) if op == "call" else (0, 6)
+            return Reloc("call", (rd, tmp, args[0]), 8, self.line)
+        elif op in ("la", "lla"):
+            if len(args) != 2:
+                raise AsmError("invalid operands")
+            return Reloc("address", (register(INT_REGS, args[0]), args[1]), 8, self.line)
+        elif len(args) >= 2 and not args[1].endswith(")"):
+            # a load from a label through its own register if it is an integer one, or with a temporary given
+            # after the label, and a store to a label with the temporary
+            if len(args) == 3:
+                tmp = args[2]
+            elif op in LOADS and LOADS[op][2] is INT_REGS:
+                tmp = args[0]
+            else:
+                raise AsmError("a load or store to a label needs a temporary register")
+            return Reloc("memory", (op, args[0], args[1], tmp, register(INT_REGS, tmp)), 8, self.line)
+        return None
+
+    def _layout(self, section, start):
+        """the address of every item of section placed at start, with the sizes of the alignments updated."""
+        addresses = []
+        address = start
+        for item in section.items:
+            if type(item) is Reloc and item.kind == "align":
+                item.size = -address % item.args
+            addresses.append(address)
+            address += len(item) if type(item) is bytearray else item.size
+        addresses.append(address)
+        return addresses
+
+    def _address(self, name, addresses, line):
+        try:
+            section, item, offset = self.labels[name]
+        except KeyError:
+            raise AsmError(f"line {line}: undefined label {name}") from None
+        return addresses[section.name][item] + offset
+
+    def _place(self):
+        """the start of every section and the address of every item, with the branches that don't reach their
+        label grown until none is left."""
+        while True:
+            starts, addresses = self._starts()
+            grown = False
+            for section in self.sections.values():
+                items = addresses[section.name]
+                for i, item in enumerate(section.items):
+                    if type(item) is Reloc and item.kind == "branch" and item.size == 4:
+                        offset = self._address(item.args[3], addresses, item.line) - items[i]
+                        if not -4096 <= offset < 4096:
+                            item.size = 8
+                            grown = True
+            if not grown:
+                return starts, addresses
+
+    def _starts(self):
+        """the layout of the sections: the code and the read only data follow the headers in the first
+        segment, the data is in a second segment on the next page."""
+        starts = {}
+        addresses = {}
+        offset = ELF_HEADER_SIZE + 2 * PROGRAM_HEADER_SIZE
+        text = self._layout(self.sections[".text"], BASE_ADDRESS + offset)
+        rodata_offset = align(text[-1] - BASE_ADDRESS, 16)
+        rodata = self._layout(self.sections[".rodata"], BASE_ADDRESS + rodata_offset)
+        data_offset = align(rodata[-1] - BASE_ADDRESS, 16)
+        data = self._layout(self.sections[".data"], BASE_ADDRESS + PAGE_SIZE + data_offset)
+        for name, items, file_offset in ((".text", text, offset), (".rodata", rodata, rodata_offset),
+                                         (".data", data, data_offset)):
+            starts[name] = (items[0], file_offset)
+            addresses[name] = items
+        return starts, addresses
+
+    def _encode(self, reloc, pc, addresses):
+        kind = reloc.kind
+        if kind == "align":
+            # nops in the code
+            if pc % 4 == 0 and reloc.size % 4 == 0:
+                return encode("nop", []) * (reloc.size // 4)
+            return reloc.size
+        if kind == "branch":
+            funct3, rs1, rs2, target = reloc.args
+            offset = self._address(target, addresses, reloc.line) - pc
+            if reloc.size == 4:
+                return [b_type(funct3, rs1, rs2, offset)]
+            return [b_type(funct3 ^ 1, rs1, rs2, 8), j_type(0, offset - 4)]
+        if kind == "jal":
+            rd, target = reloc.args
+            return [j_type(rd, self._address(target, addresses, reloc.line) - pc)]
+        if kind == "call":
+            rd, tmp, target = reloc.args
+            hi, lo = pcrel(self._address(target, addresses, reloc.line) - pc)
+            return [u_type(0x17, tmp, hi), i_type(0x67, 0, rd, tmp, lo)]
+        if kind == "address":
+            rd, target = reloc.args
+            hi, lo = pcrel(self._address(target, addresses, reloc.line) - pc)
+            return [u_type(0x17, rd, hi), i_type(0x13, 0, rd, rd, lo)]
+        op, reg, target, tmp, rt = reloc.args
+        hi, lo = pcrel(self._address(target, addresses, reloc.line) - pc)
+        return [u_type(0x17, rt, hi), *encode(op, [reg, f"{lo}({tmp})"])]
+
+    def link(self):
+        """the executable of everything given so far and the runtime. raises AsmError for an undefined label."""
+        if self._partial:
+            self.write("\n")
+        self.section = self.sections[".text"]
+        self.write(RUNTIME)
+        if ENTRY not in self.labels:
+            raise AsmError(f"undefined label {ENTRY}")
+
+        starts, addresses = self._place()
+        contents = {}
+        for name, section in self.sections.items():
+            out = bytearray()
+            for i, item in enumerate(section.items):
+                if type(item) is bytearray:
+                    out += item
+                    continue
+                try:
+                    encoded = self._encode(item, addresses[name][i], addresses)
+                except AsmError as e:
+                    message = str(e)
+                    if not message.startswith("line "):
+                        message = f"line {item.line}: {message}"
+                    raise AsmError(message) from None
+                if type(encoded) is int:
+                    out += bytes(encoded)
+                else:
+                    for word in encoded:
+                        out += word.to_bytes(4, "little")
+            contents[name] = bytes(out)
+
+        symbols = []
+        for name, (section, item, offset) in self.labels.items():
+            if not name.startswith(".L"):
+                symbols.append((name, addresses[section.name][item] + offset, section.name, name in self.globals))
+        entry = self._address(ENTRY, addresses, 0)
+        return executable(contents, starts, entry, symbols)
+
+
+def align(value, alignment):
+    return value + (-value % alignment)
+
+
+def executable(contents, starts, entry, symbols):
+    """a static ELF executable: two loadable segments, the headers with the code and read only data, and the
+    data, followed by the section headers and the symbols for the debuggers and disassemblers."""
+    text_address, text_offset = starts[".text"]
+    data_address, data_offset = starts[".data"]
+    rodata_address, rodata_offset = starts[".rodata"]
+    image = bytearray(data_offset + len(contents[".data"]))
+    image[text_offset:text_offset + len(contents[".text"])] = contents[".text"]
+    image[rodata_offset:rodata_offset + len(contents[".rodata"])] = contents[".rodata"]
+    image[data_offset:] = contents[".data"]
+
+    # the symbol table, the local symbols first
+    names = bytearray(b"\0")
+    table = bytearray(SYMBOL_SIZE)
+    section_index = {".text": 1, ".rodata": 2, ".data": 3}
+    symbols = sorted(symbols, key=lambda symbol: symbol[3])
+    first_global = 1 + sum(not symbol[3] for symbol in symbols)
+    for name, address, section, is_global in symbols:
+        table += struct.pack(
+            "<IBBHQQ", len(names), is_global << 4, 0, section_index[section], address, 0
+        )
+        names += name.encode() + b"\0"
+    table_offset = align(len(image), 8)
+    image += bytes(table_offset - len(image)) + table
+    names_offset = len(image)
+    image += names
+    section_names = b"\0.text\0.rodata\0.data\0.symtab\0.strtab\0.shstrtab\0"
+    section_names_offset = len(image)
+    image += section_names
+
+    def name_index(name):
+        return section_names.index(name.encode() + b"\0")
+
+    headers_offset = align(len(image), 8)
+    image += bytes(headers_offset - len(image))
+    sections = [
+        (0, 0, 0, 0, 0, 0, 0, 0, 0, 0),
+        (name_index(".text"), 1, 0x6, text_address, text_offset, len(contents[".text"]), 0, 0, 4, 0),
+        (name_index(".rodata"), 1, 0x2, rodata_address, rodata_offset, len(contents[".rodata"]), 0, 0, 8, 0),
+        (name_index(".data"), 1, 0x3, data_address, data_offset, len(contents[".data"]), 0, 0, 8, 0),
+        (name_index(".symtab"), 2, 0, 0, table_offset, len(table), 5, first_global, 8, SYMBOL_SIZE),
+        (name_index(".strtab"), 3, 0, 0, names_offset, len(names), 0, 0, 1, 0),
+        (name_index(".shstrtab"), 3, 0, 0, section_names_offset, len(section_names), 0, 0, 1, 0),
+    ]
+    for header in sections:
+        image += struct.pack("<IIQQQQIIQQ", *header)
+
+    image[:ELF_HEADER_SIZE] = struct.pack(
+        "<4sBBBBB7sHHIQQQIHHHHHH",
+        b"\x7fELF", 2, 1, 1, 0, 0, bytes(7),
+        2, EM_RISCV, 1, entry, ELF_HEADER_SIZE, headers_offset, EF_RISCV_FLOAT_ABI_DOUBLE,
+        ELF_HEADER_SIZE, PROGRAM_HEADER_SIZE, 2, SECTION_HEADER_SIZE, len(sections), len(sections) - 1,
+    )
+    rx_size = rodata_offset + len(contents[".rodata"])
+    segments = (
+        (1, 0x5, 0, BASE_ADDRESS, BASE_ADDRESS, rx_size, rx_size, PAGE_SIZE),
+        (1, 0x6, data_offset, data_address, data_address, len(contents[".data"]), len(contents[".data"]), PAGE_SIZE),
+    )
+    for i, segment in enumerate(segments):
+        offset = ELF_HEADER_SIZE + i * PROGRAM_HEADER_SIZE
+        image[offset:offset + PROGRAM_HEADER_SIZE] = struct.pack("<IIQQQQQQ", *segment)
+    return bytes(image)
+
+
+def assemble(text):
+    """the executable of the assembly text."""
+    assembler = Assembler()
+    assembler.write(text)
+    return assembler.link()
+
+
+def write_executable(path, image):
+    """writes image to path, executable by everyone the umask allows."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o777)
+    with open(fd, "wb") as f:
+        f.write(image)
+
+
+def show_encoding(f, out):
+    """writes every instruction of the assembly file f with the encoding of each instruction it expands to,
+    in the format of llvm-mc -show-encoding. the instructions can't refer to labels."""
+    for n, line in enumerate(f, 1):
+        line = strip_comment(line).strip()
+        if not line or line.startswith(".") or line.endswith(":"):
+            continue
+        op, *rest = line.split(None, 1)
+        args = [arg.strip() for arg in rest[0].split(",")] if rest else []
+        try:
+            words = encode(op, args)
+        except AsmError as e:
+            raise AsmError(f"line {n}: {e}: {line}") from None
+        for word in words:
+            encoding = ",".join(f"0x{b:02x}" for b in word.to_bytes(4, "little"))
+            out.write(f"\t{line}\t# encoding: [{encoding}]\n")
+
+
+if __name__ == "__main__":
+    argparser = argparse.ArgumentParser(
+        prog="rvasm.py",
+        description="assembles the RISC-V assembly of voxc.py into a static executable",
+    )
+    argparser.add_argument("filename", help="assembly file")
+    argparser.add_argument("-o", default="a.out", help="output binary")
+    argparser.add_argument(
+        "--show-encoding", action="store_true",
+        help="print the encoding of every instruction like llvm-mc -show-encoding instead")
+
+    args = argparser.parse_args()
+    try:
+        with open(args.filename) as f:
+            if args.show_encoding:
+                show_encoding(f, sys.stdout)
+            else:
+                write_executable(args.o, assemble(f.read()))
+    except AsmError as e:
+        sys.exit(f"{args.filename}: {e}")
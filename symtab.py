@@ -0,0 +1,74 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from ast_tools import Identifier
+
+
+@dataclass(frozen=True)
+class Binding:
+    """the declaration an identifier resolves to. kind is "global", "local", "param" or "function", level is the
+    depth of the declaring scope. slot is the position of a local or parameter in the frame of its block, parameters
+    come first in the order they are declared. vector_len is the length of a vector variable, 0 otherwise."""
+
+    kind: str
+    decl: Identifier
+    level: int
+    slot: int = 0
+    vector_len: int = 0
+
+
+class ScopedTable:
+    """symbol table of nested scopes. every name maps to the stack of its bindings, innermost last, so looking a
+    name up is one dict access and leaving a scope only touches the names declared in it. scope 0 is the global one."""
+
+    def __init__(self):
+        # name -> [(level, value), ...]
+        self._bindings = {}
+        # names declared in each scope
+        self._scopes = [[]]
+
+    @property
+    def level(self):
+        return len(self._scopes) - 1
+
+    def push(self):
+        self._scopes.append([])
+
+    def pop(self):
+        bindings = self._bindings
+        for name in self._scopes.pop():
+            stack = bindings[name]
+            stack.pop()
+            if not stack:
+                del bindings[name]
+
+    def declare(self, name, value):
+        """binds name in the current scope. a name that is already declared in it keeps its first binding,
+        in which case False is returned."""
+        stack = self._bindings.get(name)
+        if stack is None:
+            self._bindings[name] = [(self.level, value)]
+        elif stack[-1][0] == self.level:
+            return False
+        else:
+            stack.append((self.level, value))
+        self._scopes[-1].append(name)
+        return True
+
+    def find(self, name):
+        """(value, level) of the innermost binding of name, None if it is not declared."""
+        stack = self._bindings.get(name)
+        if stack is None:
+            return None
+        level, value = stack[-1]
+        return value, level
+
+    def lookup(self, name):
+        stack = self._bindings.get(name)
+        return None if stack is None else stack[-1][1]
+
+    def declared_here(self, name):
+        stack = self._bindings.get(name)
+        return stack is not None and stack[-1][0] == self.level
+
+    def __contains__(self, name):
+        return name in self._bindings
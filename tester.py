@@ -1,16 +1,22 @@
 #!/usr/bin/env python3
 
 import argparse
-import pickle
+import astfile
+import ir
+import irgen
 from ast_tools import PrintVisitor
+from folding import fold
+from lowering import lower
 from misc import *
-from lexer import Lexer
+from ranges import use_integers
 
 arg_parser = argparse.ArgumentParser()
 
-arg_parser.add_argument('test_type', choices=['scan', 'parse', 'analyze'])
+arg_parser.add_argument('test_type', choices=['scan', 'parse', 'analyze', 'ir', 'spills'])
 arg_parser.add_argument('filename', type=str)
 arg_parser.add_argument('--save', action='store_true')
+arg_parser.add_argument('--lexer', choices=list(LEXERS), default='sly')
+arg_parser.add_argument('--parser', choices=PARSERS, default='lalr')
 
 args = arg_parser.parse_args()
 
@@ -18,7 +24,7 @@ with open(args.filename, 'r') as f:
     source = f.read()
 
 if args.test_type == 'scan':
-    toks = Lexer().tokenize(source)
+    toks = tokenize(source, args.lexer)
     result = 'Tokens:\n'+'\n'.join([str(tok) for tok in toks])
     print(result)
     if args.save:
@@ -26,19 +32,39 @@ if args.test_type == 'scan':
             f.write(result)
 
 elif args.test_type == 'parse':
-    intermediate = process(source)
+    intermediate = process(source, args.lexer, args.parser)
     ast = generate_ast(intermediate)
     ast_str = PrintVisitor().visit(ast)
     print('PrintVisitor Output:')
     print(ast_str)
     if args.save:
-        with open(args.filename+'.ast.pkl', 'wb') as f:
-            pickle.dump(ast, f)
+        astfile.dump(ast, args.filename+'.ast.bin')
         with open(args.filename+'.ast', 'w') as f:
             f.write(ast_str)
 
+elif args.test_type == 'ir':
+    intermediate = process(source, args.lexer, args.parser)
+    module = lower(fold(generate_ast(intermediate)), intermediate.bindings)
+    use_integers(module)
+    for fn in module.functions:
+        ir.verify(fn)
+    result = '\n'.join([str(fn) for fn in module.functions])
+    print(result)
+    if args.save:
+        with open(args.filename+'.ir', 'w') as f:
+            f.write(result)
+
+elif args.test_type == 'spills':
+    intermediate = process(source, args.lexer, args.parser)
+    generator = irgen.IRGenerator(fold(generate_ast(intermediate)), intermediate.bindings)
+    result = '\n'.join(generator.spill_report())
+    print(result)
+    if args.save:
+        with open(args.filename+'.spills', 'w') as f:
+            f.write(result)
+
 else:
-    intermediate = process(source)
+    intermediate = process(source, args.lexer, args.parser)
     ast = generate_ast(intermediate)
     print('PrintVisitor Output:')
     print(PrintVisitor().visit(ast))
@@ -0,0 +1,6 @@
+# checks that the dfa lexer backend reproduces the token goldens of the sly lexer
+cd "$(dirname "$0")/.."
+for f in lexer_tests/*.txt tests/lexer/*.txt; do
+	echo "Testing ${f}"
+	python tester.py --lexer dfa scan ${f} | diff <(cat ${f}.toks; echo) -
+done
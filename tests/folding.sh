@@ -0,0 +1,19 @@
+# checks the IR of the folded programs against their goldens, made with tester.py ir --save. each program covers one
+# kind of folding: arithmetic on literals, -0.0, nans, !, and/or with a literal operand, and branches and loops whose
+# condition is a literal. where a program has a <file>.s golden, made with voxc.py -c, the code of the default backend
+# is checked too, and where qemu-riscv64 is installed what it prints against <file>.out. setvector.vox stores logical
+# values in vectors, which stored the index where computing it took the register of the value
+cd "$(dirname "$0")/.."
+tmp=$(mktemp -d)
+trap 'rm -rf "$tmp"' EXIT
+
+for f in tests/folding/*.vox; do
+	echo "Testing ${f}"
+	python tester.py --lexer dfa --parser rd ir ${f} | diff <(cat ${f}.ir; echo) -
+	[ -f ${f}.s ] || continue
+	python voxc.py --no-cache ${f} -o "$tmp/a.out" -c "$tmp/a.s" || continue
+	diff ${f}.s "$tmp/a.s"
+	if command -v qemu-riscv64 > /dev/null; then
+		diff ${f}.out <(qemu-riscv64 "$tmp/a.out")
+	fi
+done
@@ -0,0 +1,188 @@
+#include <stdio.h>
+.align 2
+.section .text
+.global main
+
+
+f:
+addi sp, sp, -32
+sd ra, 0(sp)
+sd a0, 8(sp)
+sd a1, 16(sp)
+sd a2, 24(sp)
+fld ft0, 16(sp)
+fld ft1, 24(sp)
+flt.d t0, ft0, ft1
+fld ft1, 16(sp)
+fld ft0, .Ld.3ff0000000000000, s1 # 1.0
+fadd.d ft1, ft1, ft0
+fcvt.d.w ft0, t0
+ld s0, 8(sp)
+fcvt.w.d s1, ft1
+slli s1, s1, 3
+add s0, s0, s1
+fsd ft0, (s0)
+fld ft1, 16(sp)
+fld ft0, 24(sp)
+flt.d t0, ft0, ft1
+beqz t0, .Lf.0
+fld ft0, 24(sp)
+fmv.d.x ft1, zero # 0.0
+flt.d t1, ft1, ft0
+and t0, t0, t1
+.Lf.0:
+fld ft1, 24(sp)
+fld ft0, .Ld.3ff0000000000000, s1 # 1.0
+fsub.d ft1, ft1, ft0
+fcvt.d.w ft0, t0
+ld s0, 8(sp)
+fcvt.w.d s1, ft1
+slli s1, s1, 3
+add s0, s0, s1
+fsd ft0, (s0)
+fld ft1, 16(sp)
+fld ft0, 24(sp)
+flt.d t0, ft0, ft1
+xori t0, t0, 1
+fld ft0, 24(sp)
+fld ft1, .Ld.3ff0000000000000, s1 # 1.0
+fadd.d ft0, ft0, ft1
+fcvt.d.w ft1, t0
+ld s0, 8(sp)
+fcvt.w.d s1, ft0
+slli s1, s1, 3
+add s0, s0, s1
+fsd ft1, (s0)
+fmv.d.x ft0, zero # 0.0
+fmv.x.d a0, ft0
+ld ra, 0(sp)
+addi sp, sp, 32
+ret
+ld ra, 0(sp)
+addi sp, sp, 32
+li a0, 0
+ret
+main:
+la a0, .glob_v
+fmv.d.x ft0, zero # 0.0
+fsd ft0, 0(a0)
+fmv.d.x ft0, zero # 0.0
+fsd ft0, 8(a0)
+fmv.d.x ft0, zero # 0.0
+fsd ft0, 16(a0)
+fmv.d.x ft0, zero # 0.0
+fsd ft0, 24(a0)
+li t0, 1
+fld ft0, .Ld.3ff0000000000000, s1 # 1.0
+fcvt.d.w ft1, t0
+la s0, .glob_v
+fcvt.w.d s1, ft0
+slli s1, s1, 3
+add s0, s0, s1
+fsd ft1, (s0)
+li t0, 0
+fld ft0, .Ld.4000000000000000, s1 # 2.0
+fcvt.d.w ft1, t0
+la s0, .glob_v
+fcvt.w.d s1, ft0
+slli s1, s1, 3
+add s0, s0, s1
+fsd ft1, (s0)
+li t0, 1
+fld ft0, .Ld.4008000000000000, s1 # 3.0
+fcvt.d.w ft1, t0
+la s0, .glob_v
+fcvt.w.d s1, ft0
+slli s1, s1, 3
+add s0, s0, s1
+fsd ft1, (s0)
+fld ft0, .Ld.3ff0000000000000, s1 # 1.0
+la s0, .glob_v
+fcvt.w.d a1, ft0
+slli s1, a1, 3
+add s0, s0, s1
+fld ft0, (s0)
+la a0, .floatformat
+fmv.x.d a1, ft0
+call printf
+fld ft0, .Ld.4000000000000000, s1 # 2.0
+la s0, .glob_v
+fcvt.w.d a1, ft0
+slli s1, a1, 3
+add s0, s0, s1
+fld ft0, (s0)
+la a0, .floatformat
+fmv.x.d a1, ft0
+call printf
+fld ft0, .Ld.4008000000000000, s1 # 3.0
+la s0, .glob_v
+fcvt.w.d a1, ft0
+slli s1, a1, 3
+add s0, s0, s1
+fld ft0, (s0)
+la a0, .floatformat
+fmv.x.d a1, ft0
+call printf
+la t0, .glob_v
+mv a0, t0
+fmv.d.x ft1, zero # 0.0
+fmv.x.d a1, ft1
+fld ft1, .Ld.4000000000000000, s1 # 2.0
+fmv.x.d a2, ft1
+addi sp, sp, -8
+fsd ft0, 0(sp)
+call f
+fld ft0, 0(sp)
+addi sp, sp, 8
+fmv.d.x ft0, a0
+fmv.d.x ft1, zero # 0.0
+la s0, .glob_v
+fcvt.w.d s1, ft1
+slli s1, s1, 3
+add s0, s0, s1
+fsd ft0, (s0)
+fmv.d.x ft0, zero # 0.0
+la s0, .glob_v
+fcvt.w.d a1, ft0
+slli s1, a1, 3
+add s0, s0, s1
+fld ft0, (s0)
+fld ft1, .Ld.3ff0000000000000, s1 # 1.0
+la s0, .glob_v
+fcvt.w.d a1, ft1
+slli s1, a1, 3
+add s0, s0, s1
+fld ft1, (s0)
+fld ft2, .Ld.4024000000000000, s1 # 10.0
+fmul.d ft1, ft1, ft2
+fadd.d ft0, ft0, ft1
+fld ft1, .Ld.4008000000000000, s1 # 3.0
+la s0, .glob_v
+fcvt.w.d a1, ft1
+slli s1, a1, 3
+add s0, s0, s1
+fld ft1, (s0)
+fld ft2, .Ld.4059000000000000, s1 # 100.0
+fmul.d ft1, ft1, ft2
+fadd.d ft0, ft0, ft1
+la a0, .floatformat
+fmv.x.d a1, ft0
+call printf
+
+li a0, 0
+li a7, 93
+ecall
+
+
+.section .data
+.glob_v: .dword 0,0,0,0
+.strformat: .string "%s\n"
+.intformat: .string "%d\n"
+.floatformat: .string "%f\n"
+.section .rodata
+.align 3
+.Ld.3ff0000000000000: .dword 4607182418800017408
+.Ld.4000000000000000: .dword 4611686018427387904
+.Ld.4008000000000000: .dword 4613937818241073152
+.Ld.4024000000000000: .dword 4621819117588971520
+.Ld.4059000000000000: .dword 4636737291354636288
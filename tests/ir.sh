@@ -0,0 +1,31 @@
+# checks the IR of the codegen tests with ir.verify() and against its goldens, and the code generated from it with
+# -O against its goldens, with the builtin assembler and with llvm-mc. where qemu-riscv64 is installed, the -O
+# program must print what the program of the default backend prints. the goldens are made with tester.py ir --save
+# and voxc.py -O -c <file>.O.s
+cd "$(dirname "$0")/.."
+LLVM_MC="llvm-mc -triple=riscv64 -mattr=+m,+d,+v"
+tmp=$(mktemp -d)
+trap 'rm -rf "$tmp"' EXIT
+
+for f in codegen_tests/*.vox; do
+	echo "Testing ${f}"
+	python tester.py --lexer dfa --parser rd ir ${f} | diff <(cat ${f}.ir; echo) - || continue
+	python voxc.py -O --no-cache ${f} -o "$tmp/a.out" -c "$tmp/a.s" || continue
+	diff ${f}.O.s "$tmp/a.s"
+	$LLVM_MC -filetype=obj "$tmp/a.s" -o "$tmp/a.o"
+	if command -v qemu-riscv64 > /dev/null; then
+		python voxc.py --no-cache ${f} -o "$tmp/b.out" || continue
+		diff <(qemu-riscv64 "$tmp/b.out") <(qemu-riscv64 "$tmp/a.out")
+	fi
+done
+
+# the spill reports, made with tester.py spills --save, of programs whose values take the callee-saved registers and
+# are spilled by how often they are used, in and out of loops. the code of the programs in tests/spills shows which
+# values are spilled: the ones used in a loop keep their registers
+for f in codegen_tests/*.vox tests/spills/*.vox; do
+	[ -f ${f}.spills ] || continue
+	echo "Testing ${f}.spills"
+	python tester.py --lexer dfa --parser rd spills ${f} | diff <(cat ${f}.spills; echo) -
+	[ -f ${f}.O.s ] || continue
+	python voxc.py -O --no-cache ${f} -o "$tmp/a.out" -c "$tmp/a.s" && diff ${f}.O.s "$tmp/a.s"
+done
@@ -0,0 +1,21 @@
+# checks the constant pool of programs that use the same literals in several functions and in main: the code of the
+# default backend, of -O and of --stream (with -j 1 and -j 4, which give the same output) against the goldens
+# <file>.s, <file>.O.s and <file>.stream.s, made with voxc.py -c. each literal has a single .Ld or .Ls label
+cd "$(dirname "$0")/.."
+tmp=$(mktemp -d)
+trap 'rm -rf "$tmp"' EXIT
+
+check() {
+	diff $1 "$tmp/a.s" || return
+	labels=$(grep '^\.L[ds]\.' "$tmp/a.s" | cut -d: -f1)
+	[ -z "$(echo "$labels" | sort | uniq -d)" ] || echo "$1: a constant is in the pool twice"
+}
+
+for f in tests/pool/*.vox; do
+	echo "Testing ${f}"
+	python voxc.py --no-cache ${f} -o "$tmp/a.out" -c "$tmp/a.s" && check ${f}.s
+	python voxc.py -O --no-cache ${f} -o "$tmp/a.out" -c "$tmp/a.s" && check ${f}.O.s
+	for jobs in 1 4; do
+		python voxc.py --stream -j ${jobs} --no-cache ${f} -o "$tmp/a.out" -c "$tmp/a.s" && check ${f}.stream.s
+	done
+done
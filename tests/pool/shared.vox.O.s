@@ -0,0 +1,83 @@
+#include <stdio.h>
+.align 2
+.section .text
+.global main
+
+
+f:
+addi sp, sp, -16
+sd ra, 0(sp)
+fsd fs0, 8(sp)
+mv t3, a0
+fmv.d.x fs0, t3
+la t3, .Ls.a4d26868017c0ccf
+la a0, .strformat
+mv a1, t3
+call printf
+fld ft3, .Ld.4004000000000000, t6
+fmul.d ft3, fs0, ft3
+fmv.x.d t3, ft3
+mv a0, t3
+ld ra, 0(sp)
+fld fs0, 8(sp)
+addi sp, sp, 16
+ret
+g:
+addi sp, sp, -16
+sd ra, 0(sp)
+fsd fs0, 8(sp)
+mv t3, a0
+fmv.d.x fs0, t3
+la t3, .Ls.a4d26868017c0ccf
+la a0, .strformat
+mv a1, t3
+call printf
+fld ft3, .Ld.4004000000000000, t6
+fadd.d ft3, fs0, ft3
+fmv.x.d t3, ft3
+mv a0, t3
+ld ra, 0(sp)
+fld fs0, 8(sp)
+addi sp, sp, 16
+ret
+main:
+la t3, .glob_x
+fld ft3, .Ld.4004000000000000, t6
+fsd ft3, 0(t3)
+la t3, .Ls.a4d26868017c0ccf
+la a0, .strformat
+mv a1, t3
+call printf
+la t3, .glob_x
+fld ft3, 0(t3)
+fmv.x.d t3, ft3
+mv a0, t3
+call f
+mv t3, a0
+fmv.d.x fs0, t3
+fld ft3, .Ld.4004000000000000, t6
+fmv.x.d t3, ft3
+mv a0, t3
+call g
+mv t3, a0
+fmv.d.x ft3, t3
+fadd.d ft3, fs0, ft3
+la a0, .floatformat
+fmv.x.d a1, ft3
+call printf
+li a0, 0
+
+li a0, 0
+li a7, 93
+ecall
+
+
+.section .data
+.glob_x: .dword 0
+.strformat: .string "%s\n"
+.intformat: .string "%d\n"
+.floatformat: .string "%f\n"
+.section .rodata
+.align 3
+.Ld.4004000000000000: .dword 4612811918334230528
+.Ls.a4d26868017c0ccf: .string "shared"
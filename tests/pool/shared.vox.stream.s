@@ -0,0 +1,93 @@
+#include <stdio.h>
+.align 2
+.section .text
+.global main
+
+
+main:
+.section .data
+.glob_x: .dword 0
+.section .text
+fld ft0, .Ld.4004000000000000, s1 # 2.5
+la a0, .glob_x
+fsd ft0, (a0)
+.section .rodata
+.align 3
+.Ld.4004000000000000: .dword 4612811918334230528
+.section .text
+j .Lstatements
+f:
+addi sp, sp, -16
+sd ra, 0(sp)
+sd a0, 8(sp)
+la a0, .strformat
+la a1, .Ls.a4d26868017c0ccf
+call printf
+fld ft0, 8(sp)
+fld ft1, .Ld.4004000000000000, s1 # 2.5
+fmul.d ft0, ft0, ft1
+fmv.x.d a0, ft0
+ld ra, 0(sp)
+addi sp, sp, 16
+ret
+ld ra, 0(sp)
+addi sp, sp, 16
+li a0, 0
+ret
+.section .rodata
+.align 3
+.Ls.a4d26868017c0ccf: .string "shared"
+.section .text
+g:
+addi sp, sp, -16
+sd ra, 0(sp)
+sd a0, 8(sp)
+la a0, .strformat
+la a1, .Ls.a4d26868017c0ccf
+call printf
+fld ft0, 8(sp)
+fld ft1, .Ld.4004000000000000, s1 # 2.5
+fadd.d ft0, ft0, ft1
+fmv.x.d a0, ft0
+ld ra, 0(sp)
+addi sp, sp, 16
+ret
+ld ra, 0(sp)
+addi sp, sp, 16
+li a0, 0
+ret
+.Lstatements:
+la a0, .strformat
+la a1, .Ls.a4d26868017c0ccf
+call printf
+la s0, .glob_x
+fld ft1, (s0)
+fmv.x.d a0, ft1
+addi sp, sp, -8
+fsd ft0, 0(sp)
+call f
+fld ft0, 0(sp)
+addi sp, sp, 8
+fmv.d.x ft0, a0
+fld ft2, .Ld.4004000000000000, s1 # 2.5
+fmv.x.d a0, ft2
+addi sp, sp, -16
+fsd ft0, 0(sp)
+fsd ft1, 8(sp)
+call g
+fld ft0, 0(sp)
+fld ft1, 8(sp)
+addi sp, sp, 16
+fmv.d.x ft1, a0
+fadd.d ft0, ft0, ft1
+la a0, .floatformat
+fmv.x.d a1, ft0
+call printf
+
+li a0, 0
+li a7, 93
+ecall
+.section .data
+.strformat: .string "%s\n"
+.intformat: .string "%d\n"
+.floatformat: .string "%f\n"
@@ -0,0 +1,17 @@
+# checks the IR of the programs in tests/ranges against their goldens, made with tester.py ir --save. the loop counter
+# and index of counter.vox are i64, with slt and add. the numbers of the other programs stay f64: one that may be -0.0,
+# one bound above 2^31, a product by a negative number and a negated range that has 0. where qemu-riscv64 is
+# installed, the -O program must print what the program of the default backend prints
+cd "$(dirname "$0")/.."
+tmp=$(mktemp -d)
+trap 'rm -rf "$tmp"' EXIT
+
+for f in tests/ranges/*.vox; do
+	echo "Testing ${f}"
+	python tester.py --lexer dfa --parser rd ir ${f} | diff <(cat ${f}.ir; echo) - || continue
+	if command -v qemu-riscv64 > /dev/null; then
+		python voxc.py -O --no-cache ${f} -o "$tmp/a.out" || continue
+		python voxc.py --no-cache ${f} -o "$tmp/b.out" || continue
+		diff <(qemu-riscv64 "$tmp/b.out") <(qemu-riscv64 "$tmp/a.out")
+	fi
+done
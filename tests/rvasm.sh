@@ -0,0 +1,22 @@
+# checks the builtin assembler against llvm-mc: the encodings of every instruction it knows, and the code of the
+# codegen tests disassembled and assembled again
+cd "$(dirname "$0")/.."
+LLVM_MC="llvm-mc -triple=riscv64 -mattr=+m,+d,+v"
+tmp=$(mktemp -d)
+trap 'rm -rf "$tmp"' EXIT
+
+for f in tests/rvasm/*.s; do
+	echo "Testing ${f}"
+	diff <($LLVM_MC -show-encoding ${f} | grep -o 'encoding: .*') \
+		<(python rvasm.py --show-encoding ${f} | grep -o 'encoding: .*')
+done
+
+for f in codegen_tests/*.vox; do
+	echo "Testing ${f}"
+	python voxc.py --no-cache ${f} -o "$tmp/a.out" || continue
+	llvm-objcopy -O binary --only-section=.text "$tmp/a.out" "$tmp/text"
+	# one instruction per line, as its bytes
+	od -An -v -tx1 "$tmp/text" | tr -s ' ' '\n' | grep . | sed 's/^/0x/' | paste -d, - - - - > "$tmp/words"
+	tr , ' ' < "$tmp/words" | $LLVM_MC --disassemble > "$tmp/text.s"
+	diff <(sed 's/.*/encoding: [&]/' "$tmp/words") <($LLVM_MC -show-encoding "$tmp/text.s" | grep -o 'encoding: .*')
+done
@@ -0,0 +1,371 @@
+# every instruction the builtin assembler encodes, with registers and immediates at the ends of their ranges
+add a0, s1, t6
+add t6, zero, sp
+sub a0, s1, t6
+sub t6, zero, sp
+sll a0, s1, t6
+sll t6, zero, sp
+slt a0, s1, t6
+slt t6, zero, sp
+sltu a0, s1, t6
+sltu t6, zero, sp
+xor a0, s1, t6
+xor t6, zero, sp
+srl a0, s1, t6
+srl t6, zero, sp
+sra a0, s1, t6
+sra t6, zero, sp
+or a0, s1, t6
+or t6, zero, sp
+and a0, s1, t6
+and t6, zero, sp
+mul a0, s1, t6
+mul t6, zero, sp
+mulh a0, s1, t6
+mulh t6, zero, sp
+mulhsu a0, s1, t6
+mulhsu t6, zero, sp
+mulhu a0, s1, t6
+mulhu t6, zero, sp
+div a0, s1, t6
+div t6, zero, sp
+divu a0, s1, t6
+divu t6, zero, sp
+rem a0, s1, t6
+rem t6, zero, sp
+remu a0, s1, t6
+remu t6, zero, sp
+addw a0, s1, t6
+addw t6, zero, sp
+subw a0, s1, t6
+subw t6, zero, sp
+sllw a0, s1, t6
+sllw t6, zero, sp
+srlw a0, s1, t6
+srlw t6, zero, sp
+sraw a0, s1, t6
+sraw t6, zero, sp
+mulw a0, s1, t6
+mulw t6, zero, sp
+divw a0, s1, t6
+divw t6, zero, sp
+divuw a0, s1, t6
+divuw t6, zero, sp
+remw a0, s1, t6
+remw t6, zero, sp
+remuw a0, s1, t6
+remuw t6, zero, sp
+addi a0, s1, -2048
+addi t6, zero, 2047
+addi sp, sp, 0
+slti a0, s1, -2048
+slti t6, zero, 2047
+slti sp, sp, 0
+sltiu a0, s1, -2048
+sltiu t6, zero, 2047
+sltiu sp, sp, 0
+xori a0, s1, -2048
+xori t6, zero, 2047
+xori sp, sp, 0
+ori a0, s1, -2048
+ori t6, zero, 2047
+ori sp, sp, 0
+andi a0, s1, -2048
+andi t6, zero, 2047
+andi sp, sp, 0
+addiw a0, s1, -2048
+addiw t6, zero, 2047
+addiw sp, sp, 0
+slli a0, s1, 0
+slli t6, t0, 63
+srli a0, s1, 0
+srli t6, t0, 63
+srai a0, s1, 0
+srai t6, t0, 63
+slliw a0, s1, 0
+slliw t6, t0, 31
+srliw a0, s1, 0
+srliw t6, t0, 31
+sraiw a0, s1, 0
+sraiw t6, t0, 31
+lb a0, 0(sp)
+lb t6, -2048(s0)
+lb a0, 2047(t6)
+lb a0, (a1)
+lh a0, 0(sp)
+lh t6, -2048(s0)
+lh a0, 2047(t6)
+lh a0, (a1)
+lw a0, 0(sp)
+lw t6, -2048(s0)
+lw a0, 2047(t6)
+lw a0, (a1)
+ld a0, 0(sp)
+ld t6, -2048(s0)
+ld a0, 2047(t6)
+ld a0, (a1)
+lbu a0, 0(sp)
+lbu t6, -2048(s0)
+lbu a0, 2047(t6)
+lbu a0, (a1)
+lhu a0, 0(sp)
+lhu t6, -2048(s0)
+lhu a0, 2047(t6)
+lhu a0, (a1)
+lwu a0, 0(sp)
+lwu t6, -2048(s0)
+lwu a0, 2047(t6)
+lwu a0, (a1)
+fld ft0, 0(sp)
+fld fs11, -2048(s0)
+fld ft0, 2047(t6)
+fld ft0, (a1)
+sb a0, 0(sp)
+sb t6, -2048(s0)
+sb a0, 2047(t6)
+sb a0, (a1)
+sh a0, 0(sp)
+sh t6, -2048(s0)
+sh a0, 2047(t6)
+sh a0, (a1)
+sw a0, 0(sp)
+sw t6, -2048(s0)
+sw a0, 2047(t6)
+sw a0, (a1)
+sd a0, 0(sp)
+sd t6, -2048(s0)
+sd a0, 2047(t6)
+sd a0, (a1)
+fsd ft0, 0(sp)
+fsd fa7, -2048(s0)
+fsd ft0, 2047(t6)
+fsd ft0, (a1)
+beq a0, s1, -4096
+beq t6, zero, 4094
+beq t0, t1, 12
+bne a0, s1, -4096
+bne t6, zero, 4094
+bne t0, t1, 12
+blt a0, s1, -4096
+blt t6, zero, 4094
+blt t0, t1, 12
+bge a0, s1, -4096
+bge t6, zero, 4094
+bge t0, t1, 12
+bltu a0, s1, -4096
+bltu t6, zero, 4094
+bltu t0, t1, 12
+bgeu a0, s1, -4096
+bgeu t6, zero, 4094
+bgeu t0, t1, 12
+beqz a0, -4096
+beqz t6, 4094
+bnez a0, -4096
+bnez t6, 4094
+blez a0, -4096
+blez t6, 4094
+bgez a0, -4096
+bgez t6, 4094
+bltz a0, -4096
+bltz t6, 4094
+bgtz a0, -4096
+bgtz t6, 4094
+bgt a0, s1, -8
+bgt t6, zero, 4094
+ble a0, s1, -8
+ble t6, zero, 4094
+bgtu a0, s1, -8
+bgtu t6, zero, 4094
+bleu a0, s1, -8
+bleu t6, zero, 4094
+jal ra, -1048576
+jal zero, 1048574
+jal 16
+j -4
+j 2048
+jalr ra, 0(t0)
+jalr zero, -2048(a0)
+jalr t0
+jr ra
+ret
+lui a0, 0
+lui t6, 1048575
+auipc ra, 524288
+auipc sp, 1
+ecall
+ebreak
+nop
+li t2, 0
+li t2, 1
+li t2, -1
+li t2, 2047
+li t2, -2048
+li t2, 2048
+li t2, -2049
+li t2, 4096
+li t2, 2147483647
+li t2, -2147483648
+li t2, 2147483648
+li t2, 4294967295
+li t2, 2147481600
+li t2, 2147481599
+li t2, 4294967296
+li t2, 1311768467463790320
+li t2, -1311768467463790320
+li t2, 9223372036854775807
+li t2, -9223372036854775808
+li t2, 4611686018427387904
+li t2, 4607182418800017408
+li t2, 13830554455654793216
+li t2, 4636737291354636288
+li t2, 4614256656552045848
+li t2, 4591870180066957722
+li t2, 4294967297
+li t2, 4503599627370495
+fadd.d ft0, fa1, fs11
+fadd.d ft0, fa1, fs11, rne
+fadd.d ft0, fa1, fs11, rtz
+fadd.d ft0, fa1, fs11, rmm
+fsub.d ft0, fa1, fs11
+fsub.d ft0, fa1, fs11, rne
+fsub.d ft0, fa1, fs11, rtz
+fsub.d ft0, fa1, fs11, rmm
+fmul.d ft0, fa1, fs11
+fmul.d ft0, fa1, fs11, rne
+fmul.d ft0, fa1, fs11, rtz
+fmul.d ft0, fa1, fs11, rmm
+fdiv.d ft0, fa1, fs11
+fdiv.d ft0, fa1, fs11, rne
+fdiv.d ft0, fa1, fs11, rtz
+fdiv.d ft0, fa1, fs11, rmm
+fsqrt.d ft0, fa1
+fsqrt.d ft0, fa1, rne
+fsqrt.d ft0, fa1, rtz
+fsqrt.d ft0, fa1, rmm
+fsgnj.d ft11, fs1, fs2
+fsgnjn.d ft11, fs1, fs2
+fsgnjx.d ft11, fs1, fs2
+fmin.d ft11, fs1, fs2
+fmax.d ft11, fs1, fs2
+feq.d a0, fs1, fs2
+flt.d a0, fs1, fs2
+fle.d a0, fs1, fs2
+fmv.x.d a0, fs1
+fclass.d a0, fs1
+fmv.d.x ft11, s1
+fcvt.w.d t0, ft7
+fcvt.w.d t0, ft7, rtz
+fcvt.w.d t0, ft7, rne
+fcvt.w.d t0, ft7, dyn
+fcvt.wu.d t0, ft7
+fcvt.wu.d t0, ft7, rtz
+fcvt.wu.d t0, ft7, rne
+fcvt.wu.d t0, ft7, dyn
+fcvt.l.d t0, ft7
+fcvt.l.d t0, ft7, rtz
+fcvt.l.d t0, ft7, rne
+fcvt.l.d t0, ft7, dyn
+fcvt.lu.d t0, ft7
+fcvt.lu.d t0, ft7, rtz
+fcvt.lu.d t0, ft7, rne
+fcvt.lu.d t0, ft7, dyn
+fcvt.d.w fa0, s2
+fcvt.d.wu fa0, s2
+fcvt.d.l fa0, s2
+fcvt.d.l fa0, s2, rtz
+fcvt.d.l fa0, s2, rne
+fcvt.d.l fa0, s2, dyn
+fcvt.d.lu fa0, s2
+fcvt.d.lu fa0, s2, rtz
+fcvt.d.lu fa0, s2, rne
+fcvt.d.lu fa0, s2, dyn
+fmadd.d ft0, ft1, ft2, ft3
+fmadd.d fs11, fa0, ft8, ft11, rne
+fmsub.d ft0, ft1, ft2, ft3
+fmsub.d fs11, fa0, ft8, ft11, rne
+fnmsub.d ft0, ft1, ft2, ft3
+fnmsub.d fs11, fa0, ft8, ft11, rne
+fnmadd.d ft0, ft1, ft2, ft3
+fnmadd.d fs11, fa0, ft8, ft11, rne
+fmv.d ft0, ft1
+fabs.d fa0, fs3
+fneg.d ft11, ft0
+mv a0, sp
+not t0, t1
+neg a0, a1
+negw a0, a1
+sext.w t1, t4
+seqz a0, a1
+snez t0, t1
+sltz a0, t6
+sgtz s1, s2
+vsetvli s1, s2, e8, m1, ta, ma
+vsetvli zero, t0, e8, m1, ta, ma
+vsetvli s1, s2, e16, m2, tu, mu
+vsetvli zero, t0, e16, m2, tu, mu
+vsetvli s1, s2, e32, mf2, ta, mu
+vsetvli zero, t0, e32, mf2, ta, mu
+vsetvli s1, s2, e64, m8, tu, ma
+vsetvli zero, t0, e64, m8, tu, ma
+vsetvli s1, s2, e64, m1, tu, mu
+vsetvli zero, t0, e64, m1, tu, mu
+vle8.v v0, (s0)
+vle8.v v31, (t6)
+vle8.v v1, (a0), v0.t
+vle16.v v0, (s0)
+vle16.v v31, (t6)
+vle16.v v1, (a0), v0.t
+vle32.v v0, (s0)
+vle32.v v31, (t6)
+vle32.v v1, (a0), v0.t
+vle64.v v0, (s0)
+vle64.v v31, (t6)
+vle64.v v1, (a0), v0.t
+vse8.v v0, (s0)
+vse8.v v31, (t6)
+vse8.v v1, (a0), v0.t
+vse16.v v0, (s0)
+vse16.v v31, (t6)
+vse16.v v1, (a0), v0.t
+vse32.v v0, (s0)
+vse32.v v31, (t6)
+vse32.v v1, (a0), v0.t
+vse64.v v0, (s0)
+vse64.v v31, (t6)
+vse64.v v1, (a0), v0.t
+vfadd.vv v0, v0, v1
+vfadd.vv v31, v2, v17
+vfadd.vv v3, v4, v1, v0.t
+vfadd.vf v0, v0, ft1
+vfadd.vf v31, v2, fs11
+vfadd.vf v3, v4, ft1, v0.t
+vfsub.vv v0, v0, v1
+vfsub.vv v31, v2, v17
+vfsub.vv v3, v4, v1, v0.t
+vfsub.vf v0, v0, ft1
+vfsub.vf v31, v2, fs11
+vfsub.vf v3, v4, ft1, v0.t
+vfmin.vv v0, v0, v1
+vfmin.vv v31, v2, v17
+vfmin.vv v3, v4, v1, v0.t
+vfmin.vf v0, v0, ft1
+vfmin.vf v31, v2, fs11
+vfmin.vf v3, v4, ft1, v0.t
+vfmax.vv v0, v0, v1
+vfmax.vv v31, v2, v17
+vfmax.vv v3, v4, v1, v0.t
+vfmax.vf v0, v0, ft1
+vfmax.vf v31, v2, fs11
+vfmax.vf v3, v4, ft1, v0.t
+vfdiv.vv v0, v0, v1
+vfdiv.vv v31, v2, v17
+vfdiv.vv v3, v4, v1, v0.t
+vfdiv.vf v0, v0, ft1
+vfdiv.vf v31, v2, fs11
+vfdiv.vf v3, v4, ft1, v0.t
+vfmul.vv v0, v0, v1
+vfmul.vv v31, v2, v17
+vfmul.vv v3, v4, v1, v0.t
+vfmul.vf v0, v0, ft1
+vfmul.vf v31, v2, fs11
+vfmul.vf v3, v4, ft1, v0.t
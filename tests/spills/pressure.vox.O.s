@@ -0,0 +1,200 @@
+#include <stdio.h>
+.align 2
+.section .text
+.global main
+
+
+g:
+addi sp, sp, -16
+sd ra, 0(sp)
+mv t3, a0
+fmv.d.x ft3, t3
+fld ft4, .Ld.3fe0000000000000, t6
+fmul.d ft3, ft3, ft4
+fmv.x.d t3, ft3
+mv a0, t3
+ld ra, 0(sp)
+addi sp, sp, 16
+ret
+f:
+addi sp, sp, -192
+sd ra, 80(sp)
+sd s0, 88(sp)
+fsd fs0, 96(sp)
+fsd fs1, 104(sp)
+fsd fs2, 112(sp)
+fsd fs3, 120(sp)
+fsd fs4, 128(sp)
+fsd fs5, 136(sp)
+fsd fs6, 144(sp)
+fsd fs7, 152(sp)
+fsd fs8, 160(sp)
+fsd fs9, 168(sp)
+fsd fs10, 176(sp)
+fsd fs11, 184(sp)
+mv t3, a0
+fmv.d.x ft3, t3
+fld ft4, .Ld.4000000000000000, t6
+fmul.d fs0, ft3, ft4
+fld ft4, .Ld.4008000000000000, t6
+fmul.d fs1, ft3, ft4
+fld ft4, .Ld.4010000000000000, t6
+fmul.d fs2, ft3, ft4
+fld ft4, .Ld.4014000000000000, t6
+fmul.d fs3, ft3, ft4
+fld ft4, .Ld.4018000000000000, t6
+fmul.d fs4, ft3, ft4
+fld ft4, .Ld.401c000000000000, t6
+fmul.d fs5, ft3, ft4
+fld ft4, .Ld.4020000000000000, t6
+fmul.d fs6, ft3, ft4
+fld ft4, .Ld.4022000000000000, t6
+fmul.d fs7, ft3, ft4
+fld ft4, .Ld.4024000000000000, t6
+fmul.d fs8, ft3, ft4
+fld ft4, .Ld.4026000000000000, t6
+fmul.d fs9, ft3, ft4
+fld ft4, .Ld.4028000000000000, t6
+fmul.d ft0, ft3, ft4
+fsd ft0, 72(sp)
+fld ft4, .Ld.402a000000000000, t6
+fmul.d ft0, ft3, ft4
+fsd ft0, 64(sp)
+fld ft4, .Ld.402c000000000000, t6
+fmul.d ft0, ft3, ft4
+fsd ft0, 0(sp)
+fld ft4, .Ld.402e000000000000, t6
+fmul.d ft0, ft3, ft4
+fsd ft0, 8(sp)
+fld ft4, .Ld.4030000000000000, t6
+fmul.d ft0, ft3, ft4
+fsd ft0, 16(sp)
+fld ft4, .Ld.4031000000000000, t6
+fmul.d ft0, ft3, ft4
+fsd ft0, 24(sp)
+fld ft4, .Ld.4032000000000000, t6
+fmul.d ft0, ft3, ft4
+fsd ft0, 32(sp)
+fld ft4, .Ld.4033000000000000, t6
+fmul.d ft0, ft3, ft4
+fsd ft0, 40(sp)
+fld ft4, .Ld.4034000000000000, t6
+fmul.d ft0, ft3, ft4
+fsd ft0, 48(sp)
+fld ft4, .Ld.4035000000000000, t6
+fmul.d ft0, ft3, ft4
+fsd ft0, 56(sp)
+li t3, 0
+li t4, 100
+slt t3, t3, t4
+fmv.d.x fs11, zero
+li s0, 0
+fmv.d.x fs10, zero
+beqz t3, .Lf.2
+.Lf.1:
+fmv.x.d t3, fs11
+mv a0, t3
+call g
+mv t3, a0
+fmv.d.x ft3, t3
+fadd.d ft3, fs11, ft3
+fadd.d ft3, ft3, fs0
+fadd.d ft3, ft3, fs1
+fadd.d ft3, ft3, fs2
+fadd.d ft3, ft3, fs3
+fadd.d ft3, ft3, fs4
+fadd.d ft3, ft3, fs5
+fadd.d ft3, ft3, fs6
+fadd.d ft3, ft3, fs7
+fadd.d ft3, ft3, fs8
+fadd.d ft3, ft3, fs9
+addi t3, s0, 1
+slti t4, t3, 100
+fmv.d fs11, ft3
+mv s0, t3
+fmv.d fs10, ft3
+bnez t4, .Lf.1
+.Lf.2:
+fld ft0, 72(sp)
+fadd.d ft3, fs10, ft0
+fld ft0, 64(sp)
+fadd.d ft3, ft3, ft0
+fld ft0, 0(sp)
+fadd.d ft3, ft3, ft0
+fld ft0, 8(sp)
+fadd.d ft3, ft3, ft0
+fld ft0, 16(sp)
+fadd.d ft3, ft3, ft0
+fld ft0, 24(sp)
+fadd.d ft3, ft3, ft0
+fld ft0, 32(sp)
+fadd.d ft3, ft3, ft0
+fld ft0, 40(sp)
+fadd.d ft3, ft3, ft0
+fld ft0, 48(sp)
+fadd.d ft3, ft3, ft0
+fld ft0, 56(sp)
+fadd.d ft3, ft3, ft0
+fmv.x.d t3, ft3
+mv a0, t3
+ld ra, 80(sp)
+ld s0, 88(sp)
+fld fs0, 96(sp)
+fld fs1, 104(sp)
+fld fs2, 112(sp)
+fld fs3, 120(sp)
+fld fs4, 128(sp)
+fld fs5, 136(sp)
+fld fs6, 144(sp)
+fld fs7, 152(sp)
+fld fs8, 160(sp)
+fld fs9, 168(sp)
+fld fs10, 176(sp)
+fld fs11, 184(sp)
+addi sp, sp, 192
+ret
+main:
+fld ft3, .Ld.3fd0000000000000, t6
+fmv.x.d t3, ft3
+mv a0, t3
+call f
+mv t3, a0
+fmv.d.x ft3, t3
+la a0, .floatformat
+fmv.x.d a1, ft3
+call printf
+li a0, 0
+
+li a0, 0
+li a7, 93
+ecall
+
+
+.section .data
+.strformat: .string "%s\n"
+.intformat: .string "%d\n"
+.floatformat: .string "%f\n"
+.section .rodata
+.align 3
+.Ld.3fe0000000000000: .dword 4602678819172646912
+.Ld.4000000000000000: .dword 4611686018427387904
+.Ld.4008000000000000: .dword 4613937818241073152
+.Ld.4010000000000000: .dword 4616189618054758400
+.Ld.4014000000000000: .dword 4617315517961601024
+.Ld.4018000000000000: .dword 4618441417868443648
+.Ld.401c000000000000: .dword 4619567317775286272
+.Ld.4020000000000000: .dword 4620693217682128896
+.Ld.4022000000000000: .dword 4621256167635550208
+.Ld.4024000000000000: .dword 4621819117588971520
+.Ld.4026000000000000: .dword 4622382067542392832
+.Ld.4028000000000000: .dword 4622945017495814144
+.Ld.402a000000000000: .dword 4623507967449235456
+.Ld.402c000000000000: .dword 4624070917402656768
+.Ld.402e000000000000: .dword 4624633867356078080
+.Ld.4030000000000000: .dword 4625196817309499392
+.Ld.4031000000000000: .dword 4625478292286210048
+.Ld.4032000000000000: .dword 4625759767262920704
+.Ld.4033000000000000: .dword 4626041242239631360
+.Ld.4034000000000000: .dword 4626322717216342016
+.Ld.4035000000000000: .dword 4626604192193052672
+.Ld.3fd0000000000000: .dword 4598175219545276416
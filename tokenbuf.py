@@ -0,0 +1,77 @@
+from array import array
+from dfalexer import DFALexer
+
+# kind ids stored in TokenBuffer.kinds
+TYPES = sorted(DFALexer.tokens) + sorted(DFALexer.literals) + ["ERROR"]
+KIND = {t: i for i, t in enumerate(TYPES)}
+
+
+class TokenBuffer:
+    """struct of arrays token storage. a token is only its kind, offsets and line in the source,
+    values are decoded from the source text when they are asked for."""
+
+    def __init__(self, text, lexer=None, lineno=1, index=0):
+        self.text = text
+        self.kinds = array("B")
+        self.starts = array("I")
+        self.ends = array("I")
+        self.linenos = array("I")
+
+        kind = KIND
+        add_kind = self.kinds.append
+        add_start = self.starts.append
+        add_end = self.ends.append
+        add_lineno = self.linenos.append
+        for tok_type, start, end, line in (lexer or DFALexer()).scan(text, lineno, index):
+            add_kind(kind[tok_type])
+            add_start(start)
+            add_end(end)
+            add_lineno(line)
+
+    def __len__(self):
+        return len(self.kinds)
+
+    def type(self, i):
+        return TYPES[self.kinds[i]]
+
+    def value(self, i):
+        return DFALexer.token_value(TYPES[self.kinds[i]], self.text[self.starts[i]:self.ends[i]])
+
+    def __getitem__(self, i):
+        return TokenView(self, i)
+
+    def __iter__(self):
+        types = TYPES
+        kinds = self.kinds
+        for i in range(len(kinds)):
+            yield TokenView(self, i, types[kinds[i]])
+
+
+class TokenView:
+    """a token of a TokenBuffer with the attributes of sly's Token, which is what the parser reads."""
+
+    __slots__ = ("type", "_buf", "_i")
+
+    def __init__(self, buf, i, tok_type=None):
+        self._buf = buf
+        self._i = i
+        self.type = buf.type(i) if tok_type is None else tok_type
+
+    @property
+    def value(self):
+        return self._buf.value(self._i)
+
+    @property
+    def lineno(self):
+        return self._buf.linenos[self._i]
+
+    @property
+    def index(self):
+        return self._buf.starts[self._i]
+
+    @property
+    def end(self):
+        return self._buf.ends[self._i]
+
+    def __repr__(self):
+        return f"Token(type={self.type!r}, value={self.value!r}, lineno={self.lineno}, index={self.index}, end={self.end})"
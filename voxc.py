@@ -1,42 +1,317 @@
 import argparse
+import contextlib
+import os
 import misc
+import shutil
 import sys
+import time
+import buildcache
 import codegen
+import folding
+import irgen
+import rvasm
 import subprocess
+import tempfile
+from rdparser import ParseError
 
-if __name__ == "__main__":
+ASSEMBLER_FLAGS = "-march=rv64gcv -static"
+ASSEMBLERS = ("builtin", "gcc")
+
+
+class Tee:
+    """text stream that writes to all of the given streams."""
+
+    def __init__(self, *streams):
+        self.streams = streams
+
+    def write(self, text):
+        for stream in self.streams:
+            stream.write(text)
+
+
+@contextlib.contextmanager
+def captured_output():
+    """collects what is written to the file descriptors 1 and 2 inside the block, also by subprocesses, into the
+    "stdout" and "stderr" items of the dict it yields."""
+    output = {}
+    with tempfile.TemporaryFile() as out, tempfile.TemporaryFile() as err:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        saved = os.dup(1), os.dup(2)
+        os.dup2(out.fileno(), 1)
+        os.dup2(err.fileno(), 2)
+        try:
+            yield output
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os.dup2(saved[0], 1)
+            os.dup2(saved[1], 2)
+            os.close(saved[0])
+            os.close(saved[1])
+            for name, f in (("stdout", out), ("stderr", err)):
+                f.seek(0)
+                output[name] = f.read().decode(errors="replace")
+
+
+def compile_stream(f, out, lexer="dfa", fun_cache=None):
+    """compiles the source file f to the text stream out one top level declaration or statement at a time, so
+    neither the source, its AST nor the assembly is held as a whole. stops at the first undeclared or redeclared
+    name and returns False, out then holds the code of the part before it. a syntax error raises ParseError."""
+    intermediate = misc.StreamingIntermediate(f, lexer)
+    generator = codegen.CodeGenerator(fun_cache=fun_cache)
+    generator.start_stream(out)
+    for node, bindings in intermediate:
+        if (
+            misc.undeclared_vars(intermediate) != []
+            or misc.multiple_var_declarations(intermediate) != []
+        ):
+            return False
+        node = folding.fold(node)
+        if node is not None:
+            generator.stream_item(node, bindings)
+    generator.end_stream()
+    return True
+
+
+def link(assembler, binary, code=None):
+    """writes the executable of what was given to assembler, an rvasm.Assembler, and of the asm.Code records
+    code to binary. returns the exit status an assembler process would have."""
+    try:
+        if code is not None:
+            assembler.add(code)
+        image = assembler.link()
+    except rvasm.AsmError as e:
+        print(f"{binary}: {e}", file=sys.stderr)
+        return 1
+    rvasm.write_executable(binary, image)
+    return 0
+
+
+def stream(args, cmd, asm_paths, fun_cache=None):
+    """compiles with compile_stream(), writing the assembly into the assembler's stdin, or the builtin
+    assembler if cmd is None, and the files at asm_paths as it is generated. returns the result of
+    compile_stream(), or None if the source has a syntax error, and the assembler's exit status. nothing is
+    assembled unless the result is True."""
+    if cmd is None:
+        sink = rvasm.Assembler()
+    else:
+        p = subprocess.Popen(cmd.split(), stdin=subprocess.PIPE, text=True)
+        sink = p.stdin
+    asm_files = [open(path, "w") for path in asm_paths]
+    out = Tee(sink, *asm_files) if asm_files else sink
+    rejected = False
+    try:
+        with open(args.filename) as f:
+            ok = compile_stream(f, out, args.lexer, fun_cache)
+    except (ParseError, RecursionError):
+        ok = None
+    except rvasm.AsmError as e:
+        # a line the builtin assembler can't assemble, reported like link() does
+        print(f"{args.o}: {e}", file=sys.stderr)
+        ok = rejected = True
+    finally:
+        for asm_file in asm_files:
+            asm_file.close()
+
+    if not ok or rejected:
+        # don't leave a partial program behind
+        for path in asm_paths:
+            os.remove(path)
+        if cmd is None:
+            return ok, 1
+        p.kill()
+        p.wait()
+        return ok, p.returncode
+
+    if cmd is None:
+        return ok, link(sink, args.o)
+    p.stdin.close()
+    p.wait()
+    return ok, p.returncode
+
+
+def cache(pending, binary, returncode):
+    """adds the compiled program to the cache if the assembler succeeded. the assembly is already written."""
+    if pending is None:
+        return
+    try:
+        if returncode == 0:
+            shutil.copyfile(binary, pending.binary_path)
+            shutil.copymode(binary, pending.binary_path)
+            pending.commit()
+            return
+    except OSError:
+        pass
+    pending.abort()
+
+
+def build(args, fun_cache=None, assembler_slots=None):
+    """compiles args.filename to the binary args.o, and the assembly args.c if it is given, through the compile
+    cache unless args.no_cache. the code of functions is reused from fun_cache. assembler_slots, a semaphore,
+    limits how many assemblers run at once. returns False if the program has an error or doesn't assemble."""
+    pending = None
+    if not args.no_cache:
+        assembler = ASSEMBLER_FLAGS if args.assembler == "gcc" else args.assembler
+        flags = {"lexer": args.lexer, "parser": args.parser, "stream": args.stream, "assembler": assembler,
+                 "optimize": args.optimize}
+        key = buildcache.cache_key(args.filename, flags)
+        if buildcache.fetch(key, args.c, args.o):
+            return True
+        try:
+            pending = buildcache.Pending(key)
+        except OSError:
+            # the cache can't be written, the program is compiled without it
+            pass
+
+    cmd = f"riscv64-linux-gnu-gcc {ASSEMBLER_FLAGS} -o {args.o} -xassembler -" if args.assembler == "gcc" else None
+    if args.stream:
+        asm_paths = [path for path in (args.c, pending and pending.asm_path) if path]
+        ok, returncode = stream(args, cmd, asm_paths, fun_cache)
+        if ok:
+            cache(pending, args.o, returncode)
+            return returncode == 0
+        if ok is False:
+            if pending:
+                pending.abort()
+            print("Error msg")
+            return False
+        # the rd parser can't recover from syntax errors, the source is compiled as a whole to report them
+
+    with open(args.filename) as f:
+        intermediate = misc.process(f, args.lexer, args.parser)
+    if (
+        misc.undeclared_vars(intermediate) != []
+        or misc.multiple_var_declarations(intermediate) != []
+    ):
+        if pending:
+            pending.abort()
+        print("Error msg")
+        return False
+
+    ast = folding.fold(misc.generate_ast(intermediate))
+    if args.optimize:
+        try:
+            generator = irgen.IRGenerator(ast, intermediate.bindings)
+        except ValueError as e:
+            # what the IR has no form for
+            if pending:
+                pending.abort()
+            print(e)
+            return False
+    else:
+        generator = codegen.CodeGenerator(ast, intermediate.bindings, fun_cache, args.jobs)
+    for path in (args.c, pending and pending.asm_path):
+        if path:
+            with open(path, "w") as f:
+                generator.asm.write(f)
+
+    if cmd is None:
+        # the records are assembled without parsing their text
+        returncode = link(rvasm.Assembler(), args.o, generator.asm)
+    else:
+        with assembler_slots or contextlib.nullcontext():
+            p = subprocess.Popen(cmd.split(), stdin=subprocess.PIPE)
+            p.communicate(input=generator.code.encode())
+        returncode = p.returncode
+    cache(pending, args.o, returncode)
+    return returncode == 0
+
+
+def watch(args, interval=0.5):
+    """builds whenever the modification time of the source changes, until interrupted. the code of functions
+    is kept in memory between the builds."""
+    fun_cache = buildcache.FunctionCache()
+    last = None
+    try:
+        while True:
+            try:
+                mtime = os.stat(args.filename).st_mtime_ns
+            except FileNotFoundError:
+                mtime = None
+            if mtime is not None and mtime != last:
+                last = mtime
+                hits, misses = fun_cache.hits, fun_cache.misses
+                t = time.perf_counter()
+                try:
+                    build(args, fun_cache)
+                except (ParseError, RecursionError) as e:
+                    print(e)
+                hits, misses = fun_cache.hits - hits, fun_cache.misses - misses
+                elapsed = time.perf_counter() - t
+                print(f"built {args.filename} in {elapsed:.3f} s, reused {hits} of {hits + misses} functions")
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        pass
+
+
+def parse_args(argv=None):
+    """the options of the command line argv, sys.argv[1:] if it is None. exits with a usage message if they
+    are invalid."""
     argparser = argparse.ArgumentParser(
         prog="voxc.py",
         description="Compiler for Vox, project language for METU CENG444",
         epilog="",
     )
-    argparser.add_argument("filename", help="source file to be compiled")
+    argparser.add_argument("filename", nargs="?", help="source file to be compiled")
     argparser.add_argument("-o", default="a.out", help="output binary")
     argparser.add_argument(
         "-c", default="", help="output the compiled assembly code")
+    argparser.add_argument(
+        "--lexer", choices=list(misc.LEXERS), default="dfa", help="scanner backend")
+    argparser.add_argument(
+        "--parser", choices=misc.PARSERS, default="rd", help="parser backend")
+    argparser.add_argument(
+        "--stream", action="store_true",
+        help="compile one top level declaration or statement at a time, in bounded memory")
+    argparser.add_argument(
+        "-j", "--jobs", type=int, default=1,
+        help="number of processes that generate the code of the functions, the output is the same for any number")
+    argparser.add_argument(
+        "-O", "--optimize", action="store_true",
+        help="generate the code through the SSA IR of ir.py instead of straight from the AST")
+    argparser.add_argument(
+        "--assembler", choices=ASSEMBLERS, default="builtin",
+        help="assemble and link in process, or with riscv64-linux-gnu-gcc and libc")
+    argparser.add_argument(
+        "--no-cache", action="store_true",
+        help="neither look the program up in the compile cache nor add it")
+    argparser.add_argument(
+        "--cache-stats", action="store_true", help="print the statistics of the compile cache and exit")
+    argparser.add_argument(
+        "--watch", action="store_true",
+        help="compile again whenever the source changes, reusing the code of the unchanged functions")
 
-    args = argparser.parse_args()
-    code = ""
-    with open(args.filename) as f:
-        l = f.readlines()
-        for line in l:
-            code += line
+    args = argparser.parse_args(argv)
+    if args.filename is None and not args.cache_stats:
+        argparser.error("the following arguments are required: filename")
+    if args.stream and args.parser != "rd":
+        argparser.error("--stream needs the rd parser")
+    if args.stream and args.optimize:
+        argparser.error("--stream can't be combined with -O, the IR is built for a whole program")
+    return args
 
-    intermediate = misc.process(code)
-    if (
-        misc.undeclared_vars(intermediate) != []
-        or misc.multiple_var_declarations(intermediate) != []
-    ):
-        print("Error msg")
-        sys.exit()
-
-    ast = misc.generate_ast(intermediate)
-    generator = codegen.CodeGenerator(ast)
-    out = generator.code
-    if args.c:
-        with open(args.c, "w") as f:
-            f.write(out)
-
-    cmd = f"riscv64-linux-gnu-gcc -march=rv64gcv -static -o {args.o} -xassembler -"
-    p = subprocess.Popen(cmd.split(), stdin=subprocess.PIPE)
-    p.communicate(input=out.encode())
+
+def run(args, fun_cache=None):
+    """does what the options ask for. the code of functions is reused from fun_cache if it is given, and from
+    the function cache on disk otherwise. returns False if the program isn't built."""
+    if args.cache_stats:
+        for name, value in buildcache.stats().items():
+            print(f"{name}: {value}")
+    elif args.watch:
+        watch(args)
+    elif args.no_cache:
+        return build(args)
+    elif fun_cache is not None:
+        return build(args, fun_cache)
+    else:
+        # the functions of the previous builds of any program
+        fun_cache = buildcache.FunctionCache(buildcache.function_cache_path())
+        ok = build(args, fun_cache)
+        fun_cache.save()
+        return ok
+    return True
+
+
+if __name__ == "__main__":
+    sys.exit(0 if run(parse_args()) else 1)
@@ -0,0 +1,36 @@
+import json
+import os
+import socket
+import sys
+import tempfile
+
+# where compileserver.py listens
+SOCKET_PATH = os.environ.get(
+    "VOX_SERVER_SOCKET", os.path.join(tempfile.gettempdir(), f"voxc-{os.getuid()}.sock")
+)
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def request(message, path=SOCKET_PATH):
+    """sends message to the compile server and returns its reply, both are JSON objects. raises OSError if no
+    server is listening at path."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+        s.connect(path)
+        s.sendall(json.dumps(message).encode() + b"\n")
+        s.shutdown(socket.SHUT_WR)
+        with s.makefile("rb") as f:
+            return json.loads(f.read())
+
+
+if __name__ == "__main__":
+    # the command line of voxc.py, which is compiled by the server. this module imports nothing of the compiler
+    # so that it starts fast
+    try:
+        reply = request({"argv": sys.argv[1:], "cwd": os.getcwd()})
+    except OSError:
+        # no server, compile in this process
+        voxc = os.path.join(HERE, "voxc.py")
+        os.execv(sys.executable, [sys.executable, voxc, *sys.argv[1:]])
+    sys.stdout.write(reply["stdout"])
+    sys.stderr.write(reply["stderr"])
+    sys.exit(reply["status"])